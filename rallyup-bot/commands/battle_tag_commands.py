@@ -512,7 +512,7 @@ class BattleTagCommands(commands.Cog):
             if 배틀태그:
                 # 특정 배틀태그만 갱신
                 rank_info = await self.bot.db_manager.refresh_battle_tag_rank(
-                    guild_id, user_id, 배틀태그
+                    guild_id, user_id, 배틀태그, use_cache=False
                 )
                 
                 if rank_info:
@@ -545,7 +545,7 @@ class BattleTagCommands(commands.Cog):
                 success_count = 0
                 for tag in tags:
                     rank_info = await self.bot.db_manager.refresh_battle_tag_rank(
-                        guild_id, user_id, tag['battle_tag']
+                        guild_id, user_id, tag['battle_tag'], use_cache=False
                     )
                     if rank_info:
                         success_count += 1
@@ -745,7 +745,7 @@ class BattleTagListView(discord.ui.View):
         success_count = 0
         for tag in self.tags:
             rank_info = await self.bot.db_manager.refresh_battle_tag_rank(
-                self.guild_id, self.user_id, tag['battle_tag']
+                self.guild_id, self.user_id, tag['battle_tag'], use_cache=False
             )
             if rank_info:
                 success_count += 1
@@ -945,7 +945,7 @@ class BattleTagDetailView(discord.ui.View):
         
         # API 호출
         rank_info = await self.bot.db_manager.refresh_battle_tag_rank(
-            self.guild_id, self.user_id, battle_tag
+            self.guild_id, self.user_id, battle_tag, use_cache=False
         )
         
         if rank_info:
@@ -2467,7 +2467,7 @@ class ThreadDMBridgeView(discord.ui.View):
         
         # DB에 등록된 관리자
         try:
-            async with self.bot.db_manager.get_connection() as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT user_id FROM server_admins
                     WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
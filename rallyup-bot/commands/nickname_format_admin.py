@@ -4,6 +4,8 @@ from discord import app_commands
 from typing import List
 import re
 
+from utils.bulk_nickname_applier import BulkNicknameApplier
+
 class NicknameFormatCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -45,46 +47,43 @@ class NicknameFormatCommands(commands.Cog):
                 )
                 return
             
-            # 진행 메시지
-            progress_embed = discord.Embed(
-                title="🔄 닉네임 일괄 변경 진행 중...",
-                description=f"총 {len(registered_users)}명의 유저 닉네임을 변경합니다.\n잠시만 기다려주세요...",
-                color=0xffaa00
+            # 목표 닉네임 계산 + 이미 맞는 멤버 제외
+            applier = BulkNicknameApplier()
+            plan = applier.plan(
+                self.bot.db_manager, guild, registered_users, format_settings['format_template']
             )
-            await interaction.followup.send(embed=progress_embed, ephemeral=True)
-            
-            # 결과 추적
-            success_count = 0
-            failed_count = 0
-            skipped_count = 0
-            failed_users = []
-            
-            # 각 유저에 대해 닉네임 변경
-            for user_data in registered_users:
-                user_id = user_data['user_id']
-                member = guild.get_member(int(user_id))
-                
-                if not member:
-                    skipped_count += 1
-                    continue
-                
-                # 닉네임 변경 시도
-                result = await self.bot.db_manager._update_user_nickname(
-                    member,
-                    user_data['main_position'],
-                    user_data['current_season_tier'],
-                    user_data['battle_tag'],  # 이제는 대표 닉네임
-                    user_data.get('birth_year')
+            total = len(plan.edits)
+            
+            def build_progress_embed(done: int, succeeded: int, failed: int) -> discord.Embed:
+                percentage = int(done / total * 100) if total else 100
+                gauge = "█" * (percentage // 10) + "░" * (10 - percentage // 10)
+                embed = discord.Embed(
+                    title="🔄 닉네임 일괄 변경 진행 중...",
+                    description=f"변경 대상 {total}명 (이미 적용됨 {plan.unchanged}명 제외)\n"
+                                f"`{gauge}` {done}/{total} ({percentage}%)",
+                    color=0xffaa00
                 )
-                
-                if "✅" in result:
-                    success_count += 1
-                elif "⚠️" in result or "❌" in result:
-                    failed_count += 1
-                    failed_users.append({
-                        'name': member.display_name,
-                        'reason': result
-                    })
+                embed.add_field(name="✅ 성공", value=f"{succeeded}명", inline=True)
+                embed.add_field(name="❌ 실패", value=f"{failed}명", inline=True)
+                return embed
+            
+            # 진행 메시지
+            await interaction.followup.send(embed=build_progress_embed(0, 0, 0), ephemeral=True)
+            
+            async def on_progress(metrics: dict):
+                await interaction.edit_original_response(
+                    embed=build_progress_embed(metrics['done'], metrics['succeeded'], metrics['failed'])
+                )
+            
+            failed_users = await applier.run(plan.edits, on_progress=on_progress)
+            failed_users.extend(
+                {'name': edit.old_nickname, 'reason': "권한 부족 (봇 역할이 대상 유저보다 낮음)"}
+                for edit in plan.forbidden
+            )
+            
+            metrics = applier.last_metrics
+            success_count = metrics['succeeded']
+            failed_count = len(failed_users)
             
             # 결과 임베드
             result_embed = discord.Embed(
@@ -95,8 +94,10 @@ class NicknameFormatCommands(commands.Cog):
             result_embed.add_field(
                 name="📊 변경 결과",
                 value=f"✅ 성공: {success_count}명\n"
+                    f"⏸️ 변경 불필요: {plan.unchanged}명 (이미 포맷 적용됨)\n"
                     f"❌ 실패: {failed_count}명\n"
-                    f"⏭️ 건너뜀: {skipped_count}명 (서버 미참여)",
+                    f"⏭️ 건너뜀: {plan.missing}명 (서버 미참여)\n"
+                    f"⏱️ 소요 시간: {metrics['elapsed_seconds']}초",
                 inline=False
             )
             
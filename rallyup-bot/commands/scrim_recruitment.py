@@ -1,10 +1,16 @@
+import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime, time, timedelta
 import re
 
+from utils.recruitment_message_refresher import recruitment_refresher
+
+# 진행 중인 모집 DM 발송 태스크 (완료 전에 GC 되지 않도록 참조 유지)
+_dm_notification_tasks: Set[asyncio.Task] = set()
+
 def get_upcoming_weekday(weekday: int) -> datetime:
     """
     다가오는 특정 요일 날짜를 반환
@@ -2042,15 +2048,20 @@ class DateTimeSelectionView(discord.ui.View):
 
                 self.bot.add_view(view)
 
-                dm_stats = await self._send_dm_notifications(
+                # DM 은 초당 발송 수가 제한돼 큰 서버는 interaction 토큰(15분)보다 오래 걸리므로
+                # 백그라운드로 보내고 결과는 로그로 남긴다 (dm_outbox 에 기록되어 재시작해도 이어서 발송)
+                dm_targets = sum(1 for member in interaction.guild.members if not member.bot)
+                task = asyncio.create_task(self._send_dm_notifications(
                     interaction.guild, recruitment_id, embed, scrim_datetime
-                )
+                ))
+                _dm_notification_tasks.add(task)
+                task.add_done_callback(_dm_notification_tasks.discard)
                 
                 await interaction.followup.send(
                     f"✅ **{self.title}** 내전 모집이 성공적으로 등록되었습니다!\n"
                     f"📅 **일시**: {scrim_datetime.strftime('%Y년 %m월 %d일 %H:%M')}\n"
                     f"⏰ **마감**: {deadline_datetime.strftime('%Y년 %m월 %d일 %H:%M')}\n\n"
-                    f"🔔 **DM 알림 결과**: {dm_stats['success']}명 성공, {dm_stats['failed']}명 실패",
+                    f"🔔 **DM 알림**: {dm_targets}명에게 순차 발송 중입니다.",
                     ephemeral=True
                 )
             else:
@@ -2065,55 +2076,34 @@ class DateTimeSelectionView(discord.ui.View):
 
     async def _send_dm_notifications(self, guild: discord.Guild, recruitment_id: str,
                                      embed: discord.Embed, scrim_datetime: datetime) -> dict:
-        """서버 멤버들에게 내전 모집 DM 알림 전송"""
-        success_count = 0
-        failed_count = 0
+        """서버 멤버들에게 내전 모집 DM 알림 전송 (공용 DM 발송기 경유)"""
+        members = [member for member in guild.members if not member.bot]
 
         try:
             print(f"🔔 {guild.name} 서버 멤버들에게 내전 모집 DM 알림 전송을 시작합니다...")
-
-            members = [member for member in guild.members if not member.bot]
             print(f"대상 멤버 수: {len(members)}명 (봇 제외)")
 
             # DM 용 임베드 생성
             dm_embed = await self._create_dm_notification_embed(embed, guild, scrim_datetime)
 
-            import asyncio
-
-            async def send_single_dm(member):
-                nonlocal success_count, failed_count
-                try:
-                    await member.send(embed=dm_embed)
-                    success_count += 1
-                    print(f"✅ {member.display_name}님에게 DM 알림 전송 성공")
-                except discord.Forbidden:
-                    failed_count += 1
-                    print(f"❌ {member.display_name}님에게 DM 알림 전송 실패 (DM 차단)")
-                except discord.HTTPException as e:
-                    failed_count += 1
-                    print(f"❌ {member.display_name}님에게 DM 알림 전송 실패 (HTTP 오류: {str(e)})")
-                except Exception as e:
-                    failed_count += 1
-                    print(f"❌ {member.display_name}님에게 DM 알림 전송 실패 (기타 오류: {str(e)})")
-
-                await asyncio.sleep(0.1)
-
-            tasks = [send_single_dm(member) for member in members]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            stats = await self.bot.dm_dispatcher.send_bulk(
+                guild, 'recruitment_announce', [(member, dm_embed) for member in members]
+            )
 
-            print(f"🔔 DM 알림 전송 완료: 성공 {success_count}명, 실패 {failed_count}명")
+            print(f"🔔 DM 알림 전송 완료 ({recruitment_id}): 성공 {stats['success']}명, 실패 {stats['failed']}명, "
+                  f"DM 차단 {stats['skipped']}명")
 
             return {
-                'success': success_count,
-                'failed': failed_count,
+                'success': stats['success'],
+                'failed': stats['failed'] + stats['skipped'],
                 'total': len(members)
             }
 
         except Exception as e:
             print("❌ DM 알림 전송 중 오류 발생:", str(e))
             return {
-                'success': success_count,
-                'failed': failed_count,
+                'success': 0,
+                'failed': len(members),
                 'total': len(members)
             }
 
@@ -2389,8 +2379,11 @@ class RecruitmentView(discord.ui.View):
                 )
                 return
             
-            # 4. 메시지 업데이트
-            await self._update_recruitment_message(interaction)
+            # 4. 메시지 업데이트 (연속 클릭은 합쳐서 주기적으로 한 번만 수정)
+            await recruitment_refresher.record(
+                self.bot.db_manager, self.recruitment_id, str(interaction.user.id), status,
+                interaction, self, self._build_recruitment_embed
+            )
             
             if status == "joined":
                 status_text = "참가"
@@ -2489,70 +2482,62 @@ class RecruitmentView(discord.ui.View):
                 ephemeral=True
             )
     
-    async def _update_recruitment_message(self, interaction: discord.Interaction):
-        """모집 메시지 업데이트 (참가자 수 실시간 반영, 늦참자 포함)"""
-        try:
-            recruitment = await self.bot.db_manager.get_recruitment_by_id(self.recruitment_id)
-            participants = await self.bot.db_manager.get_recruitment_participants(self.recruitment_id)
-            
-            joined_count = len([p for p in participants if p['status'] == 'joined'])
-            late_join_count = len([p for p in participants if p['status'] == 'late_join']) 
-            declined_count = len([p for p in participants if p['status'] == 'declined'])
-            
-            # 업데이트된 임베드 생성
-            scrim_date = datetime.fromisoformat(recruitment['scrim_date'])
-            deadline = datetime.fromisoformat(recruitment['deadline'])
-            
-            # 상태에 따른 색상 및 텍스트
-            if datetime.now() > deadline:
-                status_text = "🔒 모집 마감"
-                color = 0x666666
-            else:
-                status_text = "🟢 모집 중"
-                color = 0x0099ff
-            
-            embed = discord.Embed(
-                title=f"🎮 {recruitment['title']}",
-                description=f"{recruitment['description']}\n",
-                color=color
-            )
-            
-            embed.add_field(
-                name="📅 내전 일시",
-                value=scrim_date.strftime('%Y년 %m월 %d일 (%A) %H:%M'),
-                inline=True
-            )
-            
-            embed.add_field(
-                name="⏰ 모집 마감",
-                value=deadline.strftime('%Y년 %m월 %d일 (%A) %H:%M'),
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📊 현재 상황",
-                value=status_text,
-                inline=True
-            )
-            
-            # 참가 현황 (시각적 바 포함)
-            participation_bar = self._create_participation_bar(joined_count, late_join_count, declined_count)
-            embed.add_field(
-                name="👥 참가 현황",
-                value=f"✅ **참가**: {joined_count}명\n"
-                    f"⏰ **늦참**: {late_join_count}명\n"
-                    f"❌ **불참**: {declined_count}명\n"
-                    f"{participation_bar}",
-                inline=False
-            )
-            
-            embed.set_footer(text=f"모집 ID: {recruitment['id']} | 버튼을 눌러 참가 의사를 표시하세요!")
-            
-            # 원본 메시지 업데이트
-            await interaction.edit_original_response(embed=embed, view=self)
-            
-        except Exception as e:
-            print(f"❌ 모집 메시지 업데이트 실패: {e}")
+    def _build_recruitment_embed(self, recruitment: dict, counts: Dict[str, int]) -> discord.Embed:
+        """모집 메시지 임베드 생성 (참가자 수 실시간 반영, 늦참자 포함)"""
+        joined_count = counts.get('joined', 0)
+        late_join_count = counts.get('late_join', 0)
+        declined_count = counts.get('declined', 0)
+        
+        # 업데이트된 임베드 생성
+        scrim_date = datetime.fromisoformat(recruitment['scrim_date'])
+        deadline = datetime.fromisoformat(recruitment['deadline'])
+        
+        # 상태에 따른 색상 및 텍스트
+        if datetime.now() > deadline:
+            status_text = "🔒 모집 마감"
+            color = 0x666666
+        else:
+            status_text = "🟢 모집 중"
+            color = 0x0099ff
+        
+        embed = discord.Embed(
+            title=f"🎮 {recruitment['title']}",
+            description=f"{recruitment['description']}\n",
+            color=color
+        )
+        
+        embed.add_field(
+            name="📅 내전 일시",
+            value=scrim_date.strftime('%Y년 %m월 %d일 (%A) %H:%M'),
+            inline=True
+        )
+        
+        embed.add_field(
+            name="⏰ 모집 마감",
+            value=deadline.strftime('%Y년 %m월 %d일 (%A) %H:%M'),
+            inline=True
+        )
+        
+        embed.add_field(
+            name="📊 현재 상황",
+            value=status_text,
+            inline=True
+        )
+        
+        # 참가 현황 (시각적 바 포함)
+        participation_bar = self._create_participation_bar(joined_count, late_join_count, declined_count)
+        embed.add_field(
+            name="👥 참가 현황",
+            value=f"✅ **참가**: {joined_count}명\n"
+                f"⏰ **늦참**: {late_join_count}명\n"
+                f"❌ **불참**: {declined_count}명\n"
+                f"{participation_bar}",
+            inline=False
+        )
+        
+        embed.set_footer(text=f"모집 ID: {recruitment['id']} | 버튼을 눌러 참가 의사를 표시하세요!")
+        
+        return embed
     
     async def _create_updated_embed(self, recruitment: dict, joined_count: int, declined_count: int):
         """업데이트된 임베드 생성"""
@@ -3471,20 +3456,15 @@ class ScrimRecruitmentCommands(commands.Cog):
         if 채널:
             target_channel = 채널
         else:
-            cached_channel_id = self.bot.recruitment_channels_cache.get(str(interaction.guild_id))
-            
-            if cached_channel_id:
-                target_channel = interaction.guild.get_channel(int(cached_channel_id))
-            else:
-                try:
-                    default_channel_id = await self.bot.db_manager.get_recruitment_channel(
-                        str(interaction.guild_id)
-                    )
-                    if default_channel_id:
-                        self.bot.recruitment_channels_cache[str(interaction.guild_id)] = default_channel_id
-                        target_channel = interaction.guild.get_channel(int(default_channel_id))
-                except:
-                    pass
+            # 기본 채널은 db_manager 설정 캐시에서 조회 (설정 변경 시 자동 무효화)
+            try:
+                default_channel_id = await self.bot.db_manager.get_recruitment_channel(
+                    str(interaction.guild_id)
+                )
+                if default_channel_id:
+                    target_channel = interaction.guild.get_channel(int(default_channel_id))
+            except:
+                pass
         
         if not target_channel:
             await interaction.response.send_message(
@@ -3927,6 +3907,7 @@ class ScrimRecruitmentCommands(commands.Cog):
                     "❌ 모집 취소 처리 중 오류가 발생했습니다.", ephemeral=True
                 )
                 return
+            recruitment_refresher.discard(모집id)
 
             # 3. 원본 메시지 업데이트 (취소 표시)
             if recruitment['message_id'] and recruitment['channel_id']:
@@ -547,14 +547,12 @@ class ConfirmCompleteView(discord.ui.View):
                 match_data['match_number'] = match_num
                 match_data['created_by'] = self.session.created_by
                 
-                if not match_data.get('saved_to_db'):
-                    await self.bot.db_manager.save_match_result(match_data)
-                    self.session.matches[match_num]['saved_to_db'] = True
-                
                 completed_match_data.append(match_data)
             
-            # 통계 업데이트
-            await self.bot.db_manager.update_user_statistics(self.guild_id, completed_match_data)
+            # 미저장 경기 저장 + 통계 업데이트 (한 트랜잭션)
+            await self.bot.db_manager.record_matches(self.guild_id, completed_match_data)
+            for match_num in completed_matches:
+                self.session.matches[match_num]['saved_to_db'] = True
             
             # 세션 종료
             if self.guild_id in active_sessions:
@@ -2248,17 +2246,14 @@ class ScrimResultCommands(commands.Cog):
                 match_data['match_number'] = match_num
                 match_data['created_by'] = session.created_by
                 
-                # 개별 매치가 아직 저장되지 않았다면 저장
-                if not match_data.get('saved_to_db'):
-                    await self.bot.db_manager.save_match_result(match_data)
-                    # 세션의 매치 데이터에도 플래그 설정
-                    session.matches[match_num]['saved_to_db'] = True
-                
                 completed_match_data.append(match_data)
                 total_saved += 1
             
-            # 전체 세션 통계 업데이트
-            await self.bot.db_manager.update_user_statistics(guild_id, completed_match_data)
+            # 미저장 경기 저장 + 전체 세션 통계 업데이트 (한 트랜잭션)
+            await self.bot.db_manager.record_matches(guild_id, completed_match_data)
+            for match_num in completed_matches:
+                # 세션의 매치 데이터에도 플래그 설정
+                session.matches[match_num]['saved_to_db'] = True
             
             # 세션 종료
             del active_sessions[guild_id]
@@ -2292,5 +2287,36 @@ class ScrimResultCommands(commands.Cog):
                 f"❌ 완료 처리 중 오류가 발생했습니다: {str(e)}", ephemeral=True
             )
 
+    @app_commands.command(name="페어통계재계산", description="[관리자] 경기 기록으로 동료/상대 전적 통계를 다시 계산합니다")
+    @app_commands.default_permissions(manage_guild=True)
+    async def rebuild_pair_stats(self, interaction: discord.Interaction):
+        """동료/상대 전적 집계 재계산"""
+        if not await self.is_admin(interaction):
+            await interaction.response.send_message(
+                "❌ 이 명령어는 관리자만 사용할 수 있습니다.", ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+
+        try:
+            guild_id = str(interaction.guild_id)
+            counts = await self.bot.db_manager.rebuild_pair_stats(guild_id)
+
+            embed = discord.Embed(
+                title="🔄 동료/상대 전적 재계산 완료",
+                description="저장된 경기 기록을 기준으로 집계를 새로 만들었습니다.",
+                color=0x00ff88
+            )
+            embed.add_field(name="👥 동료 조합", value=f"{counts['teammate_rows']:,}개", inline=True)
+            embed.add_field(name="⚔️ 상대 조합", value=f"{counts['opponent_rows']:,}개", inline=True)
+
+            await interaction.followup.send(embed=embed, ephemeral=True)
+
+        except Exception as e:
+            await interaction.followup.send(
+                f"❌ 재계산 중 오류가 발생했습니다: {str(e)}", ephemeral=True
+            )
+
 async def setup(bot):
     await bot.add_cog(ScrimResultCommands(bot))
\ No newline at end of file
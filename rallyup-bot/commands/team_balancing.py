@@ -194,7 +194,7 @@ class TeamBalancingCommand(commands.Cog):
         
         embed = discord.Embed(
             title="🤖 자동 팀 밸런싱",
-            description="균형잡힌 5vs5 팀을 AI가 자동으로 생성합니다.\n먼저 참가할 10명의 플레이어를 선택해주세요.",
+            description="균형잡힌 5vs5 팀을 AI가 자동으로 생성합니다.\n먼저 참가할 10~16명의 플레이어를 선택해주세요.\n10명을 넘으면 남는 인원은 대기 인원으로 나뉩니다.",
             color=0x0099ff
         )
         
@@ -221,7 +221,7 @@ class TeamBalancingCommand(commands.Cog):
         
         embed.add_field(
             name="💡 사용 방법",
-            value="1️⃣ 드롭다운에서 참가자 10명 선택\n"
+            value="1️⃣ 드롭다운에서 참가자 10~16명 선택\n"
                   "2️⃣ 밸런싱 모드 선택\n"
                   "3️⃣ AI가 계산한 최적 팀 구성 확인\n"
                   "4️⃣ 팀 구성 확정",
@@ -25,9 +25,7 @@ class TeamInfoCommands(commands.Cog):
     async def on_ready(self):
         """봇 시작 시 DB에서 음성 모니터링 설정 로드"""
         try:
-            import aiosqlite
-            
-            async with aiosqlite.connect(self.bot.db_manager.db_path, timeout=30.0) as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT guild_id FROM voice_monitor_settings
                     WHERE enabled = TRUE
@@ -371,11 +369,7 @@ class TeamInfoCommands(commands.Cog):
     async def _save_voice_monitor_setting(self, guild_id: str, enabled: bool):
         """음성 모니터링 설정을 DB에 저장"""
         try:
-            import aiosqlite
-            
-            async with aiosqlite.connect(self.bot.db_manager.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.bot.db_manager.get_connection() as db:
                 # UPSERT (있으면 업데이트, 없으면 삽입)
                 await db.execute('''
                     INSERT INTO voice_monitor_settings (guild_id, enabled)
@@ -511,9 +505,7 @@ class TeamInfoCommands(commands.Cog):
     async def _get_voice_monitor_setting(self, guild_id: str) -> bool:
         """DB에서 음성 모니터링 설정 조회"""
         try:
-            import aiosqlite
-            
-            async with aiosqlite.connect(self.bot.db_manager.db_path, timeout=30.0) as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT enabled FROM voice_monitor_settings
                     WHERE guild_id = ?
@@ -576,41 +568,22 @@ class TeamInfoCommands(commands.Cog):
         return None
     
     async def _collect_members_info(self, guild_id: str, members: List[discord.Member]) -> List[Dict]:
-        """멤버 정보 수집 (공통 메서드)"""
-        members_info = []
+        """멤버 정보 수집 (공통 메서드, 전체 멤버를 한 번에 조회)"""
+        profiles = await self.bot.db_manager.get_member_profiles(
+            guild_id, [str(member.id) for member in members]
+        )
         
+        members_info = []
         for member in members:
-            user_id = str(member.id)
-            battle_tags = await self.bot.db_manager.get_user_battle_tags(guild_id, user_id)
-            tier_info = await self._get_user_tier(guild_id, user_id)
-            
+            profile = profiles.get(str(member.id), {})
             members_info.append({
                 'member': member,
-                'battle_tags': battle_tags,
-                'tier': tier_info
+                'battle_tags': profile.get('battle_tags', []),
+                'tier': profile.get('tier')
             })
         
         return members_info
     
-    async def _get_user_tier(self, guild_id: str, user_id: str) -> Optional[str]:
-        """유저 티어 조회"""
-        try:
-            import aiosqlite
-            
-            async with aiosqlite.connect(self.bot.db_manager.db_path, timeout=30.0) as db:
-                async with db.execute('''
-                    SELECT current_season_tier FROM registered_users
-                    WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
-                ''', (guild_id, user_id)) as cursor:
-                    row = await cursor.fetchone()
-                    if row and row[0]:
-                        return row[0]
-            
-            return None
-        except Exception as e:
-            print(f"❌ 티어 조회 실패: {e}")
-            return None
-    
     def _create_compact_team_embed(
         self, 
         voice_channel: discord.VoiceChannel, 
@@ -930,9 +903,8 @@ class CompactTeamView(discord.ui.View):
         user_id = str(interaction.user.id)
         
         # 등록된 유저인지 확인
-        import aiosqlite
         try:
-            async with aiosqlite.connect(interaction.client.db_manager.db_path, timeout=30.0) as db:
+            async with interaction.client.db_manager.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT user_id FROM registered_users
                     WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
@@ -11,7 +11,11 @@ import time
 import logging
 import glob
 import platform
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, Literal, Set
+
+from utils.opus_audio import OpusPacketSource, encode_ogg_opus
+from utils.tts_audio_cache import TTSAudioCache
+from utils.tts_log_sink import TTSLogSink
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +57,19 @@ class TTSCommands(commands.Cog):
         self.daily_threads_cache: Dict[str, discord.Thread] = {}
         self.session_message_counts: Dict[str, int] = {}
 
+        # 일별 로그 쓰레드 기록은 백그라운드에서 묶어서 전송 (재생 루프는 기다리지 않음)
+        self.log_sink = TTSLogSink(self._get_or_create_daily_log_thread, self._increment_message_count)
+
+        # 파이프라인: 재생 대기 중 미리 합성해 둘 최대 항목 수 (재생 중인 항목 포함)
+        self.tts_prefetch_limit = 3
+        self.tts_pipeline_stats: Dict[str, Dict[str, float]] = {}
+
+        # 자동 TTS 채널 색인: 전용 채널이 아닌 메시지는 on_message 에서 DB 조회/로그 없이 바로 버림
+        # (연결된 음성 채널은 tts_join/_cleanup_channel 이 관리하는 voice_clients 로 확인)
+        self.tts_channel_by_guild: Dict[str, int] = {}
+        self.tts_channel_ids: Set[int] = set()
+        self.tts_channel_index_ready = False
+
         self.korean_voices = {
             '인준': {
                 'voice': 'ko-KR-InJoonNeural',
@@ -250,6 +267,38 @@ class TTSCommands(commands.Cog):
         self.ffmpeg_executable = self._find_ffmpeg()
         self._force_load_opus_linux()
 
+        # 합성 음성 캐시 (자주 나오는 짧은 문구는 재합성 없이 재사용)
+        self.audio_cache = TTSAudioCache(os.path.join(tempfile.gettempdir(), 'rallyup_tts_cache'))
+
+    async def cog_load(self):
+        await self._load_tts_channel_index()
+
+    async def cog_unload(self):
+        # 버퍼에 남은 로그 전송
+        await self.log_sink.close()
+
+    async def _load_tts_channel_index(self):
+        """전체 서버의 TTS 전용 채널을 한 번에 읽어 색인 구성 (실패 시 메시지마다 설정 조회)"""
+        try:
+            channels = await self.bot.db_manager.get_tts_dedicated_channel_ids()
+        except Exception as e:
+            logger.error(f"❌ TTS 전용 채널 색인 로드 실패: {e}")
+            return
+
+        self.tts_channel_by_guild = {guild_id: int(channel_id) for guild_id, channel_id in channels.items()}
+        self.tts_channel_ids = set(self.tts_channel_by_guild.values())
+        self.tts_channel_index_ready = True
+        logger.info(f"📇 TTS 전용 채널 색인: {len(self.tts_channel_ids)}개")
+
+    def _update_tts_channel_index(self, guild_id: str, channel_id: Optional[str]):
+        """전용 채널 설정/해제를 색인에 반영"""
+        previous = self.tts_channel_by_guild.pop(guild_id, None)
+        if previous is not None:
+            self.tts_channel_ids.discard(previous)
+        if channel_id:
+            self.tts_channel_by_guild[guild_id] = int(channel_id)
+            self.tts_channel_ids.add(int(channel_id))
+
     def _find_ffmpeg(self):
         """FFmpeg 경로 찾기 (Linux 서버용)"""
         paths = [
@@ -451,7 +500,7 @@ class TTSCommands(commands.Cog):
         
         try:
             # DB에서 설정 조회
-            async with self.bot.db_manager.get_connection() as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 cursor = await db.execute(
                     'SELECT log_channel_id, enabled FROM tts_log_settings WHERE guild_id = ?',
                     (guild_id,)
@@ -1165,6 +1214,7 @@ class TTSCommands(commands.Cog):
             success = await self.bot.db_manager.set_tts_dedicated_channel(guild_id, None)
             
             if success:
+                self._update_tts_channel_index(guild_id, None)
                 embed = discord.Embed(
                     title="✅ TTS 전용 채널 해제",
                     description="자동 TTS 기능이 비활성화되었습니다.",
@@ -1196,6 +1246,7 @@ class TTSCommands(commands.Cog):
         success = await self.bot.db_manager.set_tts_dedicated_channel(guild_id, channel_id)
         
         if success:
+            self._update_tts_channel_index(guild_id, channel_id)
             embed = discord.Embed(
                 title="✅ TTS 전용 채널 설정 완료",
                 description=f"{채널.mention}에서 자동 TTS가 활성화됩니다.",
@@ -1473,6 +1524,15 @@ class TTSCommands(commands.Cog):
                 voice_client = self.voice_clients[user_channel_id]
                 if voice_client.is_playing():
                     queue_detail += "\n🔊 현재 재생 중"
+            
+            pipeline_stats = self.tts_pipeline_stats.get(user_channel_id)
+            if pipeline_stats and pipeline_stats['played']:
+                played = pipeline_stats['played']
+                queue_detail += (
+                    f"\n⏱️ 평균 합성 {pipeline_stats['synth_time'] / played * 1000:.0f}ms, "
+                    f"평균 공백 {pipeline_stats['stall_time'] / played * 1000:.0f}ms "
+                    f"(공백 발생 {pipeline_stats['stalls']}/{played}회)"
+                )
         
         embed.add_field(
             name=f"{queue_status} 5단계: TTS 큐 상태",
@@ -1480,6 +1540,18 @@ class TTSCommands(commands.Cog):
             inline=False
         )
         
+        # 6. 음성 캐시 상태
+        cache_stats = self.audio_cache.get_stats()
+        embed.add_field(
+            name="💾 음성 캐시",
+            value=f"적중률: {cache_stats['hit_rate']:.1%} "
+                  f"(적중 {cache_stats['hits']} / 미스 {cache_stats['misses']})\n"
+                  f"저장: {cache_stats['entries']}개, "
+                  f"{cache_stats['total_bytes'] / 1024 / 1024:.1f}MB / {cache_stats['max_bytes'] / 1024 / 1024:.0f}MB\n"
+                  f"평균 합성 시간: {cache_stats['avg_synth_ms']}ms",
+            inline=False
+        )
+        
         # 종합 진단
         all_ok = (
             voice_status == "✅" and
@@ -1625,7 +1697,13 @@ class TTSCommands(commands.Cog):
         return connected
 
     async def _process_tts_queue(self, channel_id: str):
-        """TTS 큐를 순차적으로 처리하는 백그라운드 태스크"""
+        """TTS 큐를 처리하는 백그라운드 태스크 (합성/재생 파이프라인)
+        
+        프리페처가 큐에서 요청을 꺼내 최대 tts_prefetch_limit 개까지 미리 합성하고,
+        이 태스크는 합성이 끝난 순서대로 재생만 한다.
+        현재 클립이 재생되는 동안 다음 클립이 합성되므로 메시지 사이 공백이 거의 없다.
+        태스크가 취소되면(/퇴장) 프리페처와 대기 중인 합성도 함께 취소한다.
+        """
         
         channel_info = "Unknown"
         if channel_id in self.voice_clients:
@@ -1635,25 +1713,38 @@ class TTSCommands(commands.Cog):
         
         logger.info(f"🎬 큐 프로세서 시작: {channel_info} (ID: {channel_id})")
         
+        queue = self.tts_queues[channel_id]
+        ready: asyncio.Queue = asyncio.Queue()
+        slots = asyncio.Semaphore(self.tts_prefetch_limit)
+        stats = self.tts_pipeline_stats.setdefault(channel_id, self._new_pipeline_stats())
+        prefetcher = asyncio.create_task(self._prefetch_tts_queue(channel_id, queue, ready, slots))
+        current: Optional[Dict[str, Any]] = None
+        
         try:
             while True:
-                tts_request = await self.tts_queues[channel_id].get()
+                entry = await ready.get()
+                current = entry
                 
                 try:
+                    tts_request = entry['request']
                     user = tts_request['user']
-                    user_id = tts_request.get('user_id')
                     text = tts_request['text']
                     voice = tts_request['voice']
                     channel_name = tts_request.get('channel_name', 'Unknown')
                     request_time = tts_request.get('timestamp', time.time())
                     auto_tts = tts_request.get('auto_tts', False)
                     
-                    voice_info = self.all_voices[voice]
                     logger.info(
                         f"🎵 TTS 처리 시작: {user.display_name} > "
                         f"'{text[:30]}...' @ {channel_name} {'(자동)' if auto_tts else ''}"
                     )
                     
+                    # 합성이 아직 안 끝났으면 대기 (이 시간이 재생 공백)
+                    wait_started = time.perf_counter()
+                    audio = await entry['task']
+                    stall = time.perf_counter() - wait_started
+                    current = None
+                    
                     if channel_id not in self.voice_clients:
                         logger.warning(f"⚠️ VoiceClient 없음, 큐 처리 중단: {channel_id}")
                         break
@@ -1665,14 +1756,12 @@ class TTSCommands(commands.Cog):
                     
                     guild_id = str(voice_client.guild.id)
                     
-                    # TTS 파일 생성 (user_id 전달)
-                    audio_file = await self._create_edge_tts_file(text, guild_id, voice, user_id)
-                    
-                    if not audio_file:
-                        logger.error(f"❌ TTS 파일 생성 실패: {text[:30]}")
+                    if not audio:
+                        logger.error(f"❌ TTS 음성 생성 실패: {text[:30]}")
+                        stats['failed'] += 1
                         
                         # 실패도 로그에 기록
-                        await self._log_to_thread(
+                        self._log_to_thread(
                             channel_id=channel_id,
                             guild_id=guild_id,
                             voice_channel_name=channel_name,
@@ -1686,10 +1775,19 @@ class TTSCommands(commands.Cog):
                         continue
                     
                     # 오디오 재생
-                    success = await self._play_audio_and_wait(voice_client, audio_file, text)
+                    play_started = time.perf_counter()
+                    success = await self._play_audio_and_wait(voice_client, audio, text)
+                    play_elapsed = time.perf_counter() - play_started
                     
-                    # 쓰레드에 기록
-                    await self._log_to_thread(
+                    self._record_pipeline_timing(stats, entry, stall, play_elapsed)
+                    logger.info(
+                        f"⏱️ TTS 단계별 시간: 대기 {entry['queue_wait'] * 1000:.0f}ms, "
+                        f"합성 {entry['synth_time'] * 1000:.0f}ms, 공백 {stall * 1000:.0f}ms, "
+                        f"재생 {play_elapsed * 1000:.0f}ms"
+                    )
+                    
+                    # 쓰레드에 기록 (버퍼에만 넣고 전송은 로그 싱크가 처리)
+                    self._log_to_thread(
                         channel_id=channel_id,
                         guild_id=guild_id,
                         voice_channel_name=channel_name,
@@ -1706,19 +1804,97 @@ class TTSCommands(commands.Cog):
                     else:
                         logger.error(f"❌ TTS 재생 실패: {user.display_name} @ {channel_name}")
                     
-                    self.tts_queues[channel_id].task_done()
-                    await asyncio.sleep(0.5)
-                    
                 except Exception as e:
                     logger.error(f"❌ TTS 처리 중 오류: {e}", exc_info=True)
-                    self.tts_queues[channel_id].task_done()
                     continue
+                finally:
+                    slots.release()
+                    queue.task_done()
                     
         except asyncio.CancelledError:
             logger.info(f"🛑 큐 프로세서 중지: {channel_info}")
             raise
         except Exception as e:
             logger.error(f"❌ 큐 프로세서 오류: {e}", exc_info=True)
+        finally:
+            # 프리페처 및 미리 합성된 항목 정리
+            prefetcher.cancel()
+            try:
+                await prefetcher
+            except (asyncio.CancelledError, Exception):
+                pass
+            
+            pending = [current] if current else []
+            while not ready.empty():
+                pending.append(ready.get_nowait())
+            
+            for entry in pending:
+                task = entry['task']
+                if not task.done():
+                    task.cancel()
+                    stats['cancelled'] += 1
+                elif not task.cancelled() and task.exception() is None:
+                    stats['cancelled'] += 1
+
+    async def _prefetch_tts_queue(self, channel_id: str, queue: asyncio.Queue,
+                                  ready: asyncio.Queue, slots: asyncio.Semaphore):
+        """큐에서 요청을 꺼내 미리 합성 시작 (재생 대기 중인 합성은 최대 slots 개)"""
+        try:
+            while True:
+                await slots.acquire()
+                tts_request = await queue.get()
+                dequeued = time.time()
+                
+                voice_client = self.voice_clients.get(channel_id)
+                guild_id = str(voice_client.guild.id) if voice_client else ''
+                
+                entry = {
+                    'request': tts_request,
+                    'queue_wait': max(0.0, dequeued - tts_request.get('timestamp', dequeued)),
+                    'synth_time': 0.0,
+                }
+                entry['task'] = asyncio.create_task(self._synthesize_for_pipeline(entry, guild_id))
+                await ready.put(entry)
+                
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ TTS 프리페처 오류: {e}", exc_info=True)
+
+    async def _synthesize_for_pipeline(self, entry: Dict[str, Any], guild_id: str) -> Optional[bytes]:
+        """파이프라인용 합성 (합성 시간 기록)"""
+        tts_request = entry['request']
+        started = time.perf_counter()
+        try:
+            return await self._create_edge_tts_audio(
+                tts_request['text'], guild_id, tts_request['voice'], tts_request.get('user_id')
+            )
+        finally:
+            entry['synth_time'] = time.perf_counter() - started
+
+    @staticmethod
+    def _new_pipeline_stats() -> Dict[str, float]:
+        return {
+            'played': 0,
+            'failed': 0,
+            'cancelled': 0,
+            'stalls': 0,
+            'queue_wait': 0.0,
+            'synth_time': 0.0,
+            'stall_time': 0.0,
+            'play_time': 0.0,
+        }
+
+    @staticmethod
+    def _record_pipeline_timing(stats: Dict[str, float], entry: Dict[str, Any], stall: float, play_elapsed: float):
+        stats['played'] += 1
+        stats['queue_wait'] += entry['queue_wait']
+        stats['synth_time'] += entry['synth_time']
+        stats['stall_time'] += stall
+        stats['play_time'] += play_elapsed
+        # 50ms 이상 합성을 기다렸으면 공백이 생긴 것으로 간주
+        if stall >= 0.05:
+            stats['stalls'] += 1
 
     async def _get_or_create_daily_log_thread(self, guild_id: str) -> Optional[discord.Thread]:
         try:
@@ -1735,7 +1911,7 @@ class TTSCommands(commands.Cog):
                 logger.debug(f"📦 캐시에서 일별 쓰레드 발견: {thread.name}")
                 return thread
             
-            async with self.bot.db_manager.get_connection() as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 cursor = await db.execute(
                     'SELECT thread_id FROM tts_daily_threads WHERE guild_id = ? AND date = ?',
                     (guild_id, today)
@@ -1770,7 +1946,7 @@ class TTSCommands(commands.Cog):
                 except discord.HTTPException as e:
                     logger.error(f"⚠️ 쓰레드 fetch 오류: {e}")
             
-            async with self.bot.db_manager.get_connection() as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 cursor = await db.execute(
                     'SELECT log_channel_id, enabled FROM tts_log_settings WHERE guild_id = ?',
                     (guild_id,)
@@ -1880,23 +2056,14 @@ class TTSCommands(commands.Cog):
             logger.error(f"⚠️ 일별 로그 쓰레드 생성 중 예상치 못한 오류: {e}", exc_info=True)
             return None
 
-    async def _increment_message_count(self, guild_id: str):
-        """DB의 메시지 카운트 증가"""
+    async def _increment_message_count(self, guild_id: str, count: int = 1):
+        """DB의 메시지 카운트 증가 (로그 묶음 전송 1회당 1번)"""
         try:
             from datetime import datetime, timezone, timedelta
             kst = timezone(timedelta(hours=9))
             today = datetime.now(kst).strftime('%Y-%m-%d')
             
-            async with self.bot.db_manager.get_connection() as db:
-                await db.execute(
-                    '''
-                    UPDATE tts_daily_threads 
-                    SET message_count = message_count + 1 
-                    WHERE guild_id = ? AND date = ?
-                    ''',
-                    (guild_id, today)
-                )
-                await db.commit()
+            await self.bot.db_manager.add_tts_daily_message_count(guild_id, today, count)
         except Exception as e:
             logger.error(f"⚠️ 메시지 카운트 증가 실패: {e}")
 
@@ -1910,6 +2077,9 @@ class TTSCommands(commands.Cog):
             starter: 세션을 시작한 사용자
         """
         try:
+            # 앞서 쌓인 로그가 구분선보다 먼저 보이도록
+            await self.log_sink.flush(guild_id)
+            
             thread = await self._get_or_create_daily_log_thread(guild_id)
             if not thread:
                 return
@@ -1939,6 +2109,9 @@ class TTSCommands(commands.Cog):
             channel_id: 음성 채널 ID (메시지 카운트 조회용)
         """
         try:
+            # 이 세션의 마지막 로그까지 보낸 뒤 종료 구분선 전송
+            await self.log_sink.flush(guild_id)
+            
             thread = await self._get_or_create_daily_log_thread(guild_id)
             if not thread:
                 return
@@ -1979,7 +2152,7 @@ class TTSCommands(commands.Cog):
         
         try:
             # DB에서 로그 채널 설정 조회
-            async with self.bot.db_manager.get_connection() as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 cursor = await db.execute(
                     'SELECT log_channel_id, enabled FROM tts_log_settings WHERE guild_id = ?',
                     (guild_id,)
@@ -2038,7 +2211,7 @@ class TTSCommands(commands.Cog):
             logger.error(f"⛔ 쓰레드 생성 오류: {e}", exc_info=True)
             return None
 
-    async def _log_to_thread(
+    def _log_to_thread(
         self, 
         channel_id: str,
         guild_id: str,
@@ -2050,13 +2223,8 @@ class TTSCommands(commands.Cog):
         success: bool = True,
         auto_tts: bool = False  # 추가
     ):
+        """일별 로그 쓰레드 기록 예약 (전송과 DB 카운트는 log_sink 가 묶어서 처리)"""
         try:
-            # 일별 쓰레드 가져오기
-            thread = await self._get_or_create_daily_log_thread(guild_id)
-            
-            if not thread:
-                return
-            
             voice_info = self.all_voices.get(voice, {})
             lang = voice_info.get('language', 'ko-KR')
             language_emoji = (
@@ -2088,25 +2256,18 @@ class TTSCommands(commands.Cog):
                     f"<t:{int(request_time)}:T>"
                 )
             
-            await thread.send(log_message)
+            self.log_sink.add(guild_id, log_message)
             
             # 세션별 메시지 카운트 증가
             if channel_id not in self.session_message_counts:
                 self.session_message_counts[channel_id] = 0
             self.session_message_counts[channel_id] += 1
             
-            # DB 전체 메시지 카운트 증가
-            await self._increment_message_count(guild_id)
-            
-        except discord.Forbidden:
-            logger.error(f"⚠️ 쓰레드 쓰기 권한 없음: {guild_id}")
-        except discord.HTTPException as e:
-            logger.error(f"⚠️ 쓰레드 메시지 전송 실패: {e}")
         except Exception as e:
             logger.error(f"⚠️ 쓰레드 기록 오류: {e}", exc_info=True)
 
-    async def _create_edge_tts_file(self, text: str, guild_id: str, voice_override: str = None, user_id: str = None) -> Optional[str]:
-        """Edge TTS 파일 생성 (개인 설정 우선 적용)"""
+    async def _create_edge_tts_audio(self, text: str, guild_id: str, voice_override: str = None, user_id: str = None) -> Optional[bytes]:
+        """Edge TTS 음성 생성 (개인 설정 우선 적용, 재생용 Ogg Opus 바이트 반환)"""
         try:
             # 설정 우선순위:
             # 1순위: voice_override (명령어에서 직접 지정)
@@ -2160,97 +2321,82 @@ class TTSCommands(commands.Cog):
                 logger.error(f"❌ 잘못된 목소리: {selected_voice}")
                 return None
             
-            # 임시 파일 생성
-            temp_dir = tempfile.gettempdir()
-            timestamp = int(time.time() * 1000000)
-            audio_file = os.path.join(temp_dir, f"edge_tts_{guild_id}_{timestamp}.mp3")
-            
-            logger.info(
-                f"🎵 TTS 생성: '{text[:30]}...' "
-                f"(목소리: {selected_voice}, 언어: {voice_config['language']})"
-            )
-            
-            # Edge TTS로 음성 생성
-            communicate = edge_tts.Communicate(
-                text=text,
-                voice=voice_config['voice'],
-                rate=rate,
-                pitch=pitch,
-                volume=volume
-            )
-            
-            await communicate.save(audio_file)
-            
-            if os.path.exists(audio_file) and os.path.getsize(audio_file) > 1000:
-                logger.info(f"✅ TTS 생성 완료 ({selected_voice}, {voice_config['language']})")
-                return audio_file
-            else:
-                logger.error(f"❌ TTS 파일 생성 실패")
-                return None
+            async def synthesize() -> Optional[bytes]:
+                logger.info(
+                    f"🎵 TTS 생성: '{text[:30]}...' "
+                    f"(목소리: {selected_voice}, 언어: {voice_config['language']})"
+                )
+                
+                # Edge TTS로 음성 생성 (MP3 스트림을 파일 없이 메모리로 받음)
+                communicate = edge_tts.Communicate(
+                    text=text,
+                    voice=voice_config['voice'],
+                    rate=rate,
+                    pitch=pitch,
+                    volume=volume
+                )
+                
+                mp3 = bytearray()
+                async for chunk in communicate.stream():
+                    if chunk['type'] == 'audio':
+                        mp3.extend(chunk['data'])
+                
+                if len(mp3) <= 1000:
+                    logger.error(f"❌ TTS 음성 생성 실패")
+                    return None
+                
+                # 재생 때 ffmpeg 를 다시 띄우지 않도록 볼륨까지 적용해 Opus 로 한 번만 변환
+                audio = await encode_ogg_opus(bytes(mp3), self.ffmpeg_executable, volume=1.5)
+                if audio:
+                    logger.info(f"✅ TTS 생성 완료 ({selected_voice}, {voice_config['language']})")
+                return audio
+            
+            # 같은 (텍스트, 목소리, 속도, 피치, 볼륨) 은 캐시된 음성 재사용
+            cache_key = TTSAudioCache.make_key(text, voice_config['voice'], rate, pitch, volume)
+            return await self.audio_cache.get_or_create(cache_key, synthesize)
                 
         except Exception as e:
-            logger.error(f"❌ TTS 파일 생성 실패: {e}", exc_info=True)
+            logger.error(f"❌ TTS 음성 생성 실패: {e}", exc_info=True)
             return None
 
-    async def _play_audio_and_wait(self, voice_client: discord.VoiceClient, audio_file: str, text: str) -> bool:
-        """오디오를 재생하고 완료될 때까지 대기 (큐 시스템용)"""
+    async def _play_audio_and_wait(self, voice_client: discord.VoiceClient, audio: bytes, text: str) -> bool:
+        """오디오를 재생하고 완료될 때까지 대기 (큐 시스템용)
+        
+        합성 때 이미 Opus 로 인코딩해 두었으므로 ffmpeg 없이 패킷을 그대로 전송한다.
+        """
         try:
-            logger.info(f"🔊 오디오 재생 시작: {os.path.basename(audio_file)}")
-            
-            # Linux 서버용 FFmpeg 옵션
-            ffmpeg_options = '-vn -filter:a "volume=1.5"'
+            audio_source = OpusPacketSource.from_ogg(audio)
+            if not audio_source.packets:
+                logger.warning("⏸️ 재생할 오디오 패킷 없음")
+                return False
             
-            # Discord PCM 오디오 소스 생성
-            audio_source = discord.FFmpegPCMAudio(
-                audio_file,
-                executable=self.ffmpeg_executable,
-                options=ffmpeg_options
-            )
+            logger.info(f"🔊 오디오 재생 시작: {audio_source.duration:.1f}초")
             
             # 재생 완료 추적
             play_finished = asyncio.Event()
             play_error = None
+            loop = asyncio.get_running_loop()
             
             def after_play(error):
                 nonlocal play_error
                 if error:
                     play_error = error
                     logger.error(f"⏸️ 재생 오류: {error}")
-                else:
-                    logger.info("✅ 오디오 재생 완료")
-                play_finished.set()
-                
-                # 안전한 파일 정리
-                try:
-                    if self.bot.loop and self.bot.loop.is_running():
-                        asyncio.run_coroutine_threadsafe(
-                            self._cleanup_audio_file(audio_file), 
-                            self.bot.loop
-                        )
-                    else:
-                        try:
-                            if os.path.exists(audio_file):
-                                os.remove(audio_file)
-                                logger.info(f"🗑️ 동기 파일 삭제: {os.path.basename(audio_file)}")
-                        except Exception as sync_error:
-                            logger.error(f"⏸️ 동기 파일 삭제 오류: {sync_error}")
-                except Exception as cleanup_error:
-                    logger.error(f"⚠️ 파일 정리 실패: {cleanup_error}")
+                # 플레이어 스레드에서 호출되므로 이벤트 루프로 넘겨서 설정
+                loop.call_soon_threadsafe(play_finished.set)
             
             # 재생 시작
             voice_client.play(audio_source, after=after_play)
             
-            # 재생 시작 확인
+            # 재생 시작 확인 (0.5초보다 짧은 클립은 이미 끝났을 수 있음)
             await asyncio.sleep(0.5)
-            if not voice_client.is_playing():
+            if not voice_client.is_playing() and not play_finished.is_set():
                 logger.warning("⏸️ 재생이 시작되지 않음")
                 return False
             
-            logger.info("🎵 오디오 재생 중...")
-            
-            # 재생 완료 대기 (최대 30초)
+            # 재생 완료 대기 (클립 길이 + 여유, 최소 30초)
             try:
-                await asyncio.wait_for(play_finished.wait(), timeout=30.0)
+                await asyncio.wait_for(play_finished.wait(), timeout=max(30.0, audio_source.duration + 10.0))
                 success = play_error is None
                 
                 if success:
@@ -2277,83 +2423,6 @@ class TTSCommands(commands.Cog):
         bot_permissions = channel.permissions_for(channel.guild.me)
         return bot_permissions.send_messages and bot_permissions.embed_links
 
-    async def _play_audio_fixed(self, voice_client: discord.VoiceClient, audio_file: str, text: str) -> bool:
-        """Linux 서버용 오디오 재생"""
-        try:
-            logger.info(f"🔊 Linux 서버 오디오 재생 시작: {os.path.basename(audio_file)}")
-            
-            # Linux 서버용 FFmpeg 옵션
-            ffmpeg_options = '-vn -filter:a "volume=1.5"'
-            
-            # Discord PCM 오디오 소스 생성
-            audio_source = discord.FFmpegPCMAudio(
-                audio_file,
-                executable=self.ffmpeg_executable,
-                options=ffmpeg_options
-            )
-            
-            # 재생 완료 추적
-            play_finished = asyncio.Event()
-            play_error = None
-            
-            def after_play(error):
-                nonlocal play_error
-                if error:
-                    play_error = error
-                    logger.error(f"⌛ 재생 오류: {error}")
-                else:
-                    logger.info("✅ 오디오 재생 완료")
-                play_finished.set()
-                
-                # 안전한 파일 정리
-                try:
-                    if self.bot.loop and self.bot.loop.is_running():
-                        asyncio.run_coroutine_threadsafe(
-                            self._cleanup_audio_file(audio_file), 
-                            self.bot.loop
-                        )
-                    else:
-                        try:
-                            if os.path.exists(audio_file):
-                                os.remove(audio_file)
-                                logger.info(f"🗑️ 동기 파일 삭제: {os.path.basename(audio_file)}")
-                        except Exception as sync_error:
-                            logger.error(f"⌛ 동기 파일 삭제 오류: {sync_error}")
-                except Exception as cleanup_error:
-                    logger.error(f"⚠️ 파일 정리 실패: {cleanup_error}")
-            
-            # 재생 시작
-            voice_client.play(audio_source, after=after_play)
-            
-            # 재생 시작 확인
-            await asyncio.sleep(0.5)
-            if not voice_client.is_playing():
-                logger.warning("⌛ 재생이 시작되지 않음")
-                return False
-            
-            logger.info("🎵 오디오 재생 중...")
-            
-            # 재생 완료 대기
-            try:
-                await asyncio.wait_for(play_finished.wait(), timeout=30.0)
-                success = play_error is None
-                
-                if success:
-                    logger.info("✅ 오디오 재생 성공")
-                else:
-                    logger.error(f"⌛ 재생 중 오류: {play_error}")
-                
-                return success
-                
-            except asyncio.TimeoutError:
-                logger.warning("⚠️ 재생 타임아웃")
-                voice_client.stop()
-                return False
-            
-        except Exception as e:
-            logger.error(f"⌛ 오디오 재생 실패: {e}", exc_info=True)
-            return False
-
     def _is_emoji_only(self, text: str) -> bool:
         """텍스트가 이모지만 포함하는지 확인"""
         import re
@@ -2407,16 +2476,6 @@ class TTSCommands(commands.Cog):
             return member.voice.channel
         return None
 
-    async def _cleanup_audio_file(self, audio_file: str):
-        """오디오 파일 비동기 정리"""
-        try:
-            await asyncio.sleep(1)
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-                logger.info(f"🗑️ 비동기 파일 삭제: {os.path.basename(audio_file)}")
-        except Exception as e:
-            logger.error(f"⌛ 비동기 파일 삭제 오류: {e}")
-
     async def _cleanup_channel(self, channel_id: str):
         """특정 채널의 모든 리소스 정리"""
         try:
@@ -2441,6 +2500,7 @@ class TTSCommands(commands.Cog):
             # 큐 정리
             if channel_id in self.tts_queues:
                 del self.tts_queues[channel_id]
+            self.tts_pipeline_stats.pop(channel_id, None)
             
             # 세션 종료 로그
             if guild_id:
@@ -2469,6 +2529,10 @@ class TTSCommands(commands.Cog):
         """
         TTS 전용 채널에서 자동 TTS 처리
         """
+        # 빠른 거절: 전용 채널이 아닌 메시지는 집합 조회 한 번으로 끝 (DB/로그 없음)
+        if self.tts_channel_index_ready and message.channel.id not in self.tts_channel_ids:
+            return
+
         # 기본 필터링
         if not message.guild:
             return
@@ -2479,68 +2543,36 @@ class TTSCommands(commands.Cog):
         guild_id = str(message.guild.id)
         channel_id = str(message.channel.id)
         
-        # 🔍 디버그 1: 메시지 수신 확인
-        logger.info(f"📩 [TTS-AUTO] 메시지 수신: '{message.content[:50]}' from {message.author.name} in #{message.channel.name}")
-        
-        # TTS 전용 채널 설정 조회
+        # TTS 전용 채널 설정 조회 (필터 옵션용, 설정 캐시)
         settings = await self.bot.db_manager.get_tts_channel_settings(guild_id)
         
-        # 🔍 디버그 2: 설정 확인
-        logger.info(f"⚙️ [TTS-AUTO] TTS 채널 설정: {settings}")
-        
         if not settings or not settings.get('channel_id'):
-            logger.info(f"❌ [TTS-AUTO] TTS 전용 채널 미설정 - 서버: {message.guild.name}")
             return  # 전용 채널 미설정
         
-        # 🔍 디버그 3: 채널 ID 비교
-        logger.info(f"🔍 [TTS-AUTO] 현재 채널: {channel_id}, 설정된 채널: {settings['channel_id']}, 일치: {settings['channel_id'] == channel_id}")
-        
-        # 전용 채널이 아니면 무시
+        # 전용 채널이 아니면 무시 (색인 로드 실패 시에만 여기까지 옴)
         if settings['channel_id'] != channel_id:
-            logger.debug(f"[TTS-AUTO] 다른 채널의 메시지 (무시) - #{message.channel.name}")
             return
         
-        logger.info(f"✅ [TTS-AUTO] TTS 전용 채널 확인됨: #{message.channel.name}")
-        
         # 메시지 필터링 체크
         should_process, reason = self._should_process_auto_tts(message, settings)
         
-        # 🔍 디버그 4: 필터링 결과
-        logger.info(f"🔍 [TTS-AUTO] 필터링 결과: {should_process}, 사유: {reason}")
-        
         if not should_process:
-            logger.info(f"🚫 [TTS-AUTO] 자동 TTS 스킵: {reason} - '{message.content[:20]}'")
+            logger.debug(f"🚫 [TTS-AUTO] 자동 TTS 스킵: {reason} - '{message.content[:20]}'")
             return
         
-        logger.info(f"✅ [TTS-AUTO] 필터링 통과: '{message.content[:30]}'")
-        
         # 사용자가 음성 채널에 있는지 확인
         user_voice_channel = await self._get_user_voice_channel(message.guild, str(message.author.id))
         
-        # 🔍 디버그 5: 사용자 음성 채널 확인
-        if user_voice_channel:
-            logger.info(f"✅ [TTS-AUTO] 사용자 음성 채널: {user_voice_channel.name} (ID: {user_voice_channel.id})")
-        else:
-            logger.warning(f"❌ [TTS-AUTO] 사용자가 음성 채널에 없음: {message.author.name}")
-            logger.warning(f"   ⚠️ 해결방법: 사용자가 먼저 음성 채널에 입장해야 합니다!")
-        
         if not user_voice_channel:
             # 조용히 무시 (사용자가 음성 채널에 없음)
+            logger.debug(f"[TTS-AUTO] 사용자가 음성 채널에 없음: {message.author.name}")
             return
         
         user_channel_id = str(user_voice_channel.id)
         
-        # 🔍 디버그 6: 봇 연결 상태 확인
-        logger.info(f"🔍 [TTS-AUTO] 현재 봇이 연결된 채널들: {list(self.voice_clients.keys())}")
-        logger.info(f"🔍 [TTS-AUTO] 사용자가 있는 채널 ID: {user_channel_id}")
-        logger.info(f"🔍 [TTS-AUTO] 봇이 사용자 채널에 연결됨: {user_channel_id in self.voice_clients}")
-        
         # 해당 음성 채널에 봇이 연결되어 있는지 확인
         if user_channel_id not in self.voice_clients:
-            logger.warning(f"❌ [TTS-AUTO] 봇이 사용자 채널에 연결되지 않음")
-            logger.warning(f"   ⚠️ 사용자 채널: {user_voice_channel.name} (ID: {user_channel_id})")
-            logger.warning(f"   ⚠️ 봇이 연결된 채널: {[self.voice_clients[cid].channel.name for cid in self.voice_clients.keys()] if self.voice_clients else '없음'}")
-            logger.warning(f"   ⚠️ 해결방법: 사용자가 있는 채널에서 `/입장` 명령어를 사용하세요!")
+            logger.debug(f"[TTS-AUTO] 봇이 사용자 채널에 연결되지 않음: {user_voice_channel.name}")
             
             # 봇이 연결되지 않음 - 안내 메시지
             embed = discord.Embed(
@@ -2551,26 +2583,20 @@ class TTSCommands(commands.Cog):
             await message.channel.send(embed=embed, delete_after=5)
             return
         
-        logger.info(f"✅ [TTS-AUTO] 봇이 사용자 채널에 연결되어 있음!")
-        
         voice_client = self.voice_clients[user_channel_id]
         
         if not voice_client.is_connected():
             logger.warning(f"❌ [TTS-AUTO] 봇 연결이 끊어짐")
             return
         
-        logger.info(f"✅ [TTS-AUTO] 봇 음성 연결 정상")
-        
         # TTS 큐에 추가
         text = message.content.strip()
         user_id = str(message.author.id)
         
-        # 개인 설정 조회 (목소리 결정용)
+        # 개인 설정 조회 (목소리 결정용, 유저별 캐시)
         preference = await self.bot.db_manager.get_user_tts_preference(guild_id, user_id)
         selected_voice = preference['voice'] if preference else self.tts_settings.get(guild_id, {}).get('voice', '인준')
         
-        logger.info(f"🎤 [TTS-AUTO] 선택된 목소리: {selected_voice}")
-        
         tts_request = {
             'user': message.author,
             'user_id': user_id,
@@ -2585,12 +2611,9 @@ class TTSCommands(commands.Cog):
         await self.tts_queues[user_channel_id].put(tts_request)
         queue_size = self.tts_queues[user_channel_id].qsize()
         
-        logger.info(f"✅ [TTS-AUTO] TTS 큐에 추가 완료: 대기열 {queue_size}번째")
-        
         # 반응 추가 (처리 중 표시)
         try:
             await message.add_reaction('🎵')
-            logger.info(f"✅ [TTS-AUTO] 메시지에 반응 추가 완료")
         except discord.Forbidden:
             logger.warning(f"⚠️ [TTS-AUTO] 반응 추가 권한 없음")
             pass
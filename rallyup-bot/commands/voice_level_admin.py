@@ -22,7 +22,7 @@ class VoiceLevelAdmin(commands.Cog):
         user_id = str(interaction.user.id)
         
         # admin_system에 있는 메서드 사용
-        async with self.db.get_connection() as db:
+        async with self.db.get_connection(readonly=True) as db:
             cursor = await db.execute('''
                 SELECT id FROM server_admins 
                 WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
@@ -264,7 +264,7 @@ class VoiceLevelAdmin(commands.Cog):
             settings = await self.db.get_voice_level_settings(guild_id)
             
             # 통계 조회
-            async with self.db.get_connection() as db:
+            async with self.db.get_connection(readonly=True) as db:
                 # 활성 세션 수
                 cursor = await db.execute('''
                     SELECT COUNT(*) FROM voice_sessions
@@ -449,7 +449,7 @@ class VoiceLevelAdmin(commands.Cog):
             fixed = []
             
             # 1. 유령 세션 체크 (DB에는 있지만 실제로는 없음)
-            async with self.db.get_connection() as db:
+            async with self.db.get_connection(readonly=True) as db:
                 cursor = await db.execute('''
                     SELECT session_uuid, user_id, channel_id
                     FROM voice_sessions
@@ -499,15 +499,14 @@ class VoiceLevelAdmin(commands.Cog):
                             guild_id, user_id, str(voice_channel.id), is_muted
                         )
                         
-                        # 메모리 캐시에도 추가
-                        if self.bot.voice_level_tracker:
-                            session_key = (guild_id, user_id)
-                            self.bot.voice_level_tracker.active_sessions[session_key] = session_uuid
-                        
                         fixed.append(f"✅ 세션 생성: {member.mention}")
             
+            # 고친 DB 세션 기준으로 메모리 접속 현황 재구성
+            if fixed and self.bot.voice_level_tracker:
+                await self.bot.voice_level_tracker.reload_presence(interaction.guild)
+            
             # 3. 음수 시간 체크
-            async with self.db.get_connection() as db:
+            async with self.db.get_connection(readonly=True) as db:
                 cursor = await db.execute('''
                     SELECT user1_id, user2_id, total_time_seconds
                     FROM user_relationships
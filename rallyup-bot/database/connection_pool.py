@@ -0,0 +1,287 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+
+class _Lease:
+    """태스크가 현재 대여 중인 연결 정보"""
+
+    __slots__ = ('conn', 'is_writer', 'depth')
+
+    def __init__(self, conn: aiosqlite.Connection, is_writer: bool):
+        self.conn = conn
+        self.is_writer = is_writer
+        self.depth = 1
+
+
+class ConnectionPool:
+    """aiosqlite 장기 연결 풀 (WAL 모드: writer 1개 + reader N개)
+
+    - writer 연결은 Lock 으로 직렬화되어 한 번에 한 태스크만 사용
+    - reader 연결은 최대 reader_size 개까지 지연 생성되어 재사용
+    - 같은 태스크 안에서 중첩 대여 시 이미 잡고 있는 연결을 재사용 (데드락 방지)
+    - PRAGMA 는 연결 생성 시 한 번만 적용
+    - 연결이 유지되므로 sqlite3 statement cache 에 준비된 쿼리가 계속 남는다
+    """
+
+    COMMON_PRAGMAS = (
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA cache_size=10000',
+        'PRAGMA temp_store=memory',
+        'PRAGMA busy_timeout=30000',
+    )
+
+    def __init__(
+        self,
+        db_path: str,
+        reader_size: int = 4,
+        timeout: float = 30.0,
+        cached_statements: int = 256
+    ):
+        self.db_path = db_path
+        self.reader_size = max(1, reader_size)
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._writer_lock = asyncio.Lock()
+
+        self._idle_readers: List[aiosqlite.Connection] = []
+        self._reader_count = 0
+        self._reader_cond = asyncio.Condition()
+
+        self._leases: Dict[asyncio.Task, List[_Lease]] = {}
+        self._closed = False
+
+        self._stats = {
+            'reader': {'acquired': 0, 'waiting': 0, 'total_wait': 0.0, 'max_wait': 0.0},
+            'writer': {'acquired': 0, 'waiting': 0, 'total_wait': 0.0, 'max_wait': 0.0},
+            'reentrant': 0,
+            'fallback': 0,
+            'rollbacks': 0,
+            'opened': 0,
+        }
+
+    async def _open(self, readonly: bool) -> aiosqlite.Connection:
+        """새 연결 생성 및 PRAGMA 적용"""
+        conn = await aiosqlite.connect(
+            self.db_path, timeout=self.timeout, cached_statements=self.cached_statements
+        )
+        try:
+            if not readonly:
+                await conn.execute('PRAGMA journal_mode=WAL')
+            for pragma in self.COMMON_PRAGMAS:
+                await conn.execute(pragma)
+            if readonly:
+                await conn.execute('PRAGMA query_only=ON')
+        except Exception:
+            await conn.close()
+            raise
+
+        self._stats['opened'] += 1
+        return conn
+
+    def _record_wait(self, kind: str, started: float):
+        stats = self._stats[kind]
+        waited = time.perf_counter() - started
+        stats['acquired'] += 1
+        stats['total_wait'] += waited
+        if waited > stats['max_wait']:
+            stats['max_wait'] = waited
+
+    async def _acquire_writer(self) -> aiosqlite.Connection:
+        started = time.perf_counter()
+        self._stats['writer']['waiting'] += 1
+        try:
+            await self._writer_lock.acquire()
+        finally:
+            self._stats['writer']['waiting'] -= 1
+
+        try:
+            if self._writer is None:
+                self._writer = await self._open(readonly=False)
+        except Exception:
+            self._writer_lock.release()
+            raise
+
+        self._record_wait('writer', started)
+        return self._writer
+
+    async def _release_writer(self, conn: aiosqlite.Connection):
+        try:
+            if not await self._reset(conn):
+                self._writer = None
+            elif self._closed:
+                await conn.close()
+                self._writer = None
+        finally:
+            self._writer_lock.release()
+
+    async def _acquire_reader(self) -> aiosqlite.Connection:
+        started = time.perf_counter()
+        async with self._reader_cond:
+            self._stats['reader']['waiting'] += 1
+            try:
+                while not self._idle_readers and self._reader_count >= self.reader_size:
+                    await self._reader_cond.wait()
+            finally:
+                self._stats['reader']['waiting'] -= 1
+
+            if self._idle_readers:
+                self._record_wait('reader', started)
+                return self._idle_readers.pop()
+            self._reader_count += 1
+
+        try:
+            conn = await self._open(readonly=True)
+        except Exception:
+            async with self._reader_cond:
+                self._reader_count -= 1
+                self._reader_cond.notify()
+            raise
+
+        self._record_wait('reader', started)
+        return conn
+
+    async def _release_reader(self, conn: aiosqlite.Connection):
+        healthy = await self._reset(conn)
+        if healthy and self._closed:
+            await conn.close()
+            healthy = False
+
+        async with self._reader_cond:
+            if healthy:
+                self._idle_readers.append(conn)
+            else:
+                self._reader_count -= 1
+            self._reader_cond.notify()
+
+    async def _reset(self, conn: aiosqlite.Connection) -> bool:
+        """반납 전 연결 상태 정리 (커밋되지 않은 트랜잭션 롤백)"""
+        try:
+            if conn.in_transaction:
+                await conn.rollback()
+                self._stats['rollbacks'] += 1
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ 풀 연결 정리 실패, 연결 폐기: {e}")
+            try:
+                await conn.close()
+            except Exception:
+                pass
+            return False
+
+    @asynccontextmanager
+    async def connection(self, readonly: bool = False):
+        """풀에서 연결 대여
+
+        Args:
+            readonly: True 면 reader 연결, False 면 writer 연결
+        """
+        if self._closed:
+            # 종료 이후 늦게 들어온 호출은 기존처럼 일회성 연결로 처리
+            self._stats['fallback'] += 1
+            async with aiosqlite.connect(self.db_path, timeout=self.timeout) as conn:
+                yield conn
+            return
+
+        task = asyncio.current_task()
+        stack = self._leases.get(task) if task is not None else None
+
+        # 같은 태스크가 이미 연결을 잡고 있으면 재사용
+        if stack:
+            top = stack[-1]
+            if top.is_writer or readonly:
+                top.depth += 1
+                self._stats['reentrant'] += 1
+                try:
+                    yield top.conn
+                finally:
+                    top.depth -= 1
+                return
+
+        if readonly:
+            conn = await self._acquire_reader()
+        else:
+            conn = await self._acquire_writer()
+
+        lease = _Lease(conn, is_writer=not readonly)
+        if task is not None:
+            self._leases.setdefault(task, []).append(lease)
+
+        try:
+            yield conn
+        finally:
+            if task is not None:
+                stack = self._leases.get(task)
+                if stack:
+                    stack.pop()
+                    if not stack:
+                        del self._leases[task]
+
+            if readonly:
+                await self._release_reader(conn)
+            else:
+                await self._release_writer(conn)
+
+    def held_writer(self) -> Optional[aiosqlite.Connection]:
+        """현재 태스크가 writer 연결을 잡고 있으면 그 연결 반환"""
+        task = asyncio.current_task()
+        stack = self._leases.get(task) if task is not None else None
+        if stack and stack[-1].is_writer:
+            return stack[-1].conn
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 크기 및 대기 시간 메트릭"""
+        def summarize(kind: str) -> Dict[str, Any]:
+            stats = self._stats[kind]
+            acquired = stats['acquired']
+            return {
+                'acquired': acquired,
+                'waiting': stats['waiting'],
+                'avg_wait_ms': round(stats['total_wait'] / acquired * 1000, 3) if acquired else 0.0,
+                'max_wait_ms': round(stats['max_wait'] * 1000, 3),
+            }
+
+        return {
+            'reader_size': self.reader_size,
+            'readers_open': self._reader_count,
+            'readers_idle': len(self._idle_readers),
+            'readers_in_use': self._reader_count - len(self._idle_readers),
+            'writer_open': self._writer is not None,
+            'writer_in_use': self._writer_lock.locked(),
+            'reader': summarize('reader'),
+            'writer': summarize('writer'),
+            'reentrant': self._stats['reentrant'],
+            'fallback': self._stats['fallback'],
+            'rollbacks': self._stats['rollbacks'],
+            'connections_opened': self._stats['opened'],
+        }
+
+    async def close(self):
+        """모든 풀 연결 종료"""
+        self._closed = True
+
+        async with self._writer_lock:
+            if self._writer is not None:
+                await self._writer.close()
+                self._writer = None
+
+        async with self._reader_cond:
+            idle, self._idle_readers = self._idle_readers, []
+            self._reader_count -= len(idle)
+
+        for conn in idle:
+            try:
+                await conn.close()
+            except Exception as e:
+                logger.warning(f"⚠️ reader 연결 종료 실패: {e}")
+
+        logger.info("🔌 데이터베이스 연결 풀 종료")
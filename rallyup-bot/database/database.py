@@ -6,46 +6,133 @@ from typing import Any, Dict, List, Optional, Tuple
 from utils.time_utils import TimeUtils
 
 import discord
+from database.connection_pool import ConnectionPool
+from database.member_profile_cache import MemberProfileCache
+from database.migrations import MigrationRunner
+from database.query_registry import HOT_QUERIES, QueryRegistry
+from database.settings_cache import SettingsCache
+from database.write_queue import WriteBatcher
 from database.models import BestPairSummary, ClanScrim, ClanTeam, ScrimRecruitment, TeamWinrateAnalysis, TeammatePairStats, User, Match, Participant, UserMatchup, WordleAttempt, WordleGame, WordleGuess, WordleRating
 import uuid
 import asyncio
+from contextlib import asynccontextmanager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class DatabaseManager:
-    def __init__(self, db_path: str = "database/rallyup.db"):
+    def __init__(
+        self,
+        db_path: str = "database/rallyup.db",
+        reader_pool_size: int = 4,
+        write_flush_interval: float = 0.05,
+        write_batch_size: int = 500
+    ):
         self.db_path = db_path
+        self.pool = ConnectionPool(db_path, reader_size=reader_pool_size)
+        self.write_queue = WriteBatcher(
+            self.pool, flush_interval=write_flush_interval, max_batch=write_batch_size
+        )
+        self.queries = QueryRegistry(HOT_QUERIES)
+        self.settings_cache = SettingsCache()
+        self.member_profiles = MemberProfileCache()
+        self.migrations = MigrationRunner()
+        # 봇이 DeadlineScheduler 를 연결하면 마감 시각이 있는 행의 생성/마감/취소를 바로 알린다
+        self.deadline_scheduler = None
+
+    def get_connection(self, readonly: bool = False):
+        """풀에서 데이터베이스 연결 대여 (async with 로 사용)
+
+        Args:
+            readonly: 조회 전용이면 True (reader 연결 사용)
+        """
+        return self.pool.connection(readonly=readonly)
+
+    @staticmethod
+    @asynccontextmanager
+    async def _atomic(db, name: str):
+        """블록을 원자적으로 실행 (commit 은 가장 바깥 트랜잭션 소유자가 수행)
+
+        호출 태스크가 이미 writer 에서 트랜잭션을 열어 둔 상태면 BEGIN 이 실패하므로
+        write_queue 와 같이 SAVEPOINT 로만 감싼다.
+        """
+        if db.in_transaction:
+            await db.execute(f'SAVEPOINT {name}')
+            try:
+                yield db
+            except BaseException:
+                await db.execute(f'ROLLBACK TO {name}')
+                await db.execute(f'RELEASE {name}')
+                raise
+            await db.execute(f'RELEASE {name}')
+            return
+
+        await db.execute('BEGIN')
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+        await db.commit()
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """연결 풀 크기 및 대기 시간 메트릭"""
+        return self.pool.get_stats()
+
+    def get_write_queue_stats(self) -> Dict[str, Any]:
+        """쓰기 병합 큐 메트릭"""
+        return self.write_queue.get_stats()
+
+    def get_query_stats(self) -> List[Dict[str, Any]]:
+        """등록된 핫 쿼리별 호출 수 및 지연 히스토그램"""
+        return self.queries.get_stats()
+
+    def get_settings_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """길드 설정 캐시 적중률 통계"""
+        return self.settings_cache.get_stats()
+
+    def get_member_profile_cache_stats(self) -> Dict[str, int]:
+        """멤버 프로필 캐시 적중률 통계"""
+        return self.member_profiles.get_stats()
 
-    def get_connection(self):
-        """데이터베이스 연결 반환"""
-        return aiosqlite.connect(self.db_path)
+    def _schedule_deadline(self, kind: str, key: str, when, naive_utc: bool = False):
+        """마감 스케줄러에 항목 등록/변경 (커밋 후 호출, 스케줄러가 없으면 무시)"""
+        if self.deadline_scheduler is None or not when:
+            return
+        try:
+            self.deadline_scheduler.schedule(kind, key, TimeUtils.to_timestamp(when, naive_utc))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"⚠️ 마감 시각 해석 실패 ({kind}: {key}, {when}): {e}")
+
+    def _cancel_deadline(self, kind: str, key: str):
+        """마감 스케줄러에서 항목 제거"""
+        if self.deadline_scheduler is not None:
+            self.deadline_scheduler.cancel(kind, key)
+
+    async def close(self):
+        """쓰기 큐를 비우고 연결 풀 종료"""
+        await self.write_queue.close()
+        await self.pool.close()
 
     def generate_uuid(self) -> str:
         """UUID 생성"""
         return str(uuid.uuid4())
     
     async def initialize(self):
-        """데이터베이스 초기화"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            await db.execute('PRAGMA synchronous=NORMAL') 
-            await db.execute('PRAGMA cache_size=10000')
-            await db.execute('PRAGMA temp_store=memory')
-            await db.execute('PRAGMA busy_timeout=30000')
+        """데이터베이스 초기화 (미적용 스키마 마이그레이션 실행 후 핫 쿼리 실행 계획 검사)"""
+        async with self.get_connection() as db:
+            await self.migrations.migrate(self, db)
 
-            await self.initialize_clan_tables()
-            await self.initialize_server_settings_tables()
-            await self.create_bamboo_tables()
-            await self.initialize_wordle_tables()
-            await self.create_inter_guild_scrim_tables()
-            await self.initialize_voice_level_tables()
-            await self.create_scrim_settings_table()
-            await self.create_auto_schedule_tables()
-            await self.create_inquiry_tables()
-            await self.create_consultation_tables()
-            await self.initialize_event_system_tables()
+            violations = await self.migrations.check_query_plans(db, self.queries)
+            for name, scans in violations.items():
+                logger.warning(f"⚠️ 인덱스를 사용하지 않는 쿼리: {name} {scans}")
+
+    async def create_baseline_schema(self):
+        """마이그레이션 도입 이전 스키마 (database/migrations.py 의 버전 1)
 
+        새 테이블/컬럼/인덱스는 여기에 추가하지 말고 MIGRATIONS 에 새 버전으로 추가한다.
+        """
+        async with self.get_connection() as db:
             # users 테이블
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS users (
@@ -467,11 +554,22 @@ class DatabaseManager:
 
             await db.commit()
 
+            # 기능별 테이블 (일부는 위의 server_admins 등을 참조하므로 기본 테이블 다음에 생성)
+            await self.initialize_clan_tables()
+            await self.initialize_server_settings_tables()
+            await self.create_bamboo_tables()
+            await self.initialize_wordle_tables()
+            await self.create_inter_guild_scrim_tables()
+            await self.initialize_voice_level_tables()
+            await self.create_scrim_settings_table()
+            await self.create_auto_schedule_tables()
+            await self.create_inquiry_tables()
+            await self.create_consultation_tables()
+            await self.initialize_event_system_tables()
+
     async def initialize_event_system_tables(self):
         """이벤트 시스템 테이블 초기화"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 1. 팀 정보 테이블
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS event_teams (
@@ -643,9 +741,7 @@ class DatabaseManager:
 
     async def create_auto_schedule_tables(self):
         """정기 내전 자동 스케줄 테이블 생성"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS scrim_auto_schedules (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -691,9 +787,7 @@ class DatabaseManager:
 
     async def create_consultation_tables(self):
         """1:1 상담 관련 테이블 생성"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 1:1 상담 테이블
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS consultations (
@@ -744,9 +838,7 @@ class DatabaseManager:
 
     async def create_inquiry_tables(self):
         """문의 시스템 관련 테이블 생성"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 문의/티켓 메인 테이블
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS inquiries (
@@ -844,9 +936,7 @@ class DatabaseManager:
 
     async def initialize_voice_level_tables(self):
         """음성 레벨 시스템 테이블 초기화"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 음성 세션 테이블
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS voice_sessions (
@@ -952,9 +1042,7 @@ class DatabaseManager:
 
     async def initialize_clan_tables(self):
         """클랜전 관련 테이블 초기화"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 클랜 팀 테이블
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS clan_teams (
@@ -1059,9 +1147,7 @@ class DatabaseManager:
 
     async def create_scrim_settings_table(self):
         """내전 설정 테이블 생성 (채널 설정, 자동 스케줄링 등)"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS scrim_settings (
                     guild_id TEXT PRIMARY KEY,
@@ -1085,9 +1171,7 @@ class DatabaseManager:
 
     async def initialize_server_settings_tables(self):
         """서버 설정 테이블 초기화"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 서버 설정 테이블 생성
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS server_settings (
@@ -1111,9 +1195,7 @@ class DatabaseManager:
 
     async def create_bamboo_tables(self):
         """대나무숲 관련 테이블 생성"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 대나무숲 메시지 테이블
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS bamboo_messages (
@@ -1189,10 +1271,7 @@ class DatabaseManager:
     
     async def get_or_create_user(self, discord_id: str, username: str) -> User:
         """유저 정보 가져오기 또는 생성 (별도 연결용)"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            await db.execute('PRAGMA busy_timeout=30000')
-            
+        async with self.get_connection() as db:
             await self.get_or_create_user_in_transaction(db, discord_id, username)
             await db.commit()
             
@@ -1233,10 +1312,7 @@ class DatabaseManager:
         
         for attempt in range(3):
             try:
-                async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                    await db.execute('PRAGMA journal_mode=WAL')
-                    await db.execute('PRAGMA busy_timeout=30000')
-                    
+                async with self.get_connection() as db:
                     # 활성 세션 확인
                     session_id = None
                     match_number = 1
@@ -1337,10 +1413,7 @@ class DatabaseManager:
         """새 내전 세션 생성"""
         session_uuid = str(uuid.uuid4())
         
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            await db.execute('PRAGMA busy_timeout=30000')
-            
+        async with self.get_connection() as db:
             # 세션 생성
             cursor = await db.execute('''
                 INSERT INTO scrim_sessions 
@@ -1366,7 +1439,7 @@ class DatabaseManager:
 
     async def get_active_session(self, guild_id: str) -> Optional[dict]:
         """활성 세션 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT * FROM scrim_sessions 
                 WHERE guild_id = ? AND session_status = 'active'
@@ -1381,7 +1454,7 @@ class DatabaseManager:
 
     async def get_active_session_details(self, guild_id: str) -> Optional[tuple]:
         """활성 세션의 상세 정보 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             # 세션 정보
             async with db.execute('''
                 SELECT * FROM scrim_sessions 
@@ -1420,9 +1493,7 @@ class DatabaseManager:
     
     async def end_scrim_session(self, session_id: int):
         """세션 종료"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 세션 상태 업데이트
             await db.execute('''
                 UPDATE scrim_sessions 
@@ -1444,9 +1515,7 @@ class DatabaseManager:
 
     async def update_participation_counts(self, participants: List):
         """참여자들의 세션 참여 횟수 업데이트"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             for participant in participants:
                 await db.execute('''
                     UPDATE users 
@@ -1490,10 +1559,7 @@ class DatabaseManager:
         """매치에 포지션 정보 추가"""
         for attempt in range(3):
             try:
-                async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                    await db.execute('PRAGMA journal_mode=WAL')
-                    await db.execute('PRAGMA busy_timeout=30000')
-                    
+                async with self.get_connection() as db:
                     # 매치 ID 찾기
                     async with db.execute(
                         'SELECT id FROM matches WHERE match_uuid = ?', 
@@ -1544,7 +1610,7 @@ class DatabaseManager:
                 
     async def get_best_teammates(self, user_id: str, min_matches: int = 3):
         """베스트 팀메이트 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT 
                     CASE 
@@ -1571,7 +1637,7 @@ class DatabaseManager:
 
     async def get_position_synergy(self, user_id: str, min_matches: int = 3):
         """포지션 조합별 궁합 분석"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT 
                     CASE 
@@ -1673,9 +1739,7 @@ class DatabaseManager:
 
     async def find_recent_match(self, guild_id: str, user_id: str, minutes: int = 10) -> Optional[str]:
         """최근 매치 찾기 (포지션 추가용)"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA busy_timeout=30000')
-            
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT m.match_uuid 
                 FROM matches m
@@ -1695,9 +1759,7 @@ class DatabaseManager:
     
     async def find_recent_dev_match(self, guild_id: str, minutes: int = 10) -> Optional[str]:
         """개발용 매치만 찾기 (dev_commands 전용)"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA busy_timeout=30000')
-            
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT match_uuid 
                 FROM matches 
@@ -1714,9 +1776,7 @@ class DatabaseManager:
     
     async def get_match_participants(self, match_uuid: str) -> Tuple[List[Participant], List[Participant]]:
         """매치 참가자 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA busy_timeout=30000')
-            
+        async with self.get_connection(readonly=True) as db:
             # 매치 ID 찾기
             async with db.execute(
                 'SELECT id FROM matches WHERE match_uuid = ?', 
@@ -1761,7 +1821,7 @@ class DatabaseManager:
 
     async def get_user_session_stats(self, user_id: str, days: int = 30):
         """사용자의 세션 참여 통계"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT 
                     COUNT(DISTINCT sp.session_id) as sessions_joined,
@@ -1778,7 +1838,7 @@ class DatabaseManager:
 
     async def get_popular_session_times(self, guild_id: str, days: int = 30):
         """인기 세션 시간대 분석"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT 
                     strftime('%H', started_at) as hour,
@@ -1796,7 +1856,7 @@ class DatabaseManager:
 
     async def get_session_participation_rate(self, guild_id: str, days: int = 30):
         """세션 참여율 분석"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT 
                     u.username,
@@ -1819,9 +1879,7 @@ class DatabaseManager:
 
     async def register_clan(self, guild_id: str, clan_name: str, created_by: str) -> bool:
         """클랜 등록"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             try:
                 await db.execute('''
                     INSERT INTO clan_teams (guild_id, clan_name, created_by)
@@ -1835,7 +1893,7 @@ class DatabaseManager:
 
     async def get_registered_clans(self, guild_id: str) -> List[ClanTeam]:
         """등록된 클랜 목록 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT * FROM clan_teams 
                 WHERE guild_id = ? AND is_active = TRUE
@@ -1862,9 +1920,7 @@ class DatabaseManager:
         """클랜전 스크림 세션 생성"""
         scrim_uuid = str(uuid.uuid4())
         
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 스크림 세션 생성
             cursor = await db.execute('''
                 INSERT INTO clan_scrims 
@@ -1877,7 +1933,7 @@ class DatabaseManager:
 
     async def get_active_clan_scrim(self, guild_id: str) -> Optional[ClanScrim]:
         """활성 클랜전 스크림 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT * FROM clan_scrims 
                 WHERE guild_id = ? AND scrim_status = 'active'
@@ -1910,9 +1966,7 @@ class DatabaseManager:
         """클랜전 개별 경기 생성"""
         match_uuid = str(uuid.uuid4())
         
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 활성 스크림 조회
             scrim = await self.get_active_clan_scrim(guild_id)
             if not scrim:
@@ -1975,9 +2029,7 @@ class DatabaseManager:
 
     async def add_clan_position_data(self, match_uuid: str, team_side: str, position_data: dict):
         """클랜전 경기에 포지션 정보 추가"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 매치 ID 찾기
             async with db.execute(
                 'SELECT id FROM clan_matches WHERE match_uuid = ?', 
@@ -2047,9 +2099,7 @@ class DatabaseManager:
         if len(hero_composition) != 5:
             raise ValueError(f"영웅은 정확히 5명이어야 합니다: {len(hero_composition)}명")
         
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 매치 ID 찾기
             async with db.execute(
                 'SELECT id FROM clan_matches WHERE match_uuid = ?', 
@@ -2079,7 +2129,7 @@ class DatabaseManager:
 
     async def get_clan_match_by_uuid(self, match_uuid: str) -> Optional[dict]:
         """UUID로 클랜전 경기 정보 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT cm.*, cs.clan_a_name, cs.clan_b_name, 
                     cs.voice_channel_a, cs.voice_channel_b
@@ -2095,9 +2145,7 @@ class DatabaseManager:
 
     async def end_clan_scrim(self, guild_id: str):
         """클랜전 스크림 종료"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             await db.execute('''
                 UPDATE clan_scrims 
                 SET scrim_status = 'completed', ended_at = CURRENT_TIMESTAMP
@@ -2108,7 +2156,7 @@ class DatabaseManager:
 
     async def find_recent_clan_match(self, guild_id: str, minutes: int = 10) -> Optional[str]:
         """최근 클랜전 경기 찾기 (포지션 추가용)"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT cm.match_uuid 
                 FROM clan_matches cm
@@ -2138,9 +2186,7 @@ class DatabaseManager:
         """사용자 신청 생성"""
         
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 print(f"[DEBUG] 신청 데이터 검증 시작:")
                 print(f"  - guild_id: {guild_id}")
                 print(f"  - user_id: {user_id}")
@@ -2234,7 +2280,7 @@ class DatabaseManager:
 
     async def get_user_application(self, guild_id: str, user_id: str) -> Optional[dict]:
         """특정 유저의 신청 정보 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT * FROM user_applications 
                 WHERE guild_id = ? AND user_id = ?
@@ -2247,7 +2293,7 @@ class DatabaseManager:
 
     async def get_registered_user_info(self, guild_id: str, user_id: str) -> Optional[dict]:
         """등록된 유저 정보 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT * FROM registered_users 
                 WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
@@ -2260,9 +2306,7 @@ class DatabaseManager:
             
     async def update_registered_user_info(self, guild_id: str, user_id: str, updates: dict) -> bool:
         """등록된 유저 정보 업데이트 (제공된 필드만)"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             try:
                 # 업데이트할 필드가 없으면 실패
                 if not updates:
@@ -2293,6 +2337,7 @@ class DatabaseManager:
                 
                 await db.execute(query, values)
                 await db.commit()
+                self.member_profiles.invalidate(guild_id, user_id)
                 
                 return True
                 
@@ -2304,7 +2349,7 @@ class DatabaseManager:
 
     async def get_pending_applications(self, guild_id: str) -> List[dict]:
         """대기 중인 신청 목록 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT * FROM user_applications 
                 WHERE guild_id = ? AND status = 'pending'
@@ -2316,9 +2361,7 @@ class DatabaseManager:
 
     async def reject_user_application(self, guild_id: str, user_id: str, admin_id: str, admin_note: str = None) -> bool:
         """유저 신청 거절"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             cursor = await db.execute('''
                 UPDATE user_applications 
                 SET status = 'rejected', reviewed_at = CURRENT_TIMESTAMP, 
@@ -2333,7 +2376,7 @@ class DatabaseManager:
 
     async def is_user_registered(self, guild_id: str, user_id: str) -> bool:
         """유저가 이미 등록되어 있는지 확인"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT COUNT(*) FROM registered_users 
                 WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
@@ -2343,7 +2386,7 @@ class DatabaseManager:
 
     async def get_application_stats(self, guild_id: str) -> dict:
         """신청 통계 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             stats = {}
             
             # 상태별 신청 수
@@ -2365,19 +2408,13 @@ class DatabaseManager:
         
     async def is_server_admin(self, guild_id: str, user_id: str) -> bool:
         """사용자가 서버 관리자인지 확인"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            async with db.execute('''
-                SELECT COUNT(*) FROM server_admins 
-                WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
-            ''', (guild_id, user_id)) as cursor:
-                count = (await cursor.fetchone())[0]
-                return count > 0
+        async with self.get_connection(readonly=True) as db:
+            row = await self.queries.fetchone(db, 'is_server_admin', (guild_id, user_id))
+            return row[0] > 0
 
     async def add_server_admin(self, guild_id: str, user_id: str, username: str, added_by: str) -> bool:
         """서버 관리자 추가"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             try:
                 await db.execute('''
                     INSERT INTO server_admins (guild_id, user_id, username, added_by)
@@ -2391,9 +2428,7 @@ class DatabaseManager:
 
     async def remove_server_admin(self, guild_id: str, user_id: str) -> bool:
         """서버 관리자 제거"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             cursor = await db.execute('''
                 UPDATE server_admins 
                 SET is_active = FALSE 
@@ -2407,7 +2442,7 @@ class DatabaseManager:
 
     async def get_server_admins(self, guild_id: str) -> List[dict]:
         """서버의 모든 관리자 목록 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT user_id, username, added_by, added_at 
                 FROM server_admins 
@@ -2420,7 +2455,7 @@ class DatabaseManager:
 
     async def get_admin_count(self, guild_id: str) -> int:
         """서버의 관리자 수 조회 (서버 소유자 제외)"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT COUNT(*) FROM server_admins 
                 WHERE guild_id = ? AND is_active = TRUE
@@ -2429,9 +2464,7 @@ class DatabaseManager:
 
     async def delete_user_registration(self, guild_id: str, user_id: str) -> tuple[bool, dict]:
         """등록된 유저 삭제 (재신청 가능하도록)"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 먼저 등록된 유저 정보 가져오기
             async with db.execute('''
                 SELECT * FROM registered_users 
@@ -2455,6 +2488,7 @@ class DatabaseManager:
             ''', (guild_id, user_id))
             
             await db.commit()
+            self.member_profiles.invalidate(guild_id, user_id)
             
             # 삭제된 유저 정보 반환
             columns = ['id', 'guild_id', 'user_id', 'username', 'entry_method', 'battle_tag', 
@@ -2467,9 +2501,7 @@ class DatabaseManager:
     async def delete_registered_user(self, guild_id: str, user_id: str, admin_id: str, reason: str = None):
         """등록된 유저 삭제"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 등록된 유저인지 확인하고 정보 가져오기
                 async with db.execute('''
                     SELECT username FROM registered_users 
@@ -2493,6 +2525,7 @@ class DatabaseManager:
                 ''', (guild_id, user_id))
                 
                 await db.commit()
+                self.member_profiles.invalidate(guild_id, user_id)
                 return True
                 
         except Exception as e:
@@ -2504,9 +2537,7 @@ class DatabaseManager:
     async def get_registered_users_list(self, guild_id: str, limit: int = 50):
         """등록된 유저 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT user_id, username, entry_method, battle_tag, main_position, 
                         current_season_tier, registered_at, approved_by
@@ -2536,7 +2567,7 @@ class DatabaseManager:
 
     async def search_registered_user(self, guild_id: str, search_term: str) -> List[dict]:
         """등록된 유저 검색 (닉네임, 배틀태그, 유입경로로) - 유입경로 포함"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT user_id, username, entry_method, battle_tag, main_position, current_season_tier, registered_at 
                 FROM registered_users 
@@ -2588,9 +2619,7 @@ class DatabaseManager:
                                     member_role_id: str = None, auto_role_change: bool = True,
                                     welcome_channel_id: str = None):
         """서버 설정 업데이트"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             await db.execute('''
                 INSERT INTO server_settings 
                 (guild_id, newbie_role_id, member_role_id, auto_role_change, welcome_channel_id, updated_at)
@@ -2604,18 +2633,26 @@ class DatabaseManager:
             ''', (guild_id, newbie_role_id, member_role_id, auto_role_change, welcome_channel_id))
             
             await db.commit()
+            self.settings_cache.invalidate(SettingsCache.SERVER, guild_id)
 
     async def get_server_settings(self, guild_id: str) -> dict:
         """서버 설정 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        cached = self.settings_cache.get(SettingsCache.SERVER, guild_id)
+        if cached is not SettingsCache.MISSING:
+            return cached
+        version = self.settings_cache.version(SettingsCache.SERVER, guild_id)
+
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT * FROM server_settings WHERE guild_id = ?
             ''', (guild_id,)) as cursor:
                 result = await cursor.fetchone()
+                settings = {}
                 if result:
                     columns = [description[0] for description in cursor.description]
-                    return dict(zip(columns, result))
-                return {}
+                    settings = dict(zip(columns, result))
+
+        return self.settings_cache.set(SettingsCache.SERVER, guild_id, settings, version)
 
     async def _update_user_roles_conditional(self, member, guild_id: str) -> str:
         """서버 설정에 따른 조건부 역할 변경"""
@@ -2770,8 +2807,7 @@ class DatabaseManager:
                                 reveal_time: Optional[int] = None) -> bool:
         """대나무숲 메시지 데이터베이스에 저장"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
+            async with self.get_connection() as db:
                 utc_now = TimeUtils.get_utc_now().isoformat()
 
                 await db.execute('''
@@ -2784,7 +2820,10 @@ class DatabaseManager:
                 
                 await db.commit()
                 print(f"🎋 메시지 저장 완료 - UTC: {utc_now}, KST: {TimeUtils.get_kst_now()}")
-                return True
+
+            if message_type == 'timed_reveal':
+                self._schedule_deadline('bamboo_reveal', message_id, reveal_time)
+            return True
                 
         except Exception as e:
             print(f"대나무숲 메시지 저장 오류: {e}")
@@ -2793,7 +2832,7 @@ class DatabaseManager:
     async def get_bamboo_message(self, message_id: str) -> Optional[Dict]:
         """메시지 ID로 대나무숲 메시지 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM bamboo_messages WHERE message_id = ?
                 ''', (message_id,)) as cursor:
@@ -2808,39 +2847,10 @@ class DatabaseManager:
             print(f"대나무숲 메시지 조회 오류: {e}")
             return None
 
-    async def get_pending_reveals(self) -> List[Dict]:
-        """공개 시간이 도래한 메시지들 조회"""
-        try:
-            current_time = int(TimeUtils.get_utc_now().timestamp())
-            
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                async with db.execute('''
-                    SELECT * FROM bamboo_messages 
-                    WHERE message_type = 'timed_reveal' 
-                    AND is_revealed = FALSE 
-                    AND reveal_time <= ?
-                    ORDER BY reveal_time ASC
-                ''', (current_time,)) as cursor:
-                    rows = await cursor.fetchall()
-                    columns = [desc[0] for desc in cursor.description]
-                    result = [dict(zip(columns, row)) for row in rows]
-                    
-                    # print(f"🐛 공개 대상 메시지: {len(result)}개")
-                    # for msg in result:
-                    #     print(f"  - {msg['message_id']}: 예정시간 {msg['reveal_time']}")
-                    
-                    return result
-                    
-        except Exception as e:
-            print(f"공개 대기 메시지 조회 오류: {e}")
-            return []
-
     async def mark_message_revealed(self, message_id: str) -> bool:
         """메시지를 공개됨으로 표시"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-
+            async with self.get_connection() as db:
                 revealed_at_utc = TimeUtils.get_utc_now().isoformat()
 
                 cursor = await db.execute('''
@@ -2851,9 +2861,10 @@ class DatabaseManager:
                 
                 if cursor.rowcount > 0:
                     await db.commit()
+                    self._cancel_deadline('bamboo_reveal', message_id)
                     return True
                 return False
-                
+
         except Exception as e:
             print(f"메시지 공개 표시 오류: {e}")
             return False
@@ -2861,7 +2872,7 @@ class DatabaseManager:
     async def get_bamboo_statistics(self, guild_id: str) -> Dict:
         """대나무숲 사용 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection() as db:
                 stats = {}
                 
                 # 기본 통계
@@ -2958,7 +2969,7 @@ class DatabaseManager:
     async def get_user_bamboo_messages(self, guild_id: str, author_id: str, limit: int = 10) -> List[Dict]:
         """특정 사용자의 대나무숲 메시지 조회 (관리자용)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT message_id, original_content, message_type, is_revealed, 
                         created_at, reveal_time, revealed_at
@@ -2980,9 +2991,7 @@ class DatabaseManager:
         try:
             cutoff_date = datetime.now() - timedelta(days=days_old)
             
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 오래된 메시지 삭제 (공개된 메시지 또는 완전 익명 메시지)
                 cursor = await db.execute('''
                     DELETE FROM bamboo_messages 
@@ -3006,7 +3015,7 @@ class DatabaseManager:
                                         message_content: str) -> Optional[Dict]:
         """작성자와 내용으로 메시지 찾기 (중복 방지용)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 최근 1시간 내 동일한 작성자의 동일한 내용 메시지 확인
                 one_hour_ago = datetime.now() - timedelta(hours=1)
                 
@@ -3030,9 +3039,7 @@ class DatabaseManager:
     async def set_new_member_auto_role(self, guild_id: str, role_id: str, enabled: bool = True) -> bool:
         """신규 유저 자동 역할 배정 설정"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 기존 설정이 있는지 확인
                 async with db.execute('''
                     SELECT id FROM server_settings WHERE guild_id = ?
@@ -3057,6 +3064,7 @@ class DatabaseManager:
                     ''', (guild_id, role_id, enabled))
                 
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.SERVER, guild_id)
                 return True
                 
         except Exception as e:
@@ -3066,7 +3074,7 @@ class DatabaseManager:
     async def get_new_member_auto_role_settings(self, guild_id: str) -> dict:
         """신규 유저 자동 역할 배정 설정 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT new_member_role_id, auto_assign_new_member
                     FROM server_settings 
@@ -3089,7 +3097,7 @@ class DatabaseManager:
     async def disable_new_member_auto_role(self, guild_id: str) -> bool:
         """신규 유저 자동 역할 배정 비활성화"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE server_settings 
                     SET auto_assign_new_member = FALSE,
@@ -3098,6 +3106,7 @@ class DatabaseManager:
                 ''', (guild_id,))
                 
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.SERVER, guild_id)
                 return True
                 
         except Exception as e:
@@ -3107,9 +3116,7 @@ class DatabaseManager:
     async def get_deletable_users_for_autocomplete(self, guild_id: str, search_query: str = "", limit: int = 100):
         """유저삭제 자동완성용 - 관리자 제외, 검색어 필터링"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection(readonly=True) as db:
                 # 관리자 목록 먼저 조회
                 admin_user_ids = []
                 async with db.execute('''
@@ -3174,9 +3181,7 @@ class DatabaseManager:
     async def get_all_server_admins_for_notification(self, guild_id: str, guild_owner_id: str):
         """알림용 모든 관리자 ID 목록 조회 (서버 소유자 포함)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection(readonly=True) as db:
                 admin_ids = set()
                 
                 # 1. 서버 소유자 추가
@@ -3204,7 +3209,7 @@ class DatabaseManager:
         try:
             recruitment_id = str(uuid.uuid4())
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     INSERT INTO scrim_recruitments 
                     (id, guild_id, title, description, scrim_date, deadline, created_by)
@@ -3219,7 +3224,8 @@ class DatabaseManager:
                     created_by
                 ))
                 await db.commit()
-                
+
+            self._schedule_deadline('recruitment', recruitment_id, deadline)
             return recruitment_id
             
         except Exception as e:
@@ -3230,7 +3236,7 @@ class DatabaseManager:
                                            channel_id: str) -> bool:
         """모집 메시지 ID 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE scrim_recruitments 
                     SET message_id = ?, channel_id = ?, updated_at = CURRENT_TIMESTAMP
@@ -3247,7 +3253,7 @@ class DatabaseManager:
     async def set_recruitment_channel(self, guild_id: str, channel_id: str) -> bool:
         """내전 공지 채널 설정"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 기존 설정이 있는지 확인
                 async with db.execute('''
                     SELECT guild_id FROM scrim_settings WHERE guild_id = ?
@@ -3269,6 +3275,7 @@ class DatabaseManager:
                     ''', (guild_id, channel_id))
                 
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.RECRUITMENT_CHANNEL, guild_id)
                 print(f"✅ 공지 채널 설정 완료: guild_id={guild_id}, channel_id={channel_id}")
                 
             return True
@@ -3282,24 +3289,31 @@ class DatabaseManager:
 
     async def get_recruitment_channel(self, guild_id: str) -> Optional[str]:
         """설정된 내전 공지 채널 ID 조회"""
+        cached = self.settings_cache.get(SettingsCache.RECRUITMENT_CHANNEL, guild_id)
+        if cached is not SettingsCache.MISSING:
+            return cached
+        version = self.settings_cache.version(SettingsCache.RECRUITMENT_CHANNEL, guild_id)
+
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT recruitment_channel_id FROM scrim_settings 
                     WHERE guild_id = ?
                 ''', (guild_id,)) as cursor:
                     result = await cursor.fetchone()
                     
-                    return result[0] if result and result[0] else None
+                    channel_id = result[0] if result and result[0] else None
                     
         except Exception as e:
             print(f"❌ 공지 채널 조회 실패: {e}")
             return None
 
+        return self.settings_cache.set(SettingsCache.RECRUITMENT_CHANNEL, guild_id, channel_id, version)
+
     async def get_active_recruitments(self, guild_id: str) -> List[Dict]:
         """활성 상태인 내전 모집 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM scrim_recruitments 
                     WHERE guild_id = ? AND status = 'active'
@@ -3317,7 +3331,7 @@ class DatabaseManager:
     async def get_recruitment_by_id(self, recruitment_id: str) -> Optional[Dict]:
         """ID로 특정 모집 정보 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM scrim_recruitments WHERE id = ?
                 ''', (recruitment_id,)) as cursor:
@@ -3337,7 +3351,7 @@ class DatabaseManager:
                                         username: str, status: str) -> bool:
         """모집 참가자 추가/업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     INSERT INTO scrim_participants 
                     (recruitment_id, user_id, username, status)
@@ -3358,7 +3372,7 @@ class DatabaseManager:
     async def get_recruitment_participants(self, recruitment_id: str) -> List[Dict]:
         """특정 모집의 참가자 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM scrim_participants 
                     WHERE recruitment_id = ?
@@ -3376,43 +3390,26 @@ class DatabaseManager:
     async def close_recruitment(self, recruitment_id: str) -> bool:
         """모집 마감 처리"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE scrim_recruitments 
                     SET status = 'closed', updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
                 ''', (recruitment_id,))
                 await db.commit()
-                
+
+            self._cancel_deadline('recruitment', recruitment_id)
+            self._cancel_deadline('voting_deadline', recruitment_id)
             return True
-            
+
         except Exception as e:
             print(f"❌ 모집 마감 처리 실패: {e}")
             return False
 
-    async def get_expired_recruitments(self) -> List[Dict]:
-        """마감시간이 지난 활성 모집들 조회"""
-        try:
-            current_time = datetime.now().isoformat()
-            
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute('''
-                    SELECT * FROM scrim_recruitments 
-                    WHERE status = 'active' AND deadline < ?
-                ''', (current_time,)) as cursor:
-                    results = await cursor.fetchall()
-                    columns = [description[0] for description in cursor.description]
-                    
-                    return [dict(zip(columns, row)) for row in results]
-                    
-        except Exception as e:
-            print(f"❌ 만료된 모집 조회 실패: {e}")
-            return []
-
     async def cancel_recruitment(self, recruitment_id: str) -> bool:
         """모집 취소 처리"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE scrim_recruitments 
                     SET status = 'cancelled', updated_at = CURRENT_TIMESTAMP
@@ -3423,8 +3420,12 @@ class DatabaseManager:
                 changes = await result.fetchone()
                 
                 await db.commit()
-                
-                return changes[0] > 0  # 실제로 업데이트된 행이 있는지 확인
+
+            if changes[0] > 0:  # 실제로 업데이트된 행이 있는지 확인
+                self._cancel_deadline('recruitment', recruitment_id)
+                self._cancel_deadline('voting_deadline', recruitment_id)
+                return True
+            return False
                 
         except Exception as e:
             print(f"❌ 모집 취소 처리 실패: {e}")
@@ -3433,7 +3434,7 @@ class DatabaseManager:
     async def get_user_participation_status(self, recruitment_id: str, user_id: str) -> Optional[str]:
         """특정 사용자의 특정 모집 참가 상태 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT status FROM scrim_participants 
                     WHERE recruitment_id = ? AND user_id = ?
@@ -3449,7 +3450,7 @@ class DatabaseManager:
     async def get_recruitment_stats(self, guild_id: str) -> Dict:
         """서버의 내전 모집 통계"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 전체 모집 수
                 async with db.execute('''
                     SELECT COUNT(*) FROM scrim_recruitments WHERE guild_id = ?
@@ -3501,7 +3502,7 @@ class DatabaseManager:
     async def get_user_recruitment_history(self, guild_id: str, user_id: str) -> List[Dict]:
         """특정 사용자의 모집 참가 이력"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT r.title, r.scrim_date, r.status as recruitment_status,
                         p.status as participation_status, p.joined_at
@@ -3526,7 +3527,7 @@ class DatabaseManager:
             from datetime import datetime, timedelta
             cutoff_date = (datetime.now() - timedelta(days=days_old)).isoformat()
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 오래된 참가자 데이터 삭제
                 await db.execute('''
                     DELETE FROM scrim_participants 
@@ -3555,7 +3556,7 @@ class DatabaseManager:
     async def get_popular_participation_times(self, guild_id: str) -> Dict:
         """인기 있는 참가 시간대 분석"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 시간대별 참가자 수 통계
                 async with db.execute('''
                     SELECT 
@@ -3592,7 +3593,7 @@ class DatabaseManager:
     async def get_server_admins(self, guild_id: str) -> List[Dict]:
         """서버의 등록된 관리자 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT user_id, username, added_at FROM server_admins 
                     WHERE guild_id = ?
@@ -3610,7 +3611,7 @@ class DatabaseManager:
     async def get_recruitment_detailed_stats(self, recruitment_id: str) -> Dict:
         """특정 모집의 상세 통계"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 기본 모집 정보
                 async with db.execute('''
                     SELECT * FROM scrim_recruitments WHERE id = ?
@@ -3669,7 +3670,7 @@ class DatabaseManager:
             
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 최근 모집들
                 async with db.execute('''
                     SELECT 
@@ -3720,17 +3721,8 @@ class DatabaseManager:
                                                 notification_type: str = 'closed') -> bool:
         """모집 알림 발송 기록"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # 알림 발송 기록용 컬럼이 없다면 추가하는 로직도 포함
-                try:
-                    await db.execute('''
-                        ALTER TABLE scrim_recruitments 
-                        ADD COLUMN notifications_sent TEXT DEFAULT ''
-                    ''')
-                except:
-                    pass  # 컬럼이 이미 존재하는 경우
-                
-                # 기존 알림 기록 조회
+            async with self.get_connection() as db:
+                # 기존 알림 기록 조회 (notifications_sent 컬럼은 마이그레이션 2에서 추가)
                 async with db.execute('''
                     SELECT notifications_sent FROM scrim_recruitments WHERE id = ?
                 ''', (recruitment_id,)) as cursor:
@@ -3758,7 +3750,7 @@ class DatabaseManager:
     async def get_recruitment_participation_timeline(self, recruitment_id: str) -> List[Dict]:
         """모집 참가 신청 시간순 타임라인"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         user_id, username, status, joined_at, updated_at
@@ -3790,19 +3782,8 @@ class DatabaseManager:
         try:
             # 향후 리마인더 기능 구현 시 사용할 메소드
             # 현재는 기본 구조만 제공
-            async with aiosqlite.connect(self.db_path) as db:
-                # 리마인더 테이블이 필요하면 생성
-                await db.execute('''
-                    CREATE TABLE IF NOT EXISTS recruitment_reminders (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        recruitment_id TEXT NOT NULL,
-                        remind_at TEXT NOT NULL,
-                        status TEXT DEFAULT 'pending',
-                        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (recruitment_id) REFERENCES scrim_recruitments(id)
-                    )
-                ''')
-                
+            # recruitment_reminders 테이블은 마이그레이션 6 에서 생성
+            async with self.get_connection() as db:
                 # 리마인더 시간 계산 및 저장
                 recruitment = await self.get_recruitment_by_id(recruitment_id)
                 if recruitment:
@@ -3827,7 +3808,7 @@ class DatabaseManager:
     async def set_bamboo_channel(self, guild_id: str, channel_id: str) -> bool:
         """대나무숲 채널 ID 설정"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 기존 설정이 있는지 확인
                 async with db.execute('''
                     SELECT guild_id FROM server_settings WHERE guild_id = ?
@@ -3849,6 +3830,7 @@ class DatabaseManager:
                     ''', (guild_id, channel_id))
                 
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.SERVER, guild_id)
                 return True
                 
         except Exception as e:
@@ -3858,7 +3840,7 @@ class DatabaseManager:
     async def get_bamboo_channel(self, guild_id: str) -> str:
         """대나무숲 채널 ID 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT bamboo_channel_id FROM server_settings 
                     WHERE guild_id = ?
@@ -3876,13 +3858,14 @@ class DatabaseManager:
     async def remove_bamboo_channel(self, guild_id: str) -> bool:
         """대나무숲 채널 설정 제거"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE server_settings 
                     SET bamboo_channel_id = NULL, updated_at = CURRENT_TIMESTAMP
                     WHERE guild_id = ?
                 ''', (guild_id,))
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.SERVER, guild_id)
                 return True
                 
         except Exception as e:
@@ -3892,7 +3875,7 @@ class DatabaseManager:
     async def get_completed_recruitments(self, guild_id: str) -> List[Dict]:
         """마감된 내전 모집 목록 조회 (참가자 수 포함)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         r.id,
@@ -3934,54 +3917,8 @@ class DatabaseManager:
     async def save_match_result(self, match_data: Dict) -> str:
         """매치 결과를 데이터베이스에 저장 (맵 정보 포함)"""
         try:
-            match_id = str(uuid.uuid4())
-            
-            async with aiosqlite.connect(self.db_path) as db:
-                # 🆕 맵 정보 추출
-                map_name = match_data.get('map_name')
-                map_type = match_data.get('map_type')
-                
-                # 매치 기본 정보 저장 (맵 정보 포함)
-                await db.execute('''
-                    INSERT INTO match_results (
-                        id, recruitment_id, match_number, winning_team, 
-                        created_by, guild_id, match_date, map_name, map_type
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    match_id,
-                    match_data['recruitment_id'],
-                    match_data['match_number'],
-                    match_data['winner'],
-                    match_data['created_by'],
-                    match_data['guild_id'],
-                    datetime.now().isoformat(),
-                    map_name,
-                    map_type
-                ))
-                
-                # 참가자별 세부 정보 저장
-                for team_key in ['team_a', 'team_b']:
-                    team_data = match_data[team_key]
-                    positions = match_data[f'{team_key}_positions']
-                    is_winning_team = (match_data['winner'] == team_key)
-                    
-                    for participant in team_data:
-                        user_id = participant['user_id']
-                        position = positions.get(user_id, '미설정')  # 포지션 정보가 없을 경우 기본값
-                        
-                        await db.execute('''
-                            INSERT INTO match_participants (
-                                match_id, user_id, username, team, position, won
-                            ) VALUES (?, ?, ?, ?, ?, ?)
-                        ''', (
-                            match_id,
-                            user_id,
-                            participant['username'],
-                            team_key,
-                            position,
-                            is_winning_team
-                        ))
-                
+            async with self.get_connection() as db:
+                match_id = await self._insert_match(db, match_data)
                 await db.commit()
                 return match_id
                 
@@ -3989,10 +3926,214 @@ class DatabaseManager:
             print(f"❌ 매치 저장 실패: {e}")
             raise
 
+    async def _insert_match(self, db, match_data: Dict) -> str:
+        """경기/참가자 행과 동료/상대 집계 저장 (commit 은 호출자가 수행)"""
+        match_id = str(uuid.uuid4())
+        
+        # 매치 기본 정보 저장 (맵 정보 포함)
+        await db.execute('''
+            INSERT INTO match_results (
+                id, recruitment_id, match_number, winning_team, 
+                created_by, guild_id, match_date, map_name, map_type
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            match_id,
+            match_data['recruitment_id'],
+            match_data['match_number'],
+            match_data['winner'],
+            match_data['created_by'],
+            match_data['guild_id'],
+            datetime.now().isoformat(),
+            match_data.get('map_name'),
+            match_data.get('map_type')
+        ))
+        
+        # 참가자별 세부 정보 저장
+        participant_rows = []
+        for team_key in ['team_a', 'team_b']:
+            positions = match_data[f'{team_key}_positions']
+            is_winning_team = (match_data['winner'] == team_key)
+            
+            for participant in match_data[team_key]:
+                user_id = participant['user_id']
+                participant_rows.append((
+                    match_id,
+                    user_id,
+                    participant['username'],
+                    team_key,
+                    positions.get(user_id, '미설정'),  # 포지션 정보가 없을 경우 기본값
+                    is_winning_team
+                ))
+        
+        await db.executemany('''
+            INSERT INTO match_participants (
+                match_id, user_id, username, team, position, won
+            ) VALUES (?, ?, ?, ?, ?, ?)
+        ''', participant_rows)
+        
+        # 동료/상대 집계도 같은 트랜잭션에서 갱신
+        await self._apply_match_pair_stats(db, match_data)
+        
+        return match_id
+
+    async def record_matches(self, guild_id: str, matches: List[Dict], registered_only: bool = True) -> List[str]:
+        """여러 경기 결과를 한 트랜잭션으로 기록
+        
+        아직 저장되지 않은 경기(saved_to_db 없음)는 경기/참가자 행과 동료/상대 집계를 저장하고,
+        모든 경기의 참가자 통계를 사용자별로 합산해 한 번씩 upsert 한다.
+        
+        Args:
+            guild_id: 서버 ID
+            matches: 매치 데이터 리스트
+            registered_only: True 면 등록된 유저만 개인 통계에 반영
+            
+        Returns:
+            새로 저장한 경기 ID 목록
+        """
+        registered_user_ids = await self._get_registered_user_ids(guild_id) if registered_only else None
+        
+        entries = []
+        for match_data in matches:
+            for team_key in ['team_a', 'team_b']:
+                positions = match_data[f'{team_key}_positions']
+                is_winning_team = (match_data['winner'] == team_key)
+                for participant in match_data[team_key]:
+                    user_id = participant['user_id']
+                    if registered_user_ids is not None and user_id not in registered_user_ids:
+                        continue
+                    entries.append((user_id, positions.get(user_id), is_winning_team))
+        
+        try:
+            async with self.get_connection() as db, self._atomic(db, 'record_matches'):
+                match_ids = []
+                for match_data in matches:
+                    if not match_data.get('saved_to_db'):
+                        match_ids.append(await self._insert_match(db, match_data))
+                
+                updated_users = await self._upsert_user_stats(db, guild_id, entries)
+            
+            print(f"✅ 경기 {len(matches)}건 기록 완료 - 신규 저장 {len(match_ids)}건, 통계 반영 {updated_users}명")
+            return match_ids
+            
+        except Exception as e:
+            print(f"❌ 경기 일괄 기록 실패: {e}")
+            raise
+
+    async def _apply_match_pair_stats(self, db, match_data: Dict):
+        """경기 1건의 동료/상대 조합을 집계 테이블에 반영 (commit 은 호출자가 수행)"""
+        guild_id = match_data['guild_id']
+        winner = match_data['winner']
+        
+        rosters = {}
+        for team_key in ['team_a', 'team_b']:
+            positions = match_data[f'{team_key}_positions']
+            rosters[team_key] = [
+                (p['user_id'], p['username'], positions.get(p['user_id'], '미설정'), 1 if winner == team_key else 0)
+                for p in match_data[team_key]
+            ]
+        
+        teammate_rows = []
+        opponent_rows = []
+        for team_key, other_key in (('team_a', 'team_b'), ('team_b', 'team_a')):
+            for user_id, _, position, won in rosters[team_key]:
+                for mate_id, mate_name, mate_position, _ in rosters[team_key]:
+                    if mate_id != user_id:
+                        teammate_rows.append((guild_id, user_id, position, mate_position, mate_id, mate_name, won))
+                for opp_id, opp_name, _, _ in rosters[other_key]:
+                    opponent_rows.append((guild_id, user_id, opp_id, opp_name, won, 1 - won))
+        
+        await db.executemany('''
+            INSERT INTO teammate_pair_stats (
+                guild_id, user_id, user_position, teammate_position,
+                teammate_id, teammate_name, games, wins
+            ) VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+            ON CONFLICT(guild_id, user_id, user_position, teammate_position, teammate_id) DO UPDATE SET
+                games = games + 1,
+                wins = wins + excluded.wins,
+                teammate_name = excluded.teammate_name
+        ''', teammate_rows)
+        
+        await db.executemany('''
+            INSERT INTO opponent_pair_stats (
+                guild_id, user_id, opponent_id, opponent_name, games, wins, losses
+            ) VALUES (?, ?, ?, ?, 1, ?, ?)
+            ON CONFLICT(guild_id, user_id, opponent_id) DO UPDATE SET
+                games = games + 1,
+                wins = wins + excluded.wins,
+                losses = losses + excluded.losses,
+                opponent_name = excluded.opponent_name
+        ''', opponent_rows)
+
+    async def fill_pair_stats(self, db, guild_id: Optional[str] = None):
+        """match_participants 전체로 동료/상대 집계 테이블 채우기 (트랜잭션/commit 은 호출자가 관리)"""
+        guild_filter = 'AND mr.guild_id = ?' if guild_id else ''
+        params = (guild_id,) if guild_id else ()
+        
+        if guild_id:
+            await db.execute('DELETE FROM teammate_pair_stats WHERE guild_id = ?', params)
+            await db.execute('DELETE FROM opponent_pair_stats WHERE guild_id = ?', params)
+        else:
+            await db.execute('DELETE FROM teammate_pair_stats')
+            await db.execute('DELETE FROM opponent_pair_stats')
+        
+        await db.execute(f'''
+            INSERT INTO teammate_pair_stats (
+                guild_id, user_id, user_position, teammate_position,
+                teammate_id, teammate_name, games, wins
+            )
+            SELECT mr.guild_id, me.user_id, me.position, mate.position,
+                mate.user_id, MAX(mate.username), COUNT(*), SUM(me.won)
+            FROM match_participants me
+            JOIN match_participants mate ON (
+                me.match_id = mate.match_id
+                AND me.team = mate.team
+                AND me.user_id != mate.user_id
+            )
+            JOIN match_results mr ON me.match_id = mr.id
+            WHERE 1 = 1 {guild_filter}
+            GROUP BY mr.guild_id, me.user_id, me.position, mate.position, mate.user_id
+        ''', params)
+        
+        await db.execute(f'''
+            INSERT INTO opponent_pair_stats (
+                guild_id, user_id, opponent_id, opponent_name, games, wins, losses
+            )
+            SELECT mr.guild_id, me.user_id, opp.user_id, MAX(opp.username), COUNT(*),
+                SUM(CASE WHEN me.won = 1 AND opp.won = 0 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN me.won = 0 AND opp.won = 1 THEN 1 ELSE 0 END)
+            FROM match_participants me
+            JOIN match_participants opp ON (
+                me.match_id = opp.match_id
+                AND me.team != opp.team
+            )
+            JOIN match_results mr ON me.match_id = mr.id
+            WHERE 1 = 1 {guild_filter}
+            GROUP BY mr.guild_id, me.user_id, opp.user_id
+        ''', params)
+
+    async def rebuild_pair_stats(self, guild_id: Optional[str] = None) -> Dict[str, int]:
+        """동료/상대 집계 테이블 재계산 (백필/정합성 복구용)
+        
+        Returns:
+            {'teammate_rows': int, 'opponent_rows': int}
+        """
+        async with self.get_connection() as db, self._atomic(db, 'rebuild_pair_stats'):
+            await self.fill_pair_stats(db, guild_id)
+        
+        where = 'WHERE guild_id = ?' if guild_id else ''
+        params = (guild_id,) if guild_id else ()
+        async with self.get_connection(readonly=True) as db:
+            async with db.execute(f'SELECT COUNT(*) FROM teammate_pair_stats {where}', params) as cursor:
+                teammate_rows = (await cursor.fetchone())[0]
+            async with db.execute(f'SELECT COUNT(*) FROM opponent_pair_stats {where}', params) as cursor:
+                opponent_rows = (await cursor.fetchone())[0]
+        
+        return {'teammate_rows': teammate_rows, 'opponent_rows': opponent_rows}
+
     async def _get_registered_user_ids(self, guild_id: str) -> set:
         """등록된 유저 ID 목록을 Set으로 반환"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT user_id FROM registered_users 
                     WHERE guild_id = ? AND is_active = TRUE
@@ -4011,133 +4152,91 @@ class DatabaseManager:
             match_results: 매치 결과 데이터 리스트
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # 🔍 등록된 유저 ID 목록 조회 (한 번만)
-                registered_user_ids = await self._get_registered_user_ids(guild_id)
-                
-                if not registered_user_ids:
-                    print("⚠️ 등록된 유저가 없습니다.")
-                    return
-                
-                skipped_users = [] 
-                
-                for match_data in match_results:
-                    for team_key in ['team_a', 'team_b']:
-                        team_data = match_data[team_key]
-                        positions = match_data[f'{team_key}_positions']
-                        is_winning_team = (match_data['winner'] == team_key)
+            # 🔍 등록된 유저 ID 목록 조회 (한 번만)
+            registered_user_ids = await self._get_registered_user_ids(guild_id)
+            
+            if not registered_user_ids:
+                print("⚠️ 등록된 유저가 없습니다.")
+                return
+            
+            entries = []
+            skipped_user_ids = set()
+            
+            for match_data in match_results:
+                for team_key in ['team_a', 'team_b']:
+                    positions = match_data[f'{team_key}_positions']
+                    is_winning_team = (match_data['winner'] == team_key)
+                    
+                    for participant in match_data[team_key]:
+                        user_id = participant['user_id']
                         
-                        for participant in team_data:
-                            user_id = participant['user_id']
-                            
-                            if user_id not in registered_user_ids:
-                                skipped_users.append({
-                                    'username': participant['username'],
-                                    'user_id': user_id
-                                })
-                                print(f"⚠️ 미등록 유저 통계 제외: {participant['username']} ({user_id})")
-                                continue
-                            
-                            position = positions[user_id]
-                            
-                            await self._update_single_user_stats(
-                                db, guild_id, user_id, position, is_winning_team
-                            )
-                
+                        if user_id not in registered_user_ids:
+                            skipped_user_ids.add(user_id)
+                            print(f"⚠️ 미등록 유저 통계 제외: {participant['username']} ({user_id})")
+                            continue
+                        
+                        entries.append((user_id, positions[user_id], is_winning_team))
+            
+            async with self.get_connection() as db:
+                updated_users = await self._upsert_user_stats(db, guild_id, entries)
                 await db.commit()
-                
-                # 결과 요약 로그
-                registered_count = len(registered_user_ids)
-                skipped_count = len(set(u['user_id'] for u in skipped_users))
-                print(f"✅ 통계 업데이트 완료 - 등록 유저: {registered_count}명 반영, 외부 유저: {skipped_count}명 제외")
+            
+            # 결과 요약 로그
+            print(f"✅ 통계 업데이트 완료 - 등록 유저: {updated_users}명 반영, 외부 유저: {len(skipped_user_ids)}명 제외")
                 
         except Exception as e:
             print(f"❌ 통계 업데이트 실패: {e}")
             raise
 
-    async def _update_single_user_stats(self, db, guild_id: str, user_id: str, position: str, won: bool):
-        """개별 사용자 통계 업데이트"""
-        # 기존 통계 조회
-        async with db.execute('''
-            SELECT total_games, total_wins, tank_games, tank_wins, 
-                dps_games, dps_wins, support_games, support_wins
-            FROM user_statistics
-            WHERE user_id = ? AND guild_id = ?
-        ''', (user_id, guild_id)) as cursor:
-            existing = await cursor.fetchone()
-        
-        if existing:
-            # 기존 데이터 업데이트
-            total_games, total_wins, tank_games, tank_wins = existing[:4]
-            dps_games, dps_wins, support_games, support_wins = existing[4:]
-            
-            # 전체 통계 업데이트
-            total_games += 1
-            if won:
-                total_wins += 1
-            
-            # 포지션별 통계 업데이트
-            if position == '탱커':
-                tank_games += 1
-                if won:
-                    tank_wins += 1
-            elif position == '딜러':
-                dps_games += 1
-                if won:
-                    dps_wins += 1
-            elif position == '힐러':
-                support_games += 1
-                if won:
-                    support_wins += 1
-            
-            await db.execute('''
-                UPDATE user_statistics SET
-                    total_games = ?, total_wins = ?,
-                    tank_games = ?, tank_wins = ?,
-                    dps_games = ?, dps_wins = ?,
-                    support_games = ?, support_wins = ?,
-                    last_updated = ?
-                WHERE user_id = ? AND guild_id = ?
-            ''', (
-                total_games, total_wins, tank_games, tank_wins,
-                dps_games, dps_wins, support_games, support_wins,
-                datetime.now().isoformat(), user_id, guild_id
-            ))
-        else:
-            # 새 데이터 생성
-            stats = {
-                'total_games': 1, 'total_wins': 1 if won else 0,
-                'tank_games': 0, 'tank_wins': 0,
-                'dps_games': 0, 'dps_wins': 0,
-                'support_games': 0, 'support_wins': 0
-            }
-            
-            if position == '탱커':
-                stats['tank_games'] = 1
-                stats['tank_wins'] = 1 if won else 0
-            elif position == '딜러':
-                stats['dps_games'] = 1
-                stats['dps_wins'] = 1 if won else 0
-            elif position == '힐러':
-                stats['support_games'] = 1
-                stats['support_wins'] = 1 if won else 0
-            
-            await db.execute('''
-                INSERT INTO user_statistics (
-                    user_id, guild_id, total_games, total_wins,
-                    tank_games, tank_wins, dps_games, dps_wins,
-                    support_games, support_wins, last_updated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                user_id, guild_id, stats['total_games'], stats['total_wins'],
-                stats['tank_games'], stats['tank_wins'], stats['dps_games'], stats['dps_wins'],
-                stats['support_games'], stats['support_wins'], datetime.now().isoformat()
-            ))
+    async def _upsert_user_stats(self, db, guild_id: str, entries: List[Tuple[str, Optional[str], bool]]) -> int:
+        """(user_id, 포지션, 승리 여부) 목록을 사용자별로 합산해 user_statistics 에 upsert (commit 은 호출자가 수행)
+        
+        탱커/딜러/힐러 외의 포지션은 전체 전적에만 반영한다.
+        
+        Returns:
+            반영된 사용자 수
+        """
+        position_columns = {'탱커': (2, 3), '딜러': (4, 5), '힐러': (6, 7)}
+        
+        # [total_games, total_wins, tank_games, tank_wins, dps_games, dps_wins, support_games, support_wins]
+        deltas: Dict[str, List[int]] = {}
+        for user_id, position, won in entries:
+            delta = deltas.setdefault(user_id, [0] * 8)
+            delta[0] += 1
+            delta[1] += 1 if won else 0
+            columns = position_columns.get(position)
+            if columns:
+                delta[columns[0]] += 1
+                delta[columns[1]] += 1 if won else 0
+        
+        if not deltas:
+            return 0
+        
+        now = datetime.now().isoformat()
+        await db.executemany('''
+            INSERT INTO user_statistics (
+                user_id, guild_id, total_games, total_wins,
+                tank_games, tank_wins, dps_games, dps_wins,
+                support_games, support_wins, last_updated
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, guild_id) DO UPDATE SET
+                total_games = total_games + excluded.total_games,
+                total_wins = total_wins + excluded.total_wins,
+                tank_games = tank_games + excluded.tank_games,
+                tank_wins = tank_wins + excluded.tank_wins,
+                dps_games = dps_games + excluded.dps_games,
+                dps_wins = dps_wins + excluded.dps_wins,
+                support_games = support_games + excluded.support_games,
+                support_wins = support_wins + excluded.support_wins,
+                last_updated = excluded.last_updated
+        ''', [(user_id, guild_id, *delta, now) for user_id, delta in deltas.items()])
+        
+        return len(deltas)
 
     async def get_detailed_user_stats(self, user_id: str, guild_id: str = None) -> Dict:
         """사용자의 상세 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 query = '''
                     SELECT total_games, total_wins, tank_games, tank_wins,
                         dps_games, dps_wins, support_games, support_wins
@@ -4182,7 +4281,7 @@ class DatabaseManager:
     async def get_recent_matches(self, user_id: str, guild_id: str, limit: int = 5) -> List[Dict]:
         """사용자의 최근 경기 기록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT mr.match_date, mp.position, mp.won, mr.match_number,
                         sr.title as scrim_title
@@ -4213,7 +4312,7 @@ class DatabaseManager:
     async def get_user_server_rank(self, user_id: str, guild_id: str, position: str = "all") -> Dict:
         """특정 사용자의 서버 내 순위 조회 (포지션별 순위 지원)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 포지션별 게임 수와 승수 컬럼 선택
                 if position == "tank":
                     games_col = "tank_games"
@@ -4272,33 +4371,21 @@ class DatabaseManager:
     async def get_head_to_head(self, user1_id: str, user2_id: str, guild_id: str) -> Dict:
         """두 사용자 간 대전 기록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute('''
-                    SELECT 
-                        SUM(CASE WHEN mp1.won = 1 AND mp2.won = 0 THEN 1 ELSE 0 END) as user1_wins,
-                        SUM(CASE WHEN mp1.won = 0 AND mp2.won = 1 THEN 1 ELSE 0 END) as user2_wins,
-                        COUNT(*) as total_matches
-                    FROM match_participants mp1
-                    JOIN match_participants mp2 ON mp1.match_id = mp2.match_id
-                    JOIN match_results mr ON mp1.match_id = mr.id
-                    WHERE mp1.user_id = ?      
-                        AND mp2.user_id = ?         
-                        AND mp1.user_id != mp2.user_id 
-                        AND mp1.team != mp2.team    
-                        AND mr.guild_id = ?  
-                ''', (user1_id, user2_id, guild_id)) as cursor:
-                    result = await cursor.fetchone()
-                    
-                    if result and result[2] > 0:
-                        return {
-                            'user1_wins': result[0] or 0,
-                            'user2_wins': result[1] or 0,
-                            'total_matches': result[2],
-                            'wins': result[0] or 0,   
-                            'losses': result[1] or 0  
-                        }
-                    
-                    return None
+            async with self.get_connection(readonly=True) as db:
+                result = await self.queries.fetchone(
+                    db, 'get_head_to_head', (guild_id, user1_id, user2_id)
+                )
+                
+                if result and result[2] > 0:
+                    return {
+                        'user1_wins': result[0] or 0,
+                        'user2_wins': result[1] or 0,
+                        'total_matches': result[2],
+                        'wins': result[0] or 0,   
+                        'losses': result[1] or 0  
+                    }
+                
+                return None
                     
         except Exception as e:
             print(f"Head-to-Head 조회 실패: {e}")
@@ -4307,35 +4394,8 @@ class DatabaseManager:
     async def finalize_session_statistics(self, guild_id: str, completed_matches: List[Dict]):
         """세션 완료 후 모든 통계 일괄 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # 트랜잭션으로 일괄 처리
-                await db.execute('BEGIN TRANSACTION')
-                
-                try:
-                    for match_data in completed_matches:
-                        # 매치 저장
-                        match_id = await self.save_match_result(match_data)
-                        
-                        # 개별 통계 업데이트
-                        for team_key in ['team_a', 'team_b']:
-                            team_data = match_data[team_key]
-                            positions = match_data[f'{team_key}_positions']
-                            is_winning_team = (match_data['winner'] == team_key)
-                            
-                            for participant in team_data:
-                                user_id = participant['user_id']
-                                position = positions[user_id]
-                                
-                                await self._update_single_user_stats(
-                                    db, guild_id, user_id, position, is_winning_team
-                                )
-                    
-                    await db.execute('COMMIT')
-                    return True
-                    
-                except Exception as e:
-                    await db.execute('ROLLBACK')
-                    raise e
+            await self.record_matches(guild_id, completed_matches, registered_only=False)
+            return True
                     
         except Exception as e:
             print(f"세션 통계 완료 실패: {e}")
@@ -4344,7 +4404,7 @@ class DatabaseManager:
     async def get_max_match_number(self, recruitment_id: str) -> Optional[int]:
         """특정 모집의 최대 경기번호 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT MAX(match_number) FROM match_results 
                     WHERE recruitment_id = ?
@@ -4359,7 +4419,7 @@ class DatabaseManager:
     async def get_user_map_type_stats(self, user_id: str, guild_id: str) -> List[Dict]:
         """사용자의 맵 타입별 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         mr.map_type,
@@ -4393,7 +4453,7 @@ class DatabaseManager:
     async def get_user_best_worst_maps(self, user_id: str, guild_id: str) -> Dict:
         """사용자의 최고/최저 승률 맵 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         mr.map_name,
@@ -4444,7 +4504,7 @@ class DatabaseManager:
     async def get_user_position_map_stats(self, user_id: str, guild_id: str) -> List[Dict]:
         """사용자의 포지션-맵타입 조합별 성과 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         mp.position,
@@ -4481,7 +4541,7 @@ class DatabaseManager:
     async def get_server_map_type_rankings(self, guild_id: str, map_type: str, min_games: int = 3) -> List[Dict]:
         """서버 맵 타입별 랭킹 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         mp.user_id,
@@ -4520,7 +4580,7 @@ class DatabaseManager:
     async def get_server_specific_map_rankings(self, guild_id: str, map_name: str, min_games: int = 3) -> List[Dict]:
         """서버 특정 맵별 랭킹 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         mp.user_id,
@@ -4560,7 +4620,7 @@ class DatabaseManager:
                                 position: str = "all", min_games: int = 5) -> List[Dict]:
         """서버 내 사용자 랭킹 조회 (포지션별 데이터 반환 지원)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 맵 타입별 정렬인지 확인
                 if sort_by.endswith('_winrate'):
                     map_type_name = sort_by.replace('_winrate', '')
@@ -4641,7 +4701,7 @@ class DatabaseManager:
     async def get_server_map_popularity(self, guild_id: str, map_type: str = "all", limit: int = 10) -> List[Dict]:
         """서버 인기 맵 랭킹 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 if map_type == "all":
                     query = '''
                         SELECT 
@@ -4697,7 +4757,7 @@ class DatabaseManager:
     async def get_server_map_balance(self, guild_id: str, min_games: int = 3) -> List[Dict]:
         """서버 맵별 밸런스 분석 (A팀 vs B팀 승률)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         map_name,
@@ -4738,44 +4798,31 @@ class DatabaseManager:
     async def get_server_map_meta(self, guild_id: str, min_games: int = 5) -> List[Dict]:
         """서버 맵 메타 분석 (맵별 포지션 승률)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute('''
-                    SELECT 
-                        mr.map_name,
-                        mr.map_type,
-                        mp.position,
-                        COUNT(*) as games,
-                        SUM(mp.won) as wins,
-                        ROUND(SUM(mp.won) * 100.0 / COUNT(*), 1) as winrate
-                    FROM match_participants mp
-                    JOIN match_results mr ON mp.match_id = mr.id
-                    WHERE mr.guild_id = ? AND mr.map_name IS NOT NULL AND mp.position IS NOT NULL
-                    GROUP BY mr.map_name, mr.map_type, mp.position
-                    HAVING COUNT(*) >= ?
-                    ORDER BY mr.map_name, winrate DESC
-                ''', (guild_id, min_games)) as cursor:
-                    rows = await cursor.fetchall()
-                    
-                    # 맵별로 그룹화해서 반환
-                    map_meta = {}
-                    for row in rows:
-                        map_name = row[0]
-                        if map_name not in map_meta:
-                            map_meta[map_name] = {
-                                'map_name': row[0],
-                                'map_type': row[1],
-                                'positions': []
-                            }
-                        
-                        map_meta[map_name]['positions'].append({
-                            'position': row[2],
-                            'games': row[3],
-                            'wins': row[4],
-                            'winrate': row[5]
-                        })
-                    
-                    return list(map_meta.values())
+            async with self.get_connection(readonly=True) as db:
+                rows = await self.queries.fetchall(
+                    db, 'get_server_map_meta', (guild_id, min_games)
+                )
+                
+                # 맵별로 그룹화해서 반환
+                map_meta = {}
+                for row in rows:
+                    map_name = row[0]
+                    if map_name not in map_meta:
+                        map_meta[map_name] = {
+                            'map_name': row[0],
+                            'map_type': row[1],
+                            'positions': []
+                        }
                     
+                    map_meta[map_name]['positions'].append({
+                        'position': row[2],
+                        'games': row[3],
+                        'wins': row[4],
+                        'winrate': row[5]
+                    })
+                
+                return list(map_meta.values())
+                
         except Exception as e:
             print(f"서버 맵 메타 조회 실패: {e}")
             return []
@@ -4783,7 +4830,7 @@ class DatabaseManager:
     async def get_server_map_overview(self, guild_id: str) -> Dict:
         """서버 맵 통계 전체 개요"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 전체 통계
                 async with db.execute('''
                     SELECT 
@@ -4846,7 +4893,7 @@ class DatabaseManager:
     async def get_user_detailed_map_stats(self, user_id: str, guild_id: str, map_type: str = None) -> List[Dict]:
         """사용자의 상세 맵별 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 base_query = '''
                     SELECT 
                         mr.map_name,
@@ -4894,7 +4941,7 @@ class DatabaseManager:
     async def get_user_position_map_matrix(self, user_id: str, guild_id: str) -> List[Dict]:
         """사용자의 포지션-맵 매트릭스 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         mp.position,
@@ -4930,7 +4977,7 @@ class DatabaseManager:
     async def get_map_improvement_suggestions(self, user_id: str, guild_id: str) -> Dict:
         """맵/포지션 개선 제안 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 가장 약한 맵 타입 찾기
                 async with db.execute('''
                     SELECT 
@@ -5019,7 +5066,7 @@ class DatabaseManager:
     async def get_map_teammates_recommendations(self, user_id: str, guild_id: str, map_type: str = None) -> List[Dict]:
         """특정 맵에서 잘하는 추천 팀원들 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 base_query = '''
                     SELECT 
                         mp.user_id,
@@ -5070,51 +5117,29 @@ class DatabaseManager:
                                     my_position: str, teammate_position: str) -> List[TeammatePairStats]:
         """특정 포지션 페어의 승률 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                # 같은 팀에서 함께 플레이한 경기들 조회
-                query = '''
-                    SELECT 
-                        teammate.user_id as teammate_id,
-                        teammate.username as teammate_name,
-                        COUNT(DISTINCT me.match_id) as total_games,
-                        SUM(CASE WHEN me.won = 1 THEN 1 ELSE 0 END) as wins
-                    FROM match_participants me
-                    JOIN match_participants teammate ON (
-                        me.match_id = teammate.match_id 
-                        AND me.team = teammate.team 
-                        AND me.user_id != teammate.user_id
+            async with self.get_connection(readonly=True) as db:
+                rows = await self.queries.fetchall(
+                    db, 'get_teammate_pair_stats', (guild_id, user_id, my_position, teammate_position)
+                )
+                
+                pair_stats = []
+                for row in rows:
+                    teammate_id, teammate_name, total_games, wins = row
+                    winrate = round((wins / total_games) * 100, 1) if total_games > 0 else 0.0
+                    
+                    stats = TeammatePairStats(
+                        teammate_id=teammate_id,
+                        teammate_name=teammate_name,
+                        my_position=my_position,
+                        teammate_position=teammate_position,
+                        total_games=total_games,
+                        wins=wins,
+                        winrate=winrate
                     )
-                    JOIN match_results mr ON me.match_id = mr.id
-                    WHERE me.user_id = ? 
-                        AND mr.guild_id = ?
-                        AND me.position = ? 
-                        AND teammate.position = ?
-                    GROUP BY teammate.user_id, teammate.username
-                    HAVING COUNT(*) >= 1
-                    ORDER BY wins DESC, total_games DESC
-                '''
+                    pair_stats.append(stats)
+                
+                return pair_stats
                 
-                async with db.execute(query, (user_id, guild_id, my_position, teammate_position)) as cursor:
-                    rows = await cursor.fetchall()
-                    
-                    pair_stats = []
-                    for row in rows:
-                        teammate_id, teammate_name, total_games, wins = row
-                        winrate = round((wins / total_games) * 100, 1) if total_games > 0 else 0.0
-                        
-                        stats = TeammatePairStats(
-                            teammate_id=teammate_id,
-                            teammate_name=teammate_name,
-                            my_position=my_position,
-                            teammate_position=teammate_position,
-                            total_games=total_games,
-                            wins=wins,
-                            winrate=winrate
-                        )
-                        pair_stats.append(stats)
-                    
-                    return pair_stats
-                    
         except Exception as e:
             print(f"팀메이트 페어 통계 조회 실패: {e}")
             return []
@@ -5122,10 +5147,11 @@ class DatabaseManager:
     async def get_user_team_winrate_analysis(self, user_id: str, guild_id: str) -> Optional[TeamWinrateAnalysis]:
         """사용자의 전체 팀 승률 분석 - 동료 승률 시스템"""
         try:
-            # 각 포지션별 동료 승률 조회 (내 포지션 무관)
-            tank_teammates = await self.get_teammate_stats_by_position(user_id, guild_id, '탱커')
-            dps_teammates = await self.get_teammate_stats_by_position(user_id, guild_id, '딜러')
-            support_teammates = await self.get_teammate_stats_by_position(user_id, guild_id, '힐러')
+            # 각 포지션별 동료 승률 조회 (내 포지션 무관, 집계 테이블 1회 조회)
+            teammates = await self.get_teammate_stats_all_positions(user_id, guild_id)
+            tank_teammates = teammates.get('탱커', [])
+            dps_teammates = teammates.get('딜러', [])
+            support_teammates = teammates.get('힐러', [])
             
             # 사용자 정보 조회
             user_info = await self.get_registered_user_info(guild_id, user_id)
@@ -5219,7 +5245,7 @@ class DatabaseManager:
     async def debug_team_winrate_data(self, user_id: str, guild_id: str) -> Dict:
         """팀 승률 데이터 디버깅용"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 사용자의 모든 경기 데이터 조회
                 async with db.execute('''
                     SELECT mp.match_id, mp.position, mp.won, mp.team,
@@ -5269,34 +5295,21 @@ class DatabaseManager:
     async def get_user_map_type_stats(self, user_id: str, guild_id: str):
         """사용자의 맵 타입별 통계 (database.py에 추가)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                query = '''
-                    SELECT 
-                        mr.map_type,
-                        COUNT(*) as games,
-                        SUM(CASE WHEN mp.won = 1 THEN 1 ELSE 0 END) as wins,
-                        ROUND(AVG(CASE WHEN mp.won = 1 THEN 100.0 ELSE 0.0 END), 1) as winrate
-                    FROM match_participants mp
-                    JOIN match_results mr ON mp.match_id = mr.id
-                    WHERE mp.user_id = ? AND mr.guild_id = ? AND mr.map_type IS NOT NULL
-                    GROUP BY mr.map_type
-                    HAVING COUNT(*) >= 3
-                    ORDER BY winrate DESC, games DESC
-                '''
+            async with self.get_connection(readonly=True) as db:
+                rows = await self.queries.fetchall(
+                    db, 'get_user_map_type_stats', (user_id, guild_id)
+                )
+                
+                return [
+                    {
+                        'map_type': row[0],
+                        'games': row[1],
+                        'wins': row[2],
+                        'winrate': row[3]
+                    }
+                    for row in rows
+                ]
                 
-                async with db.execute(query, (user_id, guild_id)) as cursor:
-                    rows = await cursor.fetchall()
-                    
-                    return [
-                        {
-                            'map_type': row[0],
-                            'games': row[1],
-                            'wins': row[2],
-                            'winrate': row[3]
-                        }
-                        for row in rows
-                    ]
-                    
         except Exception as e:
             print(f"맵 타입별 통계 조회 실패: {e}")
             return []
@@ -5304,7 +5317,7 @@ class DatabaseManager:
     async def get_user_best_worst_maps(self, user_id: str, guild_id: str, limit: int = 3):
         """사용자의 베스트/워스트 맵 (database.py에 추가)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 query = '''
                     SELECT 
                         mr.map_name,
@@ -5344,7 +5357,7 @@ class DatabaseManager:
     async def get_user_recent_matches(self, user_id: str, guild_id: str, limit: int = 5):
         """사용자의 최근 경기"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 query = '''
                     SELECT 
                         mp.won,
@@ -5376,7 +5389,7 @@ class DatabaseManager:
     async def get_user_actual_team_games(self, user_id: str, guild_id: str) -> int:
         """사용자의 실제 고유 경기 수 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT COUNT(DISTINCT mr.id)
                     FROM match_participants mp
@@ -5393,53 +5406,59 @@ class DatabaseManager:
     async def get_teammate_stats_by_position(self, user_id: str, guild_id: str, teammate_position: str) -> List[TeammatePairStats]:
         """특정 포지션 동료들과의 승률 통계 조회 (내 포지션 무관)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                query = '''
-                    SELECT 
-                        teammate.user_id as teammate_id,
-                        teammate.username as teammate_name,
-                        COUNT(*) as total_games,
-                        SUM(me.won) as wins
-                    FROM match_participants me
-                    JOIN match_participants teammate ON (
-                        me.match_id = teammate.match_id 
-                        AND me.team = teammate.team 
-                        AND me.user_id != teammate.user_id
+            async with self.get_connection(readonly=True) as db:
+                rows = await self.queries.fetchall(
+                    db, 'get_teammate_stats_by_position', (guild_id, user_id, teammate_position)
+                )
+                
+                teammate_stats = []
+                for row in rows:
+                    teammate_id, teammate_name, total_games, wins = row
+                    winrate = round((wins / total_games) * 100, 1) if total_games > 0 else 0.0
+                    
+                    stats = TeammatePairStats(
+                        teammate_id=teammate_id,
+                        teammate_name=teammate_name,
+                        my_position="모든포지션",  # 내 포지션은 무관
+                        teammate_position=teammate_position,
+                        total_games=total_games,
+                        wins=wins,
+                        winrate=winrate
                     )
-                    JOIN match_results mr ON me.match_id = mr.id
-                    WHERE me.user_id = ? 
-                        AND mr.guild_id = ?
-                        AND teammate.position = ?  -- 동료의 포지션만 지정
-                    GROUP BY teammate.user_id, teammate.username
-                    HAVING COUNT(*) >= 1
-                    ORDER BY (SUM(me.won) * 100.0 / COUNT(*)) DESC, COUNT(*) DESC
-                '''
+                    teammate_stats.append(stats)
+                
+                return teammate_stats
                 
-                async with db.execute(query, (user_id, guild_id, teammate_position)) as cursor:
-                    rows = await cursor.fetchall()
-                    
-                    teammate_stats = []
-                    for row in rows:
-                        teammate_id, teammate_name, total_games, wins = row
-                        winrate = round((wins / total_games) * 100, 1) if total_games > 0 else 0.0
-                        
-                        stats = TeammatePairStats(
-                            teammate_id=teammate_id,
-                            teammate_name=teammate_name,
-                            my_position="모든포지션",  # 내 포지션은 무관
-                            teammate_position=teammate_position,
-                            total_games=total_games,
-                            wins=wins,
-                            winrate=winrate
-                        )
-                        teammate_stats.append(stats)
-                    
-                    return teammate_stats
-                    
         except Exception as e:
             print(f"동료 포지션별 승률 조회 실패 ({teammate_position}): {e}")
             return []
 
+    async def get_teammate_stats_all_positions(self, user_id: str, guild_id: str) -> Dict[str, List[TeammatePairStats]]:
+        """동료 포지션별 승률 통계를 한 번에 조회 (get_teammate_stats_by_position 과 같은 정렬)"""
+        try:
+            async with self.get_connection(readonly=True) as db:
+                rows = await self.queries.fetchall(
+                    db, 'get_teammate_stats_all_positions', (guild_id, user_id)
+                )
+            
+            by_position: Dict[str, List[TeammatePairStats]] = {}
+            for teammate_position, teammate_id, teammate_name, total_games, wins in rows:
+                by_position.setdefault(teammate_position, []).append(TeammatePairStats(
+                    teammate_id=teammate_id,
+                    teammate_name=teammate_name,
+                    my_position="모든포지션",
+                    teammate_position=teammate_position,
+                    total_games=total_games,
+                    wins=wins,
+                    winrate=0.0  # __post_init__ 에서 계산
+                ))
+            
+            return by_position
+            
+        except Exception as e:
+            print(f"동료 포지션별 승률 일괄 조회 실패: {e}")
+            return {}
+
     def _select_best_teammates(self, tank_teammates: List[TeammatePairStats], 
                             support_teammates: List[TeammatePairStats], 
                             dps_teammates: List[TeammatePairStats]) -> BestPairSummary:
@@ -5458,11 +5477,9 @@ class DatabaseManager:
     
     async def initialize_wordle_tables(self):
         """띵지워들 관련 테이블 초기화"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             try:
-                # 1. 기존 users 테이블에 워들 관련 컬럼 추가
-                await self._add_wordle_columns_to_users(db)
-                
+                # 1. registered_users 의 워들 컬럼은 마이그레이션 6 에서 추가
                 # 2. 워들 게임 테이블
                 await db.execute('''
                     CREATE TABLE IF NOT EXISTS wordle_games (
@@ -5542,24 +5559,6 @@ class DatabaseManager:
                 print(f"❌ 띵지워들 테이블 생성 중 오류: {e}")
                 raise
 
-    async def _add_wordle_columns_to_users(self, db):
-        """기존 users 테이블에 워들 관련 컬럼 추가"""
-        try:
-            # wordle_points 컬럼 추가
-            await db.execute('ALTER TABLE registered_users ADD COLUMN wordle_points INTEGER DEFAULT 10000')
-            print("✅ users 테이블에 wordle_points 컬럼 추가")
-        except Exception:
-            # 이미 컬럼이 존재하는 경우 무시
-            pass
-        
-        try:
-            # daily_points_claimed 컬럼 추가
-            await db.execute('ALTER TABLE registered_users ADD COLUMN daily_points_claimed TEXT')
-            print("✅ users 테이블에 daily_points_claimed 컬럼 추가")
-        except Exception:
-            # 이미 컬럼이 존재하는 경우 무시
-            pass
-
     async def _create_wordle_indexes(self, db):
         """워들 관련 테이블 인덱스 생성"""
         indexes = [
@@ -5587,7 +5586,7 @@ class DatabaseManager:
     async def get_user_points(self, guild_id: str, user_id: str) -> int:
         """등록된 사용자의 포인트 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT wordle_points FROM registered_users 
                     WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
@@ -5601,7 +5600,7 @@ class DatabaseManager:
     async def update_user_points(self, user_id: str, points: int) -> bool:
         """사용자 포인트 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE users 
                     SET wordle_points = ?, updated_at = CURRENT_TIMESTAMP
@@ -5616,7 +5615,7 @@ class DatabaseManager:
     async def add_user_points(self, guild_id: str, user_id: str, points: int) -> bool:
         """등록된 사용자만 포인트 변경 가능"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 cursor = await db.execute('''
                     UPDATE registered_users 
                     SET wordle_points = wordle_points + ?
@@ -5637,7 +5636,7 @@ class DatabaseManager:
         try:
             today = datetime.now().strftime('%Y-%m-%d')
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 등록된 사용자인지 확인 + 오늘 이미 받았는지 확인
                 async with db.execute('''
                     SELECT daily_points_claimed FROM registered_users 
@@ -5668,7 +5667,7 @@ class DatabaseManager:
     async def create_game(self, game: WordleGame) -> Optional[int]:
         """새 게임 생성"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 cursor = await db.execute('''
                     INSERT INTO wordle_games (
                         guild_id, word, hint, creator_id, creator_username,
@@ -5690,7 +5689,7 @@ class DatabaseManager:
     async def get_active_games(self, guild_id: str) -> List[Dict]:
         """활성 게임 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT id, word, hint, creator_id, creator_username, bet_points, total_pool,
                             created_at, expires_at
@@ -5722,7 +5721,7 @@ class DatabaseManager:
     async def get_game_by_id(self, game_id: int) -> Optional[Dict]:
         """ID로 게임 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM wordle_games WHERE id = ?
                 ''', (game_id,)) as cursor:
@@ -5738,7 +5737,7 @@ class DatabaseManager:
     async def delete_game(self, game_id: int, creator_id: str) -> bool:
         """게임 삭제 (본인만 가능)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 cursor = await db.execute('''
                     DELETE FROM wordle_games 
                     WHERE id = ? AND creator_id = ? AND is_completed = 0
@@ -5755,7 +5754,7 @@ class DatabaseManager:
                            winner_username: Optional[str] = None) -> bool:
         """게임 완료 처리"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE wordle_games 
                     SET is_completed = 1, is_active = 0,
@@ -5773,7 +5772,7 @@ class DatabaseManager:
     async def add_to_pool(self, game_id: int, amount: int) -> bool:
         """게임 포인트 풀에 포인트 추가"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE wordle_games 
                     SET total_pool = total_pool + ?
@@ -5789,7 +5788,7 @@ class DatabaseManager:
     async def create_attempt(self, attempt: WordleAttempt) -> Optional[int]:
         """새 도전 기록 생성"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 cursor = await db.execute('''
                     INSERT INTO wordle_attempts (
                         game_id, user_id, username, bet_amount, 
@@ -5811,7 +5810,7 @@ class DatabaseManager:
     async def get_user_attempt(self, game_id: int, user_id: str) -> Optional[Dict]:
         """사용자의 특정 게임 도전 기록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM wordle_attempts 
                     WHERE game_id = ? AND user_id = ?
@@ -5829,7 +5828,7 @@ class DatabaseManager:
                                     attempts_used: int) -> bool:
         """도전 진행 상황 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE wordle_attempts 
                     SET remaining_points = ?, attempts_used = ?
@@ -5845,7 +5844,7 @@ class DatabaseManager:
     async def complete_attempt(self, attempt_id: int, is_winner: bool) -> bool:
         """도전 완료 처리"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE wordle_attempts 
                     SET is_completed = 1, is_winner = ?, completed_at = CURRENT_TIMESTAMP
@@ -5861,7 +5860,7 @@ class DatabaseManager:
     async def add_guess(self, guess: WordleGuess) -> bool:
         """추측 기록 추가"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     INSERT INTO wordle_guesses (
                         attempt_id, guess_word, result_pattern, 
@@ -5881,7 +5880,7 @@ class DatabaseManager:
     async def get_attempt_guesses(self, attempt_id: int) -> List[Dict]:
         """특정 도전의 모든 추측 기록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT guess_word, result_pattern, guess_number, created_at
                     FROM wordle_guesses
@@ -5906,7 +5905,7 @@ class DatabaseManager:
     async def add_rating(self, rating: WordleRating) -> bool:
         """난이도 평가 추가"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     INSERT OR REPLACE INTO wordle_ratings (
                         game_id, user_id, username, rating, created_at
@@ -5925,7 +5924,7 @@ class DatabaseManager:
     async def get_game_ratings(self, game_id: int) -> Dict[str, int]:
         """게임의 난이도 평가 집계"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT rating, COUNT(*) 
                     FROM wordle_ratings 
@@ -5946,7 +5945,7 @@ class DatabaseManager:
     async def get_expired_games(self) -> List[Dict]:
         """만료된 게임들 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT id, creator_id, bet_points, total_pool
                     FROM wordle_games
@@ -5971,7 +5970,7 @@ class DatabaseManager:
     async def expire_game(self, game_id: int) -> bool:
         """게임 만료 처리"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE wordle_games 
                     SET is_active = 0, completed_at = CURRENT_TIMESTAMP
@@ -6032,7 +6031,7 @@ class DatabaseManager:
     async def safe_transfer_points(self, from_user_id: str, to_user_id: str, amount: int) -> bool:
         """안전한 포인트 이전 (트랜잭션)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('BEGIN TRANSACTION')
                 
                 try:
@@ -6079,7 +6078,7 @@ class DatabaseManager:
     async def safe_reward_winner(self, game_id: int, winner_id: str, total_pool: int) -> bool:
         """안전한 승자 보상 지급"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('BEGIN TRANSACTION')
                 
                 try:
@@ -6119,7 +6118,7 @@ class DatabaseManager:
     async def get_top_players(self, limit: int = 10) -> List[Dict]:
         """포인트 상위 플레이어 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT user_id, username, wordle_points
                     FROM registered_users
@@ -6145,7 +6144,7 @@ class DatabaseManager:
     async def get_user_stats(self, guild_id: str, user_id: str) -> Dict:
         """사용자 게임 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 기본 포인트 조회
                 points = await self.get_user_points(guild_id, user_id)
                 
@@ -6185,9 +6184,7 @@ class DatabaseManager:
 
     async def create_inter_guild_scrim_tables(self):
         """길드 간 스크림 관련 테이블 생성 (내전과 별도)"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 길드 간 스크림 모집 테이블
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS inter_guild_scrims (
@@ -6331,7 +6328,7 @@ class DatabaseManager:
             
     async def create_scrim(self, scrim_data: Dict[str, Any]) -> str:
         """새 길드 간 스크림 모집 생성"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             scrim_id = self.generate_uuid()
             created_at = datetime.now(timezone.utc).isoformat()
             
@@ -6347,13 +6344,15 @@ class DatabaseManager:
                 scrim_data['scrim_date'], scrim_data['deadline_date'], scrim_data['channel_id'],
                 5, 'active', scrim_data['created_by'], created_at
             ))
-            
+
             await db.commit()
-            return scrim_id
+
+        self._schedule_deadline('inter_guild_scrim', scrim_id, scrim_data['deadline_date'], naive_utc=True)
+        return scrim_id
 
     async def get_scrim_by_id(self, scrim_id: str) -> Optional[Dict[str, Any]]:
         """ID로 길드 간 스크림 모집 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT * FROM inter_guild_scrims WHERE id = ?
             ''', (scrim_id,)) as cursor:
@@ -6365,7 +6364,7 @@ class DatabaseManager:
 
     async def get_active_scrims(self, guild_id: str) -> List[Dict[str, Any]]:
         """활성 길드 간 스크림 모집 목록 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT s.*, 
                        COUNT(p.id) as participant_count
@@ -6383,7 +6382,7 @@ class DatabaseManager:
     async def add_participant(self, scrim_id: str, user_id: str, 
                             username: str, status: str = 'joined') -> bool:
         """길드 간 스크림 참가자 추가/업데이트"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             now = datetime.now(timezone.utc).isoformat()
             
             await db.execute('''
@@ -6397,7 +6396,7 @@ class DatabaseManager:
 
     async def get_participants(self, scrim_id: str) -> List[Dict[str, Any]]:
         """길드 간 스크림 모집 참가자 목록 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT * FROM inter_guild_participants 
                 WHERE scrim_id = ?
@@ -6409,33 +6408,22 @@ class DatabaseManager:
 
     async def update_scrim_status(self, scrim_id: str, status: str) -> bool:
         """길드 간 스크림 모집 상태 업데이트"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             await db.execute('''
                 UPDATE inter_guild_scrims 
                 SET status = ? 
                 WHERE id = ?
             ''', (status, scrim_id))
-            
+
             await db.commit()
-            return True
 
-    async def get_expired_scrims(self) -> List[Dict[str, Any]]:
-        """마감 시간이 지난 길드 간 스크림 모집 조회"""
-        current_time = datetime.now(timezone.utc).isoformat()
-        
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute('''
-                SELECT * FROM inter_guild_scrims 
-                WHERE status = 'active' 
-                AND deadline_date < ?
-            ''', (current_time,)) as cursor:
-                rows = await cursor.fetchall()
-                columns = [description[0] for description in cursor.description]
-                return [dict(zip(columns, row)) for row in rows]
+        if status != 'active':
+            self._cancel_deadline('inter_guild_scrim', scrim_id)
+        return True
 
     async def get_scrim_statistics(self, guild_id: str) -> Dict[str, Any]:
         """길드 간 스크림 모집 통계 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # 전체 통계
             async with db.execute('''
                 SELECT 
@@ -6472,7 +6460,7 @@ class DatabaseManager:
 
     async def delete_scrim(self, scrim_id: str) -> bool:
         """길드 간 스크림 모집 삭제 (관련 데이터도 함께 삭제)"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             # 참가자 데이터 먼저 삭제
             await db.execute('DELETE FROM inter_guild_participants WHERE scrim_id = ?', (scrim_id,))
             
@@ -6485,7 +6473,7 @@ class DatabaseManager:
     async def get_user_participation_history(self, guild_id: str, user_id: str) -> List[Dict]:
         """특정 사용자의 길드 간 스크림 참가 이력"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT s.title, s.scrim_date, s.status as scrim_status,
                         p.status as participation_status, p.joined_at
@@ -6510,7 +6498,7 @@ class DatabaseManager:
             from datetime import timedelta
             cutoff_date = (datetime.now() - timedelta(days=days_old)).isoformat()
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 오래된 참가자 데이터 삭제
                 await db.execute('''
                     DELETE FROM inter_guild_participants 
@@ -6537,7 +6525,7 @@ class DatabaseManager:
 
     async def get_available_clans_for_dropdown(self, guild_id: str) -> List[Dict[str, str]]:
         """드롭다운용 클랜 목록 조회 (등록된 클랜 + 글로벌 클랜)"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # 1. 현재 서버에 등록된 클랜들
             async with db.execute('''
                 SELECT clan_name, 'local' as source 
@@ -6584,7 +6572,7 @@ class DatabaseManager:
 
     async def get_our_clan_name(self, guild_id: str) -> Optional[str]:
         """현재 서버의 대표 클랜명 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # 가장 최근에 등록된 클랜을 대표 클랜으로 사용
             async with db.execute('''
                 SELECT clan_name 
@@ -6602,11 +6590,7 @@ class DatabaseManager:
         # 재시도 로직 추가
         for attempt in range(3):
             try:
-                async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                    await db.execute('PRAGMA journal_mode=WAL')
-                    await db.execute('PRAGMA synchronous=NORMAL')  # 성능 개선
-                    await db.execute('PRAGMA busy_timeout=30000')   # 30초 대기
-                    
+                async with self.get_connection() as db:
                     scrim_id = str(uuid.uuid4())
                     created_at = datetime.now(timezone.utc).isoformat()
                     
@@ -6651,8 +6635,11 @@ class DatabaseManager:
                             VALUES (?, ?, ?, 
                                     COALESCE((SELECT usage_count FROM global_shared_clans WHERE clan_name = ?), 0) + 1)
                         ''', (scrim_data['opponent_team'], scrim_data['guild_id'], now, scrim_data['opponent_team']))
-                        
+
                         await db.commit()
+                        self._schedule_deadline(
+                            'inter_guild_scrim', scrim_id, scrim_data['deadline_date'], naive_utc=True
+                        )
                         return scrim_id
                         
                     except Exception as e:
@@ -6671,7 +6658,7 @@ class DatabaseManager:
 
     async def update_global_clan_usage(self, clan_name: str, guild_id: str):
         """글로벌 클랜 사용 횟수 업데이트"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             now = datetime.now(timezone.utc).isoformat()
             
             await db.execute('''
@@ -6688,7 +6675,7 @@ class DatabaseManager:
     async def get_scrim_info(self, scrim_id: str) -> Optional[Dict[str, Any]]:
         """스크림 기본 정보 조회 (마감기한 체크용)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT id, guild_id, title, description, tier_range, opponent_team,
                         primary_date, deadline_date, channel_id, created_by, status,
@@ -6707,7 +6694,7 @@ class DatabaseManager:
 
     async def get_scrim_time_slots(self, scrim_id: str) -> List[Dict[str, Any]]:
         """스크림의 시간 조합 목록 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT id, date_str, time_slot, date_display, is_custom_time
                 FROM scrim_time_slots 
@@ -6721,7 +6708,7 @@ class DatabaseManager:
     async def add_position_participant(self, scrim_id: str, time_slot_id: int, 
                                      user_id: str, username: str, position: str) -> bool:
         """포지션별 참가자 추가"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             now = datetime.now(timezone.utc).isoformat()
             
             try:
@@ -6740,7 +6727,7 @@ class DatabaseManager:
     async def remove_position_participant(self, scrim_id: str, time_slot_id: int, 
                                         user_id: str, position: str) -> bool:
         """포지션별 참가자 제거"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             try:
                 await db.execute('''
                     DELETE FROM scrim_position_participants 
@@ -6755,7 +6742,7 @@ class DatabaseManager:
 
     async def get_position_participants(self, time_slot_id: int) -> Dict[str, List[Dict]]:
         """특정 시간대의 포지션별 참가자 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT user_id, username, position, joined_at
                 FROM scrim_position_participants 
@@ -6777,7 +6764,7 @@ class DatabaseManager:
 
     async def get_user_participation_status(self, scrim_id: str, user_id: str) -> Dict[str, Any]:
         """사용자의 스크림 참가 현황 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT ts.id as time_slot_id, ts.date_display, ts.time_slot, 
                        spp.position, spp.joined_at
@@ -6807,7 +6794,7 @@ class DatabaseManager:
 
     async def get_enhanced_scrim_summary(self, scrim_id: str) -> Dict[str, Any]:
         """향상된 스크림 요약 정보 (참가자 현황 포함)"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # 기본 스크림 정보
             async with db.execute('''
                 SELECT * FROM inter_guild_scrims WHERE id = ?
@@ -6847,7 +6834,7 @@ class DatabaseManager:
         min_level = tier_hierarchy.get(min_tier, 0)
         max_level = tier_hierarchy.get(max_tier, 8)
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # 등록된 사용자 중 해당 티어 범위의 사용자들 조회
             placeholders = ', '.join(['?' for _ in range(min_level, max_level + 1)])
             tier_names = [tier for tier, level in tier_hierarchy.items() 
@@ -6886,7 +6873,7 @@ class DatabaseManager:
     async def is_scrim_finalized(self, scrim_id: str) -> bool:
         """스크림이 마감되었는지 확인"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT COUNT(*) FROM scrim_time_slots 
                     WHERE scrim_id = ? AND finalized = TRUE
@@ -6900,7 +6887,7 @@ class DatabaseManager:
     async def finalize_time_slot(self, scrim_id: str, time_slot_id: int) -> bool:
         """특정 시간대를 확정 상태로 변경"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 해당 시간대를 확정 상태로 변경
                 await db.execute('''
                     UPDATE scrim_time_slots 
@@ -6920,7 +6907,7 @@ class DatabaseManager:
                 
         except Exception as e:
             try:
-                async with aiosqlite.connect(self.db_path) as db:
+                async with self.get_connection() as db:
                     await db.execute('''
                         UPDATE scrim_time_slots 
                         SET finalized = TRUE
@@ -6942,7 +6929,7 @@ class DatabaseManager:
     async def is_time_slot_finalized(self, time_slot_id: int) -> bool:
         """특정 시간대가 확정되었는지 확인"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT finalized FROM scrim_time_slots 
                     WHERE id = ?
@@ -6956,7 +6943,7 @@ class DatabaseManager:
     async def get_finalized_time_slots(self, scrim_id: str) -> List[Dict[str, Any]]:
         """확정된 시간대 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT id, scrim_id, date_str, time_slot, date_display, is_custom_time, finalized
                     FROM scrim_time_slots 
@@ -6973,7 +6960,7 @@ class DatabaseManager:
     async def get_non_finalized_time_slots(self, scrim_id: str) -> List[Dict[str, Any]]:
         """아직 확정되지 않은 시간대 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT id, scrim_id, date_str, time_slot, date_display, is_custom_time, 
                         COALESCE(finalized, FALSE) as finalized
@@ -6988,36 +6975,6 @@ class DatabaseManager:
             print(f"❌ get_non_finalized_time_slots 오류: {e}")
             return []
 
-    async def update_scrim_time_slots_table(self):
-        """기존 테이블에 finalized 컬럼 추가 (마이그레이션용)"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # finalized 컬럼이 존재하는지 확인
-                async with db.execute("PRAGMA table_info(scrim_time_slots)") as cursor:
-                    columns = await cursor.fetchall()
-                    column_names = [col[1] for col in columns]
-                    
-                    if 'finalized' not in column_names:
-                        await db.execute('''
-                            ALTER TABLE scrim_time_slots 
-                            ADD COLUMN finalized BOOLEAN DEFAULT FALSE
-                        ''')
-                        print("✅ scrim_time_slots 테이블에 finalized 컬럼이 추가되었습니다.")
-                    
-                    if 'updated_at' not in column_names:
-                        await db.execute('''
-                            ALTER TABLE scrim_time_slots 
-                            ADD COLUMN updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        ''')
-                        print("✅ scrim_time_slots 테이블에 updated_at 컬럼이 추가되었습니다.")
-                
-                await db.commit()
-                return True
-                
-        except Exception as e:
-            print(f"❌ update_scrim_time_slots_table 오류: {e}")
-            return False
-
     async def get_scrim_finalization_summary(self, scrim_id: str) -> Dict[str, Any]:
         """스크림 마감 현황 요약 정보"""
         try:
@@ -7057,7 +7014,7 @@ class DatabaseManager:
     async def get_scrim_admin_info(self, scrim_id: str) -> Optional[Dict[str, Any]]:
         """스크림 관리자 정보 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT created_by, title, opponent_team, guild_id
                     FROM inter_guild_scrims 
@@ -7085,7 +7042,7 @@ class DatabaseManager:
             WHERE id = ?
             """
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute(query, (message_id, channel_id, recruitment_id))
                 await db.commit()
                 print(f"✅ 메시지 정보 업데이트 성공: {recruitment_id}")
@@ -7100,7 +7057,7 @@ class DatabaseManager:
         팀 밸런싱이 가능한 유저 목록 조회
         최소 게임 수를 충족하고 등록된 유저만 반환
         """
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT 
                     ru.user_id,
@@ -7130,7 +7087,7 @@ class DatabaseManager:
         """
         특정 유저의 포지션별 상세 통계 조회
         """
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             # 기본 통계
             async with db.execute('''
                 SELECT 
@@ -7187,7 +7144,7 @@ class DatabaseManager:
         # user_ids를 문자열로 변환하여 SQL IN 절에 사용
         user_ids_placeholder = ','.join('?' * len(user_ids))
         
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute(f'''
                 SELECT 
                     um.user1_id,
@@ -7219,7 +7176,7 @@ class DatabaseManager:
         
         user_ids_placeholder = ','.join('?' * len(user_ids))
         
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute(f'''
                 SELECT 
                     tc.user1_id,
@@ -7261,7 +7218,7 @@ class DatabaseManager:
         cutoff_date = datetime.now() - timedelta(days=days)
         cutoff_date_str = cutoff_date.isoformat()
         
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             # 최근 경기들 조회
             async with db.execute('''
                 SELECT 
@@ -7353,7 +7310,7 @@ class DatabaseManager:
         """
         서버 내 포지션 분포 현황 조회 (밸런싱 참고용)
         """
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT 
                     main_position,
@@ -7397,9 +7354,12 @@ class DatabaseManager:
 
     async def get_nickname_format(self, guild_id: str) -> dict:
         """서버의 닉네임 포맷 설정 조회"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        cached = self.settings_cache.get(SettingsCache.NICKNAME_FORMAT, guild_id)
+        if cached is not SettingsCache.MISSING:
+            return cached
+        version = self.settings_cache.version(SettingsCache.NICKNAME_FORMAT, guild_id)
+
+        async with self.get_connection(readonly=True) as db:
             async with db.execute('''
                 SELECT format_template, required_fields 
                 FROM nickname_format_settings 
@@ -7409,22 +7369,22 @@ class DatabaseManager:
                 
                 if row:
                     import json
-                    return {
+                    format_settings = {
                         'format_template': row[0],
                         'required_fields': json.loads(row[1]) if row[1] else []
                     }
                 else:
                     # 기본 포맷 반환 (기존 방식)
-                    return {
+                    format_settings = {
                         'format_template': '{battle_tag}/{position}/{tier}',
                         'required_fields': ['battle_tag', 'position', 'tier']
                     }
 
+        return self.settings_cache.set(SettingsCache.NICKNAME_FORMAT, guild_id, format_settings, version)
+
     async def set_nickname_format(self, guild_id: str, format_template: str, required_fields: list) -> bool:
         """서버의 닉네임 포맷 설정 저장"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             try:
                 import json
                 await db.execute('''
@@ -7436,6 +7396,7 @@ class DatabaseManager:
                 ''', (guild_id, format_template, json.dumps(required_fields)))
                 
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.NICKNAME_FORMAT, guild_id)
                 return True
             except Exception as e:
                 print(f"❌ 닉네임 포맷 설정 실패: {e}")
@@ -7492,6 +7453,26 @@ class DatabaseManager:
         }
         return position_map.get(position, position)
 
+    def build_nickname(self, template: str, main_position: str, current_tier: str,
+                       battle_tag: str, birth_year: str = None) -> str:
+        """등록 정보로 템플릿 닉네임 생성 (Discord 호출 없음)"""
+        # 배틀태그에서 닉네임 추출 (# 앞부분)
+        nickname = battle_tag.split('#')[0] if '#' in battle_tag else battle_tag
+        
+        # 데이터 준비
+        nickname_data = {
+            'nickname': nickname,
+            'battle_tag': battle_tag,
+            'birth_year': birth_year or '',
+            'position': main_position,
+            'tier': current_tier,
+            'previous_tier': '',  
+            'highest_tier': ''    
+        }
+        
+        # 템플릿으로 닉네임 생성
+        return self._generate_nickname_from_template(template, nickname_data)
+
     async def _update_user_nickname(self, discord_member: discord.Member, 
                                 main_position: str, current_tier: str, 
                                 battle_tag: str, birth_year: str = None) -> str:
@@ -7501,24 +7482,13 @@ class DatabaseManager:
             
             # 서버 닉네임 포맷 가져오기
             format_settings = await self.get_nickname_format(guild_id)
-            template = format_settings['format_template']
-            
-            # 배틀태그에서 닉네임 추출 (# 앞부분)
-            nickname = battle_tag.split('#')[0] if '#' in battle_tag else battle_tag
-            
-            # 데이터 준비
-            nickname_data = {
-                'nickname': nickname,
-                'battle_tag': battle_tag,
-                'birth_year': birth_year or '',
-                'position': main_position,
-                'tier': current_tier,
-                'previous_tier': '',  
-                'highest_tier': ''    
-            }
+            new_nickname = self.build_nickname(
+                format_settings['format_template'], main_position, current_tier, battle_tag, birth_year
+            )
             
-            # 템플릿으로 닉네임 생성
-            new_nickname = self._generate_nickname_from_template(template, nickname_data)
+            # 이미 같은 닉네임이면 API 호출 생략
+            if discord_member.nick == new_nickname:
+                return f"✅ 닉네임 유지: {new_nickname}"
             
             # Discord 닉네임 변경 시도
             old_nickname = discord_member.display_name
@@ -7537,9 +7507,7 @@ class DatabaseManager:
     async def approve_user_application_with_nickname(self, guild_id: str, user_id: str, admin_id: str, 
                                                     discord_member: discord.Member, admin_note: str = None) -> tuple[bool, str]:
         """유저 신청 승인 및 닉네임 자동 변경 (생년 포함)"""
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-            await db.execute('PRAGMA journal_mode=WAL')
-            
+        async with self.get_connection() as db:
             # 신청 정보 가져오기 (birth_year 포함)
             async with db.execute('''
                 SELECT guild_id, user_id, username, entry_method, battle_tag, 
@@ -7592,6 +7560,7 @@ class DatabaseManager:
             ''', (guild_id, user_id, application[4]))
             
             await db.commit()
+            self.member_profiles.invalidate(guild_id, user_id)
             
             # 닉네임 변경
             nickname_result = await self._update_user_nickname(
@@ -7613,9 +7582,7 @@ class DatabaseManager:
                             account_type: str = 'sub', rank_info: dict = None) -> bool:
         """배틀태그 추가"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 이미 존재하는지 확인
                 async with db.execute('''
                     SELECT COUNT(*) FROM user_battle_tags 
@@ -7643,6 +7610,7 @@ class DatabaseManager:
                 ''', (guild_id, user_id, battle_tag, account_type, is_first, rank_json))
                 
                 await db.commit()
+                self.member_profiles.invalidate(guild_id, user_id)
                 return True
                 
         except Exception as e:
@@ -7653,7 +7621,7 @@ class DatabaseManager:
     async def get_user_battle_tags(self, guild_id: str, user_id: str) -> List[Dict]:
         """유저의 모든 배틀태그 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT battle_tag, account_type, is_primary, rank_info, created_at
                     FROM user_battle_tags
@@ -7679,10 +7647,61 @@ class DatabaseManager:
             return []
 
 
+    async def get_member_profiles(self, guild_id: str, user_ids: List[str]) -> Dict[str, Dict]:
+        """여러 유저의 배틀태그 목록과 현재 티어를 한 번에 조회 (MemberProfileCache 경유)
+        
+        Returns:
+            {user_id: {'battle_tags': get_user_battle_tags 와 같은 형식, 'tier': current_season_tier 또는 None}}
+        """
+        profiles, missing = self.member_profiles.get_many(guild_id, user_ids)
+        if not missing:
+            return profiles
+        
+        version = self.member_profiles.version(guild_id)
+        loaded = {user_id: {'battle_tags': [], 'tier': None} for user_id in missing}
+        
+        try:
+            async with self.get_connection(readonly=True) as db:
+                # 같은 유저 ID 목록에 등록 정보와 배틀태그를 각각 LEFT JOIN (배틀태그만 있는 미등록 유저 포함)
+                placeholders = ', '.join('(?)' for _ in missing)
+                async with db.execute(f'''
+                    WITH ids(user_id) AS (VALUES {placeholders})
+                    SELECT ids.user_id, ru.current_season_tier,
+                        bt.battle_tag, bt.account_type, bt.is_primary, bt.rank_info, bt.created_at
+                    FROM ids
+                    LEFT JOIN registered_users ru
+                        ON ru.guild_id = ? AND ru.user_id = ids.user_id AND ru.is_active = TRUE
+                    LEFT JOIN user_battle_tags bt
+                        ON bt.guild_id = ? AND bt.user_id = ids.user_id
+                    ORDER BY ids.user_id, bt.is_primary DESC, bt.created_at ASC
+                ''', (*missing, guild_id, guild_id)) as cursor:
+                    rows = await cursor.fetchall()
+            
+            for user_id, tier, battle_tag, account_type, is_primary, rank_info, created_at in rows:
+                profile = loaded[user_id]
+                if tier:
+                    profile['tier'] = tier
+                if battle_tag is not None:
+                    profile['battle_tags'].append({
+                        'battle_tag': battle_tag,
+                        'account_type': account_type,
+                        'is_primary': bool(is_primary),
+                        'rank_info': json.loads(rank_info) if rank_info else None,
+                        'created_at': created_at
+                    })
+            
+            self.member_profiles.set_many(guild_id, loaded, version)
+            
+        except Exception as e:
+            print(f"❌ 멤버 프로필 일괄 조회 실패: {e}")
+        
+        profiles.update(loaded)
+        return profiles
+
     async def get_primary_battle_tag(self, guild_id: str, user_id: str) -> Optional[str]:
         """주계정 배틀태그 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT battle_tag FROM user_battle_tags
                     WHERE guild_id = ? AND user_id = ? AND is_primary = TRUE
@@ -7697,9 +7716,7 @@ class DatabaseManager:
     async def delete_battle_tag(self, guild_id: str, user_id: str, battle_tag: str) -> bool:
         """배틀태그 삭제"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # primary 계정인지 확인
                 async with db.execute('''
                     SELECT is_primary FROM user_battle_tags
@@ -7731,6 +7748,7 @@ class DatabaseManager:
                     ''', (guild_id, user_id, guild_id, user_id))
                 
                 await db.commit()
+                self.member_profiles.invalidate(guild_id, user_id)
                 return True
                 
         except Exception as e:
@@ -7741,9 +7759,7 @@ class DatabaseManager:
     async def set_primary_battle_tag(self, guild_id: str, user_id: str, battle_tag: str) -> bool:
         """주계정 설정"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 해당 배틀태그 존재 확인
                 async with db.execute('''
                     SELECT COUNT(*) FROM user_battle_tags
@@ -7769,6 +7785,7 @@ class DatabaseManager:
                 ''', (guild_id, user_id, battle_tag))
                 
                 await db.commit()
+                self.member_profiles.invalidate(guild_id, user_id)
                 return True
                 
         except Exception as e:
@@ -7779,7 +7796,7 @@ class DatabaseManager:
     async def search_battle_tag_owner(self, guild_id: str, battle_tag: str) -> Optional[Dict]:
         """배틀태그로 소유자 검색 (역검색)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT u.user_id, u.username, t.account_type, t.is_primary
                     FROM user_battle_tags t
@@ -7805,9 +7822,7 @@ class DatabaseManager:
                                         battle_tag: str, rank_info: dict) -> bool:
         """배틀태그 랭크 정보 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 rank_json = json.dumps(rank_info) if rank_info else None
                 
                 await db.execute('''
@@ -7817,21 +7832,83 @@ class DatabaseManager:
                 ''', (rank_json, guild_id, user_id, battle_tag))
                 
                 await db.commit()
+                self.member_profiles.invalidate(guild_id, user_id)
                 return True
                 
         except Exception as e:
             print(f"❌ 랭크 정보 업데이트 실패: {e}")
             return False
 
+    async def get_battle_tags_for_refresh(self, guild_ids: List[str]) -> List[Dict]:
+        """랭크 갱신 대상 배틀태그 일괄 조회 (활성 등록 유저의 모든 배틀태그, 단일 쿼리)"""
+        if not guild_ids:
+            return []
+
+        try:
+            placeholders = ','.join('?' * len(guild_ids))
+            async with self.get_connection(readonly=True) as db:
+                async with db.execute(f'''
+                    SELECT ubt.guild_id, ubt.user_id, r.username, ubt.battle_tag, ubt.rank_info
+                    FROM user_battle_tags ubt
+                    JOIN registered_users r
+                        ON r.guild_id = ubt.guild_id
+                        AND r.user_id = ubt.user_id
+                        AND r.is_active = TRUE
+                    WHERE ubt.guild_id IN ({placeholders})
+                    ORDER BY ubt.guild_id, r.username, ubt.is_primary DESC, ubt.created_at ASC
+                ''', list(guild_ids)) as cursor:
+                    rows = await cursor.fetchall()
+                    return [{
+                        'guild_id': row[0],
+                        'user_id': row[1],
+                        'username': row[2],
+                        'battle_tag': row[3],
+                        'rank_info': json.loads(row[4]) if row[4] else None
+                    } for row in rows]
+        except Exception as e:
+            print(f"❌ 랭크 갱신 대상 조회 실패: {e}")
+            return []
+
+    async def bulk_update_battle_tag_rank_info(self, updates: List[Tuple[str, str, str, dict]]) -> int:
+        """
+        배틀태그 랭크 정보 일괄 업데이트 (단일 트랜잭션)
+
+        Args:
+            updates: (guild_id, user_id, battle_tag, rank_info) 목록
+
+        Returns:
+            업데이트된 행 수
+        """
+        if not updates:
+            return 0
+
+        try:
+            rows = [
+                (json.dumps(rank_info) if rank_info else None, guild_id, user_id, battle_tag)
+                for guild_id, user_id, battle_tag, rank_info in updates
+            ]
+            async with self.get_connection() as db:
+                cursor = await db.executemany('''
+                    UPDATE user_battle_tags
+                    SET rank_info = ?, last_updated = CURRENT_TIMESTAMP
+                    WHERE guild_id = ? AND user_id = ? AND battle_tag = ?
+                ''', rows)
+                await db.commit()
+                for guild_id, user_id, _, _ in updates:
+                    self.member_profiles.invalidate(guild_id, user_id)
+                return cursor.rowcount
+
+        except Exception as e:
+            print(f"❌ 랭크 정보 일괄 업데이트 실패: {e}")
+            return 0
+
     async def migrate_battle_tags_to_new_table(self):
         """기존 registered_users.battle_tag → user_battle_tags 마이그레이션"""
         try:
             print("=" * 60)
             print("🔍 [마이그레이션] 시작...")
             
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 1️⃣ 테이블 존재 확인
                 print("📋 [마이그레이션] 1단계: 테이블 존재 확인")
                 async with db.execute('''
@@ -7935,6 +8012,7 @@ class DatabaseManager:
                         print(f"   ⏭️  건너뜀: {username} (이미 존재)")
                 
                 await db.commit()
+                self.member_profiles.invalidate()
                 print("=" * 60)
                 print(f"🎉 [마이그레이션] 완료: {migrated_count}개 계정 이동")
                 print("=" * 60)
@@ -7963,7 +8041,7 @@ class DatabaseManager:
                 return primary_tag
             
             # 2순위: main 타입 배틀태그
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT battle_tag FROM user_battle_tags
                     WHERE guild_id = ? AND user_id = ? AND account_type = 'main'
@@ -7996,12 +8074,9 @@ class DatabaseManager:
         # API 호출 시도
         rank_info = None
         profile_data = await OverwatchAPI.fetch_profile(battle_tag)
-
-        print(f"[DEBUG] profile_data 존재 여부: {profile_data is not None}")
         
         if profile_data:
             rank_info = OverwatchAPI.parse_rank_info(profile_data)
-            print(f"[DEBUG] rank_info: {rank_info}")
         
         # 배틀태그 추가 (API 실패해도 진행)
         success = await self.add_battle_tag(guild_id, user_id, battle_tag, account_type, rank_info)
@@ -8009,17 +8084,21 @@ class DatabaseManager:
         return success, rank_info
 
 
-    async def refresh_battle_tag_rank(self, guild_id: str, user_id: str, battle_tag: str) -> Optional[Dict]:
+    async def refresh_battle_tag_rank(self, guild_id: str, user_id: str, battle_tag: str,
+                                      use_cache: bool = True) -> Optional[Dict]:
         """
         배틀태그 랭크 정보 갱신
         
+        Args:
+            use_cache: False 면 프로필 캐시를 건너뛰고 새로 조회 (유저가 직접 누른 새로고침)
+        
         Returns:
             갱신된 랭크 정보 dict 또는 None
         """
         from utils.overwatch_api import OverwatchAPI
         
         # API 호출
-        profile_data = await OverwatchAPI.fetch_profile(battle_tag)
+        profile_data = await OverwatchAPI.fetch_profile(battle_tag, use_cache=use_cache)
         
         if not profile_data:
             return None
@@ -8054,8 +8133,13 @@ class DatabaseManager:
 
     async def get_battle_tag_log_settings(self, guild_id: str) -> Optional[Dict]:
         """배틀태그 로그 설정 조회"""
+        cached = self.settings_cache.get(SettingsCache.BATTLE_TAG_LOG, guild_id)
+        if cached is not SettingsCache.MISSING:
+            return cached
+        version = self.settings_cache.version(SettingsCache.BATTLE_TAG_LOG, guild_id)
+
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT log_channel_id, log_add, log_delete, log_primary_change, log_tier_change
                     FROM battle_tag_log_settings
@@ -8063,26 +8147,26 @@ class DatabaseManager:
                 ''', (guild_id,)) as cursor:
                     row = await cursor.fetchone()
                     
+                    settings = None
                     if row:
-                        return {
+                        settings = {
                             'log_channel_id': row[0],
                             'log_add': bool(row[1]),
                             'log_delete': bool(row[2]),
                             'log_primary_change': bool(row[3]),
                             'log_tier_change': bool(row[4])
                         }
-                    return None
         except Exception as e:
             print(f"❌ 로그 설정 조회 실패: {e}")
             return None
 
+        return self.settings_cache.set(SettingsCache.BATTLE_TAG_LOG, guild_id, settings, version)
+
 
     async def set_battle_tag_log_channel(self, guild_id: str, channel_id: str) -> bool:
         """로그 채널 설정"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # UPSERT (없으면 INSERT, 있으면 UPDATE)
                 await db.execute('''
                     INSERT INTO battle_tag_log_settings (guild_id, log_channel_id, updated_at)
@@ -8094,6 +8178,7 @@ class DatabaseManager:
                 ''', (guild_id, channel_id))
                 
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.BATTLE_TAG_LOG, guild_id)
                 return True
         except Exception as e:
             print(f"❌ 로그 채널 설정 실패: {e}")
@@ -8107,9 +8192,7 @@ class DatabaseManager:
             if log_type not in valid_types:
                 return False
             
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 설정이 없으면 먼저 생성
                 await db.execute('''
                     INSERT INTO battle_tag_log_settings (guild_id)
@@ -8126,6 +8209,7 @@ class DatabaseManager:
                 await db.execute(query, (enabled, guild_id))
                 
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.BATTLE_TAG_LOG, guild_id)
                 return True
         except Exception as e:
             print(f"❌ 로그 토글 업데이트 실패: {e}")
@@ -8135,9 +8219,7 @@ class DatabaseManager:
     async def reset_battle_tag_log_channel(self, guild_id: str) -> bool:
         """로그 채널 설정 초기화 (채널 삭제 시)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE battle_tag_log_settings
                     SET log_channel_id = NULL, updated_at = CURRENT_TIMESTAMP
@@ -8145,6 +8227,7 @@ class DatabaseManager:
                 ''', (guild_id,))
                 
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.BATTLE_TAG_LOG, guild_id)
                 return True
         except Exception as e:
             print(f"❌ 로그 채널 초기화 실패: {e}")
@@ -8153,7 +8236,7 @@ class DatabaseManager:
     async def get_all_registered_users(self, guild_id: str) -> List[Dict]:
         """서버의 모든 등록된 유저 조회 (대표 배틀태그 포함)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         r.user_id, 
@@ -8192,103 +8275,35 @@ class DatabaseManager:
         map_type: Optional[str] = None,
         map_name: Optional[str] = None
     ) -> None:
+        await self.record_scrim_results(guild_id, [
+            {'user_id': user_id, 'position': position, 'result': result}
+        ])
+
+    async def record_scrim_results(self, guild_id: str, results: List[Dict]) -> None:
+        """경기 1건의 참가자 결과를 한 트랜잭션으로 통계에 반영
+        
+        Args:
+            guild_id: 서버 ID
+            results: [{'user_id', 'position', 'result': 'win' | 'loss'}]
+        """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # 포지션 매핑
-                position_map = {
-                    '탱커': 'tank',
-                    '딜러': 'dps', 
-                    '힐러': 'support'
-                }
-                
-                position_key = position_map.get(position)
-                
-                if not position_key:
-                    print(f"⚠️ 알 수 없는 포지션: {position}, 기본값 'dps' 사용")
-                    position_key = 'dps'
-                
-                # 승리 여부
-                is_win = 1 if result == 'win' else 0
-                
-                # 기존 통계 조회
-                async with db.execute('''
-                    SELECT total_games, total_wins,
-                        tank_games, tank_wins,
-                        dps_games, dps_wins,
-                        support_games, support_wins
-                    FROM user_statistics
-                    WHERE user_id = ? AND guild_id = ?
-                ''', (user_id, guild_id)) as cursor:
-                    existing = await cursor.fetchone()
-                
-                if existing:
-                    # 기존 데이터 업데이트
-                    total_games = existing[0] + 1
-                    total_wins = existing[1] + is_win
-                    tank_games = existing[2] + (1 if position_key == 'tank' else 0)
-                    tank_wins = existing[3] + (is_win if position_key == 'tank' else 0)
-                    dps_games = existing[4] + (1 if position_key == 'dps' else 0)
-                    dps_wins = existing[5] + (is_win if position_key == 'dps' else 0)
-                    support_games = existing[6] + (1 if position_key == 'support' else 0)
-                    support_wins = existing[7] + (is_win if position_key == 'support' else 0)
-                    
-                    await db.execute('''
-                        UPDATE user_statistics
-                        SET total_games = ?,
-                            total_wins = ?,
-                            tank_games = ?,
-                            tank_wins = ?,
-                            dps_games = ?,
-                            dps_wins = ?,
-                            support_games = ?,
-                            support_wins = ?,
-                            last_updated = ?
-                        WHERE user_id = ? AND guild_id = ?
-                    ''', (
-                        total_games, total_wins,
-                        tank_games, tank_wins,
-                        dps_games, dps_wins,
-                        support_games, support_wins,
-                        datetime.now().isoformat(),
-                        user_id, guild_id
-                    ))
-                else:
-                    # 새 레코드 생성
-                    total_games = 1
-                    total_wins = is_win
-                    tank_games = 1 if position_key == 'tank' else 0
-                    tank_wins = is_win if position_key == 'tank' else 0
-                    dps_games = 1 if position_key == 'dps' else 0
-                    dps_wins = is_win if position_key == 'dps' else 0
-                    support_games = 1 if position_key == 'support' else 0
-                    support_wins = is_win if position_key == 'support' else 0
-                    
-                    await db.execute('''
-                        INSERT INTO user_statistics (
-                            user_id, guild_id,
-                            total_games, total_wins,
-                            tank_games, tank_wins,
-                            dps_games, dps_wins,
-                            support_games, support_wins,
-                            last_updated
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        user_id, guild_id,
-                        total_games, total_wins,
-                        tank_games, tank_wins,
-                        dps_games, dps_wins,
-                        support_games, support_wins,
-                        datetime.now().isoformat()
-                    ))
-                
+            entries = []
+            for item in results:
+                position = item['position']
+                if position not in ('탱커', '딜러', '힐러'):
+                    print(f"⚠️ 알 수 없는 포지션: {position}, 기본값 '딜러' 사용")
+                    position = '딜러'
+                entries.append((item['user_id'], position, item['result'] == 'win'))
+            
+            async with self.get_connection() as db:
+                updated_users = await self._upsert_user_stats(db, guild_id, entries)
                 await db.commit()
-                
-                # 로그 출력
-                result_text = "승리" if is_win else "패배"
-                print(f"✅ 통계 업데이트: User {user_id} - {position}({position_key}) {result_text}")
+            
+            wins = sum(1 for _, _, won in entries if won)
+            print(f"✅ 통계 업데이트: {updated_users}명 (승리 {wins}, 패배 {len(entries) - wins})")
                 
         except Exception as e:
-            print(f"❌ record_scrim_result 실패: {e}")
+            print(f"❌ record_scrim_results 실패: {e}")
             import traceback
             traceback.print_exc()
             raise
@@ -8296,7 +8311,7 @@ class DatabaseManager:
     async def get_user_statistics(self, guild_id: str, user_id: str) -> Optional[Dict]:
         """특정 유저의 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT total_games, total_wins,
                         tank_games, tank_wins,
@@ -8328,7 +8343,7 @@ class DatabaseManager:
     async def set_voice_monitor_enabled(self, guild_id: str, enabled: bool) -> bool:
         """음성 모니터링 활성화 설정"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     INSERT INTO voice_monitor_settings (guild_id, enabled, updated_at)
                     VALUES (?, ?, CURRENT_TIMESTAMP)
@@ -8344,7 +8359,7 @@ class DatabaseManager:
     async def is_voice_monitor_enabled(self, guild_id: str) -> bool:
         """음성 모니터링 활성화 여부 확인"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT enabled FROM voice_monitor_settings
                     WHERE guild_id = ?
@@ -8365,7 +8380,7 @@ class DatabaseManager:
         """
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             # 현재 세션 정보 조회
             cursor = await db.execute('''
                 SELECT is_screen_sharing, updated_at, screen_share_seconds 
@@ -8407,7 +8422,7 @@ class DatabaseManager:
         """
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             # 세션 정보 조회
             cursor = await db.execute('''
                 SELECT join_time, is_muted, is_screen_sharing, updated_at, 
@@ -8477,7 +8492,7 @@ class DatabaseManager:
         session_uuid = str(uuid.uuid4())
         now = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             await db.execute('''
                 INSERT INTO voice_sessions (
                     session_uuid, guild_id, user_id, channel_id, 
@@ -8496,7 +8511,7 @@ class DatabaseManager:
         """음성 세션 종료"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             # 세션 정보 조회
             cursor = await db.execute('''
                 SELECT join_time FROM voice_sessions WHERE session_uuid = ? AND is_active = TRUE
@@ -8526,7 +8541,7 @@ class DatabaseManager:
         screen_share_seconds: int
     ):
         """유저의 총 화면 공유 시간 업데이트"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             await db.execute('''
                 UPDATE user_levels
                 SET total_screen_share_seconds = total_screen_share_seconds + ?,
@@ -8544,7 +8559,7 @@ class DatabaseManager:
         multiplier: float
     ):
         """화면 공유 보너스 설정"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             await db.execute('''
                 INSERT INTO voice_level_settings (
                     guild_id, screen_share_bonus_enabled, screen_share_multiplier, updated_at
@@ -8557,19 +8572,13 @@ class DatabaseManager:
             ''', (guild_id, enabled, multiplier, enabled, multiplier))
             
             await db.commit()
+            self.settings_cache.invalidate(SettingsCache.VOICE_LEVEL, guild_id)
 
 
     async def get_active_session(self, guild_id: str, user_id: str):
         """유저의 활성 세션 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute('''
-                SELECT session_uuid, channel_id, join_time, is_muted
-                FROM voice_sessions
-                WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
-                ORDER BY join_time DESC
-                LIMIT 1
-            ''', (guild_id, user_id))
-            row = await cursor.fetchone()
+        async with self.get_connection(readonly=True) as db:
+            row = await self.queries.fetchone(db, 'get_active_session', (guild_id, user_id))
             
             if row:
                 return {
@@ -8585,24 +8594,17 @@ class DatabaseManager:
         """세션 음소거 상태 업데이트"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                UPDATE voice_sessions 
-                SET is_muted = ?, updated_at = ?
-                WHERE session_uuid = ?
-            ''', (is_muted, datetime.utcnow().isoformat(), session_uuid))
-            await db.commit()
+        await self.write_queue.execute('''
+            UPDATE voice_sessions 
+            SET is_muted = ?, updated_at = ?
+            WHERE session_uuid = ?
+        ''', (is_muted, datetime.utcnow().isoformat(), session_uuid))
 
 
     async def get_users_in_channel(self, guild_id: str, channel_id: str):
         """특정 음성 채널에 있는 활성 유저 목록"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute('''
-                SELECT user_id, session_uuid, is_muted
-                FROM voice_sessions
-                WHERE guild_id = ? AND channel_id = ? AND is_active = TRUE
-            ''', (guild_id, channel_id))
-            rows = await cursor.fetchall()
+        async with self.get_connection(readonly=True) as db:
+            rows = await self.queries.fetchall(db, 'get_users_in_channel', (guild_id, channel_id))
             
             return [{'user_id': row[0], 'session_uuid': row[1], 'is_muted': bool(row[2])} for row in rows]
 
@@ -8625,7 +8627,7 @@ class DatabaseManager:
         if user1_id > user2_id:
             user1_id, user2_id = user2_id, user1_id
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             # 기존 관계 조회
             cursor = await db.execute('''
                 SELECT total_time_seconds FROM user_relationships
@@ -8659,7 +8661,7 @@ class DatabaseManager:
         if user1_id > user2_id:
             user1_id, user2_id = user2_id, user1_id
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             cursor = await db.execute('''
                 SELECT total_time_seconds, last_played_together, relationship_multiplier
                 FROM user_relationships
@@ -8677,7 +8679,7 @@ class DatabaseManager:
 
     async def get_user_relationships(self, guild_id: str, user_id: str):
         """특정 유저의 모든 관계 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             cursor = await db.execute('''
                 SELECT 
                     CASE WHEN user1_id = ? THEN user2_id ELSE user1_id END as partner_id,
@@ -8694,18 +8696,16 @@ class DatabaseManager:
 
     async def get_voice_level_settings(self, guild_id: str):
         """서버 음성 레벨 설정 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute('''
-                SELECT enabled, notification_channel_id, base_exp_per_minute, 
-                    daily_exp_limit, min_session_minutes, check_mute_status,
-                    screen_share_bonus_enabled, screen_share_multiplier
-                FROM voice_level_settings
-                WHERE guild_id = ?
-            ''', (guild_id,))
-            row = await cursor.fetchone()
+        cached = self.settings_cache.get(SettingsCache.VOICE_LEVEL, guild_id)
+        if cached is not SettingsCache.MISSING:
+            return cached
+        version = self.settings_cache.version(SettingsCache.VOICE_LEVEL, guild_id)
+
+        async with self.get_connection(readonly=True) as db:
+            row = await self.queries.fetchone(db, 'get_voice_level_settings', (guild_id,))
             
             if row:
-                return {
+                settings = {
                     'enabled': bool(row[0]),
                     'notification_channel_id': row[1],
                     'base_exp_per_minute': row[2],
@@ -8716,7 +8716,7 @@ class DatabaseManager:
                     'screen_share_multiplier': row[7] if row[7] is not None else 1.5
                 }
             else:
-                return {
+                settings = {
                     'enabled': False,
                     'notification_channel_id': None,
                     'base_exp_per_minute': 10.0,
@@ -8727,29 +8727,25 @@ class DatabaseManager:
                     'screen_share_multiplier': 1.5
                 }
 
+        return self.settings_cache.set(SettingsCache.VOICE_LEVEL, guild_id, settings, version)
+
     async def set_voice_level_enabled(self, guild_id: str, enabled: bool):
         """음성 레벨 기능 활성화/비활성화"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             await db.execute('''
                 INSERT INTO voice_level_settings (guild_id, enabled, updated_at)
                 VALUES (?, ?, ?)
                 ON CONFLICT(guild_id) DO UPDATE SET enabled = ?, updated_at = ?
             ''', (guild_id, enabled, datetime.utcnow().isoformat(), enabled, datetime.utcnow().isoformat()))
             await db.commit()
+            self.settings_cache.invalidate(SettingsCache.VOICE_LEVEL, guild_id)
 
     async def get_user_level(self, guild_id: str, user_id: str):
         """유저 레벨 정보 조회 (화면 공유 시간 포함)"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute('''
-                SELECT id, guild_id, user_id, current_level, current_exp, total_exp,
-                    total_play_time_seconds, total_screen_share_seconds, unique_partners_count, 
-                    last_exp_gain, daily_exp_gained, last_daily_reset, created_at, updated_at
-                FROM user_levels
-                WHERE guild_id = ? AND user_id = ?
-            ''', (guild_id, user_id))
-            row = await cursor.fetchone()
+        async with self.get_connection(readonly=True) as db:
+            row = await self.queries.fetchone(db, 'get_user_level', (guild_id, user_id))
             
             if row:
                 return {
@@ -8775,7 +8771,7 @@ class DatabaseManager:
         """새로운 유저 레벨 레코드 생성"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             now = datetime.utcnow().isoformat()
             await db.execute('''
                 INSERT INTO user_levels 
@@ -8798,7 +8794,7 @@ class DatabaseManager:
         """유저 레벨 정보 업데이트"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             now = datetime.utcnow().isoformat()
             await db.execute('''
                 UPDATE user_levels
@@ -8814,7 +8810,7 @@ class DatabaseManager:
         """유저 총 플레이 시간 업데이트"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             await db.execute('''
                 UPDATE user_levels
                 SET total_play_time_seconds = total_play_time_seconds + ?,
@@ -8828,7 +8824,7 @@ class DatabaseManager:
         """유저의 고유 파트너 수 업데이트 (캐싱용)"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             # 현재 관계 수 계산
             cursor = await db.execute('''
                 SELECT COUNT(*) FROM user_relationships
@@ -8849,7 +8845,7 @@ class DatabaseManager:
         """일일 exp 리셋"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             now = datetime.utcnow().isoformat()
             await db.execute('''
                 UPDATE user_levels
@@ -8861,7 +8857,7 @@ class DatabaseManager:
 
     async def get_level_leaderboard(self, guild_id: str, limit: int = 10):
         """레벨 순위표 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             cursor = await db.execute('''
                 SELECT user_id, current_level, total_exp, total_play_time_seconds, unique_partners_count
                 FROM user_levels
@@ -8885,7 +8881,7 @@ class DatabaseManager:
 
     async def get_diversity_leaderboard(self, guild_id: str, limit: int = 10):
         """다양성 순위표 조회 (많은 사람과 플레이한 순)"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             cursor = await db.execute('''
                 SELECT user_id, unique_partners_count, current_level, total_exp
                 FROM user_levels
@@ -8908,7 +8904,7 @@ class DatabaseManager:
 
     async def get_user_rank(self, guild_id: str, user_id: str):
         """유저의 서버 내 순위 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # 레벨 순위
             cursor = await db.execute('''
                 SELECT COUNT(*) + 1 as rank
@@ -8944,7 +8940,7 @@ class DatabaseManager:
 
     async def get_top_relationships(self, guild_id: str, limit: int = 10):
         """가장 많은 시간을 함께한 관계 순위"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             cursor = await db.execute('''
                 SELECT user1_id, user2_id, total_time_seconds, last_played_together
                 FROM user_relationships
@@ -8968,7 +8964,7 @@ class DatabaseManager:
         """알림 채널 설정"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             await db.execute('''
                 INSERT INTO voice_level_settings (guild_id, notification_channel_id, updated_at)
                 VALUES (?, ?, ?)
@@ -8978,19 +8974,21 @@ class DatabaseManager:
             ''', (guild_id, channel_id, datetime.utcnow().isoformat(), 
                 channel_id, datetime.utcnow().isoformat()))
             await db.commit()
+            self.settings_cache.invalidate(SettingsCache.VOICE_LEVEL, guild_id)
 
 
     async def clear_notification_channel(self, guild_id: str):
         """알림 채널 제거"""
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             await db.execute('''
                 UPDATE voice_level_settings
                 SET notification_channel_id = NULL, updated_at = ?
                 WHERE guild_id = ?
             ''', (datetime.utcnow().isoformat(), guild_id))
             await db.commit()
+            self.settings_cache.invalidate(SettingsCache.VOICE_LEVEL, guild_id)
 
 
     async def update_voice_level_setting(self, guild_id: str, setting_name: str, value):
@@ -9008,7 +9006,7 @@ class DatabaseManager:
         if setting_name not in allowed_settings:
             raise ValueError(f"Invalid setting name: {setting_name}")
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             # 기존 설정이 없으면 생성
             cursor = await db.execute('''
                 SELECT guild_id FROM voice_level_settings WHERE guild_id = ?
@@ -9027,6 +9025,7 @@ class DatabaseManager:
             '''
             await db.execute(query, (value, datetime.utcnow().isoformat(), guild_id))
             await db.commit()
+            self.settings_cache.invalidate(SettingsCache.VOICE_LEVEL, guild_id)
 
     async def update_session_mute_status_with_time(self, session_uuid: str, is_muted: bool):
         """
@@ -9038,7 +9037,7 @@ class DatabaseManager:
         """
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             # 현재 세션 정보 조회
             cursor = await db.execute('''
                 SELECT is_muted, updated_at, muted_seconds 
@@ -9081,7 +9080,7 @@ class DatabaseManager:
         """
         from datetime import datetime
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             # 세션 정보 조회
             cursor = await db.execute('''
                 SELECT join_time, is_muted, updated_at, muted_seconds 
@@ -9129,28 +9128,24 @@ class DatabaseManager:
 
     async def mark_session_as_solo(self, session_uuid: str):
         """세션을 혼자 있는 상태로 표시"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                UPDATE voice_sessions 
-                SET is_solo = TRUE,
-                    last_solo_marked_at = CURRENT_TIMESTAMP
-                WHERE session_uuid = ? AND is_active = TRUE
-            ''', (session_uuid,))
-            await db.commit()
+        await self.write_queue.execute('''
+            UPDATE voice_sessions 
+            SET is_solo = TRUE,
+                last_solo_marked_at = CURRENT_TIMESTAMP
+            WHERE session_uuid = ? AND is_active = TRUE
+        ''', (session_uuid,))
 
     async def mark_session_as_active_with_partners(self, session_uuid: str):
         """세션을 파트너와 함께 있는 상태로 표시"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                UPDATE voice_sessions 
-                SET is_solo = FALSE
-                WHERE session_uuid = ? AND is_active = TRUE
-            ''', (session_uuid,))
-            await db.commit()
+        await self.write_queue.execute('''
+            UPDATE voice_sessions 
+            SET is_solo = FALSE
+            WHERE session_uuid = ? AND is_active = TRUE
+        ''', (session_uuid,))
 
     async def get_session_elapsed_seconds(self, session_uuid: str) -> int:
         """세션의 경과 시간 계산 (초)"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             cursor = await db.execute('''
                 SELECT join_time, muted_seconds
                 FROM voice_sessions
@@ -9180,25 +9175,24 @@ class DatabaseManager:
         Args:
             updates: [(guild_id, user1_id, user2_id, seconds_to_add), ...]
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            for guild_id, user1_id, user2_id, seconds in updates:
-                # user1_id가 항상 작도록 정렬
-                if user1_id > user2_id:
-                    user1_id, user2_id = user2_id, user1_id
-                
-                await db.execute('''
-                    INSERT INTO user_relationships (
-                        guild_id, user1_id, user2_id, 
-                        total_time_seconds, last_played_together
-                    )
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    ON CONFLICT(guild_id, user1_id, user2_id) 
-                    DO UPDATE SET
-                        total_time_seconds = total_time_seconds + ?,
-                        last_played_together = CURRENT_TIMESTAMP
-                ''', (guild_id, user1_id, user2_id, seconds, seconds))
-            
-            await db.commit()
+        rows = []
+        for guild_id, user1_id, user2_id, seconds in updates:
+            # user1_id가 항상 작도록 정렬
+            if user1_id > user2_id:
+                user1_id, user2_id = user2_id, user1_id
+            rows.append((guild_id, user1_id, user2_id, seconds, seconds))
+        
+        await self.write_queue.executemany('''
+            INSERT INTO user_relationships (
+                guild_id, user1_id, user2_id, 
+                total_time_seconds, last_played_together
+            )
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(guild_id, user1_id, user2_id) 
+            DO UPDATE SET
+                total_time_seconds = total_time_seconds + ?,
+                last_played_together = CURRENT_TIMESTAMP
+        ''', rows)
 
     async def get_relationships_for_pairs(self, guild_id: str, pairs: list) -> dict:
         """여러 페어의 관계 정보 한 번에 조회
@@ -9214,7 +9208,7 @@ class DatabaseManager:
         
         results = {}
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # IN 절을 사용한 배치 조회
             placeholders = ','.join(['(?,?)' for _ in pairs])
             params = [guild_id]
@@ -9255,7 +9249,7 @@ class DatabaseManager:
         Returns:
             List[str]: 함께 안 한 유저 ID 리스트
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # 1. 해당 유저와 관계가 있는 모든 유저 ID 조회
             cursor = await db.execute('''
                 SELECT DISTINCT
@@ -9293,7 +9287,7 @@ class DatabaseManager:
         online_user_ids: List[str] = None,
         limit: int = 3
     ):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # 1. 함께 플레이한 적 있는 유저들
             cursor = await db.execute('''
                 SELECT DISTINCT
@@ -9353,7 +9347,7 @@ class DatabaseManager:
     ):
         from datetime import datetime, timedelta
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             # 기준 시간 (N일 전)
             threshold_date = datetime.utcnow() - timedelta(days=days_threshold)
             threshold_str = threshold_date.isoformat()
@@ -9422,14 +9416,11 @@ class DatabaseManager:
         from datetime import datetime
         now = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            for partner_id in partner_ids:
-                await db.execute('''
-                    INSERT OR IGNORE INTO session_partners 
-                    (session_uuid, partner_id, joined_together_at)
-                    VALUES (?, ?, ?)
-                ''', (session_uuid, partner_id, now))
-            await db.commit()
+        await self.write_queue.executemany('''
+            INSERT OR IGNORE INTO session_partners 
+            (session_uuid, partner_id, joined_together_at)
+            VALUES (?, ?, ?)
+        ''', [(session_uuid, partner_id, now) for partner_id in partner_ids])
 
 
     async def add_session_partner(self, session_uuid: str, partner_id: str):
@@ -9443,17 +9434,15 @@ class DatabaseManager:
         from datetime import datetime
         now = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                INSERT OR IGNORE INTO session_partners 
-                (session_uuid, partner_id, joined_together_at)
-                VALUES (?, ?, ?)
-            ''', (session_uuid, partner_id, now))
-            await db.commit()
+        await self.write_queue.execute('''
+            INSERT OR IGNORE INTO session_partners 
+            (session_uuid, partner_id, joined_together_at)
+            VALUES (?, ?, ?)
+        ''', (session_uuid, partner_id, now))
 
 
     async def get_session_partners(self, session_uuid: str) -> List[str]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection(readonly=True) as db:
             cursor = await db.execute('''
                 SELECT DISTINCT partner_id 
                 FROM session_partners
@@ -9462,8 +9451,125 @@ class DatabaseManager:
             rows = await cursor.fetchall()
             return [row[0] for row in rows]
 
+    async def get_active_voice_sessions(self, guild_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        활성 음성 세션 전체와 파트너 목록 (재시작 시 음성 접속 현황 메모리 모델 복구용)
+
+        같은 유저의 활성 세션이 여러 개면 join_time 순으로 반환 (마지막 것이 최신)
+        """
+        where = 'WHERE s.is_active = TRUE' + (' AND s.guild_id = ?' if guild_id else '')
+        params = (guild_id,) if guild_id else ()
+
+        async with self.get_connection(readonly=True) as db:
+            cursor = await db.execute(f'''
+                SELECT session_uuid, guild_id, user_id, channel_id, join_time, is_muted,
+                    is_screen_sharing, updated_at, muted_seconds, screen_share_seconds, is_solo
+                FROM voice_sessions s
+                {where}
+                ORDER BY join_time
+            ''', params)
+            rows = await cursor.fetchall()
+
+            cursor = await db.execute(f'''
+                SELECT p.session_uuid, p.partner_id
+                FROM session_partners p
+                JOIN voice_sessions s ON s.session_uuid = p.session_uuid
+                {where}
+            ''', params)
+            partner_rows = await cursor.fetchall()
+
+        partners: Dict[str, set] = {}
+        for session_uuid, partner_id in partner_rows:
+            partners.setdefault(session_uuid, set()).add(partner_id)
+
+        return [{
+            'session_uuid': row[0],
+            'guild_id': row[1],
+            'user_id': row[2],
+            'channel_id': row[3],
+            'join_time': row[4],
+            'is_muted': bool(row[5]),
+            'is_screen_sharing': bool(row[6]),
+            'updated_at': row[7] or row[4],
+            'muted_seconds': row[8] or 0,
+            'screen_share_seconds': row[9] or 0,
+            'is_solo': bool(row[10]),
+            'partners': partners.get(row[0], set()),
+        } for row in rows]
+
+    async def save_voice_session_start(
+        self,
+        session_uuid: str,
+        guild_id: str,
+        user_id: str,
+        channel_id: str,
+        join_time: str,
+        is_muted: bool,
+        is_screen_sharing: bool
+    ):
+        """메모리에서 시작한 음성 세션 기록 (세션 UUID/시각은 호출자가 정함)"""
+        await self.write_queue.execute('''
+            INSERT INTO voice_sessions (
+                session_uuid, guild_id, user_id, channel_id,
+                join_time, is_muted, is_screen_sharing, updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (session_uuid, guild_id, user_id, channel_id,
+            join_time, is_muted, is_screen_sharing, join_time))
+
+    async def add_session_partner_rows(self, rows: List[Tuple[str, str]]):
+        """(session_uuid, partner_id) 파트너 관계 일괄 기록 (입장 1건의 양방향 관계를 한 번에)"""
+        if not rows:
+            return
+
+        from datetime import datetime
+        now = datetime.utcnow().isoformat()
+
+        await self.write_queue.executemany('''
+            INSERT OR IGNORE INTO session_partners
+            (session_uuid, partner_id, joined_together_at)
+            VALUES (?, ?, ?)
+        ''', [(session_uuid, partner_id, now) for session_uuid, partner_id in rows])
+
+    async def save_voice_session_state(
+        self,
+        session_uuid: str,
+        is_muted: bool,
+        is_screen_sharing: bool,
+        muted_seconds: float,
+        screen_share_seconds: float,
+        updated_at: str
+    ):
+        """메모리에서 계산한 음소거/화면 공유 누적 상태 기록 (조회 없이 덮어씀)"""
+        await self.write_queue.execute('''
+            UPDATE voice_sessions
+            SET is_muted = ?, is_screen_sharing = ?, muted_seconds = ?,
+                screen_share_seconds = ?, updated_at = ?
+            WHERE session_uuid = ? AND is_active = TRUE
+        ''', (is_muted, is_screen_sharing, muted_seconds, screen_share_seconds, updated_at, session_uuid))
+
+    async def save_voice_session_end(
+        self,
+        session_uuid: str,
+        leave_time: str,
+        duration_seconds: int,
+        muted_seconds: int,
+        screen_share_seconds: int
+    ):
+        """메모리에서 정산한 음성 세션 종료 기록"""
+        await self.write_queue.execute('''
+            UPDATE voice_sessions
+            SET is_active = FALSE,
+                leave_time = ?,
+                duration_seconds = ?,
+                muted_seconds = ?,
+                screen_share_seconds = ?,
+                updated_at = ?
+            WHERE session_uuid = ? AND is_active = TRUE
+        ''', (leave_time, duration_seconds, muted_seconds, screen_share_seconds, leave_time, session_uuid))
+
     async def update_user_main_position(self, guild_id: str, user_id: str, main_position: str) -> bool:
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection() as db:
             try:
                 await db.execute('''
                     UPDATE registered_users 
@@ -9482,7 +9588,7 @@ class DatabaseManager:
         if not update_data:
             return True
         
-        async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+        async with self.get_connection() as db:
             try:
                 # 동적으로 UPDATE 쿼리 생성
                 set_clauses = []
@@ -9503,6 +9609,7 @@ class DatabaseManager:
                 
                 await db.execute(query, values)
                 await db.commit()
+                self.member_profiles.invalidate(guild_id, user_id)
                 return True
             except Exception as e:
                 print(f"선택적 프로필 업데이트 오류: {e}")
@@ -9511,7 +9618,7 @@ class DatabaseManager:
     async def set_inquiry_channel(self, guild_id: str, channel_id: str) -> bool:
         """관리팀 문의 채널 설정"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 기존 설정이 있는지 확인
                 async with db.execute('''
                     SELECT guild_id FROM inquiry_settings WHERE guild_id = ?
@@ -9533,6 +9640,7 @@ class DatabaseManager:
                     ''', (guild_id, channel_id))
                 
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.INQUIRY, guild_id)
                 return True
                 
         except Exception as e:
@@ -9542,7 +9650,7 @@ class DatabaseManager:
     async def get_inquiry_channel(self, guild_id: str) -> Optional[str]:
         """관리팀 문의 채널 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT team_inquiry_channel_id FROM inquiry_settings 
                     WHERE guild_id = ?
@@ -9560,8 +9668,13 @@ class DatabaseManager:
 
     async def get_inquiry_settings(self, guild_id: str) -> dict:
         """서버의 문의 시스템 설정 조회"""
+        cached = self.settings_cache.get(SettingsCache.INQUIRY, guild_id)
+        if cached is not SettingsCache.MISSING:
+            return cached
+        version = self.settings_cache.version(SettingsCache.INQUIRY, guild_id)
+
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM inquiry_settings WHERE guild_id = ?
                 ''', (guild_id,)) as cursor:
@@ -9569,10 +9682,10 @@ class DatabaseManager:
                     
                     if row:
                         columns = [desc[0] for desc in cursor.description]
-                        return dict(zip(columns, row))
+                        settings = dict(zip(columns, row))
                     else:
                         # 기본값 반환
-                        return {
+                        settings = {
                             'guild_id': guild_id,
                             'team_inquiry_channel_id': None,
                             'allowed_categories': '일반,건의,버그,계정,기타',
@@ -9586,11 +9699,13 @@ class DatabaseManager:
             print(f"❌ 문의 설정 조회 실패: {e}")
             return {}
 
+        return self.settings_cache.set(SettingsCache.INQUIRY, guild_id, settings, version)
+
 
     async def get_next_ticket_number(self, guild_id: str) -> str:
         """다음 티켓 번호 생성 (관리팀 문의 + 1:1 상담 모두 고려)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 1. inquiries 테이블에서 마지막 티켓 번호 조회
                 async with db.execute('''
                     SELECT ticket_number FROM inquiries 
@@ -9633,7 +9748,7 @@ class DatabaseManager:
     async def get_inquiry_stats(self, guild_id: str) -> dict:
         """서버의 문의 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 stats = {}
                 
                 # 전체 문의 수
@@ -9705,9 +9820,7 @@ class DatabaseManager:
     ) -> bool:
         """문의/티켓 저장"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 try:
                     await db.execute('''
                         INSERT INTO inquiries (
@@ -9746,9 +9859,7 @@ class DatabaseManager:
     ) -> bool:
         """문의 상태 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 if new_status == 'completed':
                     # 완료 시간 기록
                     await db.execute('''
@@ -9792,9 +9903,7 @@ class DatabaseManager:
     ) -> bool:
         """문의 로그 추가"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 문의 ID 조회
                 async with db.execute('''
                     SELECT id FROM inquiries
@@ -9834,9 +9943,7 @@ class DatabaseManager:
     ) -> bool:
         """익명 작성자 확인 로그 추가"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 문의 ID 조회
                 async with db.execute('''
                     SELECT id FROM inquiries
@@ -9871,7 +9978,7 @@ class DatabaseManager:
         try:
             from datetime import datetime, timedelta, timezone
             
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection() as db:
                 # ✅ 한국 시간(KST = UTC+9) 기준 오늘 00:00:00
                 kst = timezone(timedelta(hours=9))
                 now_kst = datetime.now(kst)
@@ -9896,7 +10003,7 @@ class DatabaseManager:
     async def get_inquiry_by_ticket(self, guild_id: str, ticket_number: str) -> Optional[dict]:
         """티켓 번호로 문의 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM inquiries
                     WHERE guild_id = ? AND ticket_number = ?
@@ -9922,7 +10029,7 @@ class DatabaseManager:
     ) -> List[dict]:
         """사용자의 문의 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 if status:
                     query = '''
                         SELECT * FROM inquiries
@@ -9953,7 +10060,7 @@ class DatabaseManager:
     async def get_inquiry_logs(self, guild_id: str, ticket_number: str) -> List[dict]:
         """문의 로그 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 문의 ID 조회
                 async with db.execute('''
                     SELECT id FROM inquiries
@@ -9984,7 +10091,7 @@ class DatabaseManager:
     async def get_reveal_logs(self, guild_id: str, ticket_number: str) -> List[dict]:
         """익명 작성자 확인 로그 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 문의 ID 조회
                 async with db.execute('''
                     SELECT id FROM inquiries
@@ -10026,9 +10133,7 @@ class DatabaseManager:
     ) -> bool:
         """상담 요청 저장"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 try:
                     await db.execute('''
                         INSERT INTO consultations (
@@ -10068,9 +10173,7 @@ class DatabaseManager:
     ) -> bool:
         """상담 상태 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 if new_status == 'accepted':
                     await db.execute('''
                         UPDATE consultations
@@ -10104,7 +10207,7 @@ class DatabaseManager:
     async def get_consultation_by_ticket(self, guild_id: str, ticket_number: str) -> Optional[dict]:
         """티켓 번호로 상담 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM consultations
                     WHERE guild_id = ? AND ticket_number = ?
@@ -10124,7 +10227,7 @@ class DatabaseManager:
     async def get_user_active_consultation(self, guild_id: str, user_id: str) -> Optional[dict]:
         """사용자의 진행 중인 상담 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM consultations
                     WHERE guild_id = ? AND user_id = ?
@@ -10168,7 +10271,7 @@ class DatabaseManager:
     async def get_consultation_stats(self, guild_id: str) -> dict:
         """서버의 상담 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 stats = {}
                 
                 # 전체 상담 수
@@ -10226,7 +10329,7 @@ class DatabaseManager:
     ) -> List[dict]:
         """사용자의 상담 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 if status:
                     query = '''
                         SELECT * FROM consultations
@@ -10263,7 +10366,7 @@ class DatabaseManager:
     ) -> List[dict]:
         """관리자의 상담 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 if status:
                     query = '''
                         SELECT * FROM consultations
@@ -10295,7 +10398,7 @@ class DatabaseManager:
     async def get_inquiry_stats(self, guild_id: str) -> dict:
         """서버의 문의 통계 조회 (관리팀 문의 + 1:1 상담)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 stats = {}
                 
                 # 관리팀 문의 통계
@@ -10350,7 +10453,7 @@ class DatabaseManager:
     async def get_active_inquiries(self, guild_id: str) -> List[dict]:
         """활성 상태의 문의 목록 조회 (View 복원용)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM inquiries
                     WHERE guild_id = ? AND status IN ('pending', 'processing')
@@ -10367,7 +10470,7 @@ class DatabaseManager:
     async def get_active_consultations(self, guild_id: str) -> List[dict]:
         """활성 상태의 상담 목록 조회 (View 복원용)"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM consultations
                     WHERE guild_id = ? AND status IN ('pending', 'accepted')
@@ -10383,7 +10486,7 @@ class DatabaseManager:
     async def get_server_admins(self, guild_id: str) -> List[dict]:
         """서버 관리자 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM server_admins
                     WHERE guild_id = ? AND is_active = TRUE
@@ -10401,7 +10504,7 @@ class DatabaseManager:
         try:
             from datetime import datetime, timedelta
             
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 now = datetime.utcnow()
                 one_hour_ago = now - timedelta(hours=1)
                 one_day_ago = now - timedelta(days=1)
@@ -10454,9 +10557,7 @@ class DatabaseManager:
         try:
             from datetime import datetime, timedelta
             
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 cooldown_until = datetime.now() + timedelta(hours=hours)
                 
                 await db.execute('''
@@ -10479,7 +10580,7 @@ class DatabaseManager:
         try:
             from datetime import datetime
             
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT cooldown_until, reason FROM inquiry_cooldowns
                     WHERE guild_id = ? AND user_id = ?
@@ -10511,9 +10612,7 @@ class DatabaseManager:
             
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
             
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # pending 상태 72시간 이상
                 await db.execute('''
                     UPDATE consultations
@@ -10561,7 +10660,7 @@ class DatabaseManager:
     ) -> bool:
         """TTS 전용 채널 설정"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute(
                     '''
                     INSERT INTO tts_channel_settings (guild_id, dedicated_channel_id, updated_at)
@@ -10573,6 +10672,7 @@ class DatabaseManager:
                     (guild_id, channel_id)
                 )
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.TTS_CHANNEL, guild_id)
                 return True
         except Exception as e:
             logger.error(f"❌ TTS 전용 채널 설정 실패: {e}")
@@ -10581,7 +10681,7 @@ class DatabaseManager:
     async def get_tts_dedicated_channel(self, guild_id: str) -> str:
         """TTS 전용 채널 ID 조회"""
         try:
-            async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT dedicated_channel_id FROM tts_channel_settings
                     WHERE guild_id = ?
@@ -10593,9 +10693,23 @@ class DatabaseManager:
             print(f"❌ TTS 전용 채널 조회 실패: {e}")
             return None
 
+    async def get_tts_dedicated_channel_ids(self) -> Dict[str, str]:
+        """TTS 전용 채널이 설정된 모든 서버 {guild_id: channel_id} (자동 TTS 채널 색인용)"""
+        async with self.get_connection(readonly=True) as db:
+            async with db.execute('''
+                SELECT guild_id, dedicated_channel_id FROM tts_channel_settings
+                WHERE dedicated_channel_id IS NOT NULL
+            ''') as cursor:
+                return {row[0]: row[1] for row in await cursor.fetchall()}
+
     async def get_tts_channel_settings(self, guild_id: str) -> Optional[Dict[str, Any]]:
         """TTS 전용 채널 설정 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
+        cached = self.settings_cache.get(SettingsCache.TTS_CHANNEL, guild_id)
+        if cached is not SettingsCache.MISSING:
+            return cached
+        version = self.settings_cache.version(SettingsCache.TTS_CHANNEL, guild_id)
+
+        async with self.get_connection(readonly=True) as db:
             cursor = await db.execute(
                 '''
                 SELECT dedicated_channel_id, auto_filter_short_reactions, 
@@ -10607,15 +10721,17 @@ class DatabaseManager:
             )
             result = await cursor.fetchone()
             
+            settings = None
             if result:
-                return {
+                settings = {
                     'channel_id': result[0],
                     'filter_short': bool(result[1]),
                     'min_length': result[2],
                     'filter_emoji': bool(result[3]),
                     'filter_bot': bool(result[4])
                 }
-            return None
+
+        return self.settings_cache.set(SettingsCache.TTS_CHANNEL, guild_id, settings, version)
 
     async def set_user_tts_preference(
         self, 
@@ -10628,7 +10744,7 @@ class DatabaseManager:
     ) -> bool:
         """사용자의 TTS 설정 저장"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute(
                     '''
                     INSERT INTO user_tts_preferences 
@@ -10644,32 +10760,43 @@ class DatabaseManager:
                     (guild_id, user_id, voice, rate, pitch, volume)
                 )
                 await db.commit()
+                self.settings_cache.invalidate(SettingsCache.TTS_PREFERENCE, f"{guild_id}:{user_id}")
                 return True
         except Exception as e:
             logger.error(f"❌ TTS 설정 저장 실패: {e}")
             return False
 
     async def get_user_tts_preference(self, guild_id: str, user_id: str) -> Optional[Dict[str, Any]]:
-        """사용자의 TTS 설정 조회"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                '''
-                SELECT default_voice, default_rate, default_pitch, default_volume
-                FROM user_tts_preferences
-                WHERE guild_id = ? AND user_id = ?
-                ''',
-                (guild_id, user_id)
-            )
-            result = await cursor.fetchone()
+        """사용자의 TTS 설정 조회 (자동 TTS 메시지마다 불리므로 캐시, 설정 없음도 캐시)"""
+        cache_key = f"{guild_id}:{user_id}"
+        cached = self.settings_cache.get(SettingsCache.TTS_PREFERENCE, cache_key)
+        if cached is not SettingsCache.MISSING:
+            return cached
+        version = self.settings_cache.version(SettingsCache.TTS_PREFERENCE, cache_key)
+
+        async with self.get_connection(readonly=True) as db:
+            result = await self.queries.fetchone(db, 'get_user_tts_preference', (guild_id, user_id))
             
+            preference = None
             if result:
-                return {
+                preference = {
                     'voice': result[0],
                     'rate': result[1],
                     'pitch': result[2],
                     'volume': result[3]
                 }
-            return None
+
+        return self.settings_cache.set(SettingsCache.TTS_PREFERENCE, cache_key, preference, version)
+
+    async def add_tts_daily_message_count(self, guild_id: str, date: str, count: int):
+        """일별 TTS 로그 쓰레드 메시지 수 증가 (로그 묶음 전송 1회당 1번)"""
+        if count <= 0:
+            return
+        await self.write_queue.execute('''
+            UPDATE tts_daily_threads
+            SET message_count = message_count + ?
+            WHERE guild_id = ? AND date = ?
+        ''', (count, guild_id, date))
 
     async def create_auto_schedule(
         self, 
@@ -10691,7 +10818,7 @@ class DatabaseManager:
     ) -> bool:
         """정기 내전 자동 스케줄 생성"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     INSERT INTO scrim_auto_schedules 
                     (guild_id, schedule_name, day_of_week, scrim_time, 
@@ -10722,7 +10849,7 @@ class DatabaseManager:
     async def get_auto_schedules(self, guild_id: str) -> List[Dict]:
         """서버의 모든 자동 스케줄 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM scrim_auto_schedules 
                     WHERE guild_id = ?
@@ -10739,7 +10866,7 @@ class DatabaseManager:
     async def get_active_auto_schedules(self, day_of_week: int = None) -> List[Dict]:
         """활성 자동 스케줄 조회 (특정 요일 또는 전체)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 if day_of_week is not None:
                     query = '''
                         SELECT * FROM scrim_auto_schedules 
@@ -10767,7 +10894,7 @@ class DatabaseManager:
     async def update_schedule_last_created(self, schedule_id: int, date_str: str) -> bool:
         """스케줄의 마지막 생성 날짜 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE scrim_auto_schedules 
                     SET last_created_date = ?, updated_at = CURRENT_TIMESTAMP
@@ -10783,7 +10910,7 @@ class DatabaseManager:
     async def toggle_schedule_status(self, schedule_id: int, is_active: bool) -> bool:
         """스케줄 활성화/비활성화 토글"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE scrim_auto_schedules 
                     SET is_active = ?, updated_at = CURRENT_TIMESTAMP
@@ -10799,7 +10926,7 @@ class DatabaseManager:
     async def delete_auto_schedule(self, schedule_id: int, guild_id: str) -> bool:
         """자동 스케줄 삭제"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     DELETE FROM scrim_auto_schedules 
                     WHERE id = ? AND guild_id = ?
@@ -10814,7 +10941,7 @@ class DatabaseManager:
     async def get_schedule_by_id(self, schedule_id: int) -> Optional[Dict]:
         """ID로 스케줄 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM scrim_auto_schedules WHERE id = ?
                 ''', (schedule_id,)) as cursor:
@@ -10840,9 +10967,7 @@ class DatabaseManager:
             (성공여부, 팀ID 또는 에러메시지)
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 팀명 중복 체크
                 async with db.execute('''
                     SELECT team_id FROM event_teams 
@@ -10878,7 +11003,7 @@ class DatabaseManager:
     async def get_event_teams(self, guild_id: str) -> list:
         """서버의 모든 활성 팀 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         t.team_id,
@@ -10911,7 +11036,7 @@ class DatabaseManager:
     async def get_event_team_details(self, team_id: str) -> dict:
         """특정 팀의 상세 정보 (팀원 포함)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 팀 기본 정보
                 async with db.execute('''
                     SELECT team_id, guild_id, team_name, created_by, created_at
@@ -10962,9 +11087,7 @@ class DatabaseManager:
     ) -> tuple[bool, str]:
         """팀에 새 팀원 추가"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 이미 팀원인지 체크
                 async with db.execute('''
                     SELECT id FROM event_team_members
@@ -10989,9 +11112,7 @@ class DatabaseManager:
     async def remove_team_member(self, team_id: str, user_id: str) -> tuple[bool, str]:
         """팀에서 팀원 제거"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 cursor = await db.execute('''
                     DELETE FROM event_team_members
                     WHERE team_id = ? AND user_id = ?
@@ -11011,9 +11132,7 @@ class DatabaseManager:
     async def delete_event_team(self, team_id: str) -> tuple[bool, str]:
         """팀 비활성화 (완전 삭제 대신 is_active=FALSE)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 cursor = await db.execute('''
                     UPDATE event_teams
                     SET is_active = FALSE
@@ -11034,7 +11153,7 @@ class DatabaseManager:
     async def get_user_event_team(self, guild_id: str, user_id: str) -> dict:
         """유저가 속한 이벤트 팀 정보 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         t.team_id,
@@ -11103,9 +11222,7 @@ class DatabaseManager:
         try:
             import json
             
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 미션명 중복 체크
                 async with db.execute('''
                     SELECT mission_id FROM event_missions
@@ -11151,7 +11268,7 @@ class DatabaseManager:
         try:
             import json
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 if category:
                     query = '''
                         SELECT 
@@ -11209,7 +11326,7 @@ class DatabaseManager:
         try:
             import json
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         mission_id, guild_id, mission_name, description,
@@ -11244,9 +11361,7 @@ class DatabaseManager:
     async def delete_event_mission(self, mission_id: str) -> tuple[bool, str]:
         """미션 비활성화"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 cursor = await db.execute('''
                     UPDATE event_missions
                     SET is_active = FALSE
@@ -11267,7 +11382,7 @@ class DatabaseManager:
     async def get_mission_stats(self, guild_id: str) -> dict:
         """카테고리별 미션 통계"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         category,
@@ -11311,9 +11426,7 @@ class DatabaseManager:
         try:
             from datetime import datetime
             
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # 미션 정보 조회
                 mission = await self.get_event_mission_details(mission_id)
                 if not mission:
@@ -11423,7 +11536,7 @@ class DatabaseManager:
     async def get_team_all_clear_count(self, team_id: str) -> int:
         """팀의 일일 퀘스트 올클리어 달성 횟수"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 전체 일일 미션 개수
                 async with db.execute('''
                     SELECT COUNT(*) 
@@ -11459,7 +11572,7 @@ class DatabaseManager:
     async def get_team_total_score(self, team_id: str) -> int:
         """팀의 총 누적 점수 계산"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT SUM(awarded_points)
                     FROM event_mission_completions
@@ -11479,7 +11592,7 @@ class DatabaseManager:
     ) -> list:
         """팀의 미션 완료 이력"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         c.completion_id,
@@ -11522,7 +11635,7 @@ class DatabaseManager:
     async def get_mission_completion_stats(self, mission_id: str) -> dict:
         """특정 미션의 완료 통계"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         COUNT(*) as completion_count,
@@ -11546,7 +11659,7 @@ class DatabaseManager:
     async def get_team_category_stats(self, team_id: str) -> dict:
         """팀의 카테고리별 미션 완료 통계"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         m.category,
@@ -11598,7 +11711,7 @@ class DatabaseManager:
             if not completion_date:
                 completion_date = datetime.now().strftime('%Y-%m-%d')
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 1. 해당 서버의 일일 퀘스트 총 개수 (등록된 전체)
                 async with db.execute('''
                     SELECT COUNT(*) 
@@ -11645,7 +11758,7 @@ class DatabaseManager:
     async def get_team_rankings(self, guild_id: str) -> list:
         """서버의 전체 팀 순위 (점수 순)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 오늘 날짜 계산 (오전 9시 기준)
                 now = datetime.now()
                 if now.hour < 9:
@@ -11728,7 +11841,7 @@ class DatabaseManager:
     async def get_team_rank(self, team_id: str) -> dict:
         """특정 팀의 순위 정보"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 팀의 길드 ID 조회
                 async with db.execute('''
                     SELECT guild_id FROM event_teams WHERE team_id = ?
@@ -11763,7 +11876,7 @@ class DatabaseManager:
     async def get_event_overview(self, guild_id: str) -> dict:
         """이벤트 전체 현황 통계"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 overview = {}
                 
                 # 총 팀 수
@@ -11862,7 +11975,7 @@ class DatabaseManager:
     async def get_team_completion_rate(self, team_id: str) -> dict:
         """팀의 미션 완료율 (카테고리별)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 팀의 길드 ID 조회
                 async with db.execute('''
                     SELECT guild_id FROM event_teams WHERE team_id = ?
@@ -11919,7 +12032,7 @@ class DatabaseManager:
     ) -> list:
         """서버의 최근 미션 완료 활동"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         t.team_name,
@@ -11977,7 +12090,7 @@ class DatabaseManager:
             if not completion_date:
                 completion_date = datetime.now().strftime('%Y-%m-%d')
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT COUNT(*) 
                     FROM event_mission_completions
@@ -12011,7 +12124,7 @@ class DatabaseManager:
             if not completion_date:
                 completion_date = datetime.now().strftime('%Y-%m-%d')
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT COUNT(*) 
                     FROM event_mission_completions
@@ -12031,7 +12144,7 @@ class DatabaseManager:
     async def debug_team_completions(self, team_id: str) -> dict:
         """팀의 모든 완료 기록 디버깅용 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 전체 완료 기록
                 async with db.execute('''
                     SELECT 
@@ -12083,9 +12196,7 @@ class DatabaseManager:
     ) -> tuple[bool, str]:
         """이벤트 공지 채널 설정"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 # UPSERT (있으면 업데이트, 없으면 삽입)
                 await db.execute('''
                     INSERT INTO event_announcement_channels (guild_id, channel_id, updated_at)
@@ -12111,7 +12222,7 @@ class DatabaseManager:
             channel_id 또는 None
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT channel_id 
                     FROM event_announcement_channels
@@ -12127,9 +12238,7 @@ class DatabaseManager:
     async def remove_event_announcement_channel(self, guild_id: str) -> tuple[bool, str]:
         """이벤트 공지 채널 해제"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('PRAGMA journal_mode=WAL')
-                
+            async with self.get_connection() as db:
                 cursor = await db.execute('''
                     DELETE FROM event_announcement_channels
                     WHERE guild_id = ?
@@ -12160,7 +12269,7 @@ class DatabaseManager:
             (성공여부, session_id 또는 에러메시지)
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 session_id = self.generate_uuid()
                 
                 await db.execute('''
@@ -12184,7 +12293,7 @@ class DatabaseManager:
     ) -> dict:
         """활성 음성 채널 세션 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         session_id,
@@ -12227,7 +12336,7 @@ class DatabaseManager:
     ) -> bool:
         """음성 채널 세션 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 updates = ["last_checked = CURRENT_TIMESTAMP"]
                 params = []
                 
@@ -12262,7 +12371,7 @@ class DatabaseManager:
     async def end_voice_session(self, session_id: str) -> bool:
         """음성 채널 세션 종료"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE event_voice_sessions
                     SET is_active = FALSE,
@@ -12288,7 +12397,7 @@ class DatabaseManager:
     ) -> bool:
         """음성 활동 점수 부여 로그 기록"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 log_id = self.generate_uuid()
                 
                 await db.execute('''
@@ -12309,7 +12418,7 @@ class DatabaseManager:
     async def get_all_active_voice_sessions(self, guild_id: str) -> list:
         """서버의 모든 활성 음성 세션 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         vs.session_id,
@@ -12354,7 +12463,7 @@ class DatabaseManager:
     ) -> dict:
         """팀의 음성 활동 통계 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 전체 통계
                 async with db.execute('''
                     SELECT 
@@ -12389,7 +12498,7 @@ class DatabaseManager:
     async def get_user_team(self, guild_id: str, user_id: str) -> dict:
         """유저가 속한 팀 정보 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT t.team_id, t.team_name, t.guild_id
                     FROM event_teams t
@@ -12416,7 +12525,7 @@ class DatabaseManager:
     async def get_team_members(self, team_id: str) -> list:
         """팀의 모든 멤버 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT user_id, username, joined_at
                     FROM event_team_members
@@ -12442,7 +12551,7 @@ class DatabaseManager:
     async def get_team_by_id(self, team_id: str) -> dict:
         """팀 ID로 팀 정보 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         team_id,
@@ -12482,7 +12591,7 @@ class DatabaseManager:
             해당 날짜의 총 점수
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT total_score 
                     FROM voice_team_daily_scores
@@ -12515,7 +12624,7 @@ class DatabaseManager:
         try:
             import json
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 기존 레코드 확인
                 async with db.execute('''
                     SELECT total_score, sessions
@@ -12571,7 +12680,7 @@ class DatabaseManager:
             user_id들의 set
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT user_id
                     FROM event_team_members
@@ -12606,7 +12715,7 @@ class DatabaseManager:
                 today = now
             date_str = today.strftime('%Y-%m-%d')
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT total_score, sessions
                     FROM voice_team_daily_scores
@@ -12666,7 +12775,7 @@ class DatabaseManager:
         try:
             members_json = json.dumps(list(members))
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     INSERT OR REPLACE INTO active_voice_sessions (
                         team_id, team_name, guild_id, channel_id,
@@ -12694,7 +12803,7 @@ class DatabaseManager:
             세션 정보 딕셔너리 리스트
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         team_id, team_name, guild_id, channel_id,
@@ -12731,7 +12840,7 @@ class DatabaseManager:
             import json
             from datetime import datetime
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT team_id, team_name, guild_id, channel_id, members,
                         start_time, last_check_time, hours_awarded,
@@ -12771,7 +12880,7 @@ class DatabaseManager:
             team_id: 팀 ID
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     DELETE FROM active_voice_sessions
                     WHERE team_id = ?
@@ -12786,7 +12895,7 @@ class DatabaseManager:
     async def clear_all_active_voice_sessions(self) -> bool:
         """모든 활성 음성 세션 삭제 (초기화용)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('DELETE FROM active_voice_sessions')
                 await db.commit()
                 return True
@@ -12797,7 +12906,7 @@ class DatabaseManager:
 
     async def cleanup_stale_voice_sessions(self, max_age_hours: int = 24) -> int:
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 24시간 이상 업데이트되지 않은 세션 삭제
                 result = await db.execute('''
                     DELETE FROM active_voice_sessions
@@ -12844,7 +12953,7 @@ class DatabaseManager:
             }, ...]
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT 
                         c.completion_id,
@@ -12905,7 +13014,7 @@ class DatabaseManager:
             (성공여부, 메시지, 취소된 내역 정보)
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 1. 완료 내역 조회
                 async with db.execute('''
                     SELECT 
@@ -12984,9 +13093,8 @@ class DatabaseManager:
         - channel_history 필드 추가
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # WAL 모드 활성화
-                await db.execute('PRAGMA journal_mode=WAL')
                 
                 # 1. 기존 데이터 백업
                 await db.execute('''
@@ -13114,7 +13222,7 @@ class DatabaseManager:
             import json
             from datetime import datetime, timedelta
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 최근 X시간 내의 날짜들 계산
                 now = datetime.now()
                 cutoff_time = now - timedelta(hours=hours)
@@ -13217,7 +13325,7 @@ class DatabaseManager:
         try:
             import json
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 1. 해당 날짜의 세션 데이터 조회
                 async with db.execute('''
                     SELECT total_score, sessions
@@ -13317,7 +13425,7 @@ class DatabaseManager:
         try:
             recruitment_id = str(uuid.uuid4())
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 모집 정보 저장
                 await db.execute('''
                     INSERT INTO scrim_recruitments 
@@ -13364,9 +13472,10 @@ class DatabaseManager:
                     ''', (recruitment_id, time_slot_str))
                 
                 await db.commit()
-                
+
+            self._schedule_deadline('voting_deadline', recruitment_id, deadline)
             return recruitment_id
-            
+
         except Exception as e:
             print(f"❌ 투표 방식 모집 생성 실패: {e}")
             raise
@@ -13376,7 +13485,7 @@ class DatabaseManager:
                                     user_id: str, username: str) -> bool:
         """시간대에 투표 추가 (중복 투표 가능)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 현재 투표자 목록 조회
                 async with db.execute('''
                     SELECT voter_ids, voter_names, vote_count FROM recruitment_time_slots 
@@ -13424,7 +13533,7 @@ class DatabaseManager:
                                         user_id: str) -> bool:
         """시간대에서 투표 제거"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 현재 투표자 목록 조회
                 async with db.execute('''
                     SELECT voter_ids, voter_names, vote_count FROM recruitment_time_slots 
@@ -13471,7 +13580,7 @@ class DatabaseManager:
     async def get_time_slots_by_recruitment(self, recruitment_id: str) -> List[Dict]:
         """특정 모집의 시간대 목록 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT * FROM recruitment_time_slots 
                     WHERE recruitment_id = ?
@@ -13490,7 +13599,7 @@ class DatabaseManager:
     async def get_time_slot_voters(self, recruitment_id: str, time_slot: str) -> List[str]:
         """특정 시간대의 투표자 ID 목록"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT voter_ids FROM recruitment_time_slots 
                     WHERE recruitment_id = ? AND time_slot = ?
@@ -13513,10 +13622,10 @@ class DatabaseManager:
         반환: 확정된 시간대 (없으면 None)
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 모집 정보 조회
                 async with db.execute('''
-                    SELECT min_participants, confirmed_time FROM scrim_recruitments 
+                    SELECT min_participants, confirmed_time, deadline FROM scrim_recruitments 
                     WHERE id = ?
                 ''', (recruitment_id,)) as cursor:
                     recruitment = await cursor.fetchone()
@@ -13524,7 +13633,7 @@ class DatabaseManager:
                     if not recruitment:
                         return None
                     
-                    min_participants, confirmed_time = recruitment
+                    min_participants, confirmed_time, deadline = recruitment
                     
                     # 이미 확정되었으면 반환
                     if confirmed_time:
@@ -13560,7 +13669,11 @@ class DatabaseManager:
                     ''', (confirmed_slot, recruitment_id))
                     
                     await db.commit()
-                    
+
+                    self._cancel_deadline('voting_deadline', recruitment_id)
+                    self._schedule_deadline(
+                        'voting_start', recruitment_id, self._voting_scrim_datetime(deadline, confirmed_slot)
+                    )
                     return confirmed_slot
                     
         except Exception as e:
@@ -13573,10 +13686,10 @@ class DatabaseManager:
         반환: 'confirmed' (확정됨), 'closed' (인원 미달), 'already_confirmed' (이미 확정됨)
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 모집 정보 조회
                 async with db.execute('''
-                    SELECT status, confirmed_time, min_participants 
+                    SELECT status, confirmed_time, min_participants, deadline 
                     FROM scrim_recruitments 
                     WHERE id = ?
                 ''', (recruitment_id,)) as cursor:
@@ -13585,7 +13698,7 @@ class DatabaseManager:
                     if not result:
                         return 'not_found'
                     
-                    status, confirmed_time, min_participants = result
+                    status, confirmed_time, min_participants, deadline = result
                     
                     # 이미 확정되었으면
                     if confirmed_time:
@@ -13618,6 +13731,10 @@ class DatabaseManager:
                     ''', (time_slot, recruitment_id))
                     
                     await db.commit()
+                    self._cancel_deadline('voting_deadline', recruitment_id)
+                    self._schedule_deadline(
+                        'voting_start', recruitment_id, self._voting_scrim_datetime(deadline, time_slot)
+                    )
                     return 'confirmed'
                 else:
                     # 인원 미달로 종료
@@ -13628,6 +13745,7 @@ class DatabaseManager:
                     ''', (recruitment_id,))
                     
                     await db.commit()
+                    self._cancel_deadline('voting_deadline', recruitment_id)
                     return 'closed'
                     
         except Exception as e:
@@ -13635,64 +13753,44 @@ class DatabaseManager:
             return 'error'
 
 
-    async def get_pending_voting_recruitments(self) -> List[Dict]:
-        """마감 시간이 지났지만 아직 처리되지 않은 투표 모집 조회"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute('''
-                    SELECT * FROM scrim_recruitments 
-                    WHERE recruitment_type = 'voting' 
-                    AND status = 'active' 
-                    AND datetime(deadline) <= datetime('now')
-                ''') as cursor:
-                    results = await cursor.fetchall()
-                    columns = [description[0] for description in cursor.description]
-                    
-                    return [dict(zip(columns, row)) for row in results]
-                    
-        except Exception as e:
-            print(f"❌ 마감된 투표 모집 조회 실패: {e}")
-            return []
+    @staticmethod
+    def _voting_scrim_datetime(deadline: str, confirmed_time: str) -> datetime:
+        """투표 모집의 확정 시간대(HH:MM)를 실제 내전 시작 일시로 변환"""
+        deadline_dt = datetime.fromisoformat(deadline)
 
+        # deadline의 날짜를 기준으로 시작
+        hour, minute = map(int, confirmed_time.split(':'))
+        scrim_datetime = datetime.combine(deadline_dt.date(), datetime.min.time().replace(hour=hour, minute=minute))
 
-    async def get_confirmed_recruitments_for_notification(self, minutes_before: int = 10) -> List[Dict]:
+        # deadline보다 이전이면 다음 날로
+        if scrim_datetime <= deadline_dt:
+            scrim_datetime += timedelta(days=1)
+        return scrim_datetime
+
+    async def get_confirmed_recruitments_for_notification(self, minutes_before: int = 10,
+                                                          recruitment_id: Optional[str] = None) -> List[Dict]:
         """
-        시작 N분 전 알림이 필요한 확정된 모집 조회
+        시작 N분 전 알림이 필요한 확정된 모집 조회 (recruitment_id 를 주면 해당 모집만)
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 async with db.execute('''
                     SELECT * FROM scrim_recruitments 
                     WHERE recruitment_type = 'voting' 
                     AND status = 'confirmed' 
                     AND notification_sent = 0
                     AND confirmed_time IS NOT NULL
-                ''') as cursor:
+                    AND (? IS NULL OR id = ?)
+                ''', (recruitment_id, recruitment_id)) as cursor:
                     results = await cursor.fetchall()
                     columns = [description[0] for description in cursor.description]
                     
                     recruitments = []
                     for row in results:
                         recruitment = dict(zip(columns, row))
-                        
-                        # 확정 시간 파싱
-                        confirmed_time = recruitment['confirmed_time']
-                        deadline_str = recruitment['deadline']
-                        
-                        from datetime import datetime, timedelta
-                        deadline_dt = datetime.fromisoformat(deadline_str)
-                        
-                        # 🆕 개선된 날짜 계산
-                        # deadline의 날짜를 기준으로 시작
-                        base_date = deadline_dt.date()
-                        
-                        # 확정 시간으로 datetime 생성
-                        hour, minute = map(int, confirmed_time.split(':'))
-                        scrim_datetime = datetime.combine(base_date, datetime.min.time().replace(hour=hour, minute=minute))
-                        
-                        # deadline보다 이전이면 다음 날로
-                        if scrim_datetime <= deadline_dt:
-                            scrim_datetime += timedelta(days=1)
+                        scrim_datetime = self._voting_scrim_datetime(
+                            recruitment['deadline'], recruitment['confirmed_time']
+                        )
                         
                         # N분 전 시간 계산
                         notification_time = scrim_datetime - timedelta(minutes=minutes_before)
@@ -13713,7 +13811,7 @@ class DatabaseManager:
     async def mark_notification_sent(self, recruitment_id: str) -> bool:
         """알림 발송 완료 표시"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 await db.execute('''
                     UPDATE scrim_recruitments 
                     SET notification_sent = 1, updated_at = CURRENT_TIMESTAMP
@@ -13721,7 +13819,9 @@ class DatabaseManager:
                 ''', (recruitment_id,))
                 
                 await db.commit()
-                return True
+
+            self._cancel_deadline('voting_start', recruitment_id)
+            return True
                 
         except Exception as e:
             print(f"❌ 알림 발송 표시 실패: {e}")
@@ -13731,7 +13831,7 @@ class DatabaseManager:
     async def get_voting_recruitment_info(self, recruitment_id: str) -> Optional[Dict]:
         """투표 방식 모집의 상세 정보 조회 (시간대 포함)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection(readonly=True) as db:
                 # 모집 정보
                 async with db.execute('''
                     SELECT * FROM scrim_recruitments WHERE id = ?
@@ -13761,7 +13861,7 @@ class DatabaseManager:
         try:
             recruitment_id = str(uuid.uuid4())
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 모집 정보 저장
                 await db.execute('''
                     INSERT INTO scrim_recruitments 
@@ -13789,9 +13889,10 @@ class DatabaseManager:
                     ''', (recruitment_id, time_slot))
                 
                 await db.commit()
-                
+
+            self._schedule_deadline('voting_deadline', recruitment_id, deadline)
             return recruitment_id
-            
+
         except Exception as e:
             print(f"❌ 투표 방식 모집 생성 실패: {e}")
             raise
@@ -13817,7 +13918,7 @@ class DatabaseManager:
         try:
             from datetime import datetime
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.get_connection() as db:
                 # 팀 존재 확인
                 async with db.execute('''
                     SELECT team_name FROM event_teams WHERE team_id = ?
@@ -13858,8 +13959,128 @@ class DatabaseManager:
             traceback.print_exc()
             return False, str(e)
 
+    async def enqueue_dm_outbox(self, guild_id: str, kind: str, messages: List[Tuple[str, str]]) -> List[int]:
+        """DM 발송 대기열에 추가
+        
+        Args:
+            messages: (user_id, 임베드 JSON) 목록
+            
+        Returns:
+            추가된 대기열 ID 목록 (messages 와 같은 순서)
+        """
+        if not messages:
+            return []
+        
+        async with self.get_connection() as db:
+            ids = []
+            for user_id, payload in messages:
+                cursor = await db.execute('''
+                    INSERT INTO dm_outbox (guild_id, user_id, kind, payload)
+                    VALUES (?, ?, ?, ?)
+                ''', (guild_id, user_id, kind, payload))
+                ids.append(cursor.lastrowid)
+            await db.commit()
+            return ids
 
+    async def get_pending_dm_outbox(self) -> List[Dict]:
+        """재시작 전에 보내지 못한 DM 목록 (오래된 순)"""
+        async with self.get_connection(readonly=True) as db:
+            async with db.execute('''
+                SELECT id, guild_id, user_id, kind, payload, created_at
+                FROM dm_outbox
+                ORDER BY id
+            ''') as cursor:
+                rows = await cursor.fetchall()
+        
+        return [{
+            'id': row[0],
+            'guild_id': row[1],
+            'user_id': row[2],
+            'kind': row[3],
+            'payload': row[4],
+            'created_at': row[5]
+        } for row in rows]
+
+    async def complete_dm_outbox(self, outbox_ids: List[int]):
+        """발송 완료(또는 포기)한 DM 을 대기열에서 제거"""
+        await self.write_queue.executemany(
+            'DELETE FROM dm_outbox WHERE id = ?', [(outbox_id,) for outbox_id in outbox_ids]
+        )
 
+    async def get_dm_closed_users(self, guild_id: str, since: str) -> set:
+        """since 이후 DM 차단이 확인된 유저 ID 목록"""
+        async with self.get_connection(readonly=True) as db:
+            async with db.execute('''
+                SELECT user_id FROM dm_closed_users
+                WHERE guild_id = ? AND closed_at >= ?
+            ''', (guild_id, since)) as cursor:
+                return {row[0] for row in await cursor.fetchall()}
+
+    async def mark_dm_closed(self, guild_id: str, user_id: str):
+        """DM 차단 유저 기록 (다시 확인되면 시각 갱신)"""
+        await self.write_queue.execute('''
+            INSERT INTO dm_closed_users (guild_id, user_id, closed_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(guild_id, user_id) DO UPDATE SET closed_at = excluded.closed_at
+        ''', (guild_id, user_id, datetime.utcnow().isoformat()))
+
+    # ── 마감 스케줄러 로더 ──────────────────────────────────────────
+
+    def _deadline_rows(self, kind: str, rows, naive_utc: bool = False) -> List[Tuple[str, float]]:
+        """(key, 저장된 시각) 행을 (key, epoch 초) 로 변환 (해석할 수 없는 값은 건너뜀)"""
+        deadlines = []
+        for key, when in rows:
+            if not when:
+                continue
+            try:
+                deadlines.append((key, TimeUtils.to_timestamp(when, naive_utc)))
+            except (TypeError, ValueError):
+                logger.warning(f"⚠️ 마감 시각 해석 실패 ({kind}: {key}, {when})")
+        return deadlines
+
+    async def get_recruitment_deadlines(self, recruitment_type: str = 'fixed') -> List[Tuple[str, float]]:
+        """진행 중인 내전 모집의 마감 시각 (recruitment_type: 'fixed' 또는 'voting')"""
+        async with self.get_connection(readonly=True) as db:
+            async with db.execute('''
+                SELECT id, deadline FROM scrim_recruitments
+                WHERE status = 'active' AND COALESCE(recruitment_type, 'fixed') = ?
+            ''', (recruitment_type,)) as cursor:
+                rows = await cursor.fetchall()
+        return self._deadline_rows(recruitment_type, rows)
 
+    async def get_voting_start_times(self) -> List[Tuple[str, float]]:
+        """시작 알림을 아직 보내지 않은 확정 투표 모집의 내전 시작 시각"""
+        async with self.get_connection(readonly=True) as db:
+            async with db.execute('''
+                SELECT id, deadline, confirmed_time FROM scrim_recruitments
+                WHERE recruitment_type = 'voting' AND status = 'confirmed'
+                AND notification_sent = 0 AND confirmed_time IS NOT NULL
+            ''') as cursor:
+                rows = await cursor.fetchall()
 
+        starts = []
+        for recruitment_id, deadline, confirmed_time in rows:
+            try:
+                starts.append((recruitment_id, self._voting_scrim_datetime(deadline, confirmed_time)))
+            except (TypeError, ValueError):
+                logger.warning(f"⚠️ 투표 모집 시작 시각 해석 실패: {recruitment_id}")
+        return self._deadline_rows('voting_start', starts)
+
+    async def get_inter_guild_scrim_deadlines(self) -> List[Tuple[str, float]]:
+        """진행 중인 길드 간 스크림 모집의 마감 시각 (기존처럼 UTC 기준으로 비교)"""
+        async with self.get_connection(readonly=True) as db:
+            async with db.execute('''
+                SELECT id, deadline_date FROM inter_guild_scrims WHERE status = 'active'
+            ''') as cursor:
+                rows = await cursor.fetchall()
+        return self._deadline_rows('inter_guild_scrim', rows, naive_utc=True)
 
+    async def get_pending_reveal_times(self) -> List[Tuple[str, float]]:
+        """아직 공개되지 않은 대나무숲 시간 공개 메시지의 공개 시각"""
+        async with self.get_connection(readonly=True) as db:
+            async with db.execute('''
+                SELECT message_id, reveal_time FROM bamboo_messages
+                WHERE message_type = 'timed_reveal' AND is_revealed = FALSE
+            ''') as cursor:
+                rows = await cursor.fetchall()
+        return self._deadline_rows('bamboo_reveal', rows)
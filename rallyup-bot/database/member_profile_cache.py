@@ -0,0 +1,89 @@
+import copy
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class MemberProfileCache:
+    """길드별 멤버 프로필(배틀태그 + 현재 티어) 단기 캐시
+
+    음성 채널 팀 정보처럼 같은 멤버들을 짧은 간격으로 반복 조회하는 곳을 위한 캐시.
+    항목은 ttl 초 후 만료되고, 배틀태그/등록 정보를 바꾸는 DatabaseManager 메서드가
+    커밋 후 해당 유저를 무효화한다. 조회 도중 무효화가 끼어들면 (version 불일치)
+    그 결과는 저장하지 않는다. 반환값은 복사본이다.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._data: Dict[str, Dict[str, Tuple[float, Dict[str, Any]]]] = {}
+        self._versions: Dict[str, int] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get_many(self, guild_id: str, user_ids: Iterable[str]) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """
+        캐시 조회
+
+        Returns:
+            ({user_id: 프로필}, 캐시에 없는 user_id 목록)
+        """
+        now = time.monotonic()
+        entries = self._data.get(guild_id, {})
+        found = {}
+        missing = []
+
+        for user_id in user_ids:
+            entry = entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                found[user_id] = copy.deepcopy(entry[1])
+            else:
+                if entry is not None:
+                    del entries[user_id]
+                missing.append(user_id)
+
+        self._hits += len(found)
+        self._misses += len(missing)
+        return found, missing
+
+    def version(self, guild_id: str) -> Tuple[int, int]:
+        """DB 조회 직전에 받아두는 무효화 버전 토큰"""
+        return self._generation, self._versions.get(guild_id, 0)
+
+    def set_many(self, guild_id: str, profiles: Dict[str, Dict[str, Any]],
+                 version: Optional[Tuple[int, int]] = None):
+        """
+        조회 결과 저장
+
+        Args:
+            version: 조회 전에 받은 version() 토큰. 그 사이 무효화됐다면 저장하지 않는다.
+        """
+        if version is not None and version != self.version(guild_id):
+            return
+
+        expires_at = time.monotonic() + self.ttl
+        entries = self._data.setdefault(guild_id, {})
+        for user_id, profile in profiles.items():
+            entries[user_id] = (expires_at, copy.deepcopy(profile))
+
+    def invalidate(self, guild_id: Optional[str] = None, user_id: Optional[str] = None):
+        """유저(또는 길드 전체, 전체 캐시) 무효화"""
+        if guild_id is None:
+            self._data.clear()
+            self._generation += 1
+            return
+
+        entries = self._data.get(guild_id)
+        if entries is not None:
+            if user_id is None:
+                entries.clear()
+            else:
+                entries.pop(user_id, None)
+        self._versions[guild_id] = self._versions.get(guild_id, 0) + 1
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'guilds': len(self._data),
+            'entries': sum(len(entries) for entries in self._data.values()),
+            'hits': self._hits,
+            'misses': self._misses,
+        }
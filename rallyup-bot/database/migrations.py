@@ -0,0 +1,301 @@
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Sequence, Set, Tuple
+
+import aiosqlite
+
+if TYPE_CHECKING:
+    from database.database import DatabaseManager
+    from database.query_registry import QueryRegistry
+
+
+@dataclass(frozen=True)
+class Migration:
+    """스키마 마이그레이션 1단계
+
+    version 은 1부터 증가하며, 한 번 적용된 마이그레이션은 수정하지 않고
+    변경이 필요하면 새 버전을 추가한다.
+    transactional=False 는 내부에서 직접 commit 하는 기존 초기화 함수용.
+    """
+    version: int
+    name: str
+    apply: Callable[['DatabaseManager', aiosqlite.Connection], Awaitable[None]]
+    transactional: bool = True
+
+
+async def table_exists(db: aiosqlite.Connection, table: str) -> bool:
+    async with db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ) as cursor:
+        return await cursor.fetchone() is not None
+
+
+async def add_column_if_missing(db: aiosqlite.Connection, table: str, column: str, definition: str) -> bool:
+    """컬럼이 없을 때만 ALTER TABLE ADD COLUMN (테이블이 없으면 건너뜀)"""
+    if not await table_exists(db, table):
+        return False
+
+    async with db.execute(f"PRAGMA table_info({table})") as cursor:
+        columns = {row[1] for row in await cursor.fetchall()}
+
+    if column in columns:
+        return False
+
+    await db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    print(f"✅ {table} 테이블에 {column} 컬럼 추가")
+    return True
+
+
+async def _baseline(manager: 'DatabaseManager', db: aiosqlite.Connection):
+    """마이그레이션 도입 이전의 전체 스키마 (CREATE ... IF NOT EXISTS 이므로 기존 DB 에도 안전)"""
+    await manager.create_baseline_schema()
+
+
+async def _patch_legacy_columns(manager: 'DatabaseManager', db: aiosqlite.Connection):
+    """호출 시점마다 ALTER 를 시도하던 컬럼들을 한 번에 추가"""
+    # 경기 기록 저장/맵 통계 쿼리가 사용하지만 CREATE TABLE 에는 없던 컬럼
+    await add_column_if_missing(db, 'match_results', 'map_name', 'TEXT')
+    await add_column_if_missing(db, 'match_results', 'map_type', 'TEXT')
+
+    # update_recruitment_notification_sent 가 매번 ALTER 하던 컬럼
+    await add_column_if_missing(db, 'scrim_recruitments', 'notifications_sent', "TEXT DEFAULT ''")
+
+    # update_scrim_time_slots_table 로만 추가되던 컬럼
+    await add_column_if_missing(db, 'scrim_time_slots', 'finalized', 'BOOLEAN DEFAULT FALSE')
+    await add_column_if_missing(db, 'scrim_time_slots', 'updated_at', 'TIMESTAMP')
+
+
+async def _match_analytics_indexes(manager: 'DatabaseManager', db: aiosqlite.Connection):
+    """전적/맵 통계 쿼리용 커버링 인덱스"""
+    statements = [
+        # 사용자 기준 조회 (프로필, 맵 통계, 상대 전적의 시작점)
+        '''CREATE INDEX IF NOT EXISTS idx_match_participants_user_cover
+           ON match_participants(user_id, match_id, team, position, won)''',
+        # 같은 경기의 다른 참가자 조회 (팀메이트/상대 self-join)
+        '''CREATE INDEX IF NOT EXISTS idx_match_participants_match_cover
+           ON match_participants(match_id, user_id, team, position, won, username)''',
+        # 서버 전체 맵 메타 / 서버 내 맵 타입 통계 (guild_id 로 시작, id 포함으로 테이블 미접근)
+        '''CREATE INDEX IF NOT EXISTS idx_match_results_guild_map
+           ON match_results(guild_id, map_type, map_name, id)''',
+    ]
+    for sql in statements:
+        await db.execute(sql)
+    await db.execute('ANALYZE match_participants')
+    await db.execute('ANALYZE match_results')
+
+
+async def _pair_stats_tables(manager: 'DatabaseManager', db: aiosqlite.Connection):
+    """동료/상대 전적 집계 테이블 생성 및 기존 경기 기록으로 채우기
+
+    save_match_result 가 경기 저장과 같은 트랜잭션에서 증분 갱신한다.
+    사용자 기준 조회가 기본 키 범위 읽기가 되도록 (guild_id, user_id) 로 시작하는 WITHOUT ROWID 테이블.
+    """
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS teammate_pair_stats (
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            user_position TEXT NOT NULL,
+            teammate_position TEXT NOT NULL,
+            teammate_id TEXT NOT NULL,
+            teammate_name TEXT NOT NULL,
+            games INTEGER NOT NULL DEFAULT 0,
+            wins INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, user_id, user_position, teammate_position, teammate_id)
+        ) WITHOUT ROWID
+    ''')
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS opponent_pair_stats (
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            opponent_id TEXT NOT NULL,
+            opponent_name TEXT NOT NULL,
+            games INTEGER NOT NULL DEFAULT 0,
+            wins INTEGER NOT NULL DEFAULT 0,
+            losses INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, user_id, opponent_id)
+        ) WITHOUT ROWID
+    ''')
+    await manager.fill_pair_stats(db)
+
+
+async def _dm_delivery_tables(manager: 'DatabaseManager', db: aiosqlite.Connection):
+    """DM 발송 대기열(재시작 시 이어서 발송)과 DM 차단 유저 기록"""
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS dm_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS dm_closed_users (
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            closed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (guild_id, user_id)
+        ) WITHOUT ROWID
+    ''')
+
+
+async def _runtime_ddl(manager: 'DatabaseManager', db: aiosqlite.Connection):
+    """런타임 메서드 안에서 실행되던 DDL 을 버전 관리로 이동"""
+    # _add_wordle_columns_to_users 가 매 초기화마다 ALTER 를 시도하던 컬럼
+    await add_column_if_missing(db, 'registered_users', 'wordle_points', 'INTEGER DEFAULT 10000')
+    await add_column_if_missing(db, 'registered_users', 'daily_points_claimed', 'TEXT')
+
+    # schedule_recruitment_reminder 가 호출될 때마다 생성하던 테이블
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS recruitment_reminders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            recruitment_id TEXT NOT NULL,
+            remind_at TEXT NOT NULL,
+            status TEXT DEFAULT 'pending',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (recruitment_id) REFERENCES scrim_recruitments(id)
+        )
+    ''')
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, 'baseline_schema', _baseline, transactional=False),
+    Migration(2, 'patch_legacy_columns', _patch_legacy_columns),
+    Migration(3, 'match_analytics_indexes', _match_analytics_indexes),
+    Migration(4, 'pair_stats_tables', _pair_stats_tables),
+    Migration(5, 'dm_delivery_tables', _dm_delivery_tables),
+    Migration(6, 'runtime_ddl', _runtime_ddl),
+]
+
+
+# EXPLAIN QUERY PLAN 회귀 검사 대상 (QueryRegistry 이름 -> 예시 파라미터)
+PLAN_CHECKS: Dict[str, Tuple[Any, ...]] = {
+    'get_head_to_head': ('0', '0', '1'),
+    'get_teammate_pair_stats': ('0', '0', '탱커', '딜러'),
+    'get_teammate_stats_by_position': ('0', '0', '탱커'),
+    'get_teammate_stats_all_positions': ('0', '0'),
+    'get_user_map_type_stats': ('0', '0'),
+    'get_server_map_meta': ('0', 5),
+}
+
+
+class MigrationRunner:
+    """버전별 스키마 마이그레이션 적용기
+
+    적용 이력은 schema_migrations 테이블에 남기고,
+    아직 적용되지 않은 버전만 순서대로 실행한다.
+    """
+
+    def __init__(self, migrations: Sequence[Migration] = MIGRATIONS):
+        versions = [m.version for m in migrations]
+        if versions != sorted(set(versions)):
+            raise ValueError("마이그레이션 버전은 중복 없이 오름차순이어야 합니다")
+        self.migrations = list(migrations)
+
+    async def _ensure_table(self, db: aiosqlite.Connection):
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                duration_ms REAL
+            )
+        ''')
+        await db.commit()
+
+    async def applied_versions(self, db: aiosqlite.Connection) -> Set[int]:
+        await self._ensure_table(db)
+        async with db.execute('SELECT version FROM schema_migrations') as cursor:
+            return {row[0] for row in await cursor.fetchall()}
+
+    async def migrate(self, manager: 'DatabaseManager', db: aiosqlite.Connection) -> List[int]:
+        """
+        미적용 마이그레이션 실행
+
+        Returns:
+            이번에 적용한 버전 목록
+        """
+        applied = await self.applied_versions(db)
+        pending = [m for m in self.migrations if m.version not in applied]
+        done = []
+
+        for migration in pending:
+            started = time.perf_counter()
+            if migration.transactional:
+                await db.execute('BEGIN')
+            try:
+                await migration.apply(manager, db)
+                await db.execute(
+                    'INSERT INTO schema_migrations (version, name, duration_ms) VALUES (?, ?, ?)',
+                    (migration.version, migration.name, round((time.perf_counter() - started) * 1000, 3))
+                )
+                await db.commit()
+            except Exception as e:
+                if migration.transactional:
+                    await db.rollback()
+                print(f"❌ 마이그레이션 {migration.version} ({migration.name}) 실패: {e}")
+                raise
+
+            done.append(migration.version)
+            print(f"✅ 마이그레이션 {migration.version} ({migration.name}) 적용 "
+                  f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+        return done
+
+    @staticmethod
+    async def explain(db: aiosqlite.Connection, sql: str, params: Sequence[Any] = ()) -> List[str]:
+        """EXPLAIN QUERY PLAN 의 detail 컬럼 목록"""
+        async with db.execute(f'EXPLAIN QUERY PLAN {sql}', params) as cursor:
+            return [row[-1] for row in await cursor.fetchall()]
+
+    async def check_query_plans(self, db: aiosqlite.Connection, registry: 'QueryRegistry',
+                                checks: Dict[str, Tuple[Any, ...]] = PLAN_CHECKS) -> Dict[str, List[str]]:
+        """
+        핫 쿼리가 전체 테이블 스캔 없이 인덱스로 실행되는지 검사
+
+        Returns:
+            {쿼리 이름: 문제가 된 plan 단계} (문제 없으면 빈 dict)
+        """
+        violations = {}
+        for name, params in checks.items():
+            plan = await self.explain(db, registry.sql(name), params)
+            scans = [step for step in plan if step.startswith('SCAN')]
+            if scans:
+                violations[name] = scans
+        return violations
+
+
+async def _verify_plans():
+    """임시 DB 에 전체 마이그레이션을 적용하고 핫 쿼리 실행 계획 출력"""
+    import os
+    import tempfile
+
+    from database.database import DatabaseManager
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DatabaseManager(os.path.join(tmp, 'plan_check.db'))
+        try:
+            await manager.initialize()
+
+            print("=== 핫 쿼리 실행 계획 ===")
+            async with manager.get_connection(readonly=True) as db:
+                for name, params in PLAN_CHECKS.items():
+                    print(f"[{name}]")
+                    for step in await manager.migrations.explain(db, manager.queries.sql(name), params):
+                        print(f"   {step}")
+
+                violations = await manager.migrations.check_query_plans(db, manager.queries)
+        finally:
+            await manager.close()
+
+    if violations:
+        for name, scans in violations.items():
+            print(f"❌ {name}: {scans}")
+        raise SystemExit(1)
+    print("✅ 모든 핫 쿼리가 인덱스를 사용합니다")
+
+
+if __name__ == "__main__":
+    import asyncio
+    asyncio.run(_verify_plans())
@@ -0,0 +1,192 @@
+import bisect
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiosqlite
+
+# 핫 쿼리 SQL 정의 (이름 -> SQL)
+# 같은 SQL 문자열을 장기 연결에서 재사용하므로 sqlite3 statement cache 에 그대로 남는다.
+HOT_QUERIES: Dict[str, str] = {
+    'get_voice_level_settings': '''
+        SELECT enabled, notification_channel_id, base_exp_per_minute,
+            daily_exp_limit, min_session_minutes, check_mute_status,
+            screen_share_bonus_enabled, screen_share_multiplier
+        FROM voice_level_settings
+        WHERE guild_id = ?
+    ''',
+    'get_user_level': '''
+        SELECT id, guild_id, user_id, current_level, current_exp, total_exp,
+            total_play_time_seconds, total_screen_share_seconds, unique_partners_count,
+            last_exp_gain, daily_exp_gained, last_daily_reset, created_at, updated_at
+        FROM user_levels
+        WHERE guild_id = ? AND user_id = ?
+    ''',
+    'get_active_session': '''
+        SELECT session_uuid, channel_id, join_time, is_muted
+        FROM voice_sessions
+        WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
+        ORDER BY join_time DESC
+        LIMIT 1
+    ''',
+    'get_users_in_channel': '''
+        SELECT user_id, session_uuid, is_muted
+        FROM voice_sessions
+        WHERE guild_id = ? AND channel_id = ? AND is_active = TRUE
+    ''',
+    'is_server_admin': '''
+        SELECT COUNT(*) FROM server_admins
+        WHERE guild_id = ? AND user_id = ? AND is_active = TRUE
+    ''',
+    'get_user_tts_preference': '''
+        SELECT default_voice, default_rate, default_pitch, default_volume
+        FROM user_tts_preferences
+        WHERE guild_id = ? AND user_id = ?
+    ''',
+    # 전적 분석 쿼리 (database/migrations.py 의 실행 계획 검사 대상)
+    # 동료/상대 전적은 save_match_result 가 갱신하는 집계 테이블에서 읽는다
+    'get_head_to_head': '''
+        SELECT wins, losses, games
+        FROM opponent_pair_stats
+        WHERE guild_id = ? AND user_id = ? AND opponent_id = ?
+    ''',
+    'get_teammate_pair_stats': '''
+        SELECT teammate_id, teammate_name, games, wins
+        FROM teammate_pair_stats
+        WHERE guild_id = ? AND user_id = ? AND user_position = ? AND teammate_position = ?
+        ORDER BY wins DESC, games DESC
+    ''',
+    'get_teammate_stats_by_position': '''
+        SELECT teammate_id, MAX(teammate_name), SUM(games), SUM(wins)
+        FROM teammate_pair_stats
+        WHERE guild_id = ? AND user_id = ? AND teammate_position = ?
+        GROUP BY teammate_id
+        ORDER BY SUM(wins) * 100.0 / SUM(games) DESC, SUM(games) DESC
+    ''',
+    'get_teammate_stats_all_positions': '''
+        SELECT teammate_position, teammate_id, MAX(teammate_name), SUM(games), SUM(wins)
+        FROM teammate_pair_stats
+        WHERE guild_id = ? AND user_id = ?
+        GROUP BY teammate_position, teammate_id
+        ORDER BY teammate_position, SUM(wins) * 100.0 / SUM(games) DESC, SUM(games) DESC
+    ''',
+    'get_user_map_type_stats': '''
+        SELECT
+            mr.map_type,
+            COUNT(*) as games,
+            SUM(CASE WHEN mp.won = 1 THEN 1 ELSE 0 END) as wins,
+            ROUND(AVG(CASE WHEN mp.won = 1 THEN 100.0 ELSE 0.0 END), 1) as winrate
+        FROM match_participants mp
+        JOIN match_results mr ON mp.match_id = mr.id
+        WHERE mp.user_id = ? AND mr.guild_id = ? AND mr.map_type IS NOT NULL
+        GROUP BY mr.map_type
+        HAVING COUNT(*) >= 3
+        ORDER BY winrate DESC, games DESC
+    ''',
+    'get_server_map_meta': '''
+        SELECT
+            mr.map_name,
+            mr.map_type,
+            mp.position,
+            COUNT(*) as games,
+            SUM(mp.won) as wins,
+            ROUND(SUM(mp.won) * 100.0 / COUNT(*), 1) as winrate
+        FROM match_participants mp
+        JOIN match_results mr ON mp.match_id = mr.id
+        WHERE mr.guild_id = ? AND mr.map_name IS NOT NULL AND mp.position IS NOT NULL
+        GROUP BY mr.map_name, mr.map_type, mp.position
+        HAVING COUNT(*) >= ?
+        ORDER BY mr.map_name, winrate DESC
+    ''',
+}
+
+
+class QueryRegistry:
+    """이름 붙은 SQL 레지스트리 + 쿼리별 호출 수/지연 히스토그램
+
+    등록된 SQL 은 항상 같은 문자열로 실행되므로 풀의 장기 연결에서
+    sqlite3 statement cache 를 통해 재준비 없이 재사용된다.
+    """
+
+    # 히스토그램 버킷 상한 (ms), 마지막 버킷은 그 이상
+    BUCKETS_MS: Tuple[float, ...] = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self, queries: Optional[Dict[str, str]] = None):
+        self._queries: Dict[str, str] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        for name, sql in (queries or {}).items():
+            self.register(name, sql)
+
+    def register(self, name: str, sql: str) -> str:
+        """쿼리 등록 (같은 이름 재등록 시 SQL 교체)"""
+        self._queries[name] = sql
+        self._stats.setdefault(name, self._empty_stats())
+        return sql
+
+    def sql(self, name: str) -> str:
+        """등록된 SQL 반환"""
+        return self._queries[name]
+
+    def _empty_stats(self) -> Dict[str, Any]:
+        return {
+            'calls': 0,
+            'errors': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'histogram': [0] * (len(self.BUCKETS_MS) + 1),
+        }
+
+    def _record(self, name: str, elapsed_ms: float, failed: bool):
+        stats = self._stats[name]
+        stats['calls'] += 1
+        stats['total_ms'] += elapsed_ms
+        if elapsed_ms > stats['max_ms']:
+            stats['max_ms'] = elapsed_ms
+        if failed:
+            stats['errors'] += 1
+        stats['histogram'][bisect.bisect_left(self.BUCKETS_MS, elapsed_ms)] += 1
+
+    async def _run(self, db: aiosqlite.Connection, name: str, params: Sequence[Any], fetch_all: bool):
+        sql = self._queries[name]
+        started = time.perf_counter()
+        failed = False
+        try:
+            async with db.execute(sql, params) as cursor:
+                if fetch_all:
+                    return await cursor.fetchall()
+                return await cursor.fetchone()
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._record(name, (time.perf_counter() - started) * 1000, failed)
+
+    async def fetchone(self, db: aiosqlite.Connection, name: str, params: Sequence[Any] = ()):
+        """등록된 쿼리 실행 후 한 행 반환"""
+        return await self._run(db, name, params, fetch_all=False)
+
+    async def fetchall(self, db: aiosqlite.Connection, name: str, params: Sequence[Any] = ()):
+        """등록된 쿼리 실행 후 전체 행 반환"""
+        return await self._run(db, name, params, fetch_all=True)
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """쿼리별 통계 (총 소요 시간 내림차순)"""
+        labels = [f"<={b}ms" for b in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        result = []
+        for name, stats in self._stats.items():
+            calls = stats['calls']
+            result.append({
+                'name': name,
+                'calls': calls,
+                'errors': stats['errors'],
+                'total_ms': round(stats['total_ms'], 3),
+                'avg_ms': round(stats['total_ms'] / calls, 3) if calls else 0.0,
+                'max_ms': round(stats['max_ms'], 3),
+                'histogram': dict(zip(labels, stats['histogram'])),
+            })
+        result.sort(key=lambda item: item['total_ms'], reverse=True)
+        return result
+
+    def reset_stats(self):
+        """통계 초기화"""
+        for name in self._stats:
+            self._stats[name] = self._empty_stats()
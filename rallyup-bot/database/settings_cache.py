@@ -0,0 +1,105 @@
+import copy
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class SettingsCache:
+    """길드별 설정 테이블 메모리 캐시 (write-through 무효화 방식)
+
+    설정은 관리자 명령어로만 바뀌므로 조회 결과를 길드 단위로 보관하고,
+    DatabaseManager 의 set_*/update_* 메서드가 커밋 후 해당 항목을 무효화한다.
+    조회 도중 무효화가 끼어들면 (version 불일치) 오래된 값은 저장하지 않는다.
+    반환값은 복사본이라 호출자가 수정해도 캐시는 오염되지 않는다.
+    유저 단위 네임스페이스는 MAX_ENTRIES 개까지만 LRU 로 보관한다.
+    """
+
+    VOICE_LEVEL = 'voice_level_settings'
+    TTS_CHANNEL = 'tts_channel_settings'
+    BATTLE_TAG_LOG = 'battle_tag_log_settings'
+    SERVER = 'server_settings'
+    NICKNAME_FORMAT = 'nickname_format'
+    INQUIRY = 'inquiry_settings'
+    RECRUITMENT_CHANNEL = 'recruitment_channel'
+    # 유저 단위 항목은 'guild_id:user_id' 키로 저장 (invalidate_guild 대상 아님)
+    TTS_PREFERENCE = 'user_tts_preferences'
+
+    NAMESPACES = (
+        VOICE_LEVEL, TTS_CHANNEL, BATTLE_TAG_LOG, SERVER,
+        NICKNAME_FORMAT, INQUIRY, RECRUITMENT_CHANNEL, TTS_PREFERENCE,
+    )
+
+    # 네임스페이스별 최대 항목 수 (길드 단위 항목은 길드 수만큼이라 제한 없음)
+    MAX_ENTRIES = {
+        TTS_PREFERENCE: 5000,
+    }
+
+    MISSING = object()
+
+    def __init__(self):
+        self._data: Dict[str, "OrderedDict[str, Any]"] = {ns: OrderedDict() for ns in self.NAMESPACES}
+        self._hits: Dict[str, int] = {ns: 0 for ns in self.NAMESPACES}
+        self._misses: Dict[str, int] = {ns: 0 for ns in self.NAMESPACES}
+        self._evictions: Dict[str, int] = {ns: 0 for ns in self.NAMESPACES}
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self._generation = 0
+
+    def get(self, namespace: str, guild_id: str) -> Any:
+        """캐시 조회 (없으면 SettingsCache.MISSING 반환)"""
+        value = self._data[namespace].get(guild_id, self.MISSING)
+        if value is self.MISSING:
+            self._misses[namespace] += 1
+            return self.MISSING
+
+        if namespace in self.MAX_ENTRIES:
+            self._data[namespace].move_to_end(guild_id)
+        self._hits[namespace] += 1
+        return copy.deepcopy(value)
+
+    def version(self, namespace: str, guild_id: str) -> Tuple[int, int]:
+        """DB 조회 직전에 받아두는 무효화 버전 토큰"""
+        return self._generation, self._versions.get((namespace, guild_id), 0)
+
+    def set(self, namespace: str, guild_id: str, value: Any, version: Optional[Tuple[int, int]] = None) -> Any:
+        """캐시 저장 후 호출자용 복사본 반환
+
+        Args:
+            version: 조회 전에 받은 version() 토큰. 그 사이 무효화됐다면 저장하지 않는다.
+        """
+        if version is None or version == self.version(namespace, guild_id):
+            entries = self._data[namespace]
+            entries[guild_id] = value
+
+            limit = self.MAX_ENTRIES.get(namespace)
+            if limit is not None:
+                entries.move_to_end(guild_id)
+                while len(entries) > limit:
+                    entries.popitem(last=False)
+                    self._evictions[namespace] += 1
+        return copy.deepcopy(value)
+
+    def invalidate(self, namespace: str, guild_id: Optional[str] = None):
+        """특정 길드(또는 네임스페이스 전체) 무효화"""
+        if guild_id is None:
+            self._data[namespace].clear()
+            self._generation += 1
+        else:
+            self._data[namespace].pop(guild_id, None)
+            key = (namespace, guild_id)
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+    def invalidate_guild(self, guild_id: str):
+        """길드의 모든 설정 무효화"""
+        for namespace in self.NAMESPACES:
+            self.invalidate(namespace, guild_id)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """네임스페이스별 적중/미스/항목/제거 수"""
+        return {
+            ns: {
+                'entries': len(self._data[ns]),
+                'hits': self._hits[ns],
+                'misses': self._misses[ns],
+                'evictions': self._evictions[ns],
+            }
+            for ns in self.NAMESPACES
+        }
@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+import aiosqlite
+
+from database.connection_pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class _WriteOp:
+    """큐에 들어간 개별 쓰기 작업"""
+
+    __slots__ = ('apply', 'future', 'enqueued_at')
+
+    def __init__(self, apply: Callable[[aiosqlite.Connection], Awaitable[Any]], future: asyncio.Future):
+        self.apply = apply
+        self.future = future
+        self.enqueued_at = time.perf_counter()
+
+
+class WriteBatcher:
+    """단일 writer 쓰기 병합 큐
+
+    호출자는 쓰기 작업을 큐에 넣고 future 를 await 한다.
+    writer 태스크 하나가 flush_interval 동안 모인 작업(최대 max_batch 개)을
+    하나의 트랜잭션으로 묶어 커밋하므로, 동시 쓰기가 늘어나도 커밋 횟수는 일정하다.
+    각 작업은 SAVEPOINT 로 감싸서 하나가 실패해도 나머지는 커밋된다.
+    """
+
+    def __init__(self, pool: ConnectionPool, flush_interval: float = 0.05, max_batch: int = 500):
+        self.pool = pool
+        self.flush_interval = flush_interval
+        self.max_batch = max(1, max_batch)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._stats = {
+            'ops': 0,
+            'inline_ops': 0,
+            'failed_ops': 0,
+            'commits': 0,
+            'failed_batches': 0,
+            'max_batch_size': 0,
+            'total_latency': 0.0,
+        }
+
+    def _ensure_worker(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def submit(self, apply: Callable[[aiosqlite.Connection], Awaitable[Any]]) -> Any:
+        """쓰기 작업 등록 후 커밋될 때까지 대기
+
+        Args:
+            apply: 연결을 받아 쓰기를 수행하는 코루틴 함수 (commit 호출 금지)
+
+        Returns:
+            apply 의 반환값
+        """
+        # 이미 writer 를 잡고 있는 태스크가 큐를 기다리면 데드락이므로 즉시 실행
+        held = self.pool.held_writer()
+        if held is not None or self._closed:
+            self._stats['inline_ops'] += 1
+            if held is not None:
+                # 호출자의 트랜잭션 안이면 커밋은 writer 를 잡은 쪽에 맡기고 SAVEPOINT 로만 감싼다
+                # 열린 트랜잭션이 없으면 직접 커밋 (반납 시 롤백되어 사라지지 않도록)
+                outer_transaction = held.in_transaction
+                await held.execute('SAVEPOINT inline_write_op')
+                try:
+                    result = await apply(held)
+                except Exception:
+                    await held.execute('ROLLBACK TO inline_write_op')
+                    await held.execute('RELEASE inline_write_op')
+                    raise
+                await held.execute('RELEASE inline_write_op')
+                if not outer_transaction and held.in_transaction:
+                    await held.commit()
+                return result
+            async with self.pool.connection() as db:
+                result = await apply(db)
+                await db.commit()
+                return result
+
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_WriteOp(apply, future))
+        return await future
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """단일 쓰기 SQL 등록 (영향받은 행 수 반환)"""
+        async def apply(db: aiosqlite.Connection) -> int:
+            cursor = await db.execute(sql, params)
+            return cursor.rowcount
+
+        return await self.submit(apply)
+
+    async def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any]]) -> int:
+        """같은 SQL 을 여러 파라미터로 등록 (영향받은 행 수 반환)"""
+        rows = list(seq_of_params)
+        if not rows:
+            return 0
+
+        async def apply(db: aiosqlite.Connection) -> int:
+            cursor = await db.executemany(sql, rows)
+            return cursor.rowcount
+
+        return await self.submit(apply)
+
+    async def _run(self):
+        """writer 태스크: 큐에서 작업을 모아 트랜잭션 단위로 커밋"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            op = await self._queue.get()
+            if op is None:
+                return
+
+            batch: List[_WriteOp] = [op]
+            stop = False
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                try:
+                    if remaining > 0:
+                        op = await asyncio.wait_for(self._queue.get(), remaining)
+                    else:
+                        op = self._queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+
+                if op is None:
+                    stop = True
+                    break
+                batch.append(op)
+
+            await self._commit_batch(batch)
+
+            if stop:
+                return
+
+    async def _commit_batch(self, batch: List[_WriteOp]):
+        results = []
+
+        try:
+            async with self.pool.connection() as db:
+                await db.execute('BEGIN IMMEDIATE')
+
+                for op in batch:
+                    await db.execute('SAVEPOINT write_op')
+                    try:
+                        result = await op.apply(db)
+                        await db.execute('RELEASE write_op')
+                        results.append((op, result, None))
+                    except Exception as e:
+                        await db.execute('ROLLBACK TO write_op')
+                        await db.execute('RELEASE write_op')
+                        results.append((op, None, e))
+
+                await db.commit()
+
+        except Exception as e:
+            logger.error(f"❌ 쓰기 배치 커밋 실패 ({len(batch)}건): {e}")
+            self._stats['failed_batches'] += 1
+            results = [(op, None, e) for op in batch]
+        else:
+            self._stats['commits'] += 1
+
+        now = time.perf_counter()
+        self._stats['ops'] += len(batch)
+        self._stats['max_batch_size'] = max(self._stats['max_batch_size'], len(batch))
+
+        for op, result, error in results:
+            self._stats['total_latency'] += now - op.enqueued_at
+            if op.future.done():
+                continue
+            if error is not None:
+                self._stats['failed_ops'] += 1
+                op.future.set_exception(error)
+            else:
+                op.future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """쓰기 큐 메트릭"""
+        ops = self._stats['ops']
+        commits = self._stats['commits']
+        return {
+            'queued': self._queue.qsize() if self._queue else 0,
+            'ops': ops,
+            'inline_ops': self._stats['inline_ops'],
+            'failed_ops': self._stats['failed_ops'],
+            'commits': commits,
+            'failed_batches': self._stats['failed_batches'],
+            'avg_batch_size': round(ops / commits, 2) if commits else 0.0,
+            'max_batch_size': self._stats['max_batch_size'],
+            'avg_latency_ms': round(self._stats['total_latency'] / ops * 1000, 3) if ops else 0.0,
+            'flush_interval': self.flush_interval,
+            'max_batch': self.max_batch,
+        }
+
+    async def close(self):
+        """남은 작업을 모두 커밋하고 writer 태스크 종료"""
+        self._closed = True
+        if self._worker is None or self._worker.done():
+            return
+
+        await self._queue.put(None)
+        try:
+            await self._worker
+        except Exception as e:
+            logger.error(f"❌ 쓰기 큐 종료 중 오류: {e}")
@@ -6,13 +6,16 @@ from dotenv import load_dotenv
 import os
 from database.database import DatabaseManager
 from scheduler.bamboo_scheduler import BambooForestScheduler
+from scheduler.deadline_scheduler import DeadlineScheduler
 from scheduler.recruitment_scheduler import RecruitmentScheduler
 from scheduler.scrim_scheduler import ScrimScheduler
 from commands.scrim_recruitment import RecruitmentView, VotingRecruitmentView
 from utils.battle_tag_logger import BattleTagLogger
 from utils.balancing_session_manager import session_manager
 from utils.voice_level_tracker import VoiceLevelTracker
+from utils.voice_event_dispatcher import VoiceEventDispatcher
 from utils.voice_session_tracker import VoiceSessionTracker
+from utils.dm_dispatcher import DMDispatcher
 from scheduler.auto_recruitment_scheduler import AutoRecruitmentScheduler
 from scheduler.voting_notification_scheduler import VotingNotificationScheduler
 
@@ -38,6 +41,10 @@ class RallyUpBot(commands.Bot):
         )
         
         self.db_manager = DatabaseManager()
+        self.dm_dispatcher = DMDispatcher(self)
+        # 모집/스크림/대나무숲 마감 시각 공용 타이머 (DB 가 생성/마감/취소 시 직접 갱신)
+        self.deadline_scheduler = DeadlineScheduler(self)
+        self.db_manager.deadline_scheduler = self.deadline_scheduler
         self.bamboo_scheduler = BambooForestScheduler(self)
         self.recruitment_scheduler = None
         self.scrim_scheduler = None
@@ -57,10 +64,9 @@ class RallyUpBot(commands.Bot):
         self.battle_tag_logger = None
         self.tier_change_scheduler = None  
         self.voice_level_tracker = None
+        self.voice_event_dispatcher = None
         self.voice_session_tracker = None
 
-        self.recruitment_channels_cache = {}
-
     async def setup_hook(self):
         """봇 시작시 실행되는 설정"""
         try:
@@ -69,6 +75,9 @@ class RallyUpBot(commands.Bot):
 
             await self._load_recruitment_channels_cache()
 
+            # 재시작 전에 못 보낸 DM 은 봇 준비 후 이어서 발송
+            self.dm_dispatcher.start()
+
             await self.load_commands()
 
             await self._register_persistent_views()
@@ -83,6 +92,8 @@ class RallyUpBot(commands.Bot):
 
             if not self.voice_level_tracker:
                 self.voice_level_tracker = VoiceLevelTracker(self)
+                # 음성 상태 이벤트는 서버별 순서 보장 큐로 넘겨서 처리 (게이트웨이 이벤트 핸들러는 기다리지 않음)
+                self.voice_event_dispatcher = VoiceEventDispatcher(self.voice_level_tracker)
                 logger.info("음성 레벨 트래커 시작")
 
             # if not self.voice_session_tracker:
@@ -111,6 +122,9 @@ class RallyUpBot(commands.Bot):
                 await self.scrim_scheduler.start()
                 logger.info("스크림 스케줄러 시작")
 
+            # 위 스케줄러들이 등록한 마감 항목을 봇 준비 후 한 번 읽어 대기
+            self.deadline_scheduler.start()
+
             # 티어 변동 스케줄러 시작
             if not self.tier_change_scheduler:
                 from scheduler.tier_change_scheduler import TierChangeScheduler
@@ -118,6 +132,10 @@ class RallyUpBot(commands.Bot):
                 await self.tier_change_scheduler.start()
                 logger.info("티어 변동 감지 스케줄러 시작")
 
+            from utils.balance_executor import balance_executor
+            await balance_executor.start()
+            logger.info("밸런싱 프로세스 풀 시작")
+
             await self.restore_inquiry_views()
             logger.info("문의 시스템 View 복원 완료")
 
@@ -243,17 +261,18 @@ class RallyUpBot(commands.Bot):
         await self.restore_recruitment_views()
 
     async def _load_recruitment_channels_cache(self):
-        """모든 길드의 모집 채널을 캐시에 로드"""
+        """모든 길드의 모집 채널을 DB 설정 캐시에 미리 로드"""
         try:
+            loaded = 0
             for guild in self.guilds:
                 try:
-                    channel_id = await self.db_manager.get_recruitment_channel(str(guild.id))
-                    if channel_id:
-                        self.recruitment_channels_cache[str(guild.id)] = channel_id
+                    # 조회 결과는 db_manager.settings_cache 에 저장됨
+                    if await self.db_manager.get_recruitment_channel(str(guild.id)):
+                        loaded += 1
                 except Exception as e:
                     logger.error(f"길드 {guild.name} 채널 캐시 로드 실패: {e}")
             
-            logger.info(f"✅ {len(self.recruitment_channels_cache)}개 길드의 모집 채널 캐시 로드 완료")
+            logger.info(f"✅ {loaded}개 길드의 모집 채널 캐시 로드 완료")
         except Exception as e:
             logger.error(f"❌ 모집 채널 캐시 로드 실패: {e}")
 
@@ -527,22 +546,9 @@ class RallyUpBot(commands.Bot):
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
         """음성 채널 상태 변경 이벤트"""
         try:
-            # 기존 voice_level_tracker 처리
-            if self.voice_level_tracker:
-                if before.channel is None and after.channel is not None:
-                    await self.voice_level_tracker.handle_voice_join(member, after.channel)
-                elif before.channel is not None and after.channel is None:
-                    await self.voice_level_tracker.handle_voice_leave(member, before.channel)
-                elif before.channel != after.channel:
-                    await self.voice_level_tracker.handle_voice_move(member, before.channel, after.channel)
-                elif before.self_mute != after.self_mute:
-                    await self.voice_level_tracker.handle_mute_change(
-                        member, before.self_mute, after.self_mute
-                    )
-                elif before.self_stream != after.self_stream:
-                    await self.voice_level_tracker.handle_screen_share_change(
-                        member, before.self_stream, after.self_stream
-                    )
+            # voice_level_tracker 처리 (서버별 큐에 넣고 바로 반환, 입장/퇴장/이동/음소거/화면공유 분류는 디스패처가 담당)
+            if self.voice_event_dispatcher:
+                self.voice_event_dispatcher.submit(member, before, after)
 
             # voice_session_tracker 처리 (이벤트 팀 점수)
             # if self.voice_session_tracker:
@@ -593,18 +599,43 @@ class RallyUpBot(commands.Bot):
                 await self.tier_change_scheduler.stop()
                 logger.info("티어 변동 감지 스케줄러 종료")
 
+            await self.deadline_scheduler.stop()
+
+            if self.voice_event_dispatcher:
+                await self.voice_event_dispatcher.stop()
+
             if self.voice_level_tracker:
+                await self.voice_level_tracker.flush_writes()
                 self.voice_level_tracker.stop()
                 logger.info("음성 레벨 트래커 종료")
 
+            await self.dm_dispatcher.stop()
+
             # if self.voice_session_tracker:
             #     await self.voice_session_tracker.stop()
             #     logger.info("음성 세션 트래커 종료")
 
         except Exception as e:
             logger.error(f"Error stopping bamboo scheduler: {e}")
-        
+
         await super().close()
+
+        try:
+            await self.db_manager.close()
+        except Exception as e:
+            logger.error(f"Error closing database pool: {e}")
+
+        try:
+            from utils.overwatch_api import overwatch_client
+            await overwatch_client.close()
+        except Exception as e:
+            logger.error(f"Error closing Overwatch API session: {e}")
+
+        try:
+            from utils.balance_executor import balance_executor
+            balance_executor.shutdown()
+        except Exception as e:
+            logger.error(f"Error shutting down balance executor: {e}")
     
     async def on_command_error(self, ctx, error):
         logger.error(f'Error in command {ctx.command}: {error}')
@@ -12,57 +12,43 @@ class AutoRecruitmentScheduler:
     def __init__(self, bot):
         self.bot = bot
         self.running = False
-        self.task = None
         self.check_hour = 6  # 매일 오전 6시에 체크
         self.check_minute = 0
     
     async def start(self):
-        """스케줄러 시작"""
+        """스케줄러 시작 (매일 체크 시각은 DeadlineScheduler 가 정확히 맞춰 호출)"""
         if not self.running:
             self.running = True
-            self.task = asyncio.create_task(self._check_loop())
+            self.bot.deadline_scheduler.register('auto_recruitment', self._on_check_time, self._next_check)
             logger.info("✅ 정기 내전 자동 등록 스케줄러 시작")
     
     async def stop(self):
         """스케줄러 종료"""
         if self.running:
             self.running = False
-            if self.task:
-                self.task.cancel()
-                try:
-                    await self.task
-                except asyncio.CancelledError:
-                    pass
+            self.bot.deadline_scheduler.unregister('auto_recruitment')
             logger.info("🛑 정기 내전 자동 등록 스케줄러 종료")
     
-    async def _check_loop(self):
-        """메인 체크 루프"""
-        await self.bot.wait_until_ready()
-        logger.info("🔄 자동 등록 스케줄러 대기 중...")
-        
-        while not self.bot.is_closed() and self.running:
-            try:
-                now = datetime.now()
-                
-                # 매일 설정된 시간(기본: 오전 6시)에 실행
-                if now.hour == self.check_hour and now.minute == self.check_minute:
-                    logger.info(f"⏰ 자동 스케줄 체크 시작: {now.strftime('%Y-%m-%d %H:%M')}")
-                    await self._process_daily_schedules()
-                    
-                    # 같은 분에 중복 실행 방지 (1분 대기)
-                    await asyncio.sleep(60)
-                else:
-                    # 30초마다 체크
-                    await asyncio.sleep(30)
-                
-            except asyncio.CancelledError:
-                logger.info("🛑 자동 등록 스케줄러 루프 취소됨")
-                break
-            except Exception as e:
-                logger.error(f"❌ 자동 등록 체크 루프 오류: {e}")
-                import traceback
-                traceback.print_exc()
-                await asyncio.sleep(60)  # 오류 시 1분 대기
+    def _next_check_time(self) -> datetime:
+        """다음 체크 시각 (오늘 체크 시각이 지났으면 내일)"""
+        now = datetime.now()
+        next_check = now.replace(hour=self.check_hour, minute=self.check_minute, second=0, microsecond=0)
+        if next_check <= now:
+            next_check += timedelta(days=1)
+        return next_check
+    
+    async def _next_check(self):
+        """DeadlineScheduler 로더 - DB 조회 없이 다음 체크 시각만 돌려줌"""
+        return [('daily', self._next_check_time().timestamp())]
+    
+    async def _on_check_time(self, key: str):
+        """매일 설정된 시간(기본: 오전 6시)에 실행"""
+        try:
+            logger.info(f"⏰ 자동 스케줄 체크 시작: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+            await self._process_daily_schedules()
+        finally:
+            if self.running:
+                self.bot.deadline_scheduler.schedule('auto_recruitment', key, self._next_check_time().timestamp())
     
     async def _process_daily_schedules(self):
         """오늘 생성해야 할 스케줄 처리"""
@@ -410,9 +396,6 @@ class AutoRecruitmentScheduler:
         scrim_datetime: datetime
     ):
         """DM 알림 전송"""
-        success = 0
-        failed = 0
-        
         members = [m for m in guild.members if not m.bot]
         
         # DM용 임베드 (간소화)
@@ -440,17 +423,11 @@ class AutoRecruitmentScheduler:
             icon_url=guild.icon.url if guild.icon else None
         )
         
-        for member in members:
-            try:
-                await member.send(embed=dm_embed)
-                success += 1
-                await asyncio.sleep(0.1)  # Rate limit 방지
-            except discord.Forbidden:
-                failed += 1
-            except Exception:
-                failed += 1
+        stats = await self.bot.dm_dispatcher.send_bulk(
+            guild, 'auto_recruitment_announce', [(member, dm_embed) for member in members]
+        )
         
-        logger.info(f"📢 DM 알림: 성공 {success}명, 실패 {failed}명")
+        logger.info(f"📢 DM 알림: 성공 {stats['success']}명, 실패 {stats['failed']}명, DM 차단 {stats['skipped']}명")
     
     async def manual_trigger(self) -> dict:
         """수동 실행 (테스트용)"""
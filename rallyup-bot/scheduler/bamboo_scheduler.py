@@ -1,5 +1,4 @@
 import asyncio
-import aiosqlite
 import discord
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -9,16 +8,17 @@ class BambooForestScheduler:
     def __init__(self, bot):
         self.bot = bot
         self.running = False
-        self.task: Optional[asyncio.Task] = None
         
     async def start(self):
-        """스케줄러 시작"""
+        """스케줄러 시작 (공개 시각은 DeadlineScheduler 가 정확히 맞춰 호출)"""
         if self.running:
             print("🎋 스케줄러가 이미 실행 중입니다.")
             return
             
         self.running = True
-        self.task = asyncio.create_task(self._scheduler_loop())
+        self.bot.deadline_scheduler.register(
+            'bamboo_reveal', self._on_reveal_time, self.bot.db_manager.get_pending_reveal_times
+        )
         print("🎋 대나무숲 스케줄러가 시작되었습니다.")
         
     async def stop(self):
@@ -27,46 +27,18 @@ class BambooForestScheduler:
             return
             
         self.running = False
-        if self.task:
-            self.task.cancel()
-            try:
-                await self.task
-            except asyncio.CancelledError:
-                pass
+        self.bot.deadline_scheduler.unregister('bamboo_reveal')
         print("🎋 대나무숲 스케줄러가 중지되었습니다.")
         
-    async def _scheduler_loop(self):
-        """메인 스케줄러 루프 - 1분마다 실행"""
-        while self.running:
-            try:
-                await self._process_pending_reveals()
-                await asyncio.sleep(15)  # 15초 대기
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"🎋 스케줄러 오류: {e}")
-                await asyncio.sleep(15)  # 오류 발생해도 계속 실행
-                
-    async def _process_pending_reveals(self):
-        """공개할 메시지들 처리"""
-        try:
-            current_time = int(TimeUtils.get_utc_now().timestamp())
+    async def _on_reveal_time(self, message_id: str):
+        """공개 시각이 된 메시지 처리 (이미 공개됐으면 무시)"""
+        msg_data = await self.bot.db_manager.get_bamboo_message(message_id)
+        if not msg_data or msg_data['is_revealed'] or msg_data['message_type'] != 'timed_reveal':
+            return
 
-            # 공개 대기 중인 메시지들 조회
-            pending_messages = await self.bot.db_manager.get_pending_reveals()
-            
-            if not pending_messages:
-                return
-                
-            print(f"🎋 {len(pending_messages)}개 메시지 공개 처리 중...")
-            
-            for msg_data in pending_messages:
-                await self._reveal_single_message(msg_data)
-                await asyncio.sleep(0.5)  # 메시지 간 0.5초 간격
+        await self._reveal_single_message(msg_data)
+        await asyncio.sleep(0.5)  # 같은 시각에 몰린 메시지 간 0.5초 간격
                 
-        except Exception as e:
-            print(f"🎋 메시지 공개 처리 중 오류: {e}")
-            
     async def _reveal_single_message(self, msg_data: Dict):
         """개별 메시지 실명 공개"""
         try:
@@ -249,7 +221,7 @@ class BambooForestScheduler:
         try:
             current_time = int(TimeUtils.get_utc_now().timestamp())
             
-            async with aiosqlite.connect(self.bot.db_manager.db_path, timeout=30.0) as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT MIN(reveal_time) FROM bamboo_messages 
                     WHERE guild_id = ? AND message_type = 'timed_reveal' 
@@ -267,7 +239,7 @@ class BambooForestScheduler:
         try:
             current_time = int(TimeUtils.get_utc_now().timestamp())
             
-            async with aiosqlite.connect(self.bot.db_manager.db_path, timeout=30.0) as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 async with db.execute('''
                     SELECT COUNT(*) FROM bamboo_messages 
                     WHERE guild_id = ? AND message_type = 'timed_reveal' 
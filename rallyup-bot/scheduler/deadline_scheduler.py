@@ -0,0 +1,239 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (key, 이벤트 시각 epoch 초)
+DeadlineLoader = Callable[[], Awaitable[Iterable[Tuple[str, float]]]]
+DeadlineHandler = Callable[[str], Awaitable[None]]
+
+
+class _Kind:
+    def __init__(self, handler: DeadlineHandler, loader: Optional[DeadlineLoader], lead: float):
+        self.handler = handler
+        self.loader = loader
+        self.lead = lead
+        self.lock = asyncio.Lock()
+
+
+class DeadlineScheduler:
+    """마감 시각 기반 단일 타이머 스케줄러
+
+    - 각 스케줄러가 분 단위로 테이블을 훑는 대신, 다가오는 마감 시각을 한 번 읽어 힙에 넣고
+      가장 이른 항목까지 정확히 잠든 뒤 등록된 핸들러를 호출한다
+    - DatabaseManager 가 생성/마감/취소 시 schedule()/cancel() 로 힙을 직접 갱신하므로 평소에는 조회가 없다
+    - 같은 종류의 핸들러는 순서대로 하나씩 실행 (기존 스케줄러의 처리 순서 유지)
+    - 힙 밖에서 바뀐 행이나 핸들러 실패분은 resync_interval 마다 로더를 다시 돌려 복구
+    """
+
+    def __init__(self, bot, resync_interval: float = 900.0):
+        self.bot = bot
+        self.resync_interval = resync_interval
+
+        self._kinds: Dict[str, _Kind] = {}
+        self._heap: List[Tuple[float, int, str, str]] = []
+        self._entries: Dict[Tuple[str, str], Tuple[float, int]] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running_handlers: set = set()
+        self._next_resync = 0.0
+
+        self._stats = {'scheduled': 0, 'cancelled': 0, 'dispatched': 0, 'failed': 0, 'loads': 0}
+        self._lateness: List[float] = []
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def register(self, kind: str, handler: DeadlineHandler,
+                 loader: Optional[DeadlineLoader] = None, lead: float = 0.0):
+        """
+        마감 종류 등록
+
+        Args:
+            handler: 마감 시각이 되면 key 로 호출되는 코루틴 함수
+            loader: 시작/재동기화 때 대기 중인 (key, 시각) 목록을 돌려주는 코루틴 함수
+            lead: 이벤트 시각보다 몇 초 먼저 실행할지 (예: 시작 10분 전 알림)
+        """
+        self._kinds[kind] = _Kind(handler, loader, lead)
+        if self.running:
+            self._next_resync = 0.0
+            self._wakeup.set()
+
+    def unregister(self, kind: str):
+        self._kinds.pop(kind, None)
+        for entry_key in [k for k in self._entries if k[0] == kind]:
+            del self._entries[entry_key]
+
+    def schedule(self, kind: str, key: str, when: float):
+        """마감 항목 추가/변경 (when: 이벤트 시각 epoch 초, 같은 key 는 덮어씀)"""
+        registered = self._kinds.get(kind)
+        due = when - (registered.lead if registered else 0.0)
+        current = self._entries.get((kind, key))
+        if current is not None and current[0] == due:
+            return
+
+        seq = next(self._seq)
+        self._entries[(kind, key)] = (due, seq)
+        heapq.heappush(self._heap, (due, seq, kind, key))
+        self._stats['scheduled'] += 1
+
+        if self._heap[0][1] == seq:
+            self._wakeup.set()
+
+    def cancel(self, kind: str, key: str):
+        """마감 항목 제거 (힙에서는 꺼낼 때 버려짐)"""
+        if self._entries.pop((kind, key), None) is not None:
+            self._stats['cancelled'] += 1
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+            logger.info("⏰ 마감 스케줄러 시작")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for task in list(self._running_handlers):
+            task.cancel()
+        if self._running_handlers:
+            await asyncio.gather(*self._running_handlers, return_exceptions=True)
+        logger.info("⏰ 마감 스케줄러 중지")
+
+    async def _load(self):
+        """등록된 로더로 대기 중인 마감 항목 전체 재적재"""
+        for kind, registered in list(self._kinds.items()):
+            if registered.loader is None:
+                continue
+            try:
+                items = await registered.loader()
+            except Exception as e:
+                logger.error(f"❌ 마감 항목 로드 실패 ({kind}): {e}")
+                continue
+
+            for key, when in items:
+                self.schedule(kind, key, when)
+            self._stats['loads'] += 1
+
+        self._next_resync = time.time() + self.resync_interval
+
+    def _pop_due(self, now: float) -> List[Tuple[str, str, float]]:
+        due_items = []
+        while self._heap and self._heap[0][0] <= now:
+            due, seq, kind, key = heapq.heappop(self._heap)
+            if self._entries.get((kind, key)) != (due, seq):
+                continue  # 취소됐거나 다른 시각으로 바뀐 항목
+            del self._entries[(kind, key)]
+            due_items.append((kind, key, due))
+        return due_items
+
+    async def _run(self):
+        await self.bot.wait_until_ready()
+
+        while True:
+            try:
+                if time.time() >= self._next_resync:
+                    await self._load()
+
+                now = time.time()
+                for kind, key, due in self._pop_due(now):
+                    self._dispatch(kind, key, now - due)
+
+                # 가장 이른 항목 또는 재동기화 시각까지 대기 (schedule() 이 더 이른 항목을 넣으면 깨어남)
+                wake_at = self._next_resync
+                while self._heap and self._entries.get((self._heap[0][2], self._heap[0][3])) != self._heap[0][:2]:
+                    heapq.heappop(self._heap)
+                if self._heap:
+                    wake_at = min(wake_at, self._heap[0][0])
+
+                self._wakeup.clear()
+                timeout = max(0.0, wake_at - time.time())
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ 마감 스케줄러 오류: {e}")
+                await asyncio.sleep(5)
+
+    async def run_due(self, *kinds: str) -> int:
+        """
+        로더를 다시 돌려 이미 마감 시각이 지난 항목을 바로 처리하고 끝날 때까지 대기 (수동 점검용)
+
+        Args:
+            kinds: 처리할 마감 종류 (없으면 전체)
+
+        Returns:
+            처리한 항목 수
+        """
+        await self._load()
+
+        now = time.time()
+        due_items = [
+            (kind, key, due) for (kind, key), (due, _) in self._entries.items()
+            if due <= now and (not kinds or kind in kinds)
+        ]
+        tasks = []
+        for kind, key, due in due_items:
+            # 힙에 남은 항목은 꺼낼 때 버려짐
+            del self._entries[(kind, key)]
+            task = self._dispatch(kind, key, now - due)
+            if task is not None:
+                tasks.append(task)
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return len(due_items)
+
+    def _dispatch(self, kind: str, key: str, lateness: float) -> Optional[asyncio.Task]:
+        registered = self._kinds.get(kind)
+        if registered is None:
+            return None
+
+        self._lateness.append(lateness)
+        if len(self._lateness) > 200:
+            del self._lateness[:100]
+
+        task = asyncio.create_task(self._invoke(kind, registered, key))
+        self._running_handlers.add(task)
+        task.add_done_callback(self._running_handlers.discard)
+        return task
+
+    async def _invoke(self, kind: str, registered: _Kind, key: str):
+        async with registered.lock:
+            try:
+                await registered.handler(key)
+                self._stats['dispatched'] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 행이 그대로 남아 있으면 다음 재동기화 때 다시 잡힌다
+                self._stats['failed'] += 1
+                logger.error(f"❌ 마감 처리 실패 ({kind}: {key}): {e}")
+
+    def get_stats(self) -> Dict:
+        pending: Dict[str, int] = {}
+        for kind, _ in self._entries:
+            pending[kind] = pending.get(kind, 0) + 1
+
+        next_due = min((due for due, _ in self._entries.values()), default=None)
+        return {
+            **self._stats,
+            'pending': pending,
+            'next_due_in': round(next_due - time.time(), 1) if next_due is not None else None,
+            'max_lateness': round(max(self._lateness), 3) if self._lateness else 0.0,
+        }
@@ -1,8 +1,8 @@
-import asyncio
 import discord
 from datetime import datetime, timedelta
 from typing import Dict, List
-import traceback
+
+from utils.recruitment_message_refresher import recruitment_refresher
 
 class RecruitmentScheduler:
     """내전 모집 자동 마감 및 관리 스케줄러"""
@@ -10,60 +10,33 @@ class RecruitmentScheduler:
     def __init__(self, bot):
         self.bot = bot
         self.is_running = False
-        self.scheduler_task = None
-        self.check_interval = 60  # 1분마다 체크
         
     async def start(self):
-        """스케줄러 시작"""
+        """스케줄러 시작 (마감 시각은 DeadlineScheduler 가 정확히 맞춰 호출)"""
         if self.is_running:
             return
             
         self.is_running = True
-        self.scheduler_task = asyncio.create_task(self._scheduler_loop())
+        self.bot.deadline_scheduler.register(
+            'recruitment', self._on_deadline, self.bot.db_manager.get_recruitment_deadlines
+        )
         print("🕐 내전 모집 스케줄러 시작")
         
     async def stop(self):
         """스케줄러 중지"""
         self.is_running = False
-        if self.scheduler_task:
-            self.scheduler_task.cancel()
-            try:
-                await self.scheduler_task
-            except asyncio.CancelledError:
-                pass
+        self.bot.deadline_scheduler.unregister('recruitment')
         print("🛑 내전 모집 스케줄러 중지")
         
-    async def _scheduler_loop(self):
-        """스케줄러 메인 루프"""
-        while self.is_running:
-            try:
-                await self._check_expired_recruitments()
-                await asyncio.sleep(self.check_interval)
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"❌ 모집 스케줄러 오류: {e}")
-                print(f"❌ 스택트레이스: {traceback.format_exc()}")
-                await asyncio.sleep(self.check_interval)
-                
-    async def _check_expired_recruitments(self):
-        """만료된 모집들 체크 및 처리"""
-        try:
-            # 1. 만료된 모집들 조회
-            expired_recruitments = await self.bot.db_manager.get_expired_recruitments()
-            
-            if not expired_recruitments:
-                return
-                
-            print(f"🕐 {len(expired_recruitments)}개의 만료된 모집 발견")
-            
-            # 2. 각 모집별로 마감 처리
-            for recruitment in expired_recruitments:
-                await self._process_expired_recruitment(recruitment)
-                
-        except Exception as e:
-            print(f"❌ 만료된 모집 체크 실패: {e}")
+    async def _on_deadline(self, recruitment_id: str):
+        """마감 시각이 된 모집 처리 (그 사이 마감/취소됐으면 무시)"""
+        recruitment = await self.bot.db_manager.get_recruitment_by_id(recruitment_id)
+        if not recruitment or recruitment['status'] != 'active':
+            return
+        if recruitment.get('recruitment_type') == 'voting':
+            return  # 투표 모집은 VotingNotificationScheduler 가 시간대 확정까지 처리
+        
+        await self._process_expired_recruitment(recruitment)
             
     async def _process_expired_recruitment(self, recruitment: Dict):
         """개별 모집 마감 처리"""
@@ -78,6 +51,7 @@ class RecruitmentScheduler:
             if not success:
                 print(f"❌ 모집 마감 처리 실패: {recruitment_id}")
                 return
+            recruitment_refresher.discard(recruitment_id)
                 
             # 2. 참가자 정보 조회
             participants = await self.bot.db_manager.get_recruitment_participants(recruitment_id)
@@ -174,36 +148,28 @@ class RecruitmentScheduler:
             embed.set_footer(text=f"모집 ID: {recruitment['id']} | {guild.name}")
             embed.set_thumbnail(url=guild.icon.url if guild.icon else None)
             
-            # 각 참가자에게 개별 DM 발송
-            success_count = 0
-            failed_users = []
+            # 각 참가자에게 개별 DM 발송 (공용 DM 발송기 경유)
+            recipients = []
+            missing_users = []
             
             for user_data in joined_users:
-                try:
-                    member = guild.get_member(int(user_data['user_id']))
-                    if member:
-                        # 개인화된 메시지 추가
-                        personal_embed = embed.copy()
-                        personal_embed.description = f"안녕하세요 **{member.display_name}**님!\n\n" + personal_embed.description
-                        
-                        await member.send(embed=personal_embed)
-                        success_count += 1
-                        
-                        # 서버 부하 방지
-                        await asyncio.sleep(0.5)
-                    else:
-                        failed_users.append(f"{user_data['username']} (멤버 없음)")
-                        
-                except discord.Forbidden:
-                    failed_users.append(f"{user_data['username']} (DM 차단)")
-                except Exception as e:
-                    failed_users.append(f"{user_data['username']} (오류: {str(e)[:20]})")
-
-            print(f"✅ 참가 확정 DM 발송 완료: {success_count}/{len(joined_users)}명 성공")
+                member = guild.get_member(int(user_data['user_id']))
+                if member:
+                    # 개인화된 메시지 추가
+                    personal_embed = embed.copy()
+                    personal_embed.description = f"안녕하세요 **{member.display_name}**님!\n\n" + personal_embed.description
+                    recipients.append((member, personal_embed))
+                else:
+                    missing_users.append(f"{user_data['username']} (멤버 없음)")
+            
+            stats = await self.bot.dm_dispatcher.send_bulk(guild, 'recruitment_confirmation', recipients)
+            
+            print(f"✅ 참가 확정 DM 발송 완료: {stats['success']}/{len(joined_users)}명 성공 "
+                  f"(DM 차단 {stats['skipped']}명 제외)")
 
-            if failed_users:
-                print(f"⚠️ DM 발송 실패: {', '.join(failed_users[:5])}" + 
-                      (f" 외 {len(failed_users)-5}명" if len(failed_users) > 5 else ""))
+            if missing_users:
+                print(f"⚠️ DM 발송 실패: {', '.join(missing_users[:5])}" + 
+                      (f" 외 {len(missing_users)-5}명" if len(missing_users) > 5 else ""))
 
         except Exception as e:
             print(f"❌ 참가 확정 DM 발송 실패: {e}")
@@ -240,21 +206,16 @@ class RecruitmentScheduler:
             embed.set_thumbnail(url=guild.icon.url if guild.icon else None)
             
             # 불참자들에게 DM 발송 (실패해도 무시)
-            success_count = 0
-            
+            recipients = []
             for user_data in declined_users[:10]:  # 최대 10명까지만 (부하 방지)
-                try:
-                    member = guild.get_member(int(user_data['user_id']))
-                    if member:
-                        await member.send(embed=embed)
-                        success_count += 1
-                        await asyncio.sleep(0.3)  # 짧은 대기
-                        
-                except:
-                    continue  # 실패해도 계속 진행
-            
-            if success_count > 0:
-                print(f"✅ 불참자 DM 발송 완료: {success_count}/{len(declined_users)}명 성공")
+                member = guild.get_member(int(user_data['user_id']))
+                if member:
+                    recipients.append((member, embed))
+            
+            stats = await self.bot.dm_dispatcher.send_bulk(guild, 'recruitment_closure', recipients)
+            
+            if stats['success'] > 0:
+                print(f"✅ 불참자 DM 발송 완료: {stats['success']}/{len(declined_users)}명 성공")
                 
         except Exception as e:
             print(f"❌ 불참자 DM 발송 실패: {e}")
@@ -487,14 +448,18 @@ class RecruitmentScheduler:
             print(f"❌ 서버 관리자 알림 발송 실패: {e}")
 
     async def force_check_recruitments(self):
-        """수동으로 모집 마감 체크 실행 (디버깅용)"""
+        """수동으로 모집 마감 체크 실행 (디버깅용, 자동 마감과 같은 핸들러 사용)"""
         print("🔍 수동 모집 마감 체크 실행")
-        await self._check_expired_recruitments()
+        # 투표 모집은 자동 마감과 마찬가지로 VotingNotificationScheduler 가 시간대 확정까지 처리
+        processed = await self.bot.deadline_scheduler.run_due('recruitment', 'voting_deadline')
+        if processed:
+            print(f"🕐 {processed}개의 만료된 모집 처리")
         
     def get_status(self) -> Dict:
         """스케줄러 상태 조회"""
+        deadlines = self.bot.deadline_scheduler.get_stats()
         return {
             'is_running': self.is_running,
-            'check_interval': self.check_interval,
-            'task_status': 'running' if self.scheduler_task and not self.scheduler_task.done() else 'stopped'
+            'pending_deadlines': deadlines['pending'].get('recruitment', 0),
+            'task_status': 'running' if self.is_running and self.bot.deadline_scheduler.running else 'stopped'
         }
\ No newline at end of file
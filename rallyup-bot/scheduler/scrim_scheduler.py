@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict
@@ -12,57 +11,30 @@ class ScrimScheduler:
     
     def __init__(self, bot):
         self.bot = bot
-        self.task = None
         self.running = False
     
     async def start(self):
-        """스케줄러 시작"""
+        """스케줄러 시작 (마감 시각은 DeadlineScheduler 가 정확히 맞춰 호출)"""
         if self.running:
             return
         
         self.running = True
-        self.task = asyncio.create_task(self._scheduler_loop())
+        self.bot.deadline_scheduler.register(
+            'inter_guild_scrim', self._on_deadline, self.bot.db_manager.get_inter_guild_scrim_deadlines
+        )
         logger.info("🎯 길드 간 스크림 스케줄러가 시작되었습니다.")
     
     async def stop(self):
         """스케줄러 중지"""
         self.running = False
-        if self.task:
-            self.task.cancel()
-            try:
-                await self.task
-            except asyncio.CancelledError:
-                pass
+        self.bot.deadline_scheduler.unregister('inter_guild_scrim')
         logger.info("🎯 길드 간 스크림 스케줄러가 중지되었습니다.")
     
-    async def _scheduler_loop(self):
-        """스케줄러 메인 루프"""
-        while self.running:
-            try:
-                await self._process_expired_scrims()
-                await asyncio.sleep(60)  # 1분마다 체크
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"🚨 길드 간 스크림 스케줄러 오류: {e}")
-                await asyncio.sleep(60)
-    
-    async def _process_expired_scrims(self):
-        """만료된 길드 간 스크림 모집 처리"""
-        try:
-            expired_scrims = await self.bot.db_manager.get_expired_scrims()
-            
-            if expired_scrims:
-                logger.info(f"🎯 {len(expired_scrims)}개의 만료된 길드 간 스크림 모집을 처리합니다.")
-            
-            for scrim in expired_scrims:
-                await self._close_scrim(scrim)
-                
-        except AttributeError as e:
-            logger.error(f"🚨 Repository 속성 오류: {e}")
-            logger.error("inter_guild_scrim_repository가 DatabaseManager에 제대로 초기화되었는지 확인하세요.")
-        except Exception as e:
-            logger.error(f"🚨 만료된 길드 간 스크림 처리 오류: {e}")
+    async def _on_deadline(self, scrim_id: str):
+        """마감 시각이 된 스크림 모집 처리 (그 사이 상태가 바뀌었으면 무시)"""
+        scrim = await self.bot.db_manager.get_scrim_by_id(scrim_id)
+        if scrim and scrim['status'] == 'active':
+            await self._close_scrim(scrim)
     
     async def _close_scrim(self, scrim: Dict[str, Any]):
         """개별 길드 간 스크림 모집 마감 처리"""
@@ -168,12 +140,10 @@ class ScrimScheduler:
         try:
             # 활성 스크림 수 조회 (모든 길드)
             total_active = 0
-            expired_count = 0
+            # 마감 대기 중인 모집 수 (DeadlineScheduler 힙 기준, DB 조회 없음)
+            pending_count = self.bot.deadline_scheduler.get_stats()['pending'].get('inter_guild_scrim', 0)
             
             try:
-                expired_scrims = await self.bot.db_manager.get_expired_scrims()
-                expired_count = len(expired_scrims)
-                
                 # 간단한 통계 조회 (첫 번째 길드만 예시)
                 guilds = [guild.id for guild in self.bot.guilds]
                 if guilds:
@@ -186,7 +156,7 @@ class ScrimScheduler:
             return {
                 'running': self.running,
                 'total_active_scrims': total_active,
-                'expired_scrims_pending': expired_count,
+                'pending_deadlines': pending_count,
                 'last_check': datetime.now(timezone.utc).isoformat()
             }
             
@@ -3,6 +3,9 @@ import traceback
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from utils.battle_tag_logger import BattleTagLogger
+from utils.rank_refresh_pipeline import RankRefreshPipeline
+
 class TierChangeScheduler:
     """티어 변동 자동 감지 스케줄러"""
     
@@ -11,6 +14,11 @@ class TierChangeScheduler:
         self.is_running = False
         self.scheduler_task = None
         self.check_interval = 3600 * 12  # 12시간마다 체크 (하루 2회)
+        
+        # 랭크 조회 파이프라인 (초당 요청 수/동시 요청 수 제한)
+        self.pipeline = RankRefreshPipeline(rate_per_second=5.0, burst=10.0, concurrency=8)
+        self.battle_tag_logger = BattleTagLogger(bot)
+        self.last_pass_metrics: Optional[Dict] = None
     
     async def start(self):
         """스케줄러 시작"""
@@ -54,10 +62,8 @@ class TierChangeScheduler:
         try:
             print("🔍 티어 변동 체크 시작...")
             
-            total_checked = 0
-            total_changes = 0
-            
             # 모든 서버에서 티어 변동 로그가 활성화된 곳만 체크
+            guild_ids = []
             for guild in self.bot.guilds:
                 guild_id = str(guild.id)
                 
@@ -67,12 +73,11 @@ class TierChangeScheduler:
                 if not settings or not settings['log_tier_change']:
                     continue  # 티어 변동 로그 비활성화된 서버 스킵
                 
-                # 해당 서버의 모든 배틀태그 체크
-                changes_count = await self._check_guild_tier_changes(guild_id)
-                total_changes += changes_count
-                total_checked += 1
+                guild_ids.append(guild_id)
+            
+            total_changes = await self._refresh_guilds(guild_ids)
             
-            print(f"✅ 티어 변동 체크 완료: {total_checked}개 서버, {total_changes}건 변동 감지")
+            print(f"✅ 티어 변동 체크 완료: {len(guild_ids)}개 서버, {total_changes}건 변동 감지")
             
         except Exception as e:
             print(f"❌ 티어 변동 체크 실패: {e}")
@@ -80,53 +85,67 @@ class TierChangeScheduler:
     async def _check_guild_tier_changes(self, guild_id: str) -> int:
         """특정 서버의 티어 변동 체크"""
         try:
-            changes_count = 0
-            
-            # 모든 등록 유저의 배틀태그 조회
-            users = await self.bot.db_manager.get_all_registered_users(guild_id)
-            
-            for user in users:
-                user_id = user['user_id']
-                username = user['username']
-                
-                # 유저의 모든 배틀태그 조회
-                tags = await self.bot.db_manager.get_user_battle_tags(guild_id, user_id)
-                
-                for tag in tags:
-                    battle_tag = tag['battle_tag']
-                    old_rank_info = tag.get('rank_info')
-                    
-                    # API로 최신 랭크 정보 조회
-                    new_rank_info = await self.bot.db_manager.refresh_battle_tag_rank(
-                        guild_id, user_id, battle_tag
-                    )
-                    
-                    if not new_rank_info:
-                        continue  # API 실패 시 스킵
-                    
-                    # 티어 변동 비교
-                    changes = self._compare_ranks(old_rank_info, new_rank_info)
-                    
-                    if changes:
-                        # 로그 전송
-                        from utils.battle_tag_logger import BattleTagLogger
-                        logger = BattleTagLogger(self.bot)
-                        
-                        await logger.log_tier_change(
-                            guild_id, user_id, username, battle_tag, changes
-                        )
-                        
-                        changes_count += 1
-                    
-                    # API 부하 방지
-                    await asyncio.sleep(0.5)
-            
-            return changes_count
-            
+            return await self._refresh_guilds([guild_id])
         except Exception as e:
             print(f"❌ 서버 {guild_id} 티어 변동 체크 실패: {e}")
             return 0
     
+    async def _refresh_guilds(self, guild_ids: List[str]) -> int:
+        """여러 서버의 배틀태그 랭크를 한 번에 갱신하고 변동 로그 전송"""
+        if not guild_ids:
+            return 0
+        
+        # 대상 배틀태그 단일 쿼리 조회
+        tags = await self.bot.db_manager.get_battle_tags_for_refresh(guild_ids)
+        if not tags:
+            return 0
+        
+        # 동시/레이트 제한 조회 (같은 배틀태그는 한 번만)
+        rank_by_tag = await self.pipeline.run(tag['battle_tag'] for tag in tags)
+        
+        updates = []
+        pending_logs = []
+        for tag in tags:
+            new_rank_info = rank_by_tag.get(tag['battle_tag'])
+            if not new_rank_info:
+                continue  # API 실패 시 스킵
+            
+            updates.append((tag['guild_id'], tag['user_id'], tag['battle_tag'], new_rank_info))
+            
+            # 티어 변동 비교
+            changes = self._compare_ranks(tag.get('rank_info'), new_rank_info)
+            if changes:
+                pending_logs.append((tag, changes))
+        
+        # 랭크 정보 일괄 저장
+        updated = await self.bot.db_manager.bulk_update_battle_tag_rank_info(updates)
+        
+        # 로그 전송
+        for tag, changes in pending_logs:
+            try:
+                await self.battle_tag_logger.log_tier_change(
+                    tag['guild_id'], tag['user_id'], tag['username'], tag['battle_tag'], changes
+                )
+            except Exception as e:
+                print(f"❌ 티어 변동 로그 전송 실패 ({tag['battle_tag']}): {e}")
+        
+        metrics = self.pipeline.last_metrics or {}
+        self.last_pass_metrics = {
+            **metrics,
+            'guilds': len(guild_ids),
+            'rows': len(tags),
+            'updated_rows': updated,
+            'changes': len(pending_logs),
+        }
+        print(
+            f"📊 랭크 갱신: 배틀태그 {metrics.get('tags', 0)}개 / {metrics.get('elapsed_seconds', 0)}초 "
+            f"({metrics.get('throughput_per_second', 0)}개/초), 성공 {metrics.get('succeeded', 0)}, "
+            f"실패 {metrics.get('failed', 0)}, 재시도 {metrics.get('retries', 0)}, "
+            f"429 {metrics.get('rate_limited', 0)}회, DB 반영 {updated}행"
+        )
+        
+        return len(pending_logs)
+    
     def _compare_ranks(self, old_rank: Optional[Dict], new_rank: Dict) -> List[Dict]:
         """랭크 정보 비교 및 변동 추출"""
         try:
@@ -1,48 +1,53 @@
 import discord
-from discord.ext import tasks
 import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 
+from utils.recruitment_message_refresher import recruitment_refresher
+
 class VotingNotificationScheduler:
     """투표 방식 내전 알림 스케줄러"""
     
     def __init__(self, bot):
         self.bot = bot
-        self.check_interval = 60  # 1분마다 체크
+        self.notify_minutes_before = 10  # 시작 10분 전 알림
     
     def start(self):
-        """스케줄러 시작"""
-        self.check_deadlines.start()
-        self.check_notifications.start()
+        """스케줄러 시작 (마감/알림 시각은 DeadlineScheduler 가 정확히 맞춰 호출)"""
+        deadlines = self.bot.deadline_scheduler
+        deadlines.register(
+            'voting_deadline', self._on_deadline,
+            lambda: self.bot.db_manager.get_recruitment_deadlines('voting')
+        )
+        deadlines.register(
+            'voting_start', self._on_start_notification,
+            self.bot.db_manager.get_voting_start_times,
+            lead=self.notify_minutes_before * 60
+        )
         print("✅ 투표 알림 스케줄러 시작됨")
     
     def stop(self):
         """스케줄러 중지"""
-        self.check_deadlines.cancel()
-        self.check_notifications.cancel()
+        self.bot.deadline_scheduler.unregister('voting_deadline')
+        self.bot.deadline_scheduler.unregister('voting_start')
         print("⏹️ 투표 알림 스케줄러 중지됨")
     
-    @tasks.loop(seconds=60)
-    async def check_deadlines(self):
-        """마감 시간 체크 및 자동 종료 처리"""
+    async def _on_deadline(self, recruitment_id: str):
+        """마감 시간이 된 투표 모집 자동 종료 처리 (그 사이 확정/취소됐으면 무시)"""
         try:
-            # 마감 시간이 지난 투표 모집 조회
-            pending_recruitments = await self.bot.db_manager.get_pending_voting_recruitments()
-            
-            for recruitment in pending_recruitments:
+            recruitment = await self.bot.db_manager.get_recruitment_by_id(recruitment_id)
+            if recruitment and recruitment['status'] == 'active':
                 await self._process_deadline_recruitment(recruitment)
                 
         except Exception as e:
             print(f"❌ 마감 체크 오류: {e}")
     
-    @tasks.loop(seconds=60)
-    async def check_notifications(self):
-        """10분 전 알림 체크"""
+    async def _on_start_notification(self, recruitment_id: str):
+        """시작 10분 전 알림 (이미 보냈거나 시작 시간이 지났으면 무시)"""
         try:
-            # 알림이 필요한 확정된 모집 조회
             recruitments = await self.bot.db_manager.get_confirmed_recruitments_for_notification(
-                minutes_before=10
+                minutes_before=self.notify_minutes_before,
+                recruitment_id=recruitment_id
             )
             
             for recruitment in recruitments:
@@ -51,16 +56,6 @@ class VotingNotificationScheduler:
         except Exception as e:
             print(f"❌ 알림 체크 오류: {e}")
     
-    @check_deadlines.before_loop
-    async def before_check_deadlines(self):
-        """스케줄러 시작 전 봇 준비 대기"""
-        await self.bot.wait_until_ready()
-    
-    @check_notifications.before_loop
-    async def before_check_notifications(self):
-        """스케줄러 시작 전 봇 준비 대기"""
-        await self.bot.wait_until_ready()
-    
     async def _process_deadline_recruitment(self, recruitment: dict):
         """마감된 모집 처리"""
         try:
@@ -68,6 +63,7 @@ class VotingNotificationScheduler:
             
             # 자동 종료 처리
             result = await self.bot.db_manager.close_voting_recruitment_on_deadline(recruitment_id)
+            recruitment_refresher.discard(recruitment_id)
             
             # 채널에 결과 메시지 발송
             channel_id = recruitment.get('channel_id')
@@ -81,8 +77,9 @@ class VotingNotificationScheduler:
                 return
             
             if result == 'confirmed':
-                # 확정됨
-                confirmed_time = recruitment.get('confirmed_time')
+                # 확정됨 (확정 시간은 방금 기록됐으므로 다시 조회)
+                updated = await self.bot.db_manager.get_recruitment_by_id(recruitment_id)
+                confirmed_time = (updated or recruitment).get('confirmed_time')
                 
                 # 기존 메시지 업데이트
                 if message_id:
@@ -1,12 +1,10 @@
 import asyncio
-import aiosqlite
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 import logging
 
 import discord
 
-from config.settings import Settings
 
 if TYPE_CHECKING:
     from main import RallyUpBot
@@ -86,7 +84,7 @@ class WordleScheduler:
     async def _get_reward_pending_games(self):
         """보상 지급 대기 중인 게임들 조회"""
         try:
-            async with aiosqlite.connect(Settings.DATABASE_PATH) as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 # 완료된 게임 중 24시간이 지난 게임들
                 async with db.execute('''
                     SELECT DISTINCT wg.id, wg.creator_id, wg.creator_username
@@ -139,7 +137,7 @@ class WordleScheduler:
     async def _is_reward_already_paid(self, game_id: int) -> bool:
         """보상이 이미 지급되었는지 확인"""
         try:
-            async with aiosqlite.connect(Settings.DATABASE_PATH) as db:
+            async with self.bot.db_manager.get_connection(readonly=True) as db:
                 async with db.execute('SELECT creator_reward_paid FROM wordle_games WHERE id = ?', 
                                     (game_id,)) as cursor:
                     result = await cursor.fetchone()
@@ -150,7 +148,7 @@ class WordleScheduler:
     async def _atomic_reward_payment(self, guild_id: str, creator_id: str, game_id: int, reward: int) -> bool:
         """원자적 보상 지급 처리"""
         try:
-            async with aiosqlite.connect(Settings.DATABASE_PATH) as db:
+            async with self.bot.db_manager.get_connection() as db:
                 await db.execute('BEGIN IMMEDIATE')
                 
                 try:
@@ -0,0 +1,187 @@
+"""
+팀 밸런싱 엔진 벤치마크
+
+기존 PRECISE 경로와의 결과 일치, 로비 엔진 소요 시간, 교체 탐색의 증분 평가 정확도를 확인한다.
+
+    cd rallyup-bot && python scripts/benchmark_balance.py
+"""
+import heapq
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.balance_algorithm import BalanceResult, BalancingMode, TeamBalancer, TeamComposition  # noqa: E402
+from utils.balance_engine import (  # noqa: E402
+    ROLE_TEMPLATES, LobbyBalanceEngine, PreciseBalanceEngine, SwapSearchEngine
+)
+
+
+def _random_players(rng: random.Random, count: int = 10) -> List[Dict]:
+    """벤치마크용 임의 참가자"""
+    players = []
+    for i in range(count):
+        tank_games, dps_games, support_games = (rng.randint(0, 40) for _ in range(3))
+        tank_wins = rng.randint(0, tank_games)
+        dps_wins = rng.randint(0, dps_games)
+        support_wins = rng.randint(0, support_games)
+        players.append({
+            'user_id': str(1000 + i),
+            'username': f'player{i}',
+            'main_position': rng.choice(['탱커', '딜러', '힐러', '미설정']),
+            'total_games': tank_games + dps_games + support_games,
+            'total_wins': tank_wins + dps_wins + support_wins,
+            'tank_games': tank_games,
+            'tank_wins': tank_wins,
+            'dps_games': dps_games,
+            'dps_wins': dps_wins,
+            'support_games': support_games,
+            'support_wins': support_wins,
+        })
+    return players
+
+
+def _result_signature(result: BalanceResult) -> Tuple:
+    def team(comp: TeamComposition) -> Tuple:
+        return (comp.tank.user_id, comp.dps1.user_id, comp.dps2.user_id,
+                comp.support1.user_id, comp.support2.user_id)
+
+    return (team(result.team_a), team(result.team_b), result.balance_score,
+            result.skill_difference, result.predicted_winrate_a, result.reasoning)
+
+
+def benchmark_precise_engine(rounds: int = 20, seed: Optional[int] = 42):
+    """기존 PRECISE 경로와 엔진의 결과 일치 여부 및 소요 시간 비교"""
+    print("=== PRECISE 밸런싱 엔진 벤치마크 ===")
+
+    rng = random.Random(seed)
+    balancer = TeamBalancer(mode=BalancingMode.PRECISE)
+    engine = PreciseBalanceEngine(balancer)
+
+    legacy_total = 0.0
+    engine_total = 0.0
+    mismatches = 0
+    pruned = 0
+    evaluated = 0
+
+    for _ in range(rounds):
+        players = [balancer.calculate_player_skills(p) for p in _random_players(rng)]
+
+        started = time.perf_counter()
+        legacy = balancer.evaluate_combinations(balancer.generate_all_combinations(players))
+        legacy_total += time.perf_counter() - started
+
+        started = time.perf_counter()
+        fast = engine.find_optimal_balance(players)
+        engine_total += time.perf_counter() - started
+
+        pruned += engine.stats['pruned']
+        evaluated += engine.stats['assignments']
+
+        if [_result_signature(r) for r in legacy] != [_result_signature(r) for r in fast]:
+            mismatches += 1
+
+    status = "✅" if mismatches == 0 else "❌"
+    print(f"{status} 결과 일치: {rounds - mismatches}/{rounds}")
+    print(f"   기존 경로: {legacy_total / rounds * 1000:.2f}ms/회")
+    print(f"   엔진:     {engine_total / rounds * 1000:.2f}ms/회")
+    if engine_total > 0:
+        print(f"   속도 향상: {legacy_total / engine_total:.1f}배")
+    print(f"   평가한 배치: {evaluated // rounds}개/회, 가지치기: {pruned // rounds}개/회")
+
+
+def benchmark_lobby_engine(seed: Optional[int] = 42):
+    """템플릿/인원별 로비 엔진 소요 시간 및 탐색 방식 확인"""
+    print("=== 로비 밸런싱 엔진 벤치마크 ===")
+
+    rng = random.Random(seed)
+    balancer = TeamBalancer(mode=BalancingMode.PRECISE)
+    scenarios = [
+        ('5v5', 10), ('5v5', 12), ('5v5', 14), ('5v5', 16),
+        ('6v6', 12), ('6v6', 14), ('6v6', 16), ('open5', 12), ('open6', 16),
+    ]
+
+    for template_name, count in scenarios:
+        players = [balancer.calculate_player_skills(p) for p in _random_players(rng, count)]
+        engine = LobbyBalanceEngine(balancer, ROLE_TEMPLATES[template_name], seed=seed)
+        results = engine.find_balance(players)
+        best = results[0]
+
+        status = "✅" if engine.stats['elapsed_ms'] < 1000 else "⚠️"
+        print(f"{status} {template_name} {count}명: {engine.stats['mode']} "
+              f"{engine.stats['elapsed_ms']:.1f}ms, 분할 {engine.stats['splits']}개, "
+              f"최소 차이 {best.skill_difference:.4f}, 대기 {len(best.bench)}명")
+
+
+def benchmark_swap_search(rounds: int = 20, seed: Optional[int] = 42, top_n: int = 3):
+    """교체 탐색 엔진 검증
+
+    - 엔진이 증분 평가로 계산한 개선도를 교체 후 전체 재계산(analyze_fixed_team_composition) 결과와 비교
+    - 엔진이 고른 상위 top_n 교체안을 모든 교체안을 전체 재계산해 정렬한 결과와 비교
+    """
+    print("=== 교체 탐색 엔진 벤치마크 ===")
+
+    rng = random.Random(seed)
+    balancer = TeamBalancer(mode=BalancingMode.PRECISE)
+    engine = SwapSearchEngine(balancer)
+    role_order = ['탱커', '딜러', '딜러', '힐러', '힐러']
+
+    worst_error = 0.0
+    rank_matches = 0
+    engine_ms = 0.0
+    brute_ms = 0.0
+    found = 0
+
+    for _ in range(rounds):
+        players = _random_players(rng)
+        team_a, team_b = players[:5], players[5:]
+        a_positions = {p['user_id']: role for p, role in zip(team_a, role_order)}
+        b_positions = {p['user_id']: role for p, role in zip(team_b, role_order)}
+
+        current = balancer.analyze_fixed_team_composition(team_a, a_positions, team_b, b_positions)
+        improvements = engine.find_improvements(
+            team_a, a_positions, team_b, b_positions, top_n=top_n, min_improvement=0.0
+        )
+        engine_ms += engine.stats['elapsed_ms']
+        found += len(improvements)
+
+        for improvement in improvements:
+            # 탐색에 쓴 증분 개선도 vs 교체 후 구성을 처음부터 다시 계산한 개선도
+            recomputed = improvement['result'].balance_score - current.balance_score
+            worst_error = max(worst_error, abs(recomputed - improvement['estimated_improvement']))
+
+        # 모든 교체안을 전체 재계산으로 평가해 엔진과 같은 기준(스킬 차이, 교체 인원, 순서)으로 정렬
+        started = time.perf_counter()
+        brute = []
+        for order, pairs in enumerate(SwapSearchEngine.neighbours(engine.max_swaps)):
+            result = balancer.analyze_fixed_team_composition(*SwapSearchEngine.apply_swaps(
+                team_a, a_positions, team_b, b_positions, pairs
+            ))
+            if result.balance_score > current.balance_score:
+                brute.append((result.skill_difference, len(pairs), order, pairs))
+        brute_top = heapq.nsmallest(top_n, brute)
+        brute_ms += (time.perf_counter() - started) * 1000
+
+        picked = [improvement['swaps'] for improvement in improvements]
+        if picked == [pairs for *_, pairs in brute_top]:
+            rank_matches += 1
+        elif len(picked) == len(brute_top) and all(
+            abs(improvement['result'].skill_difference - key[0]) < 1e-9
+            for improvement, key in zip(improvements, brute_top)
+        ):
+            # 스킬 차이가 같은 교체안끼리 부동소수점 오차로 순서만 바뀐 경우
+            rank_matches += 1
+
+    status = "✅" if worst_error < 1e-9 and rank_matches == rounds else "❌"
+    print(f"{status} 증분 개선도 최대 오차: {worst_error:.2e}, 상위 {top_n}개 순위 일치: {rank_matches}/{rounds}")
+    print(f"   탐색: {engine.stats['neighbours']}개 교체안, 엔진 {engine_ms / rounds:.2f}ms/회, "
+          f"전체 재계산 {brute_ms / rounds:.2f}ms/회, 개선안 {found}개")
+
+
+if __name__ == "__main__":
+    benchmark_precise_engine()
+    benchmark_lobby_engine()
+    benchmark_swap_search()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트(rallyup-bot)를 import 경로에 추가 (main.py 와 같은 기준으로 모듈을 불러온다)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
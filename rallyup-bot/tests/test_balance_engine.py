@@ -0,0 +1,88 @@
+import random
+from typing import Dict, List
+
+import pytest
+
+from utils.balance_algorithm import BalanceResult, BalancingMode, TeamBalancer, TeamComposition
+from utils.balance_engine import PreciseBalanceEngine, SwapSearchEngine
+
+ROLE_ORDER = ['탱커', '딜러', '딜러', '힐러', '힐러']
+
+
+def _random_players(rng: random.Random, count: int = 10) -> List[Dict]:
+    players = []
+    for i in range(count):
+        tank_games, dps_games, support_games = (rng.randint(0, 40) for _ in range(3))
+        tank_wins = rng.randint(0, tank_games)
+        dps_wins = rng.randint(0, dps_games)
+        support_wins = rng.randint(0, support_games)
+        players.append({
+            'user_id': str(1000 + i),
+            'username': f'player{i}',
+            'main_position': rng.choice(['탱커', '딜러', '힐러', '미설정']),
+            'total_games': tank_games + dps_games + support_games,
+            'total_wins': tank_wins + dps_wins + support_wins,
+            'tank_games': tank_games,
+            'tank_wins': tank_wins,
+            'dps_games': dps_games,
+            'dps_wins': dps_wins,
+            'support_games': support_games,
+            'support_wins': support_wins,
+        })
+    return players
+
+
+def _signature(result: BalanceResult):
+    def team(comp: TeamComposition):
+        return (comp.tank.user_id, comp.dps1.user_id, comp.dps2.user_id,
+                comp.support1.user_id, comp.support2.user_id)
+
+    return (team(result.team_a), team(result.team_b), result.balance_score,
+            result.skill_difference, result.predicted_winrate_a, result.reasoning)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_precise_engine_matches_legacy_search(seed):
+    rng = random.Random(seed)
+    balancer = TeamBalancer(mode=BalancingMode.PRECISE)
+    players = [balancer.calculate_player_skills(p) for p in _random_players(rng)]
+
+    legacy = balancer.evaluate_combinations(balancer.generate_all_combinations(players))
+    fast = PreciseBalanceEngine(balancer).find_optimal_balance(players)
+
+    assert [_signature(r) for r in fast] == [_signature(r) for r in legacy]
+
+
+def test_precise_engine_uses_balancer_position_weights():
+    rng = random.Random(7)
+    balancer = TeamBalancer(mode=BalancingMode.PRECISE)
+    balancer.position_weights = {'tank': 0.5, 'dps': 0.2, 'support': 0.3}
+    players = [balancer.calculate_player_skills(p) for p in _random_players(rng)]
+
+    legacy = balancer.evaluate_combinations(balancer.generate_all_combinations(players))
+    fast = PreciseBalanceEngine(balancer).find_optimal_balance(players)
+
+    assert [_signature(r) for r in fast] == [_signature(r) for r in legacy]
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_swap_search_estimate_matches_full_recompute(seed):
+    rng = random.Random(seed)
+    balancer = TeamBalancer(mode=BalancingMode.PRECISE)
+    players = _random_players(rng)
+    team_a, team_b = players[:5], players[5:]
+    a_positions = {p['user_id']: role for p, role in zip(team_a, ROLE_ORDER)}
+    b_positions = {p['user_id']: role for p, role in zip(team_b, ROLE_ORDER)}
+
+    current = balancer.analyze_fixed_team_composition(team_a, a_positions, team_b, b_positions)
+    improvements = SwapSearchEngine(balancer).find_improvements(
+        team_a, a_positions, team_b, b_positions, top_n=3, min_improvement=0.0
+    )
+
+    for improvement in improvements:
+        recomputed = balancer.analyze_fixed_team_composition(*SwapSearchEngine.apply_swaps(
+            team_a, a_positions, team_b, b_positions, improvement['swaps']
+        ))
+        assert recomputed.balance_score - current.balance_score == pytest.approx(
+            improvement['estimated_improvement'], abs=1e-9
+        )
@@ -0,0 +1,128 @@
+import asyncio
+import time
+from typing import List
+
+from scheduler.deadline_scheduler import DeadlineScheduler
+
+
+class _Bot:
+    async def wait_until_ready(self):
+        return None
+
+
+def _recorder(fired: List[str], prefix: str = ''):
+    async def handler(key: str):
+        fired.append(prefix + key)
+    return handler
+
+
+def test_handlers_fire_in_deadline_order():
+    async def scenario():
+        fired: List[str] = []
+        scheduler = DeadlineScheduler(_Bot())
+        scheduler.register('recruitment', _recorder(fired))
+        scheduler.start()
+        try:
+            now = time.time()
+            # 등록 순서와 무관하게 마감 시각 순으로 실행
+            scheduler.schedule('recruitment', 'c', now + 0.15)
+            scheduler.schedule('recruitment', 'a', now + 0.05)
+            scheduler.schedule('recruitment', 'b', now + 0.10)
+            await asyncio.sleep(0.4)
+            return fired, scheduler.get_stats()
+        finally:
+            await scheduler.stop()
+
+    fired, stats = asyncio.run(scenario())
+    assert fired == ['a', 'b', 'c']
+    assert stats['dispatched'] == 3
+    assert stats['pending'] == {}
+
+
+def test_cancelled_and_rescheduled_entries():
+    async def scenario():
+        fired: List[str] = []
+        scheduler = DeadlineScheduler(_Bot())
+        scheduler.register('recruitment', _recorder(fired))
+        scheduler.start()
+        try:
+            now = time.time()
+            scheduler.schedule('recruitment', 'cancelled', now + 0.05)
+            scheduler.schedule('recruitment', 'moved', now + 0.05)
+            scheduler.schedule('recruitment', 'kept', now + 0.10)
+
+            scheduler.cancel('recruitment', 'cancelled')
+            # 마감 연장: 기존 힙 항목은 꺼낼 때 버려지고 새 시각에 한 번만 실행
+            scheduler.schedule('recruitment', 'moved', now + 0.20)
+
+            await asyncio.sleep(0.15)
+            early = list(fired)
+            await asyncio.sleep(0.2)
+            return early, fired, scheduler.get_stats()
+        finally:
+            await scheduler.stop()
+
+    early, fired, stats = asyncio.run(scenario())
+    assert early == ['kept']
+    assert fired == ['kept', 'moved']
+    assert stats['cancelled'] == 1
+
+
+def test_earlier_entry_wakes_sleeping_scheduler():
+    async def scenario():
+        fired: List[str] = []
+        scheduler = DeadlineScheduler(_Bot())
+        scheduler.register('scrim', _recorder(fired))
+        scheduler.start()
+        try:
+            now = time.time()
+            scheduler.schedule('scrim', 'late', now + 60)
+            await asyncio.sleep(0.05)
+            scheduler.schedule('scrim', 'soon', time.time() + 0.05)
+            await asyncio.sleep(0.2)
+            return fired
+        finally:
+            await scheduler.stop()
+
+    assert asyncio.run(scenario()) == ['soon']
+
+
+def test_run_due_handles_only_requested_kinds():
+    async def scenario():
+        fired: List[str] = []
+        now = time.time()
+
+        async def recruitment_loader():
+            return [('overdue', now - 10), ('future', now + 3600)]
+
+        async def scrim_loader():
+            return [('scrim-overdue', now - 10)]
+
+        scheduler = DeadlineScheduler(_Bot())
+        scheduler.register('recruitment', _recorder(fired, 'r:'), recruitment_loader)
+        scheduler.register('scrim', _recorder(fired, 's:'), scrim_loader)
+
+        handled = await scheduler.run_due('recruitment')
+        return handled, fired, scheduler.get_stats()
+
+    handled, fired, stats = asyncio.run(scenario())
+    assert handled == 1
+    assert fired == ['r:overdue']
+    assert stats['pending'] == {'recruitment': 1, 'scrim': 1}
+
+
+def test_lead_time_fires_before_event():
+    async def scenario():
+        fired: List[str] = []
+        scheduler = DeadlineScheduler(_Bot())
+        scheduler.register('voting_start', _recorder(fired), lead=600)
+        scheduler.start()
+        try:
+            # 시작 10분 전 알림: 이벤트 시각이 10분 뒤면 바로 실행
+            scheduler.schedule('voting_start', 'match', time.time() + 600)
+            await asyncio.sleep(0.1)
+            return fired
+        finally:
+            await scheduler.stop()
+
+    assert asyncio.run(scenario()) == ['match']
@@ -0,0 +1,156 @@
+import asyncio
+import random
+from typing import Dict, List
+
+from database.database import DatabaseManager
+
+GUILD_ID = '1'
+ROLE_ORDER = ['탱커', '딜러', '딜러', '힐러', '힐러']
+
+
+def _make_match(rng: random.Random, number: int, guild_id: str = GUILD_ID) -> Dict:
+    """12명 중 10명을 골라 5:5 경기 데이터 생성 (포지션은 매 경기 섞음)"""
+    user_ids = rng.sample([str(100 + i) for i in range(12)], 10)
+    match = {
+        'guild_id': guild_id,
+        'recruitment_id': 'recruitment',
+        'match_number': number,
+        'winner': rng.choice(['team_a', 'team_b']),
+        'created_by': 'admin',
+        'map_name': None,
+        'map_type': None,
+    }
+    for team_key, members in (('team_a', user_ids[:5]), ('team_b', user_ids[5:])):
+        roles = rng.sample(ROLE_ORDER, 5)
+        match[team_key] = [{'user_id': user_id, 'username': f'user{user_id}'} for user_id in members]
+        match[f'{team_key}_positions'] = dict(zip(members, roles))
+    return match
+
+
+async def _pair_tables(manager: DatabaseManager) -> Dict[str, List]:
+    async with manager.get_connection(readonly=True) as db:
+        tables = {}
+        for table in ('teammate_pair_stats', 'opponent_pair_stats'):
+            async with db.execute(f'SELECT * FROM {table} ORDER BY 1, 2, 3, 4, 5') as cursor:
+                tables[table] = await cursor.fetchall()
+        return tables
+
+
+def test_incremental_pair_stats_match_full_rebuild(tmp_path):
+    async def scenario():
+        manager = DatabaseManager(str(tmp_path / 'bot.db'))
+        await manager.initialize()
+        try:
+            rng = random.Random(3)
+            for number in range(1, 16):
+                await manager.save_match_result(_make_match(rng, number))
+            # 다른 서버 경기는 guild 단위 재계산에 영향을 주지 않아야 한다
+            await manager.save_match_result(_make_match(rng, 1, guild_id='2'))
+
+            incremental = await _pair_tables(manager)
+            counts = await manager.rebuild_pair_stats(GUILD_ID)
+            rebuilt = await _pair_tables(manager)
+            return incremental, counts, rebuilt
+        finally:
+            await manager.close()
+
+    incremental, counts, rebuilt = asyncio.run(scenario())
+    assert incremental['teammate_pair_stats']
+    assert incremental == rebuilt
+    assert counts['teammate_rows'] == sum(1 for row in rebuilt['teammate_pair_stats'] if row[0] == GUILD_ID)
+    assert counts['opponent_rows'] == sum(1 for row in rebuilt['opponent_pair_stats'] if row[0] == GUILD_ID)
+
+
+async def _counts(manager: DatabaseManager):
+    async with manager.get_connection(readonly=True) as db:
+        async with db.execute('SELECT COUNT(*) FROM match_results') as cursor:
+            matches = (await cursor.fetchone())[0]
+        async with db.execute(
+            'SELECT user_id, total_games, total_wins, tank_games FROM user_statistics ORDER BY user_id'
+        ) as cursor:
+            stats = await cursor.fetchall()
+    return matches, stats
+
+
+def test_record_matches_aggregates_user_stats(tmp_path):
+    async def scenario():
+        manager = DatabaseManager(str(tmp_path / 'bot.db'))
+        await manager.initialize()
+        try:
+            rng = random.Random(5)
+            matches = [_make_match(rng, number) for number in range(1, 6)]
+            match_ids = await manager.record_matches(GUILD_ID, matches, registered_only=False)
+            return matches, match_ids, await _counts(manager)
+        finally:
+            await manager.close()
+
+    matches, match_ids, (saved, stats) = asyncio.run(scenario())
+    assert len(match_ids) == len(set(match_ids)) == 5
+    assert saved == 5
+
+    expected: Dict[str, List[int]] = {}
+    for match in matches:
+        for team_key in ('team_a', 'team_b'):
+            for participant in match[team_key]:
+                user_id = participant['user_id']
+                row = expected.setdefault(user_id, [0, 0, 0])
+                row[0] += 1
+                row[1] += 1 if match['winner'] == team_key else 0
+                row[2] += 1 if match[f'{team_key}_positions'][user_id] == '탱커' else 0
+    assert {user_id: [games, wins, tank] for user_id, games, wins, tank in stats} == expected
+
+
+def test_record_matches_is_all_or_nothing(tmp_path):
+    async def scenario():
+        manager = DatabaseManager(str(tmp_path / 'bot.db'))
+        await manager.initialize()
+        try:
+            rng = random.Random(9)
+            matches = [_make_match(rng, number) for number in range(1, 4)]
+            # 마지막 경기에 CHECK 제약을 어기는 포지션을 넣어 중간 실패 유도
+            broken = matches[-1]['team_b'][0]['user_id']
+            matches[-1]['team_b_positions'][broken] = '없는포지션'
+
+            failed = False
+            try:
+                await manager.record_matches(GUILD_ID, matches, registered_only=False)
+            except Exception:
+                failed = True
+            return failed, await _counts(manager), await _pair_tables(manager)
+        finally:
+            await manager.close()
+
+    failed, (saved, stats), pair_tables = asyncio.run(scenario())
+    assert failed
+    assert saved == 0
+    assert stats == []
+    assert pair_tables == {'teammate_pair_stats': [], 'opponent_pair_stats': []}
+
+
+def test_record_matches_inside_open_transaction_uses_savepoint(tmp_path):
+    async def scenario():
+        manager = DatabaseManager(str(tmp_path / 'bot.db'))
+        await manager.initialize()
+        try:
+            rng = random.Random(11)
+            async with manager.get_connection() as db:
+                await db.execute('BEGIN')
+                match_ids = await manager.record_matches(GUILD_ID, [_make_match(rng, 1)], registered_only=False)
+                # 커밋은 바깥 트랜잭션 소유자가 결정
+                assert db.in_transaction
+                await db.rollback()
+            rolled_back = await _counts(manager)
+
+            async with manager.get_connection() as db:
+                await db.execute('BEGIN')
+                await manager.record_matches(GUILD_ID, [_make_match(rng, 2)], registered_only=False)
+                await db.commit()
+            return match_ids, rolled_back, await _counts(manager)
+        finally:
+            await manager.close()
+
+    match_ids, rolled_back, committed = asyncio.run(scenario())
+    assert len(match_ids) == 1
+    assert rolled_back == (0, [])
+    assert committed[0] == 1
+    assert len(committed[1]) == 10
@@ -0,0 +1,124 @@
+import asyncio
+import os
+
+from utils.tts_audio_cache import TTSAudioCache
+
+
+def _synth(data: bytes, calls=None, delay: float = 0.0):
+    async def synthesize():
+        if calls is not None:
+            calls.append(data)
+        if delay:
+            await asyncio.sleep(delay)
+        return data
+    return synthesize
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    async def scenario():
+        cache = TTSAudioCache(str(tmp_path), max_bytes=300, memory_bytes=0)
+        for name in ('a', 'b', 'c'):
+            await cache.get_or_create(name * 64, _synth(name.encode() * 100))
+        # a 를 다시 사용하면 가장 오래된 항목은 b 가 된다
+        await cache.get_or_create('a' * 64, _synth(b'unused'))
+        await cache.get_or_create('d' * 64, _synth(b'd' * 100))
+        return cache
+
+    cache = asyncio.run(scenario())
+    stats = cache.get_stats()
+    assert stats['evictions'] == 1
+    assert stats['total_bytes'] == 300
+    assert not os.path.exists(cache.path_for('b' * 64))
+    for name in ('a', 'c', 'd'):
+        assert os.path.exists(cache.path_for(name * 64))
+
+
+def test_memory_tier_is_bounded(tmp_path):
+    async def scenario():
+        cache = TTSAudioCache(str(tmp_path), memory_bytes=250, memory_item_bytes=150)
+        for name in ('a', 'b', 'c'):
+            await cache.get_or_create(name * 64, _synth(name.encode() * 100))
+        # 항목당 한도를 넘는 클립은 디스크에만 보관
+        await cache.get_or_create('e' * 64, _synth(b'e' * 200))
+        return cache.get_stats()
+
+    stats = asyncio.run(scenario())
+    assert stats['memory_entries'] == 2
+    assert stats['memory_bytes'] == 200
+    assert stats['entries'] == 4
+
+
+def test_concurrent_requests_synthesize_once(tmp_path):
+    async def scenario():
+        cache = TTSAudioCache(str(tmp_path))
+        calls = []
+        results = await asyncio.gather(*[
+            cache.get_or_create('k' * 64, _synth(b'voice', calls, delay=0.05)) for _ in range(5)
+        ])
+        return results, calls, cache.get_stats()
+
+    results, calls, stats = asyncio.run(scenario())
+    assert results == [b'voice'] * 5
+    assert calls == [b'voice']
+    assert stats['coalesced'] == 4
+
+
+def test_index_is_rebuilt_from_disk(tmp_path):
+    async def scenario():
+        cache = TTSAudioCache(str(tmp_path))
+        await cache.get_or_create('k' * 64, _synth(b'voice'))
+
+    asyncio.run(scenario())
+    # 저장 도중 종료되어 남은 임시 파일은 다시 열 때 정리
+    leftover = tmp_path / 'kk' / 'partial.tmp'
+    leftover.write_bytes(b'x')
+
+    async def reopen():
+        cache = TTSAudioCache(str(tmp_path))
+        data = await cache.get_or_create('k' * 64, _synth(b'other'))
+        return data, cache.get_stats()
+
+    data, stats = asyncio.run(reopen())
+    assert data == b'voice'
+    assert stats['hits'] == 1 and stats['misses'] == 0
+    assert not leftover.exists()
+
+
+def test_synthesis_is_cancelled_only_with_its_last_waiter(tmp_path):
+    async def scenario():
+        cache = TTSAudioCache(str(tmp_path))
+        started = asyncio.Event()
+        cancelled = []
+
+        async def slow():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return b'voice'
+
+        first = asyncio.create_task(cache.get_or_create('k' * 64, slow))
+        second = asyncio.create_task(cache.get_or_create('k' * 64, slow))
+        await started.wait()
+
+        # 다른 호출자가 기다리는 동안에는 합성을 계속한다
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        await asyncio.sleep(0)
+        still_running = not cancelled
+
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        # 취소된 합성은 다음 요청에서 다시 시도
+        retried = await cache.get_or_create('k' * 64, _synth(b'retry'))
+        return still_running, cancelled, retried, cache.get_stats()
+
+    still_running, cancelled, retried, stats = asyncio.run(scenario())
+    assert still_running
+    assert cancelled == [True]
+    assert retried == b'retry'
+    assert stats['synth_cancelled'] == 1
@@ -0,0 +1,104 @@
+import asyncio
+import random
+from typing import List, Tuple
+
+from utils.tts_log_sink import DISCORD_MESSAGE_LIMIT, TTSLogSink
+
+
+class _Thread:
+    def __init__(self):
+        self.messages: List[str] = []
+
+    async def send(self, content: str):
+        self.messages.append(content)
+
+
+def _sink(thread, flushed: List[Tuple[str, int]], **kwargs) -> TTSLogSink:
+    async def resolve(guild_id: str):
+        return thread
+
+    async def on_flushed(guild_id: str, count: int):
+        flushed.append((guild_id, count))
+
+    return TTSLogSink(resolve, on_flushed, **kwargs)
+
+
+def test_pack_fills_messages_up_to_limit_in_order():
+    rng = random.Random(1)
+    entries = [f'[{i}] ' + 'x' * rng.randint(10, 400) for i in range(200)]
+    entries.append('y' * DISCORD_MESSAGE_LIMIT)
+
+    packed = TTSLogSink(resolve_thread=None)._pack(entries)
+
+    assert all(len(message) <= DISCORD_MESSAGE_LIMIT for message, _ in packed)
+    assert sum(count for _, count in packed) == len(entries)
+    assert '\n'.join(message for message, _ in packed) == '\n'.join(entries)
+    # 탐욕적으로 채우므로 다음 메시지의 첫 로그는 이전 메시지에 들어갈 수 없었어야 한다
+    for (message, _), (next_message, _) in zip(packed, packed[1:]):
+        first = next_message.split('\n', 1)[0]
+        assert len(message) + 1 + len(first) > DISCORD_MESSAGE_LIMIT
+
+
+def test_small_entries_are_batched_after_interval():
+    async def scenario():
+        thread, flushed = _Thread(), []
+        sink = _sink(thread, flushed, flush_interval=0.05)
+        for i in range(20):
+            sink.add('1', f'log {i}')
+        await asyncio.sleep(0.15)
+        return thread.messages, flushed, sink.get_stats()
+
+    messages, flushed, stats = asyncio.run(scenario())
+    assert messages == ['\n'.join(f'log {i}' for i in range(20))]
+    assert flushed == [('1', 20)]
+    assert stats['messages'] == 1 and stats['pending'] == 0
+
+
+def test_full_buffer_flushes_without_waiting_for_interval():
+    async def scenario():
+        thread, flushed = _Thread(), []
+        sink = _sink(thread, flushed, flush_interval=60)
+        for i in range(30):
+            sink.add('1', f'{i:02d} ' + 'z' * 97)
+        await asyncio.sleep(0.05)
+        sent = list(thread.messages)
+        await sink.close()
+        return sent, thread.messages, flushed
+
+    sent_early, messages, flushed = asyncio.run(scenario())
+    assert sent_early
+    assert all(len(message) <= DISCORD_MESSAGE_LIMIT for message in messages)
+    assert '\n'.join(messages) == '\n'.join(f'{i:02d} ' + 'z' * 97 for i in range(30))
+    assert sum(count for _, count in flushed) == 30
+
+
+def test_oversized_entry_is_truncated():
+    async def scenario():
+        thread, flushed = _Thread(), []
+        sink = _sink(thread, flushed, flush_interval=60)
+        sink.add('1', 'a' * (DISCORD_MESSAGE_LIMIT + 500))
+        await sink.close()
+        return thread.messages
+
+    messages = asyncio.run(scenario())
+    assert len(messages) == 1
+    assert len(messages[0]) == DISCORD_MESSAGE_LIMIT
+    assert messages[0].endswith('…')
+
+
+def test_pending_buffer_is_bounded_and_missing_thread_drops():
+    async def scenario():
+        async def no_thread(guild_id: str):
+            return None
+
+        sink = TTSLogSink(no_thread, flush_interval=60, max_pending=10)
+        for i in range(25):
+            sink.add('1', f'log {i}')
+        pending = sink.get_stats()['pending']
+        await sink.close()
+        return pending, sink.get_stats()
+
+    pending, stats = asyncio.run(scenario())
+    assert pending == 10
+    assert stats['entries'] == 25
+    assert stats['dropped'] == 25
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from database.connection_pool import ConnectionPool
+from database.write_queue import WriteBatcher
+
+
+async def _open(tmp_path, **kwargs):
+    pool = ConnectionPool(str(tmp_path / 'write_queue.db'))
+    async with pool.connection() as db:
+        await db.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT NOT NULL)')
+        await db.commit()
+    return pool, WriteBatcher(pool, **kwargs)
+
+
+async def _values(pool):
+    async with pool.connection(readonly=True) as db:
+        async with db.execute('SELECT value FROM items ORDER BY id') as cursor:
+            return [row[0] for row in await cursor.fetchall()]
+
+
+def test_concurrent_writes_share_commits(tmp_path):
+    async def scenario():
+        pool, batcher = await _open(tmp_path, flush_interval=0.05)
+        try:
+            await asyncio.gather(*[
+                batcher.execute('INSERT INTO items (value) VALUES (?)', (f'v{i}',)) for i in range(50)
+            ])
+            return await _values(pool), batcher.get_stats()
+        finally:
+            await batcher.close()
+            await pool.close()
+
+    values, stats = asyncio.run(scenario())
+    assert sorted(values) == sorted(f'v{i}' for i in range(50))
+    assert stats['ops'] == 50
+    assert stats['commits'] < 50
+    assert stats['max_batch_size'] > 1
+
+
+def test_failed_op_does_not_roll_back_batch(tmp_path):
+    async def scenario():
+        pool, batcher = await _open(tmp_path, flush_interval=0.05)
+        try:
+            results = await asyncio.gather(
+                batcher.execute('INSERT INTO items (value) VALUES (?)', ('ok1',)),
+                batcher.execute('INSERT INTO items (value) VALUES (?)', (None,)),
+                batcher.execute('INSERT INTO items (value) VALUES (?)', ('ok2',)),
+                return_exceptions=True,
+            )
+            return results, await _values(pool), batcher.get_stats()
+        finally:
+            await batcher.close()
+            await pool.close()
+
+    results, values, stats = asyncio.run(scenario())
+    assert results[0] == 1 and results[2] == 1
+    assert isinstance(results[1], Exception)
+    assert values == ['ok1', 'ok2']
+    assert stats['failed_ops'] == 1
+    assert stats['commits'] == 1
+
+
+def test_inline_write_without_outer_transaction_is_committed(tmp_path):
+    async def scenario():
+        pool, batcher = await _open(tmp_path)
+        try:
+            # writer 를 잡은 태스크가 큐를 기다리면 데드락이므로 즉시 실행되어야 한다
+            async with pool.connection() as db:
+                await batcher.execute('INSERT INTO items (value) VALUES (?)', ('inline',))
+                assert not db.in_transaction
+            return await _values(pool), batcher.get_stats()
+        finally:
+            await batcher.close()
+            await pool.close()
+
+    values, stats = asyncio.run(scenario())
+    assert values == ['inline']
+    assert stats['inline_ops'] == 1
+
+
+def test_inline_write_inside_outer_transaction_follows_owner(tmp_path):
+    async def scenario():
+        pool, batcher = await _open(tmp_path)
+        try:
+            async with pool.connection() as db:
+                await db.execute('BEGIN')
+                await db.execute("INSERT INTO items (value) VALUES ('outer')")
+                await batcher.execute('INSERT INTO items (value) VALUES (?)', ('inline',))
+                with pytest.raises(Exception):
+                    await batcher.execute('INSERT INTO items (value) VALUES (?)', (None,))
+                # 실패한 작업만 SAVEPOINT 로 되돌리고 바깥 트랜잭션은 유지
+                assert db.in_transaction
+                await db.rollback()
+            return await _values(pool)
+        finally:
+            await batcher.close()
+            await pool.close()
+
+    assert asyncio.run(scenario()) == []
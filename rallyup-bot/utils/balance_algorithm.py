@@ -323,9 +323,37 @@ class TeamBalancer:
             # 실험적 모드: 랜덤 조합 포함
             combinations = self.generate_experimental_combinations(player_skills)
         else:
-            # 정밀 모드: 모든 조합 시도 (시간이 오래 걸릴 수 있음)
-            combinations = self.generate_all_combinations(player_skills)
+            # 정밀 모드: 모든 조합을 스킬 행렬 기반 엔진으로 평가
+            from utils.balance_engine import PreciseBalanceEngine
+            return PreciseBalanceEngine(self).find_optimal_balance(player_skills)
         
+        return self.evaluate_combinations(combinations)
+    
+    def find_lobby_balance(self, players: List[Dict], template: str = '5v5',
+                           time_budget: float = 0.8, top_n: int = 5) -> list:
+        """
+        인원 수/역할 템플릿에 맞춘 팀 밸런싱 (6v6, 오픈 큐, 대기 인원 포함 로비)
+        
+        Args:
+            players: 참가자 목록 (팀 2개 인원보다 많으면 나머지는 대기)
+            template: '5v5', '6v6', 'open5', 'open6'
+            time_budget: 대규모 로비 탐색 시간 제한 (초)
+            top_n: 반환할 결과 수
+            
+        Returns:
+            List[LobbyBalanceResult]
+        """
+        from utils.balance_engine import LobbyBalanceEngine, ROLE_TEMPLATES
+        
+        if template not in ROLE_TEMPLATES:
+            raise ValueError(f"지원하지 않는 역할 템플릿입니다: {template}")
+        
+        player_skills = [self.calculate_player_skills(player) for player in players]
+        engine = LobbyBalanceEngine(self, ROLE_TEMPLATES[template], time_budget=time_budget)
+        return engine.find_balance(player_skills, top_n=top_n)
+    
+    def evaluate_combinations(self, combinations: List[Tuple[TeamComposition, TeamComposition]]) -> List[BalanceResult]:
+        """팀 조합 목록을 평가하여 상위 5개 결과 반환"""
         # 각 조합 평가
         results = []
         for team_a, team_b in combinations:
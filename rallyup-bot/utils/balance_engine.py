@@ -0,0 +1,774 @@
+import heapq
+import itertools
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.balance_algorithm import (
+    BalanceResult, PlayerSkillData, TeamBalancer, TeamComposition
+)
+
+# 역할 인덱스 (스킬 행렬의 열)
+TANK, DPS, SUPPORT = 0, 1, 2
+ROLE_COUNT = 3
+
+# 5명 팀 안에서의 배치 패턴 (탱커, 딜러1, 딜러2, 힐러1, 힐러2)
+# TeamBalancer.generate_position_assignments 와 같은 순서로 나열해야
+# 동점일 때 같은 배치가 선택된다.
+ASSIGNMENTS: Tuple[Tuple[int, int, int, int, int], ...] = tuple(
+    (tank,) + tuple(rest[i] for i in dps) + tuple(rest[i] for i in range(4) if i not in dps)
+    for tank in range(5)
+    for rest in [[i for i in range(5) if i != tank]]
+    for dps in itertools.combinations(range(4), 2)
+)
+
+# 상한 비교 시 부동소수점 합산 순서 차이를 흡수하기 위한 여유값
+BOUND_EPSILON = 1e-9
+
+
+class PreciseBalanceEngine:
+    """PRECISE 모드 전용 밸런싱 엔진
+
+    기존 경로는 252개 팀 분할마다 팀당 30개의 TeamComposition 을 만들어 평가한다.
+    이 엔진은 10x3 스킬 행렬을 평탄한 리스트로 한 번만 계산하고,
+    - 5명 부분집합(252개)별 최적 포지션 배치를 비트마스크로 메모이즈
+      (A팀/B팀 양쪽에서 같은 부분집합이 다시 나오므로 절반은 재사용)
+    - 탱커 선택 단계에서 남은 인원의 최대 기여도 상한으로 가지치기
+    - 상위 N개만 힙으로 골라 그 결과에 대해서만 TeamComposition/근거 생성
+    을 수행한다. 점수 계산식과 동점 처리 순서는 기존 경로와 동일하므로
+    같은 상위 N개 BalanceResult 를 반환한다.
+    """
+
+    def __init__(self, balancer: TeamBalancer):
+        self.balancer = balancer
+
+        weights = balancer.position_weights
+        # 선수 1명이 각 역할 슬롯에서 팀 점수에 기여하는 가중치 (딜러/힐러는 2명이 나눠 가짐)
+        self.slot_weights = (weights['tank'], weights['dps'] / 2, weights['support'] / 2)
+
+        self.stats = {'subsets': 0, 'assignments': 0, 'pruned': 0}
+
+    def _build_matrices(self, players: List[PlayerSkillData]):
+        """10x3 스킬/주포지션 보너스/숙련도/상한 행렬을 평탄한 리스트로 생성"""
+        role_names = ('탱커', '딜러', '힐러')
+        skill, bonus, proficiency, upper = [], [], [], []
+
+        for player in players:
+            row = (player.tank_skill, player.dps_skill, player.support_skill)
+            for role in range(ROLE_COUNT):
+                role_bonus = 0.2 if player.main_position == role_names[role] else 0.0
+                role_prof = row[role] * 0.16
+                skill.append(row[role])
+                bonus.append(role_bonus)
+                proficiency.append(role_prof)
+                upper.append(row[role] * self.slot_weights[role] + role_bonus + role_prof)
+
+        return skill, bonus, proficiency, upper
+
+    def _best_assignment(self, members: Tuple[int, ...], skill: List[float], bonus: List[float],
+                         proficiency: List[float], upper: List[float]) -> Tuple[float, float, float, Tuple[int, ...]]:
+        """5명 부분집합의 최적 포지션 배치
+
+        선택 기준은 기존과 같은 (팀 점수 + 포지션 밸런스) 이며,
+        최대값이 여러 개면 먼저 나온 배치를 유지한다.
+
+        Returns:
+            (최종 팀 점수, 팀 점수, 포지션 밸런스, 배치된 선수 인덱스)
+        """
+        self.stats['subsets'] += 1
+        slot_weights = self.slot_weights
+
+        best_select = None
+        best = None
+
+        # 남은 선수가 딜러/힐러 중 더 유리한 쪽을 맡는다고 가정한 상한
+        flex = [max(upper[m * 3 + DPS], upper[m * 3 + SUPPORT]) for m in members]
+        flex_total = sum(flex)
+
+        last_tank = -1
+        for t, d1, d2, s1, s2 in ASSIGNMENTS:
+            if t != last_tank:
+                last_tank = t
+                bound = upper[members[t] * 3 + TANK] + flex_total - flex[t]
+                skip_tank = best_select is not None and bound + BOUND_EPSILON < best_select
+                if skip_tank:
+                    self.stats['pruned'] += 6
+            if skip_tank:
+                continue
+
+            self.stats['assignments'] += 1
+            t_i = members[t] * 3 + TANK
+            d1_i = members[d1] * 3 + DPS
+            d2_i = members[d2] * 3 + DPS
+            s1_i = members[s1] * 3 + SUPPORT
+            s2_i = members[s2] * 3 + SUPPORT
+
+            # calculate_team_score 와 같은 연산 순서
+            # (a + b) / 2 * w 와 (a + b) * (w / 2) 는 2 로 나누는 연산이 정확하므로 같은 값
+            team_score = (
+                skill[t_i] * slot_weights[TANK] +
+                (skill[d1_i] + skill[d2_i]) * slot_weights[DPS] +
+                (skill[s1_i] + skill[s2_i]) * slot_weights[SUPPORT]
+            )
+
+            # evaluate_position_balance 와 같은 누적 순서
+            position_balance = (
+                0.0 + bonus[t_i] + proficiency[t_i] +
+                bonus[d1_i] + proficiency[d1_i] +
+                bonus[d2_i] + proficiency[d2_i] +
+                bonus[s1_i] + proficiency[s1_i] +
+                bonus[s2_i] + proficiency[s2_i]
+            )
+
+            select = team_score + position_balance
+            if best_select is None or select > best_select:
+                best_select = select
+                best = (team_score, position_balance,
+                        (members[t], members[d1], members[d2], members[s1], members[s2]))
+
+        team_score, position_balance, slots = best
+        final_score = team_score * 0.8 + position_balance * 0.2
+        return final_score, team_score, position_balance, slots
+
+    def find_optimal_balance(self, players: List[PlayerSkillData], top_n: int = 5) -> List[BalanceResult]:
+        """상위 N개 밸런스 결과 계산 (TeamBalancer.find_optimal_balance PRECISE 경로와 동일 결과)"""
+        if len(players) != 10:
+            raise ValueError("정확히 10명의 플레이어가 필요합니다")
+
+        self.stats = {'subsets': 0, 'assignments': 0, 'pruned': 0}
+        skill, bonus, proficiency, upper = self._build_matrices(players)
+
+        full_mask = (1 << 10) - 1
+        best_by_mask: Dict[int, Tuple[float, float, float, Tuple[int, ...]]] = {}
+
+        def best_for(mask: int) -> Tuple[float, float, float, Tuple[int, ...]]:
+            cached = best_by_mask.get(mask)
+            if cached is None:
+                members = tuple(i for i in range(10) if mask >> i & 1)
+                cached = self._best_assignment(members, skill, bonus, proficiency, upper)
+                best_by_mask[mask] = cached
+            return cached
+
+        candidates = []
+        for order, team_a_indices in enumerate(itertools.combinations(range(10), 5)):
+            mask_a = 0
+            for i in team_a_indices:
+                mask_a |= 1 << i
+            mask_b = full_mask ^ mask_a
+
+            final_a = best_for(mask_a)[0]
+            final_b = best_for(mask_b)[0]
+
+            # find_optimal_balance 와 같은 승률/균형 점수 계산
+            score_diff = final_a - final_b
+            skill_difference = abs(score_diff)
+            predicted_winrate_a = 1 / (1 + pow(10, -score_diff * 5))
+            winrate_deviation = abs(predicted_winrate_a - 0.5)
+            balance_score = max(0.0, min(1.0, 1.0 - (winrate_deviation * 2)))
+
+            # 기존 정렬 키 + 원래 순서 (안정 정렬과 같은 동점 처리)
+            candidates.append((
+                (-balance_score, skill_difference, winrate_deviation), order,
+                mask_a, mask_b, balance_score, skill_difference, predicted_winrate_a
+            ))
+
+        results = []
+        for _, _, mask_a, mask_b, balance_score, skill_difference, predicted_winrate_a in heapq.nsmallest(top_n, candidates):
+            team_a = self._build_composition(players, best_for(mask_a))
+            team_b = self._build_composition(players, best_for(mask_b))
+            reasoning = self.balancer.generate_reasoning(team_a, team_b, balance_score, predicted_winrate_a)
+
+            results.append(BalanceResult(
+                team_a=team_a,
+                team_b=team_b,
+                balance_score=balance_score,
+                skill_difference=skill_difference,
+                predicted_winrate_a=predicted_winrate_a,
+                reasoning=reasoning
+            ))
+
+        return results
+
+    @staticmethod
+    def _build_composition(players: List[PlayerSkillData],
+                           best: Tuple[float, float, float, Tuple[int, ...]]) -> TeamComposition:
+        _, team_score, position_balance, (t, d1, d2, s1, s2) = best
+        return TeamComposition(
+            tank=players[t],
+            dps1=players[d1],
+            dps2=players[d2],
+            support1=players[s1],
+            support2=players[s2],
+            total_skill=team_score,
+            position_balance=position_balance
+        )
+
+
+# 오픈 큐 슬롯: 선수가 가장 유리한 역할을 맡는다
+OPEN = 3
+SLOT_KINDS = 4
+ROLE_NAMES = ('탱커', '딜러', '힐러')
+
+
+@dataclass(frozen=True)
+class RoleTemplate:
+    """팀 하나의 역할 슬롯 구성"""
+    name: str
+    slots: Tuple[int, ...]
+
+    @property
+    def team_size(self) -> int:
+        return len(self.slots)
+
+
+ROLE_TEMPLATES: Dict[str, RoleTemplate] = {
+    '5v5': RoleTemplate('5v5', (TANK, DPS, DPS, SUPPORT, SUPPORT)),
+    '6v6': RoleTemplate('6v6', (TANK, TANK, DPS, DPS, SUPPORT, SUPPORT)),
+    'open5': RoleTemplate('open5', (OPEN,) * 5),
+    'open6': RoleTemplate('open6', (OPEN,) * 6),
+}
+
+
+def _skill_for(player: PlayerSkillData, position: str) -> float:
+    if position == '탱커':
+        return player.tank_skill
+    if position == '딜러':
+        return player.dps_skill
+    return player.support_skill
+
+
+@dataclass
+class LobbyTeam:
+    """역할 템플릿 기반 팀 구성"""
+    players: List[PlayerSkillData]
+    positions: List[str]  # players 와 같은 순서의 배치 포지션 (탱커/딜러/힐러)
+
+    total_skill: float = 0.0
+    position_balance: float = 0.0
+
+    def role_average(self, position: str) -> Optional[float]:
+        """해당 포지션에 배치된 선수들의 평균 스킬 (없으면 None)"""
+        skills = [_skill_for(p, pos) for p, pos in zip(self.players, self.positions) if pos == position]
+        return sum(skills) / len(skills) if skills else None
+
+    def to_composition(self) -> Optional[TeamComposition]:
+        """탱1딜2힐2 구성이면 기존 TeamComposition 으로 변환"""
+        by_position = {
+            name: [p for p, pos in zip(self.players, self.positions) if pos == name]
+            for name in ROLE_NAMES
+        }
+        if len(by_position['탱커']) != 1 or len(by_position['딜러']) != 2 or len(by_position['힐러']) != 2:
+            return None
+
+        return TeamComposition(
+            tank=by_position['탱커'][0],
+            dps1=by_position['딜러'][0],
+            dps2=by_position['딜러'][1],
+            support1=by_position['힐러'][0],
+            support2=by_position['힐러'][1],
+            total_skill=self.total_skill,
+            position_balance=self.position_balance
+        )
+
+
+@dataclass
+class LobbyBalanceResult:
+    """로비 밸런싱 결과 (대기 인원 포함)"""
+    team_a: LobbyTeam
+    team_b: LobbyTeam
+    bench: List[PlayerSkillData]
+
+    balance_score: float
+    skill_difference: float
+    predicted_winrate_a: float
+
+    reasoning: Dict[str, str]
+    exact: bool = True  # False 면 시간 제한 내 담금질 탐색 결과
+
+    def to_balance_result(self) -> Optional[BalanceResult]:
+        """탱1딜2힐2 구성이면 기존 UI 에서 쓰는 BalanceResult 로 변환"""
+        team_a = self.team_a.to_composition()
+        team_b = self.team_b.to_composition()
+        if team_a is None or team_b is None:
+            return None
+
+        return BalanceResult(
+            team_a=team_a,
+            team_b=team_b,
+            balance_score=self.balance_score,
+            skill_difference=self.skill_difference,
+            predicted_winrate_a=self.predicted_winrate_a,
+            reasoning=self.reasoning
+        )
+
+
+class LobbyBalanceEngine:
+    """인원 수/역할 템플릿 일반화 밸런싱 엔진
+
+    - 팀 점수와 포지션 밸런스는 기존 식을 팀 인원에 맞게 일반화한다
+      (역할 가중치는 슬롯 수로 나누고, 주포지션 보너스/숙련도 비중은 1/인원 기준)
+    - 가능한 팀 분할 수가 exact_limit 이하면 전수 탐색,
+      그보다 크면 time_budget 안에서 담금질(simulated annealing) 탐색
+    - A/B 를 뒤집은 대칭 분할은 한 번만 평가하고, 팀에 들지 못한 인원은 대기(bench)로 남긴다
+    - 5명 부분집합별 최적 배치는 비트마스크로 메모이즈
+    """
+
+    def __init__(self, balancer: TeamBalancer, template: RoleTemplate,
+                 time_budget: float = 0.8, exact_limit: int = 10000, seed: Optional[int] = None):
+        self.balancer = balancer
+        self.template = template
+        self.time_budget = time_budget
+        self.exact_limit = exact_limit
+        self.rng = random.Random(seed)
+
+        size = template.team_size
+        weights = (
+            balancer.position_weights['tank'],
+            balancer.position_weights['dps'],
+            balancer.position_weights['support'],
+        )
+        self.slot_weights = [0.0] * SLOT_KINDS
+        for slot in set(template.slots):
+            if slot == OPEN:
+                self.slot_weights[slot] = 1.0 / size
+            else:
+                self.slot_weights[slot] = weights[slot] / template.slots.count(slot)
+
+        self.bonus_value = 1.0 / size
+        self.proficiency_weight = 0.8 / size
+
+        # 팀 내 역할 배치 패턴 (같은 역할 슬롯끼리의 순서는 구분하지 않음)
+        self.patterns = sorted(set(itertools.permutations(template.slots)))
+
+        # 담금질 파라미터: 초기 온도에서 최종 온도까지 restart 당 steps 단계로 냉각
+        self.steps_per_restart = 2000
+        self.initial_temperature = 0.02
+        self.cooling = (1e-5 / self.initial_temperature) ** (1 / self.steps_per_restart)
+        self.patience = 3
+
+        self.stats = {'mode': None, 'splits': 0, 'subsets': 0, 'restarts': 0, 'elapsed_ms': 0.0}
+
+    def split_count(self, lobby_size: int) -> int:
+        """대칭을 제외한 팀 분할 수"""
+        size = self.template.team_size
+        return math.comb(lobby_size, size) * math.comb(lobby_size - size, size) // 2
+
+    def _prepare(self, players: List[PlayerSkillData]):
+        """선수 x 슬롯 종류별 (팀 점수 기여, 포지션 밸런스 기여, 실제 포지션) 평탄 배열"""
+        self._team_part: List[float] = []
+        self._balance_part: List[float] = []
+        self._position: List[int] = []
+        self._best: Dict[int, Tuple[float, float, float, Tuple[int, ...], Tuple[int, ...]]] = {}
+
+        open_weight = 1.0 / self.template.team_size
+        for player in players:
+            skills = (player.tank_skill, player.dps_skill, player.support_skill)
+            bonuses = tuple(
+                self.bonus_value if player.main_position == ROLE_NAMES[role] else 0.0
+                for role in range(ROLE_COUNT)
+            )
+            open_role = max(
+                range(ROLE_COUNT),
+                key=lambda r: skills[r] * open_weight + bonuses[r] + skills[r] * self.proficiency_weight
+            )
+
+            for slot in range(SLOT_KINDS):
+                role = open_role if slot == OPEN else slot
+                self._team_part.append(skills[role] * self.slot_weights[slot])
+                self._balance_part.append(bonuses[role] + skills[role] * self.proficiency_weight)
+                self._position.append(role)
+
+    def _best_for(self, mask: int) -> Tuple[float, float, float, Tuple[int, ...], Tuple[int, ...]]:
+        """부분집합의 최적 역할 배치 (최종 점수, 팀 점수, 포지션 밸런스, 선수, 슬롯)"""
+        cached = self._best.get(mask)
+        if cached is not None:
+            return cached
+
+        self.stats['subsets'] += 1
+        members = tuple(i for i in range(self._lobby_size) if mask >> i & 1)
+        bases = [m * SLOT_KINDS for m in members]
+        team_part = self._team_part
+        balance_part = self._balance_part
+
+        best_select = None
+        best_pattern = None
+        for pattern in self.patterns:
+            select = 0.0
+            for base, slot in zip(bases, pattern):
+                select += team_part[base + slot] + balance_part[base + slot]
+            if best_select is None or select > best_select:
+                best_select = select
+                best_pattern = pattern
+
+        team_score = sum(team_part[base + slot] for base, slot in zip(bases, best_pattern))
+        position_balance = sum(balance_part[base + slot] for base, slot in zip(bases, best_pattern))
+        cached = (team_score * 0.8 + position_balance * 0.2, team_score, position_balance, members, best_pattern)
+        self._best[mask] = cached
+        return cached
+
+    def _difference(self, mask_a: int, mask_b: int) -> float:
+        return abs(self._best_for(mask_a)[0] - self._best_for(mask_b)[0])
+
+    def _score(self, mask_a: int, mask_b: int) -> Tuple[Tuple[float, float, float], float, float, float]:
+        """기존 find_optimal_balance 와 같은 승률/균형 점수 및 정렬 키"""
+        score_diff = self._best_for(mask_a)[0] - self._best_for(mask_b)[0]
+        skill_difference = abs(score_diff)
+        predicted_winrate_a = 1 / (1 + pow(10, -score_diff * 5))
+        winrate_deviation = abs(predicted_winrate_a - 0.5)
+        balance_score = max(0.0, min(1.0, 1.0 - (winrate_deviation * 2)))
+        return (-balance_score, skill_difference, winrate_deviation), balance_score, skill_difference, predicted_winrate_a
+
+    def _exact_search(self, top_n: int) -> List[Tuple[int, int]]:
+        """모든 분할 평가 후 상위 N개 (A팀 마스크, B팀 마스크)"""
+        size = self.template.team_size
+        candidates = []
+        order = 0
+        for team_a in itertools.combinations(range(self._lobby_size), size):
+            mask_a = 0
+            for i in team_a:
+                mask_a |= 1 << i
+            rest = [i for i in range(self._lobby_size) if not mask_a >> i & 1]
+
+            for team_b in itertools.combinations(rest, size):
+                # A/B 를 뒤집은 분할은 제외 (가장 앞 번호 선수가 A팀인 경우만)
+                if team_b[0] < team_a[0]:
+                    continue
+                mask_b = 0
+                for i in team_b:
+                    mask_b |= 1 << i
+
+                candidates.append((self._score(mask_a, mask_b)[0], order, mask_a, mask_b))
+                order += 1
+
+        self.stats['splits'] = order
+        return [(mask_a, mask_b) for _, _, mask_a, mask_b in heapq.nsmallest(top_n, candidates)]
+
+    @staticmethod
+    def _canonical(mask_a: int, mask_b: int) -> Tuple[int, int]:
+        union = mask_a | mask_b
+        lowest = union & -union
+        return (mask_a, mask_b) if mask_a & lowest else (mask_b, mask_a)
+
+    def _anneal(self, top_n: int) -> List[Tuple[int, int]]:
+        """시간 제한 담금질 탐색 후 상위 N개 (A팀 마스크, B팀 마스크)"""
+        size = self.template.team_size
+        deadline = time.perf_counter() + self.time_budget
+        rng = self.rng
+
+        # 지금까지 본 분할 중 차이가 작은 상위 N개 (최대 힙)
+        best_heap: List[Tuple[float, Tuple[int, int]]] = []
+        best_seen = set()
+
+        def remember(mask_a: int, mask_b: int, cost: float):
+            key = self._canonical(mask_a, mask_b)
+            if key in best_seen:
+                return False
+            if len(best_heap) < top_n:
+                heapq.heappush(best_heap, (-cost, key))
+            elif cost < -best_heap[0][0]:
+                _, dropped = heapq.heapreplace(best_heap, (-cost, key))
+                best_seen.discard(dropped)
+            else:
+                return False
+            best_seen.add(key)
+            return True
+
+        indices = list(range(self._lobby_size))
+        stale_restarts = 0
+        steps = 0
+
+        while time.perf_counter() < deadline and stale_restarts < self.patience:
+            self.stats['restarts'] += 1
+            rng.shuffle(indices)
+            team_a = indices[:size]
+            team_b = indices[size:size * 2]
+            bench = indices[size * 2:]
+            mask_a = sum(1 << i for i in team_a)
+            mask_b = sum(1 << i for i in team_b)
+
+            cost = self._difference(mask_a, mask_b)
+            improved = remember(mask_a, mask_b, cost)
+            temperature = self.initial_temperature
+
+            for step in range(self.steps_per_restart):
+                if step % 64 == 0 and time.perf_counter() >= deadline:
+                    break
+
+                # 이동: A팀<->B팀 교환, 또는 (대기 인원이 있으면) 팀<->대기 교환
+                i = rng.randrange(size)
+                if bench and rng.random() < 0.5:
+                    j = rng.randrange(len(bench))
+                    if rng.random() < 0.5:
+                        team, team_mask = team_a, mask_a
+                    else:
+                        team, team_mask = team_b, mask_b
+                    flip = (1 << team[i]) | (1 << bench[j])
+                    new_mask = team_mask ^ flip
+                    if team is team_a:
+                        new_cost = self._difference(new_mask, mask_b)
+                    else:
+                        new_cost = self._difference(mask_a, new_mask)
+                    move = ('bench', team, i, j, new_mask)
+                else:
+                    j = rng.randrange(size)
+                    flip = (1 << team_a[i]) | (1 << team_b[j])
+                    new_cost = self._difference(mask_a ^ flip, mask_b ^ flip)
+                    move = ('swap', None, i, j, flip)
+
+                delta = new_cost - cost
+                if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+                    kind, team, i, j, value = move
+                    if kind == 'swap':
+                        team_a[i], team_b[j] = team_b[j], team_a[i]
+                        mask_a ^= value
+                        mask_b ^= value
+                    else:
+                        team[i], bench[j] = bench[j], team[i]
+                        if team is team_a:
+                            mask_a = value
+                        else:
+                            mask_b = value
+                    cost = new_cost
+                    if remember(mask_a, mask_b, cost):
+                        improved = True
+
+                temperature *= self.cooling
+                steps += 1
+
+            stale_restarts = 0 if improved else stale_restarts + 1
+
+        self.stats['splits'] = steps
+        return [key for _, key in sorted(best_heap, reverse=True)]
+
+    def _build_team(self, players: List[PlayerSkillData], mask: int) -> LobbyTeam:
+        _, team_score, position_balance, members, pattern = self._best_for(mask)
+        return LobbyTeam(
+            players=[players[m] for m in members],
+            positions=[ROLE_NAMES[self._position[m * SLOT_KINDS + slot]] for m, slot in zip(members, pattern)],
+            total_skill=team_score,
+            position_balance=position_balance
+        )
+
+    def generate_reasoning(self, team_a: LobbyTeam, team_b: LobbyTeam,
+                           bench: List[PlayerSkillData], predicted_winrate_a: float) -> Dict[str, str]:
+        """로비 밸런싱 근거 (TeamBalancer.generate_reasoning 과 같은 기준)"""
+        reasoning = {}
+
+        winrate_diff = abs(predicted_winrate_a - 0.5)
+        if winrate_diff <= 0.05:
+            reasoning['balance'] = "황금 밸런스! 매우 균등한 팀 구성"
+        elif winrate_diff <= 0.1:
+            reasoning['balance'] = "양호한 밸런스"
+        elif winrate_diff <= 0.15:
+            reasoning['balance'] = "보통 수준의 밸런스"
+        elif winrate_diff <= 0.2:
+            reasoning['balance'] = "다소 불균형한 구성"
+        else:
+            reasoning['balance'] = "심각한 불균형 - 재조정 권장"
+
+        labels = (
+            ('탱커', 'tank', "탱커 실력 균등", "탱커 우세"),
+            ('딜러', 'dps', "딜러 화력 균등", "화력 우세"),
+            ('힐러', 'support', "힐러 실력 균등", "힐링 우세"),
+        )
+        for position, key, even_text, ahead_text in labels:
+            a_avg = team_a.role_average(position)
+            b_avg = team_b.role_average(position)
+            if a_avg is None or b_avg is None:
+                continue
+
+            diff = abs(a_avg - b_avg)
+            if diff < 0.05:
+                reasoning[key] = even_text
+            elif a_avg > b_avg:
+                reasoning[key] = f"A팀 {ahead_text} (+{diff:.1%})"
+            else:
+                reasoning[key] = f"B팀 {ahead_text} (+{diff:.1%})"
+
+        if bench:
+            reasoning['bench'] = f"대기 인원 {len(bench)}명: " + ", ".join(p.username for p in bench)
+
+        return reasoning
+
+    def find_balance(self, players: List[PlayerSkillData], top_n: int = 5) -> List[LobbyBalanceResult]:
+        """로비 인원 전체에서 상위 N개 팀 분할 계산"""
+        size = self.template.team_size
+        if len(players) < size * 2:
+            raise ValueError(f"{self.template.name} 밸런싱에는 최소 {size * 2}명의 플레이어가 필요합니다")
+
+        started = time.perf_counter()
+        self.stats = {'mode': None, 'splits': 0, 'subsets': 0, 'restarts': 0, 'elapsed_ms': 0.0}
+        self._lobby_size = len(players)
+        self._prepare(players)
+
+        exact = self.split_count(len(players)) <= self.exact_limit
+        if exact:
+            self.stats['mode'] = 'exact'
+            splits = self._exact_search(top_n)
+        else:
+            self.stats['mode'] = 'anneal'
+            splits = self._anneal(top_n)
+
+        results = []
+        for mask_a, mask_b in splits:
+            _, balance_score, skill_difference, predicted_winrate_a = self._score(mask_a, mask_b)
+            team_a = self._build_team(players, mask_a)
+            team_b = self._build_team(players, mask_b)
+            used = mask_a | mask_b
+            bench = [p for i, p in enumerate(players) if not used >> i & 1]
+
+            results.append(LobbyBalanceResult(
+                team_a=team_a,
+                team_b=team_b,
+                bench=bench,
+                balance_score=balance_score,
+                skill_difference=skill_difference,
+                predicted_winrate_a=predicted_winrate_a,
+                reasoning=self.generate_reasoning(team_a, team_b, bench, predicted_winrate_a),
+                exact=exact
+            ))
+
+        results.sort(key=lambda r: (-r.balance_score, r.skill_difference, abs(r.predicted_winrate_a - 0.5)))
+        self.stats['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 3)
+        return results
+
+
+class SwapSearchEngine:
+    """포지션 고정 구성의 선수 교체(what-if) 탐색 엔진
+
+    analyze_fixed_team_composition 의 최종 팀 점수(스킬 0.8 + 포지션 적합도 0.2)는
+    슬롯별 기여도의 합이므로, 교체는 바뀐 슬롯의 기여도 차이만 더하면 평가할 수 있다.
+    선수 10명 x 역할 3개의 기여도 표를 한 번 계산하고
+    1~max_swaps 명 교체(A/B 선수 짝 지정 포함, 3명까지 825가지)를 모두 점수화한 뒤,
+    상위 결과만 analyze_fixed_team_composition 으로 다시 계산해 근거를 만든다.
+    """
+
+    def __init__(self, balancer: TeamBalancer, max_swaps: int = 3):
+        self.balancer = balancer
+        self.max_swaps = max(1, min(5, max_swaps))
+
+        weights = balancer.position_weights
+        self.slot_weights = (weights['tank'], weights['dps'] / 2, weights['support'] / 2)
+
+        self.stats = {'neighbours': 0, 'elapsed_ms': 0.0}
+
+    def _contribution(self, player: PlayerSkillData, role: int) -> float:
+        """선수가 역할 슬롯에서 최종 팀 점수에 더하는 값"""
+        skill = (player.tank_skill, player.dps_skill, player.support_skill)[role]
+        bonus = 0.2 if player.main_position == ROLE_NAMES[role] else 0.1
+        return self.slot_weights[role] * skill * 0.8 + (bonus + skill * 0.16) * 0.2
+
+    @staticmethod
+    def _balance_score(difference: float) -> float:
+        predicted_winrate_a = 1 / (1 + pow(10, -difference * 5))
+        return max(0.0, min(1.0, 1.0 - abs(predicted_winrate_a - 0.5) * 2))
+
+    @staticmethod
+    def neighbours(max_swaps: int) -> Iterator[Tuple[Tuple[int, int], ...]]:
+        """1~max_swaps 명 교체안을 평가 순서대로 나열 ((A팀 인덱스, B팀 인덱스 + 5) 쌍 목록)"""
+        for count in range(1, max_swaps + 1):
+            for a_side in itertools.combinations(range(5), count):
+                for b_combo in itertools.combinations(range(5, 10), count):
+                    for b_side in itertools.permutations(b_combo):
+                        yield tuple(zip(a_side, b_side))
+
+    @staticmethod
+    def apply_swaps(team_a_players: List[Dict], team_a_positions: Dict[str, str],
+                    team_b_players: List[Dict], team_b_positions: Dict[str, str],
+                    pairs: Tuple[Tuple[int, int], ...]) -> Tuple[List[Dict], Dict[str, str], List[Dict], Dict[str, str]]:
+        """교체안 적용 (선수는 상대 선수의 자리/포지션을 이어받음)"""
+        new_team_a = list(team_a_players)
+        new_team_b = list(team_b_players)
+        new_a_positions = dict(team_a_positions)
+        new_b_positions = dict(team_b_positions)
+
+        for i, j in pairs:
+            a_player = team_a_players[i]
+            b_player = team_b_players[j - 5]
+            new_team_a[i] = b_player
+            new_team_b[j - 5] = a_player
+
+            new_a_positions[b_player['user_id']] = new_a_positions.pop(a_player['user_id'])
+            new_b_positions[a_player['user_id']] = new_b_positions.pop(b_player['user_id'])
+
+        return new_team_a, new_a_positions, new_team_b, new_b_positions
+
+    def find_improvements(self, team_a_players: List[Dict], team_a_positions: Dict[str, str],
+                          team_b_players: List[Dict], team_b_positions: Dict[str, str],
+                          top_n: int = 3, min_improvement: float = 0.05) -> List[Dict]:
+        """
+        현재 구성보다 밸런스 점수가 min_improvement 이상 좋아지는 교체안 탐색
+
+        Returns:
+            개선도 높은 순 [{team_a, team_b, team_a_positions, team_b_positions,
+                             result, improvement, estimated_improvement, swaps, swapped_players}]
+            improvement 는 전체 재계산 기준, estimated_improvement 는 탐색에 쓴 증분 평가 값
+        """
+        started = time.perf_counter()
+        self.stats = {'neighbours': 0, 'elapsed_ms': 0.0}
+
+        players = team_a_players + team_b_players
+        positions = {**team_a_positions, **team_b_positions}
+        roles = []
+        for player in players:
+            position = positions.get(player['user_id'])
+            if position not in ROLE_NAMES:
+                return []
+            roles.append(ROLE_NAMES.index(position))
+
+        for team_roles in (roles[:5], roles[5:]):
+            if sorted(team_roles) != [TANK, DPS, DPS, SUPPORT, SUPPORT]:
+                return []
+
+        skills = [self.balancer.calculate_player_skills(player) for player in players]
+        contrib = [[self._contribution(skill, role) for role in range(ROLE_COUNT)] for skill in skills]
+
+        base_a = sum(contrib[i][roles[i]] for i in range(5))
+        base_b = sum(contrib[j][roles[j]] for j in range(5, 10))
+        current_score = self._balance_score(base_a - base_b)
+        threshold = current_score + min_improvement
+
+        candidates = []
+        order = 0
+        for pairs in self.neighbours(self.max_swaps):
+            delta_a = 0.0
+            delta_b = 0.0
+            for i, j in pairs:
+                # B팀 선수 j 가 A팀 i 의 자리로, A팀 선수 i 가 B팀 j 의 자리로
+                delta_a += contrib[j][roles[i]] - contrib[i][roles[i]]
+                delta_b += contrib[i][roles[j]] - contrib[j][roles[j]]
+
+            difference = (base_a + delta_a) - (base_b + delta_b)
+            order += 1
+            estimated = self._balance_score(difference)
+            if estimated > threshold:
+                candidates.append((abs(difference), len(pairs), order, pairs, estimated))
+
+        self.stats['neighbours'] = order
+
+        improvements = []
+        for _, _, _, pairs, estimated in heapq.nsmallest(top_n, candidates):
+            new_team_a, new_a_positions, new_team_b, new_b_positions = self.apply_swaps(
+                team_a_players, team_a_positions, team_b_players, team_b_positions, pairs
+            )
+
+            result = self.balancer.analyze_fixed_team_composition(
+                new_team_a, new_a_positions, new_team_b, new_b_positions
+            )
+            improvements.append({
+                'team_a': new_team_a,
+                'team_b': new_team_b,
+                'team_a_positions': new_a_positions,
+                'team_b_positions': new_b_positions,
+                'result': result,
+                'improvement': result.balance_score - current_score,
+                'estimated_improvement': estimated - current_score,
+                'swaps': pairs,
+                'swapped_players': [(team_a_players[i]['username'], team_b_players[j - 5]['username'])
+                                    for i, j in pairs]
+            })
+
+        self.stats['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 3)
+        return improvements
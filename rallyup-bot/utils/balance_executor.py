@@ -0,0 +1,268 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+from utils.balance_algorithm import BalanceResult, BalancingMode, TeamBalancer
+
+logger = logging.getLogger(__name__)
+
+# 워커에 넘기는 플레이어 필드 (calculate_player_skills 가 읽는 값만)
+PLAYER_FIELDS = (
+    'user_id', 'username', 'main_position',
+    'total_games', 'total_wins',
+    'tank_games', 'tank_wins',
+    'dps_games', 'dps_wins',
+    'support_games', 'support_wins',
+    'current_tier', 'recent_winrate',
+)
+
+PLAYER_DEFAULTS = {
+    'main_position': '미설정',
+    'current_tier': None,
+    'recent_winrate': 0.0,
+}
+
+
+def compact_player(player: Dict) -> Tuple:
+    """플레이어 Dict 를 워커 전송용 튜플로 축약 (DB 행의 불필요한 필드 제외)"""
+    return tuple(player.get(field, PLAYER_DEFAULTS.get(field, 0)) for field in PLAYER_FIELDS)
+
+
+def expand_player(values: Tuple) -> Dict:
+    return dict(zip(PLAYER_FIELDS, values))
+
+
+def _warmup() -> int:
+    """워커 프로세스에서 밸런싱 모듈을 미리 import"""
+    import utils.balance_engine  # noqa: F401
+    return os.getpid()
+
+
+def _run_find_optimal_balance(mode_value: str, players: List[Tuple]) -> List[BalanceResult]:
+    """워커 프로세스에서 실행되는 밸런싱"""
+    balancer = TeamBalancer(mode=BalancingMode(mode_value))
+    return balancer.find_optimal_balance([expand_player(values) for values in players])
+
+
+def _run_find_lobby_balance(template: str, players: List[Tuple], time_budget: float) -> list:
+    """워커 프로세스에서 실행되는 로비(대기 인원 포함) 밸런싱"""
+    balancer = TeamBalancer(mode=BalancingMode.PRECISE)
+    return balancer.find_lobby_balance(
+        [expand_player(values) for values in players], template=template, time_budget=time_budget
+    )
+
+
+def _default_workers() -> int:
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    return max(1, min(4, cores))
+
+
+class BalanceExecutor:
+    """팀 밸런싱 전용 프로세스 풀
+
+    - PRECISE/EXPERIMENTAL 탐색을 이벤트 루프와 GIL 밖(별도 프로세스)에서 실행
+    - 풀은 봇 시작 시 미리 띄워 두고(warm), 워커는 밸런싱 모듈을 import 해 둔다
+    - 요청마다 제한 시간이 있고, 초과하거나 풀이 망가지면 QUICK 모드로 대신 계산
+    - 워커에는 필요한 필드만 담은 튜플을 보내 직렬화 비용을 줄인다
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: float = 8.0):
+        self.max_workers = max_workers or _default_workers()
+        self.timeout = timeout
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._warm_task: Optional[asyncio.Task] = None
+
+        self._stats = {
+            'requests': 0,
+            'completed': 0,
+            'timeouts': 0,
+            'failures': 0,
+            'fallbacks': 0,
+            'pool_restarts': 0,
+            'total_seconds': 0.0,
+        }
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # 봇 프로세스는 스레드(aiosqlite 등)를 쓰므로 fork 대신 spawn 사용
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._pool
+
+    async def start(self):
+        """풀 생성 및 워커 예열 (완료를 기다리지 않음)"""
+        pool = self._ensure_pool()
+        if self._warm_task is None or self._warm_task.done():
+            loop = asyncio.get_running_loop()
+            self._warm_task = asyncio.create_task(self._warm(loop, pool))
+
+    async def _warm(self, loop: asyncio.AbstractEventLoop, pool: ProcessPoolExecutor):
+        started = time.perf_counter()
+        try:
+            pids = await asyncio.gather(*[
+                loop.run_in_executor(pool, _warmup) for _ in range(self.max_workers)
+            ])
+            logger.info(
+                f"⚖️ 밸런싱 프로세스 풀 준비 완료: 워커 {len(set(pids))}개 "
+                f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 밸런싱 프로세스 풀 예열 실패: {e}")
+
+    @staticmethod
+    def _discard_pool(pool: ProcessPoolExecutor) -> list:
+        """풀을 닫고 워커 프로세스 종료 (shutdown 만으로는 탐색 중인 워커가 멈추지 않음)"""
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        return processes
+
+    async def _restart_pool(self):
+        """응답 없는 워커가 있는 풀을 버리고 새로 생성"""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            processes = self._discard_pool(pool)
+            self._stats['pool_restarts'] += 1
+
+            # 종료된 워커 회수 (좀비 프로세스 방지), 응답 없으면 강제 종료
+            for process in processes:
+                await asyncio.to_thread(process.join, 1.0)
+                if process.is_alive():
+                    process.kill()
+        await self.start()
+
+    async def find_optimal_balance(self, players: List[Dict],
+                                   mode: BalancingMode = BalancingMode.PRECISE,
+                                   timeout: Optional[float] = None) -> List[BalanceResult]:
+        """
+        TeamBalancer.find_optimal_balance 를 프로세스 풀에서 실행
+
+        Args:
+            players: 참가자 Dict 목록 (10명)
+            mode: 밸런싱 모드
+            timeout: 제한 시간 (초, 기본값 self.timeout)
+
+        Returns:
+            List[BalanceResult] - 제한 시간 초과 시 QUICK 모드 결과
+        """
+        if mode == BalancingMode.QUICK:
+            # QUICK 은 조합이 몇 개뿐이라 프로세스 왕복이 더 비쌈
+            return TeamBalancer(mode=BalancingMode.QUICK).find_optimal_balance(players)
+
+        self._stats['requests'] += 1
+        loop = asyncio.get_running_loop()
+        compact = [compact_player(player) for player in players]
+        started = time.perf_counter()
+
+        try:
+            future = loop.run_in_executor(self._ensure_pool(), _run_find_optimal_balance, mode.value, compact)
+            results = await asyncio.wait_for(future, timeout or self.timeout)
+            self._stats['completed'] += 1
+            return results
+        except asyncio.TimeoutError:
+            self._stats['timeouts'] += 1
+            logger.warning(f"⏱️ 밸런싱 제한 시간 초과 ({mode.value}), QUICK 모드로 대체")
+            # 실행 중인 워커는 취소할 수 없으므로 풀을 교체해 다음 요청이 막히지 않게 함
+            await self._restart_pool()
+        except BrokenProcessPool as e:
+            self._stats['failures'] += 1
+            logger.error(f"❌ 밸런싱 프로세스 풀 오류, QUICK 모드로 대체: {e}")
+            await self._restart_pool()
+        finally:
+            self._stats['total_seconds'] += time.perf_counter() - started
+
+        self._stats['fallbacks'] += 1
+        return TeamBalancer(mode=BalancingMode.QUICK).find_optimal_balance(players)
+
+    async def find_lobby_balance(self, players: List[Dict], template: str = '5v5',
+                                 time_budget: float = 0.8, timeout: Optional[float] = None) -> list:
+        """
+        TeamBalancer.find_lobby_balance 를 프로세스 풀에서 실행 (10명 초과 로비)
+
+        Args:
+            players: 참가자 Dict 목록 (팀 2개 인원보다 많으면 나머지는 대기)
+            template: 역할 템플릿 ('5v5', '6v6', 'open5', 'open6')
+            time_budget: 대규모 로비 탐색 시간 제한 (초)
+            timeout: 제한 시간 (초, 기본값 self.timeout)
+
+        Returns:
+            List[LobbyBalanceResult] - 제한 시간 초과 시 짧은 탐색 시간으로 다시 계산한 결과 (스레드에서 실행)
+        """
+        self._stats['requests'] += 1
+        loop = asyncio.get_running_loop()
+        compact = [compact_player(player) for player in players]
+        started = time.perf_counter()
+
+        try:
+            future = loop.run_in_executor(
+                self._ensure_pool(), _run_find_lobby_balance, template, compact, time_budget
+            )
+            results = await asyncio.wait_for(future, timeout or self.timeout)
+            self._stats['completed'] += 1
+            return results
+        except asyncio.TimeoutError:
+            self._stats['timeouts'] += 1
+            logger.warning(f"⏱️ 로비 밸런싱 제한 시간 초과 ({template}), 짧은 탐색으로 대체")
+            await self._restart_pool()
+        except BrokenProcessPool as e:
+            self._stats['failures'] += 1
+            logger.error(f"❌ 밸런싱 프로세스 풀 오류, 짧은 탐색으로 대체: {e}")
+            await self._restart_pool()
+        finally:
+            self._stats['total_seconds'] += time.perf_counter() - started
+
+        self._stats['fallbacks'] += 1
+        # 대체 계산도 수백 ms 걸릴 수 있으므로 이벤트 루프 밖에서 실행
+        return await asyncio.to_thread(
+            TeamBalancer(mode=BalancingMode.PRECISE).find_lobby_balance,
+            players, template=template, time_budget=min(time_budget, 0.2)
+        )
+
+    def analyze_fixed_team_composition(self, team_a_players: List[Dict], team_a_positions: Dict[str, str],
+                                       team_b_players: List[Dict], team_b_positions: Dict[str, str]) -> BalanceResult:
+        """
+        포지션 고정 팀 분석
+
+        조합 탐색 없이 한 가지 구성만 계산하므로(수십 μs) 프로세스로 보내지 않고 바로 계산한다.
+        """
+        balancer = TeamBalancer(mode=BalancingMode.PRECISE)
+        return balancer.analyze_fixed_team_composition(
+            team_a_players, team_a_positions, team_b_players, team_b_positions
+        )
+
+    def get_stats(self) -> Dict:
+        return {
+            'workers': self.max_workers,
+            'requests': self._stats['requests'],
+            'completed': self._stats['completed'],
+            'timeouts': self._stats['timeouts'],
+            'failures': self._stats['failures'],
+            'fallbacks': self._stats['fallbacks'],
+            'pool_restarts': self._stats['pool_restarts'],
+            'avg_ms': round(self._stats['total_seconds'] / self._stats['requests'] * 1000, 1)
+            if self._stats['requests'] else 0.0,
+        }
+
+    def shutdown(self):
+        """풀 종료 (봇 종료 시)"""
+        if self._warm_task and not self._warm_task.done():
+            self._warm_task.cancel()
+        if self._pool is not None:
+            self._discard_pool(self._pool)
+            self._pool = None
+
+
+balance_executor = BalanceExecutor()
@@ -2,14 +2,18 @@ import logging
 import discord
 from discord.ext import commands
 from typing import List, Dict, Optional
-import asyncio
 
 from utils.balance_algorithm import TeamBalancer, BalancingMode, BalanceResult
+from utils.balance_executor import balance_executor
 
 logger = logging.getLogger(__name__)  
 
+# 자동 밸런싱 참가 인원 (10명 초과분은 로비 밸런싱으로 대기 인원이 됨)
+MIN_PARTICIPANTS = 10
+MAX_PARTICIPANTS = 16
+
 class PlayerSelectionView(discord.ui.View):
-    """10명의 참가자를 선택하는 View"""
+    """10~16명의 참가자를 선택하는 View"""
     
     def __init__(self, bot, guild_id: str, eligible_players: List[Dict], on_complete_callback=None):
         super().__init__(timeout=300)  # 5분 타임아웃
@@ -31,8 +35,8 @@ class PlayerSelectionView(discord.ui.View):
         if len(self.eligible_players) == 0:
             return
         
-        # 10명이 이미 선택되었으면 드롭다운을 추가하지 않음
-        if len(self.selected_players) >= 10:
+        # 최대 인원이 이미 선택되었으면 드롭다운을 추가하지 않음
+        if len(self.selected_players) >= MAX_PARTICIPANTS:
             self.clear_items()
             self.add_buttons()
             return
@@ -54,15 +58,15 @@ class PlayerSelectionView(discord.ui.View):
                 ))
         
         # 옵션이 있고 아직 선택할 수 있는 경우에만 드롭다운 추가
-        if options and len(self.selected_players) < 10:
-            remaining_slots = 10 - len(self.selected_players)
+        if options and len(self.selected_players) < MAX_PARTICIPANTS:
+            remaining_slots = MAX_PARTICIPANTS - len(self.selected_players)
             max_values = min(remaining_slots, len(options))
             
             # max_values가 최소 1 이상이 되도록 보장
             if max_values > 0:
                 player_select = PlayerSelectDropdown(
                     options=options,
-                    placeholder=f"참가자 선택 ({len(self.selected_players)}/10)",
+                    placeholder=f"참가자 선택 ({len(self.selected_players)}/{MAX_PARTICIPANTS})",
                     min_values=1,
                     max_values=max_values
                 )
@@ -77,7 +81,7 @@ class PlayerSelectionView(discord.ui.View):
                 self.clear_items()
                 self.add_buttons()
         else:
-            # 옵션이 없거나 이미 10명이 선택되었으면 드롭다운 없이 버튼만
+            # 옵션이 없거나 이미 최대 인원이 선택되었으면 드롭다운 없이 버튼만
             self.clear_items()
             self.add_buttons()
     
@@ -85,9 +89,9 @@ class PlayerSelectionView(discord.ui.View):
         """확인 및 취소 버튼 추가"""
         # 선택 완료 버튼
         confirm_button = discord.ui.Button(
-            label=f"선택 완료 ({len(self.selected_players)}/10)",
+            label=f"선택 완료 ({len(self.selected_players)}/{MAX_PARTICIPANTS})",
             style=discord.ButtonStyle.success,
-            disabled=len(self.selected_players) != 10,
+            disabled=not MIN_PARTICIPANTS <= len(self.selected_players) <= MAX_PARTICIPANTS,
             emoji="✅"
         )
         confirm_button.callback = self.confirm_selection
@@ -118,10 +122,10 @@ class PlayerSelectionView(discord.ui.View):
         self.add_player_select()
     
     async def confirm_selection(self, interaction: discord.Interaction):
-        """10명 선택 완료"""
-        if len(self.selected_players) != 10:
+        """참가자 선택 완료"""
+        if not MIN_PARTICIPANTS <= len(self.selected_players) <= MAX_PARTICIPANTS:
             await interaction.response.send_message(
-                "❌ 정확히 10명을 선택해야 합니다.", ephemeral=True
+                f"❌ {MIN_PARTICIPANTS}~{MAX_PARTICIPANTS}명을 선택해야 합니다.", ephemeral=True
             )
             return
         
@@ -142,11 +146,18 @@ class PlayerSelectionView(discord.ui.View):
         # 선택된 플레이어 목록 표시
         player_list = "\n".join([f"• {p['username']}" for p in self.selected_players])
         embed.add_field(
-            name="🎮 선택된 참가자 (10명)",
+            name=f"🎮 선택된 참가자 ({len(self.selected_players)}명)",
             value=player_list,
             inline=False
         )
         
+        if len(self.selected_players) > MIN_PARTICIPANTS:
+            embed.add_field(
+                name="🪑 로비 밸런싱",
+                value=f"5vs5 팀 2개를 구성하고 남는 {len(self.selected_players) - MIN_PARTICIPANTS}명은 대기 인원이 됩니다.",
+                inline=False
+            )
+        
         await interaction.response.edit_message(embed=embed, view=options_view)
     
     async def reset_selection(self, interaction: discord.Interaction):
@@ -156,7 +167,7 @@ class PlayerSelectionView(discord.ui.View):
         
         embed = discord.Embed(
             title="👥 참가자 선택",
-            description="내전에 참가할 10명을 선택해주세요.",
+            description=f"내전에 참가할 {MIN_PARTICIPANTS}~{MAX_PARTICIPANTS}명을 선택해주세요.",
             color=0x0099ff
         )
         
@@ -579,8 +590,6 @@ class ManualTeamSelectionView(discord.ui.View):
         await interaction.response.defer()
         
         try:
-            from utils.balance_algorithm import TeamBalancer, BalancingMode
-            
             # 로딩 메시지
             embed = discord.Embed(
                 title="⏳ 팀 밸런스 분석 중...",
@@ -590,9 +599,7 @@ class ManualTeamSelectionView(discord.ui.View):
             await interaction.edit_original_response(embed=embed, view=None)
             
             # 밸런스 분석 실행 (포지션 고정)
-            balancer = TeamBalancer(mode=BalancingMode.PRECISE)
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, balancer.analyze_fixed_team_composition, 
+            result = balance_executor.analyze_fixed_team_composition(
                 self.team_a_players, self.team_a_positions,
                 self.team_b_players, self.team_b_positions
             )
@@ -1080,86 +1087,20 @@ class BalanceCheckResultView(discord.ui.View):
             await interaction.edit_original_response(embed=embed, view=None)
 
     async def find_improved_compositions(self) -> List[Dict]:
-        """더 나은 팀 구성 찾기"""
-        import itertools
-        from utils.balance_algorithm import TeamBalancer, BalancingMode
-        
-        current_score = self.result.balance_score
-        improvements = []
+        """더 나은 팀 구성 찾기 (1~3명 교체안 전체를 증분 평가)"""
+        from utils.balance_engine import SwapSearchEngine
         
-        # 현재 구성에서 가능한 개선안들 시도
-        all_players = self.original_team_a + self.original_team_b
-        balancer = TeamBalancer(mode=BalancingMode.PRECISE)
-        
-        # 1. 플레이어 교체 시나리오 (각 팀에서 1-2명씩 교체)
-        improvement_attempts = 0
-        max_attempts = 20  # 성능을 위해 시도 횟수 제한
-        
-        for swap_count in [1, 2]:  # 1명 또는 2명씩 교체
-            if improvement_attempts >= max_attempts:
-                break
-                
-            # A팀에서 swap_count명 선택
-            for a_players_to_swap in itertools.combinations(range(5), swap_count):
-                if improvement_attempts >= max_attempts:
-                    break
-                    
-                # B팀에서 swap_count명 선택  
-                for b_players_to_swap in itertools.combinations(range(5), swap_count):
-                    improvement_attempts += 1
-                    if improvement_attempts >= max_attempts:
-                        break
-                    
-                    # 새로운 팀 구성 생성
-                    new_team_a = self.original_team_a.copy()
-                    new_team_b = self.original_team_b.copy()
-                    new_a_positions = self.team_a_positions.copy()
-                    new_b_positions = self.team_b_positions.copy()
-                    
-                    # 플레이어 교체
-                    for i, j in zip(a_players_to_swap, b_players_to_swap):
-                        # 플레이어 교체
-                        a_player = new_team_a[i]
-                        b_player = new_team_b[j]
-                        
-                        new_team_a[i] = b_player
-                        new_team_b[j] = a_player
-                        
-                        # 포지션도 함께 교체
-                        a_pos = new_a_positions.get(a_player['user_id'])
-                        b_pos = new_b_positions.get(b_player['user_id'])
-                        
-                        if a_pos and b_pos:
-                            new_a_positions[b_player['user_id']] = a_pos
-                            new_b_positions[a_player['user_id']] = b_pos
-                            del new_a_positions[a_player['user_id']]
-                            del new_b_positions[b_player['user_id']]
-                    
-                    try:
-                        # 새 구성 분석
-                        new_result = await asyncio.get_event_loop().run_in_executor(
-                            None, balancer.analyze_fixed_team_composition,
-                            new_team_a, new_a_positions, new_team_b, new_b_positions
-                        )
-                        
-                        # 개선되었는지 확인
-                        if new_result.balance_score > current_score + 0.05:  # 최소 5% 개선
-                            improvements.append({
-                                'team_a': new_team_a,
-                                'team_b': new_team_b,
-                                'team_a_positions': new_a_positions,
-                                'team_b_positions': new_b_positions,
-                                'result': new_result,
-                                'improvement': new_result.balance_score - current_score,
-                                'swapped_players': [(self.original_team_a[i]['username'], self.original_team_b[j]['username']) 
-                                                for i, j in zip(a_players_to_swap, b_players_to_swap)]
-                            })
-                    except:
-                        continue  # 유효하지 않은 구성이면 스킵
-        
-        # 개선도가 높은 순으로 정렬
-        improvements.sort(key=lambda x: x['improvement'], reverse=True)
-        return improvements[:3]  # 상위 3개만 반환
+        engine = SwapSearchEngine(TeamBalancer(mode=BalancingMode.PRECISE), max_swaps=3)
+        improvements = engine.find_improvements(
+            self.original_team_a, self.team_a_positions,
+            self.original_team_b, self.team_b_positions,
+            top_n=3, min_improvement=0.05  # 최소 5% 개선
+        )
+        logger.info(
+            f"교체안 탐색: {engine.stats['neighbours']}개 평가, "
+            f"개선안 {len(improvements)}개 ({engine.stats['elapsed_ms']:.1f}ms)"
+        )
+        return improvements
 
     def create_improvement_comparison_embed(self, improvement: Dict) -> discord.Embed:
         """개선 구성 비교 임베드 생성"""
@@ -1317,9 +1258,9 @@ class PlayerSelectDropdown(discord.ui.Select):
                 if selected_player:
                     self.parent_view.selected_players.append(selected_player)
         
-        # 10명이 선택되면 자동으로 제한
-        if len(self.parent_view.selected_players) >= 10:
-            self.parent_view.selected_players = self.parent_view.selected_players[:10]
+        # 최대 인원을 넘으면 자동으로 제한
+        if len(self.parent_view.selected_players) >= MAX_PARTICIPANTS:
+            self.parent_view.selected_players = self.parent_view.selected_players[:MAX_PARTICIPANTS]
         
         # View 업데이트
         self.parent_view.update_button_states()
@@ -1327,7 +1268,7 @@ class PlayerSelectDropdown(discord.ui.Select):
         # 현재 선택 상태 표시
         embed = discord.Embed(
             title="👥 참가자 선택",
-            description=f"선택된 참가자: {len(self.parent_view.selected_players)}/10명",
+            description=f"선택된 참가자: {len(self.parent_view.selected_players)}/{MAX_PARTICIPANTS}명",
             color=0x0099ff
         )
         
@@ -1342,20 +1283,21 @@ class PlayerSelectDropdown(discord.ui.Select):
                 inline=False
             )
         
-        if len(self.parent_view.selected_players) < 10:
+        if len(self.parent_view.selected_players) < MIN_PARTICIPANTS:
             embed.add_field(
                 name="➕ 추가 선택 필요",
-                value=f"{10 - len(self.parent_view.selected_players)}명 더 선택해주세요.",
+                value=f"{MIN_PARTICIPANTS - len(self.parent_view.selected_players)}명 더 선택해주세요.",
                 inline=False
             )
         else:
             embed.add_field(
                 name="🎉 선택 완료!",
-                value="'선택 완료' 버튼을 눌러 다음 단계로 진행하세요.",
+                value="'선택 완료' 버튼을 눌러 다음 단계로 진행하세요.\n"
+                      f"{MIN_PARTICIPANTS}명을 넘는 인원은 로비 밸런싱으로 대기 인원이 정해집니다.",
                 inline=False
             )
         
-        # 10명이 선택되었을 때는 View에 드롭다운이 없을 수 있으므로 안전하게 처리
+        # 최대 인원이 선택되었을 때는 View에 드롭다운이 없을 수 있으므로 안전하게 처리
         try:
             await interaction.response.edit_message(embed=embed, view=self.parent_view)
         except discord.errors.HTTPException as e:
@@ -1382,8 +1324,11 @@ class BalancingOptionsView(discord.ui.View):
     
     def add_mode_select(self):
         """밸런싱 모드 선택 드롭다운 추가"""
+        # 10명 초과는 로비 밸런싱(5vs5 + 대기 인원)만 지원하므로 모드 선택 비활성화
+        lobby = len(self.selected_players) > MIN_PARTICIPANTS
         mode_select = discord.ui.Select(
-            placeholder="밸런싱 모드를 선택하세요",
+            placeholder="10명 초과: 로비 밸런싱으로 계산합니다" if lobby else "밸런싱 모드를 선택하세요",
+            disabled=lobby,
             options=[
                 discord.SelectOption(
                     label="빠른 밸런싱",
@@ -1396,7 +1341,7 @@ class BalancingOptionsView(discord.ui.View):
                     value="precise",
                     description="모든 요소를 고려한 정밀 계산 (~5초)",
                     emoji="🎯",
-                    default=True
+                    default=not lobby
                 ),
                 discord.SelectOption(
                     label="실험적 밸런싱",
@@ -1464,7 +1409,7 @@ class BalancingOptionsView(discord.ui.View):
         # 플레이어 목록 (간략하게)
         player_names = [p['username'] for p in self.selected_players]
         embed.add_field(
-            name="👥 참가자 (10명)",
+            name=f"👥 참가자 ({len(self.selected_players)}명)",
             value=", ".join(player_names),
             inline=False
         )
@@ -1479,16 +1424,25 @@ class BalancingOptionsView(discord.ui.View):
             # 로딩 메시지 표시
             embed = discord.Embed(
                 title="⏳ 팀 밸런싱 진행 중...",
-                description=f"선택된 모드: {self.selected_mode.value}\n하이브리드 스코어링으로 분석 중입니다.",
+                description=(
+                    f"{len(self.selected_players)}명 로비 밸런싱으로 팀과 대기 인원을 나누는 중입니다."
+                    if len(self.selected_players) > MIN_PARTICIPANTS
+                    else f"선택된 모드: {self.selected_mode.value}\n하이브리드 스코어링으로 분석 중입니다."
+                ),
                 color=0xffaa00
             )
             await interaction.edit_original_response(embed=embed, view=None)
             
-            # 밸런싱 실행 (하이브리드 스코어링 사용)
-            balancer = TeamBalancer(mode=self.selected_mode)
-            results = await asyncio.get_event_loop().run_in_executor(
-                None, balancer.find_optimal_balance, self.selected_players
-            )
+            if len(self.selected_players) > MIN_PARTICIPANTS:
+                # 10명 초과: 로비 밸런싱으로 5vs5 팀과 대기 인원 분리
+                lobby_results = await balance_executor.find_lobby_balance(self.selected_players, template='5v5')
+                results = [
+                    result for result in (lobby.to_balance_result() for lobby in lobby_results)
+                    if result is not None
+                ]
+            else:
+                # 밸런싱 실행 (하이브리드 스코어링 사용)
+                results = await balance_executor.find_optimal_balance(self.selected_players, self.selected_mode)
             
             if not results:
                 embed = discord.Embed(
@@ -1528,7 +1482,7 @@ class BalancingOptionsView(discord.ui.View):
         
         embed = discord.Embed(
             title="👥 참가자 선택",
-            description=f"선택된 참가자: {len(self.selected_players)}/10명",
+            description=f"선택된 참가자: {len(self.selected_players)}/{MAX_PARTICIPANTS}명",
             color=0x0099ff
         )
         
@@ -1691,6 +1645,14 @@ class BalanceResultView(discord.ui.View):
             inline=False
         )
         
+        # 로비 밸런싱 결과면 대기 인원 표시
+        if result.reasoning.get('bench'):
+            embed.add_field(
+                name="🪑 대기 인원",
+                value=result.reasoning['bench'],
+                inline=False
+            )
+        
         # 50:50 목표 표시
         ideal_range = "45-55%"
         current_range = f"{result.predicted_winrate_a:.1%} vs {1-result.predicted_winrate_a:.1%}"
@@ -1849,6 +1811,13 @@ class BalanceResultView(discord.ui.View):
             inline=False
         )
         
+        if result.reasoning.get('bench'):
+            embed.add_field(
+                name="🪑 대기 인원",
+                value=result.reasoning['bench'],
+                inline=False
+            )
+        
         self.clear_items()
         await interaction.edit_original_response(embed=embed, view=self)
         self.stop()
@@ -0,0 +1,195 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import discord
+
+from utils.rate_limiter import TokenBucket
+
+
+@dataclass
+class NicknameEdit:
+    """변경이 필요한 멤버 1명"""
+    member: discord.Member
+    old_nickname: str
+    new_nickname: str
+
+
+@dataclass
+class NicknamePlan:
+    """일괄 적용 전 계산 결과"""
+    edits: List[NicknameEdit]
+    unchanged: int = 0
+    missing: int = 0
+    forbidden: List[NicknameEdit] = field(default_factory=list)
+
+
+ProgressCallback = Callable[[Dict], Awaitable[None]]
+
+
+class BulkNicknameApplier:
+    """등록 유저 닉네임 일괄 적용기
+
+    - 목표 닉네임을 먼저 전부 계산하고, 현재 서버 닉네임과 같은 멤버는 건너뜀
+    - 봇보다 역할이 높거나 서버 소유자인 멤버는 API 호출 없이 실패 처리
+    - 나머지는 토큰 버킷 + 동시 작업 수 제한으로 member.edit 호출
+      (멤버 수정은 길드 단위 레이트 리밋이라 동시 요청 수는 작게 유지)
+    - 429 는 Retry-After 만큼 버킷 전체를 멈춘 뒤 재시도
+    - progress_interval 초마다 on_progress 로 진행 상황 전달
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 2.0,
+        burst: float = 5.0,
+        concurrency: int = 4,
+        max_retries: int = 2,
+        progress_interval: float = 3.0
+    ):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.progress_interval = progress_interval
+
+        self.last_metrics: Optional[Dict] = None
+
+    @staticmethod
+    def plan(db_manager, guild: discord.Guild, registered_users: List[Dict], template: str) -> NicknamePlan:
+        """
+        등록 유저 목록으로 변경 대상 계산 (Discord 호출 없음)
+
+        Args:
+            db_manager: 닉네임 생성에 쓰는 DatabaseManager
+            guild: 대상 서버
+            registered_users: get_all_registered_users 결과
+            template: 닉네임 포맷 템플릿
+        """
+        result = NicknamePlan(edits=[])
+        me = guild.me
+
+        for user_data in registered_users:
+            member = guild.get_member(int(user_data['user_id']))
+            if not member:
+                result.missing += 1
+                continue
+
+            new_nickname = db_manager.build_nickname(
+                template,
+                user_data['main_position'],
+                user_data['current_season_tier'],
+                user_data['battle_tag'],  # 이제는 대표 닉네임
+                user_data.get('birth_year')
+            )
+
+            if member.nick == new_nickname:
+                result.unchanged += 1
+                continue
+
+            edit = NicknameEdit(member, member.display_name, new_nickname)
+            if member.id == guild.owner_id or (me is not None and member.top_role >= me.top_role):
+                result.forbidden.append(edit)
+            else:
+                result.edits.append(edit)
+
+        return result
+
+    async def _apply(self, bucket: TokenBucket, edit: NicknameEdit, metrics: Dict) -> Optional[str]:
+        """닉네임 하나 변경 (재시도 포함), 실패 시 사유 반환"""
+        for attempt in range(self.max_retries + 1):
+            await bucket.acquire()
+            metrics['requests'] += 1
+
+            try:
+                await edit.member.edit(nick=edit.new_nickname)
+                return None
+            except discord.Forbidden:
+                return "권한 부족 (봇 역할이 대상 유저보다 낮음)"
+            except discord.NotFound:
+                return "서버를 나간 유저"
+            except discord.HTTPException as e:
+                if (e.status != 429 and e.status < 500) or attempt == self.max_retries:
+                    return str(e)
+
+                delay = getattr(e, 'retry_after', None) or float(2 ** attempt)
+                if e.status == 429:
+                    metrics['rate_limited'] += 1
+                    bucket.pause(delay)
+                metrics['retries'] += 1
+                await asyncio.sleep(delay)
+
+        return "재시도 초과"
+
+    async def run(self, edits: List[NicknameEdit],
+                  on_progress: Optional[ProgressCallback] = None) -> List[Dict]:
+        """
+        변경 대상 일괄 적용
+
+        Returns:
+            실패 목록 [{'name', 'reason'}]
+        """
+        started = time.perf_counter()
+        metrics = {
+            'total': len(edits),
+            'done': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'requests': 0,
+            'retries': 0,
+            'rate_limited': 0,
+        }
+        failures: List[Dict] = []
+
+        if edits:
+            bucket = TokenBucket(self.rate_per_second, self.burst)
+            queue: asyncio.Queue = asyncio.Queue()
+            for edit in edits:
+                queue.put_nowait(edit)
+
+            async def worker():
+                while True:
+                    try:
+                        edit = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    try:
+                        reason = await self._apply(bucket, edit, metrics)
+                    except Exception as e:
+                        reason = f"오류: {e}"
+
+                    if reason is None:
+                        metrics['succeeded'] += 1
+                    else:
+                        metrics['failed'] += 1
+                        failures.append({'name': edit.old_nickname, 'reason': reason})
+                    metrics['done'] += 1
+
+            async def reporter():
+                while True:
+                    await asyncio.sleep(self.progress_interval)
+                    try:
+                        await on_progress(dict(metrics))
+                    except Exception as e:
+                        print(f"⚠️ 닉네임 일괄 적용 진행 상황 갱신 실패: {e}")
+
+            workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(edits)))]
+            progress_task = asyncio.create_task(reporter()) if on_progress else None
+            try:
+                await asyncio.gather(*workers)
+            except asyncio.CancelledError:
+                for task in workers:
+                    task.cancel()
+                raise
+            finally:
+                if progress_task:
+                    progress_task.cancel()
+
+            metrics['bucket'] = bucket.get_stats()
+
+        elapsed = time.perf_counter() - started
+        metrics['elapsed_seconds'] = round(elapsed, 2)
+        metrics['throughput_per_second'] = round(len(edits) / elapsed, 2) if elapsed > 0 else 0.0
+        self.last_metrics = metrics
+
+        return failures
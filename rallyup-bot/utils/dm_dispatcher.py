@@ -0,0 +1,225 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+from utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# 받는 사람이 DM 을 막아둔 경우의 Discord 오류 코드
+CANNOT_MESSAGE_USER = 50007
+
+
+@dataclass
+class _DMJob:
+    outbox_id: int
+    guild_id: str
+    user_id: str
+    embed: discord.Embed
+    user: Optional[discord.abc.User] = None
+
+
+class DMDispatcher:
+    """봇 전체가 공유하는 DM 발송기
+
+    - 모든 DM 은 하나의 토큰 버킷과 동시 발송 수 제한을 거친다 (여러 서버/스케줄러가 동시에 보내도 합산 제한)
+    - 보내기 전에 dm_outbox 에 기록하고 발송이 끝나면 지우므로, 도중에 재시작해도 남은 DM 을 이어서 보낸다
+    - DM 차단(50007)이 확인된 유저는 closed_ttl 동안 발송 대상에서 제외
+    - 429 는 Retry-After 만큼 버킷 전체를 멈춘 뒤 재시도
+    """
+
+    def __init__(
+        self,
+        bot,
+        rate_per_second: float = 4.0,
+        burst: float = 8.0,
+        concurrency: int = 4,
+        max_retries: int = 3,
+        closed_ttl: timedelta = timedelta(days=7),
+        pending_max_age: timedelta = timedelta(hours=6)
+    ):
+        self.bot = bot
+        self.max_retries = max_retries
+        self.closed_ttl = closed_ttl
+        self.pending_max_age = pending_max_age
+
+        self._bucket = TokenBucket(rate_per_second, burst)
+        self._slots = asyncio.Semaphore(max(1, concurrency))
+        self._resume_task: Optional[asyncio.Task] = None
+
+        self._stats = {
+            'sent': 0,
+            'failed': 0,
+            'closed': 0,
+            'skipped_closed': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'resumed': 0,
+        }
+
+    @property
+    def db(self):
+        return self.bot.db_manager
+
+    def start(self):
+        """재시작 전에 남은 DM 이어서 발송 (봇 준비 후)"""
+        if self._resume_task is None or self._resume_task.done():
+            self._resume_task = asyncio.create_task(self._resume_pending())
+
+    async def stop(self):
+        if self._resume_task and not self._resume_task.done():
+            self._resume_task.cancel()
+            try:
+                await self._resume_task
+            except asyncio.CancelledError:
+                pass
+
+    async def send_bulk(self, guild: discord.Guild, kind: str,
+                        recipients: List[Tuple[discord.abc.User, discord.Embed]]) -> Dict[str, int]:
+        """
+        여러 유저에게 DM 발송
+
+        Args:
+            guild: 발송 주체 서버 (DM 차단 기록 단위)
+            kind: 로그/대기열 구분용 이름 (예: 'recruitment_announce')
+            recipients: (받는 유저, 임베드) 목록
+
+        Returns:
+            {'success', 'failed', 'skipped', 'total'} - skipped 는 DM 차단으로 제외된 수
+        """
+        guild_id = str(guild.id)
+        since = (datetime.utcnow() - self.closed_ttl).isoformat()
+        closed = await self.db.get_dm_closed_users(guild_id, since)
+
+        targets = [(user, embed) for user, embed in recipients if str(user.id) not in closed]
+        skipped = len(recipients) - len(targets)
+        self._stats['skipped_closed'] += skipped
+
+        outbox_ids = await self.db.enqueue_dm_outbox(
+            guild_id, kind, [(str(user.id), json.dumps(embed.to_dict())) for user, embed in targets]
+        )
+        jobs = [
+            _DMJob(outbox_id, guild_id, str(user.id), embed, user)
+            for outbox_id, (user, embed) in zip(outbox_ids, targets)
+        ]
+
+        started = time.perf_counter()
+        success, failed = await self._dispatch(jobs)
+        logger.info(
+            f"📨 DM 발송 [{kind}] {guild.name}: 성공 {success}명, 실패 {failed}명, "
+            f"차단 제외 {skipped}명 ({time.perf_counter() - started:.1f}초)"
+        )
+
+        return {'success': success, 'failed': failed, 'skipped': skipped, 'total': len(recipients)}
+
+    async def _dispatch(self, jobs: List[_DMJob]) -> Tuple[int, int]:
+        results = await asyncio.gather(*[self._deliver(job) for job in jobs])
+        success = sum(1 for ok in results if ok)
+        return success, len(results) - success
+
+    async def _resolve_user(self, job: _DMJob) -> Optional[discord.abc.User]:
+        if job.user is not None:
+            return job.user
+        user = self.bot.get_user(int(job.user_id))
+        if user is None:
+            try:
+                user = await self.bot.fetch_user(int(job.user_id))
+            except discord.HTTPException:
+                return None
+        return user
+
+    async def _deliver(self, job: _DMJob) -> bool:
+        """DM 1건 발송 (재시도 포함)
+
+        성공/실패/DM 차단으로 결과가 확정된 경우에만 대기열에서 제거한다.
+        취소(종료)나 예상치 못한 오류면 행을 남겨 두어 재시작 시 이어서 발송한다.
+        """
+        async with self._slots:
+            try:
+                ok = await self._send_with_retry(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ DM 발송 중 오류 ({job.user_id}), 대기열에 유지: {e}")
+                self._stats['failed'] += 1
+                return False
+
+            try:
+                await self.db.complete_dm_outbox([job.outbox_id])
+            except Exception as e:
+                logger.warning(f"⚠️ DM 대기열 정리 실패 ({job.outbox_id}): {e}")
+            return ok
+
+    async def _send_with_retry(self, job: _DMJob) -> bool:
+        user = await self._resolve_user(job)
+        if user is None:
+            self._stats['failed'] += 1
+            return False
+
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.acquire()
+            try:
+                await user.send(embed=job.embed)
+                self._stats['sent'] += 1
+                return True
+            except discord.Forbidden as e:
+                if e.code == CANNOT_MESSAGE_USER:
+                    self._stats['closed'] += 1
+                    await self.db.mark_dm_closed(job.guild_id, job.user_id)
+                else:
+                    self._stats['failed'] += 1
+                return False
+            except discord.HTTPException as e:
+                if (e.status != 429 and e.status < 500) or attempt == self.max_retries:
+                    logger.warning(f"⚠️ DM 발송 실패 ({job.user_id}): {e}")
+                    self._stats['failed'] += 1
+                    return False
+
+                delay = getattr(e, 'retry_after', None) or float(2 ** attempt)
+                if e.status == 429:
+                    self._stats['rate_limited'] += 1
+                    self._bucket.pause(delay)
+                self._stats['retries'] += 1
+                await asyncio.sleep(delay)
+
+        self._stats['failed'] += 1
+        return False
+
+    async def _resume_pending(self):
+        try:
+            await self.bot.wait_until_ready()
+            rows = await self.db.get_pending_dm_outbox()
+            if not rows:
+                return
+
+            cutoff = datetime.utcnow() - self.pending_max_age
+            jobs, expired = [], []
+            for row in rows:
+                if datetime.fromisoformat(row['created_at']) < cutoff:
+                    expired.append(row['id'])
+                    continue
+                jobs.append(_DMJob(
+                    row['id'], row['guild_id'], row['user_id'],
+                    discord.Embed.from_dict(json.loads(row['payload']))
+                ))
+
+            if expired:
+                await self.db.complete_dm_outbox(expired)
+
+            self._stats['resumed'] += len(jobs)
+            success, failed = await self._dispatch(jobs)
+            logger.info(f"📨 미발송 DM 재개: 성공 {success}명, 실패 {failed}명, 만료 {len(expired)}건")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ 미발송 DM 재개 실패: {e}")
+
+    def get_stats(self) -> Dict:
+        return {**self._stats, 'bucket': self._bucket.get_stats()}
@@ -372,44 +372,19 @@ class MapSelectionView(View):
         """DB에 경기 결과 저장 (scrim_result_recording 로직 재사용)"""
         guild_id = match_data['guild_id']
         
-        # 승리팀과 패배팀 구분
-        if match_data['winner'] == 'team_a':
-            winning_team = match_data['team_a']
-            losing_team = match_data['team_b']
-            winning_positions = match_data['team_a_positions']
-            losing_positions = match_data['team_b_positions']
-        else:
-            winning_team = match_data['team_b']
-            losing_team = match_data['team_a']
-            winning_positions = match_data['team_b_positions']
-            losing_positions = match_data['team_a_positions']
-        
-        # 각 플레이어의 결과 저장
-        for player in winning_team:
-            user_id = player['user_id']
-            position = winning_positions.get(user_id, '미설정')
-            
-            await bot.db_manager.record_scrim_result(
-                guild_id=guild_id,
-                user_id=user_id,
-                position=position,
-                result='win',
-                map_type=match_data.get('map_type'),
-                map_name=match_data.get('map_name')
-            )
-        
-        for player in losing_team:
-            user_id = player['user_id']
-            position = losing_positions.get(user_id, '미설정')
-            
-            await bot.db_manager.record_scrim_result(
-                guild_id=guild_id,
-                user_id=user_id,
-                position=position,
-                result='loss',
-                map_type=match_data.get('map_type'),
-                map_name=match_data.get('map_name')
-            )
+        # 참가자 전원의 결과를 한 트랜잭션으로 반영
+        results = []
+        for team_key in ['team_a', 'team_b']:
+            positions = match_data[f'{team_key}_positions']
+            result = 'win' if match_data['winner'] == team_key else 'loss'
+            for player in match_data[team_key]:
+                results.append({
+                    'user_id': player['user_id'],
+                    'position': positions.get(player['user_id'], '미설정'),
+                    'result': result
+                })
+        
+        await bot.db_manager.record_scrim_results(guild_id, results)
         
         logger.info(f"경기 결과 저장 완료 (세션: {match_data['session_id'][:8]})")
 
@@ -447,7 +422,8 @@ class ContinueMatchView(View):
     async def rematch_same_members(self, interaction: discord.Interaction):
         """동일 멤버로 재밸런싱"""
         from utils.balancing_session_manager import session_manager
-        from utils.balance_algorithm import TeamBalancer, BalancingMode
+        from utils.balance_algorithm import BalancingMode
+        from utils.balance_executor import balance_executor
         
         await interaction.response.defer()
         
@@ -499,9 +475,8 @@ class ContinueMatchView(View):
                 
                 updated_participants.append(player_data)
             
-            # TeamBalancer 사용
-            balancer = TeamBalancer(mode=BalancingMode.PRECISE)
-            balance_results = balancer.find_optimal_balance(updated_participants)
+            # 밸런싱 프로세스 풀 사용 (이벤트 루프 블로킹 방지)
+            balance_results = await balance_executor.find_optimal_balance(updated_participants, BalancingMode.PRECISE)
             
             if not balance_results:
                 await interaction.followup.send(
@@ -878,7 +853,8 @@ class MemberManagementView(View):
         await interaction.response.defer()
         
         try:
-            from utils.balance_algorithm import TeamBalancer, BalancingMode
+            from utils.balance_algorithm import BalancingMode
+            from utils.balance_executor import balance_executor
             bot = interaction.client
             
             # 참가자들의 최신 통계 가져오기
@@ -921,9 +897,8 @@ class MemberManagementView(View):
                 
                 updated_participants.append(player_data)
             
-            # TeamBalancer 사용
-            balancer = TeamBalancer(mode=BalancingMode.PRECISE)
-            balance_results = balancer.find_optimal_balance(updated_participants)
+            # 밸런싱 프로세스 풀 사용 (이벤트 루프 블로킹 방지)
+            balance_results = await balance_executor.find_optimal_balance(updated_participants, BalancingMode.PRECISE)
             
             if not balance_results:
                 await interaction.followup.send(
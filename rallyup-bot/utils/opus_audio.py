@@ -0,0 +1,111 @@
+import asyncio
+import io
+import logging
+from typing import List, Optional
+
+import discord
+from discord.oggparse import OggError, OggStream
+
+logger = logging.getLogger(__name__)
+
+# discord.py 음성 플레이어는 20ms 마다 패킷 하나를 보낸다
+FRAME_SECONDS = 0.02
+
+
+async def encode_ogg_opus(
+    data: bytes,
+    ffmpeg: str = 'ffmpeg',
+    volume: float = 1.0,
+    bitrate: int = 64,
+    timeout: float = 20.0
+) -> Optional[bytes]:
+    """
+    음성 데이터(MP3 등)를 Discord 전송용 Ogg Opus 로 한 번만 변환 (파이프 입출력, 임시 파일 없음)
+
+    Args:
+        data: 원본 음성 바이트
+        ffmpeg: ffmpeg 실행 파일 경로
+        volume: 인코딩 시 적용할 볼륨 배율 (재생 때는 다시 디코딩하지 않으므로 여기서 적용)
+        bitrate: Opus 비트레이트 (kbps)
+
+    Returns:
+        48kHz 스테레오 20ms 프레임 Ogg Opus 바이트 또는 None
+    """
+    args = [ffmpeg, '-hide_banner', '-loglevel', 'error', '-i', 'pipe:0', '-vn', '-map_metadata', '-1']
+    if volume != 1.0:
+        args += ['-filter:a', f'volume={volume}']
+    args += [
+        '-c:a', 'libopus', '-ar', '48000', '-ac', '2', '-b:a', f'{bitrate}k',
+        '-application', 'voip', '-frame_duration', '20',
+        '-f', 'opus', 'pipe:1'
+    ]
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
+        logger.error(f"❌ ffmpeg 실행 실패: {e}")
+        return None
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(data), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        logger.error("❌ Opus 변환 타임아웃")
+        return None
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+
+    if process.returncode != 0 or not stdout:
+        logger.error(f"❌ Opus 변환 실패 (code {process.returncode}): {stderr.decode(errors='ignore').strip()[:200]}")
+        return None
+    return stdout
+
+
+def read_opus_packets(data: bytes) -> List[bytes]:
+    """Ogg Opus 바이트에서 오디오 패킷만 추출 (OpusHead/OpusTags 헤더 제외)"""
+    packets = []
+    for packet in OggStream(io.BytesIO(data)).iter_packets():
+        if packet.startswith(b'OpusHead') or packet.startswith(b'OpusTags'):
+            continue
+        packets.append(packet)
+    return packets
+
+
+class OpusPacketSource(discord.AudioSource):
+    """메모리에 있는 Opus 패킷을 그대로 보내는 음성 소스
+
+    FFmpegPCMAudio 처럼 재생마다 ffmpeg 프로세스를 띄워 디코딩/재인코딩하지 않는다.
+    """
+
+    def __init__(self, packets: List[bytes]):
+        self.packets = packets
+        self._position = 0
+
+    @classmethod
+    def from_ogg(cls, data: bytes) -> 'OpusPacketSource':
+        try:
+            return cls(read_opus_packets(data))
+        except OggError as e:
+            raise ValueError(f"잘못된 Ogg Opus 데이터: {e}") from None
+
+    @property
+    def duration(self) -> float:
+        """재생 길이 (초)"""
+        return len(self.packets) * FRAME_SECONDS
+
+    def read(self) -> bytes:
+        if self._position >= len(self.packets):
+            return b''
+        packet = self.packets[self._position]
+        self._position += 1
+        return packet
+
+    def is_opus(self) -> bool:
+        return True
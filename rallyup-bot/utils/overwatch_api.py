@@ -1,6 +1,9 @@
 import aiohttp
 import asyncio
-from typing import Optional, Dict
+import copy
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
 from utils.helpers import parse_battle_tag_for_api
 
 class OverwatchAPI:
@@ -12,56 +15,37 @@ class OverwatchAPI:
     TIMEOUT = 10  # 초
     
     @staticmethod
-    async def fetch_profile(battle_tag: str, platform: str = None, region: str = None) -> Optional[Dict]:
-        try:
-            platform = platform or OverwatchAPI.DEFAULT_PLATFORM
-            region = region or OverwatchAPI.DEFAULT_REGION
-            
-            # 배틀태그 형식 변환 (이름#1234 → 이름-1234)
-            api_battle_tag = parse_battle_tag_for_api(battle_tag)
-            
-            url = f"{OverwatchAPI.BASE_URL}/{platform}/{region}/{api_battle_tag}/profile"
+    async def fetch_profile(battle_tag: str, platform: str = None, region: str = None,
+                            use_cache: bool = True) -> Optional[Dict]:
+        """
+        오버워치 프로필 조회 (공유 클라이언트 경유)
+        
+        Args:
+            battle_tag: 배틀태그
+            platform: 플랫폼 (기본: pc)
+            region: 지역 (기본: asia)
+            use_cache: False 면 캐시를 건너뛰고 새로 조회
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=OverwatchAPI.TIMEOUT)) as response:
-                    
-                    # 응답 확인
-                    if response.status != 200:
-                        print(f"⚠️ API 응답 실패: {response.status}")
-                        return None
-                    
-                    data = await response.json()
-                    
-                    print(f"\n{'='*50}")
-                    print(f"[DEBUG] API 응답 for {battle_tag}:")
-                    import json
-                    print(json.dumps(data, indent=2, ensure_ascii=False))
-                    print(f"{'='*50}\n")
-
-                    # 에러 응답 체크
-                    if 'error' in data:
-                        error_msg = data.get('error', 'Unknown error')
-                        if 'Player not found' in error_msg or 'PROFILE_PRIVATE' in error_msg:
-                            print(f"ℹ️ {battle_tag}: {error_msg} (비공개 또는 없는 계정)")
-                        else:
-                            print(f"⚠️ API 에러: {error_msg}")
-                        return None
-                    
-                    # 정상 응답 처리
-                    return data
-                    
-        except asyncio.TimeoutError:
-            print(f"⏱️ API 타임아웃: {battle_tag}")
-            return None
-        except aiohttp.ClientError as e:
-            print(f"🌐 네트워크 오류: {e}")
-            return None
-        except Exception as e:
-            print(f"❌ API 호출 중 오류: {e}")
-            return None
+        Returns:
+            프로필 dict 또는 None
+        """
+        return await overwatch_client.fetch_profile(battle_tag, platform, region, use_cache=use_cache)
     
     @staticmethod
-    async def fetch_complete_stats(battle_tag: str, platform: str = None, region: str = None) -> Optional[Dict]:
+    async def request_profile(battle_tag: str, platform: str = None, region: str = None,
+                              use_cache: bool = True) -> Tuple[int, Optional[Dict], Optional[float]]:
+        """
+        프로필 조회 (재시도 판단용 상태 코드 포함)
+        
+        Returns:
+            (HTTP 상태 코드, 프로필 dict 또는 None, Retry-After 초 또는 None)
+            타임아웃/네트워크 오류는 상태 코드 0
+        """
+        return await overwatch_client.request('profile', battle_tag, platform, region, use_cache=use_cache)
+    
+    @staticmethod
+    async def fetch_complete_stats(battle_tag: str, platform: str = None, region: str = None,
+                                   use_cache: bool = True) -> Optional[Dict]:
         """
         오버워치 상세 통계 조회 (영웅별, 모드별)
         
@@ -73,30 +57,7 @@ class OverwatchAPI:
         Returns:
             상세 통계 dict 또는 None
         """
-        try:
-            platform = platform or OverwatchAPI.DEFAULT_PLATFORM
-            region = region or OverwatchAPI.DEFAULT_REGION
-            
-            api_battle_tag = parse_battle_tag_for_api(battle_tag)
-            
-            url = f"{OverwatchAPI.BASE_URL}/{platform}/{region}/{api_battle_tag}/complete"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=OverwatchAPI.TIMEOUT)) as response:
-                    
-                    if response.status != 200:
-                        return None
-                    
-                    data = await response.json()
-                    
-                    if 'error' in data:
-                        return None
-                    
-                    return data
-                    
-        except Exception as e:
-            print(f"❌ 상세 통계 조회 실패: {e}")
-            return None
+        return await overwatch_client.fetch_complete_stats(battle_tag, platform, region, use_cache=use_cache)
     
     @staticmethod
     def parse_rank_info(profile_data: Dict) -> Optional[Dict]:
@@ -112,8 +73,6 @@ class OverwatchAPI:
             
             # 경쟁전 랭크 정보
             ratings = profile_data.get('ratings', [])
-
-            print(f"[DEBUG] ratings 배열: {ratings}")
             
             for rating in ratings:
                 role = rating.get('role')  # tank, offense/damage, support
@@ -127,8 +86,6 @@ class OverwatchAPI:
                     'group': group,  # 🆕 group 추가
                     'rank_icon': rank_icon
                 })
-            
-            print(f"[DEBUG] 파싱 결과: {result}")
             return result if result['ratings'] else result
             
         except Exception as e:
@@ -225,4 +182,194 @@ class OverwatchAPI:
                     highest_priority = priority
                     highest_group = group
         
-        return highest_group
\ No newline at end of file
+        return highest_group
+
+
+class OverwatchClient:
+    """공유 세션 기반 Overwatch API 클라이언트
+    
+    - keep-alive 커넥션 풀을 쓰는 aiohttp 세션 하나를 재사용 (요청마다 TCP/TLS 핸드셰이크 제거)
+    - (종류, 플랫폼, 지역, 배틀태그) 단위 TTL + LRU 응답 캐시
+      (없는/비공개 계정 응답은 더 짧은 TTL 로 캐시, 오류 응답은 캐시하지 않음)
+    - 같은 키에 대한 동시 요청은 진행 중인 요청 하나를 공유 (single-flight)
+    """
+    
+    def __init__(self, cache_ttl: float = 300.0, negative_ttl: float = 60.0,
+                 cache_size: int = 2048, connection_limit: int = 20):
+        self.cache_ttl = cache_ttl
+        self.negative_ttl = negative_ttl
+        self.cache_size = cache_size
+        self.connection_limit = connection_limit
+        
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache: "OrderedDict[Tuple[str, str, str, str], Tuple[float, int, Optional[Dict]]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str, str, str], asyncio.Task] = {}
+        
+        self._stats = {'requests': 0, 'hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0, 'evictions': 0}
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=OverwatchAPI.TIMEOUT)
+            )
+        return self._session
+    
+    @staticmethod
+    def _cache_key(kind: str, battle_tag: str, platform: Optional[str], region: Optional[str]) -> Tuple[str, str, str, str]:
+        return (
+            kind,
+            (platform or OverwatchAPI.DEFAULT_PLATFORM).lower(),
+            (region or OverwatchAPI.DEFAULT_REGION).lower(),
+            battle_tag.strip()
+        )
+    
+    def _cache_get(self, key) -> Optional[Tuple[int, Optional[Dict]]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, status, data = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        
+        self._cache.move_to_end(key)
+        return status, data
+    
+    def _cache_put(self, key, status: int, data: Optional[Dict]):
+        ttl = self.cache_ttl if data else self.negative_ttl
+        self._cache[key] = (time.monotonic() + ttl, status, data)
+        self._cache.move_to_end(key)
+        
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self._stats['evictions'] += 1
+    
+    async def _send(self, kind: str, battle_tag: str, key) -> Tuple[int, Optional[Dict], Optional[float]]:
+        """실제 HTTP 요청 (캐시/병합 없이)"""
+        _, platform, region, _ = key
+        api_battle_tag = parse_battle_tag_for_api(battle_tag)
+        url = f"{OverwatchAPI.BASE_URL}/{platform}/{region}/{api_battle_tag}/{kind}"
+        self._stats['requests'] += 1
+        
+        try:
+            async with self._get_session().get(url) as response:
+                retry_after = None
+                header = response.headers.get('Retry-After')
+                if header:
+                    try:
+                        retry_after = float(header)
+                    except ValueError:
+                        retry_after = None
+                
+                if response.status != 200:
+                    print(f"⚠️ API 응답 실패: {response.status} ({battle_tag})")
+                    self._stats['errors'] += 1
+                    return response.status, None, retry_after
+                
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    self._stats['errors'] += 1
+                    return response.status, None, None
+                
+                if not isinstance(data, dict) or 'error' in data:
+                    error_msg = data.get('error', 'Unknown error') if isinstance(data, dict) else 'Invalid response'
+                    if 'Player not found' in error_msg or 'PROFILE_PRIVATE' in error_msg:
+                        print(f"ℹ️ {battle_tag}: {error_msg} (비공개 또는 없는 계정)")
+                    else:
+                        print(f"⚠️ API 에러: {error_msg}")
+                    self._cache_put(key, response.status, None)
+                    return response.status, None, None
+                
+                self._cache_put(key, response.status, data)
+                return response.status, data, None
+                
+        except asyncio.TimeoutError:
+            print(f"⏱️ API 타임아웃: {battle_tag}")
+            self._stats['errors'] += 1
+            return 0, None, None
+        except aiohttp.ClientError as e:
+            print(f"🌐 네트워크 오류: {e}")
+            self._stats['errors'] += 1
+            return 0, None, None
+    
+    async def request(self, kind: str, battle_tag: str, platform: str = None, region: str = None,
+                      use_cache: bool = True) -> Tuple[int, Optional[Dict], Optional[float]]:
+        """
+        API 조회 (캐시 + 동시 요청 병합)
+        
+        Args:
+            kind: 'profile' 또는 'complete'
+            use_cache: False 면 캐시를 건너뛰고 새로 조회 (결과는 캐시에 반영)
+            
+        Returns:
+            (HTTP 상태 코드, 응답 dict 또는 None, Retry-After 초 또는 None)
+        """
+        key = self._cache_key(kind, battle_tag, platform, region)
+        
+        if use_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                self._stats['hits'] += 1
+                status, data = cached
+                return status, copy.deepcopy(data), None
+            self._stats['misses'] += 1
+        
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats['coalesced'] += 1
+        else:
+            # 호출자가 취소돼도 같은 요청을 기다리는 다른 호출자는 결과를 받도록 별도 태스크로 실행
+            task = asyncio.ensure_future(self._send(kind, battle_tag, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._inflight.pop(k, None))
+        
+        status, data, retry_after = await asyncio.shield(task)
+        return status, copy.deepcopy(data), retry_after
+    
+    async def fetch_profile(self, battle_tag: str, platform: str = None, region: str = None,
+                            use_cache: bool = True) -> Optional[Dict]:
+        """프로필 조회"""
+        try:
+            _, data, _ = await self.request('profile', battle_tag, platform, region, use_cache=use_cache)
+            return data
+        except Exception as e:
+            print(f"❌ API 호출 중 오류: {e}")
+            return None
+    
+    async def fetch_complete_stats(self, battle_tag: str, platform: str = None, region: str = None,
+                                   use_cache: bool = True) -> Optional[Dict]:
+        """상세 통계 조회"""
+        try:
+            _, data, _ = await self.request('complete', battle_tag, platform, region, use_cache=use_cache)
+            return data
+        except Exception as e:
+            print(f"❌ 상세 통계 조회 실패: {e}")
+            return None
+    
+    def invalidate(self, battle_tag: str, platform: str = None, region: str = None):
+        """특정 배틀태그 캐시 삭제"""
+        for kind in ('profile', 'complete'):
+            self._cache.pop(self._cache_key(kind, battle_tag, platform, region), None)
+    
+    def get_stats(self) -> Dict:
+        """캐시/요청 통계"""
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            **self._stats,
+            'entries': len(self._cache),
+            'inflight': len(self._inflight),
+            'hit_rate': round(self._stats['hits'] / lookups, 4) if lookups else 0.0,
+        }
+    
+    async def close(self):
+        """공유 세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+overwatch_client = OverwatchClient()
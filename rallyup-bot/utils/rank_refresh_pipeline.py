@@ -0,0 +1,133 @@
+import asyncio
+import random
+import time
+from typing import Dict, Iterable, Optional
+
+from utils.overwatch_api import OverwatchAPI
+from utils.rate_limiter import TokenBucket
+
+
+class RankRefreshPipeline:
+    """오버워치 랭크 일괄 조회 파이프라인
+
+    - 요청은 공유 OverwatchClient 를 거친다 (keep-alive 세션, 응답 캐시)
+    - 같은 배틀태그는 한 번만 조회 (여러 서버에 등록된 경우 포함)
+    - 토큰 버킷으로 초당 요청 수를 제한하고, 동시 요청은 concurrency 개로 제한
+    - 429/5xx/네트워크 오류는 지수 백오프(+지터)로 재시도, 429 의 Retry-After 는 버킷 전체에 반영
+    - 한 번의 실행(pass)마다 처리량/오류 메트릭을 last_metrics 에 남긴다
+    """
+
+    RETRY_STATUSES = {0, 429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        rate_per_second: float = 5.0,
+        burst: float = 10.0,
+        concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0
+    ):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.last_metrics: Optional[Dict] = None
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(self.backoff_max, retry_after)
+        # full jitter: 0 ~ base * 2^attempt
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def _fetch(self, bucket: TokenBucket, battle_tag: str, metrics: Dict) -> Optional[Dict]:
+        """배틀태그 하나 조회 (재시도 포함), 성공 시 파싱된 랭크 정보 반환"""
+        for attempt in range(self.max_retries + 1):
+            await bucket.acquire()
+            metrics['requests'] += 1
+
+            status, data, retry_after = await OverwatchAPI.request_profile(battle_tag)
+            metrics['status_counts'][status] = metrics['status_counts'].get(status, 0) + 1
+
+            if status == 200:
+                if not data:
+                    # 비공개/없는 계정 - 재시도해도 결과가 같음
+                    metrics['not_found'] += 1
+                    return None
+                return OverwatchAPI.parse_rank_info(data)
+
+            if status not in self.RETRY_STATUSES or attempt == self.max_retries:
+                break
+
+            delay = self._backoff(attempt, retry_after)
+            if status == 429:
+                metrics['rate_limited'] += 1
+                bucket.pause(delay)
+            metrics['retries'] += 1
+            await asyncio.sleep(delay)
+
+        metrics['failed'] += 1
+        return None
+
+    async def run(self, battle_tags: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """
+        배틀태그 목록 일괄 조회
+
+        Returns:
+            {battle_tag: 랭크 정보 또는 None(실패)}
+        """
+        unique_tags = list(dict.fromkeys(tag for tag in battle_tags if tag))
+        started = time.perf_counter()
+
+        metrics = {
+            'tags': len(unique_tags),
+            'requests': 0,
+            'succeeded': 0,
+            'not_found': 0,
+            'failed': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'status_counts': {},
+        }
+        results: Dict[str, Optional[Dict]] = {}
+
+        if unique_tags:
+            bucket = TokenBucket(self.rate_per_second, self.burst)
+            queue: asyncio.Queue = asyncio.Queue()
+            for tag in unique_tags:
+                queue.put_nowait(tag)
+
+            async def worker():
+                while True:
+                    try:
+                        tag = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    try:
+                        results[tag] = await self._fetch(bucket, tag, metrics)
+                    except Exception as e:
+                        print(f"❌ 랭크 조회 중 오류 ({tag}): {e}")
+                        metrics['failed'] += 1
+                        results[tag] = None
+
+            workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(unique_tags)))]
+            try:
+                await asyncio.gather(*workers)
+            except asyncio.CancelledError:
+                for task in workers:
+                    task.cancel()
+                raise
+
+            metrics['bucket'] = bucket.get_stats()
+
+        elapsed = time.perf_counter() - started
+        metrics['succeeded'] = sum(1 for rank_info in results.values() if rank_info)
+        metrics['elapsed_seconds'] = round(elapsed, 2)
+        metrics['throughput_per_second'] = round(len(unique_tags) / elapsed, 2) if elapsed > 0 else 0.0
+        metrics['error_rate'] = round(metrics['failed'] / len(unique_tags), 4) if unique_tags else 0.0
+        self.last_metrics = metrics
+
+        return results
@@ -0,0 +1,76 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 레이트 리미터
+
+    초당 rate 개씩 토큰이 채워지고 최대 capacity 개까지 모인다.
+    acquire() 는 토큰이 생길 때까지 대기하며, 대기 순서는 호출 순서를 따른다.
+    서버가 429 로 Retry-After 를 주면 pause() 로 버킷 전체를 잠시 멈춘다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate 는 0보다 커야 합니다")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self._stats = {'acquired': 0, 'waited': 0, 'total_wait': 0.0, 'pauses': 0}
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """토큰 확보 (부족하면 채워질 때까지 대기)"""
+        started = time.monotonic()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+        waited = time.monotonic() - started
+        self._stats['acquired'] += 1
+        if waited > 0.001:
+            self._stats['waited'] += 1
+            self._stats['total_wait'] += waited
+
+    def pause(self, seconds: float):
+        """일정 시간 동안 토큰 발급 중지 (429 Retry-After 대응)"""
+        until = time.monotonic() + max(0.0, seconds)
+        if until > self._paused_until:
+            self._paused_until = until
+            self._tokens = 0.0
+            self._updated = until
+            self._stats['pauses'] += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """대기 통계"""
+        waited = self._stats['waited']
+        return {
+            'rate': self.rate,
+            'capacity': self.capacity,
+            'acquired': self._stats['acquired'],
+            'waited': waited,
+            'avg_wait_ms': round(self._stats['total_wait'] / waited * 1000, 3) if waited else 0.0,
+            'pauses': self._stats['pauses'],
+        }
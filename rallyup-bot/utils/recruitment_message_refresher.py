@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+PARTICIPATION_STATUSES = ('joined', 'late_join', 'declined')
+
+# (모집 정보, 상태별 인원) -> 임베드
+RenderFunc = Callable[[Dict, Dict[str, int]], discord.Embed]
+
+
+class _RecruitmentState:
+    """모집 1건의 메모리 집계와 갱신 예약 상태"""
+
+    def __init__(self):
+        self.statuses: Dict[str, str] = {}
+        self.counts: Dict[str, int] = {status: 0 for status in PARTICIPATION_STATUSES}
+        self.loaded_at = 0.0
+        self.load_lock = asyncio.Lock()
+
+        self.interaction: Optional[discord.Interaction] = None
+        self.view: Optional[discord.ui.View] = None
+        self.render: Optional[RenderFunc] = None
+
+        self.dirty = False
+        self.task: Optional[asyncio.Task] = None
+        self.last_edit = 0.0
+        self.touched_at = time.monotonic()
+
+    def apply(self, user_id: str, status: str):
+        """유저 1명의 상태 변경을 집계에 반영 (같은 상태면 변화 없음)"""
+        previous = self.statuses.get(user_id)
+        if previous == status:
+            return
+        if previous in self.counts:
+            self.counts[previous] -= 1
+        self.statuses[user_id] = status
+        if status in self.counts:
+            self.counts[status] += 1
+
+
+class RecruitmentMessageRefresher:
+    """모집 공지 임베드 갱신 병합기
+
+    - 참가 현황은 모집별로 메모리에 들고 버튼 클릭마다 증분 반영 (첫 클릭/재동기화 때만 전체 조회)
+    - 클릭이 몰려도 모집당 min_interval 에 한 번만 메시지를 수정하고,
+      수정 중에 들어온 클릭은 다음 수정에 합쳐서 항상 마지막 상태로 끝난다
+    - 수정 직전에 모집 상태를 확인해 마감/취소된 공지는 덮어쓰지 않는다
+    - 마감/취소 시 discard 로 즉시 정리하고, 그 외 경로로 끝난 모집은 idle_ttl 동안 클릭이 없으면 정리
+    """
+
+    def __init__(self, min_interval: float = 1.5, resync_interval: float = 300.0,
+                 idle_ttl: float = 3600.0):
+        self.min_interval = min_interval
+        self.resync_interval = resync_interval
+        self.idle_ttl = idle_ttl
+        self._last_sweep = time.monotonic()
+
+        self._states: Dict[str, _RecruitmentState] = {}
+        self._stats = {'updates': 0, 'edits': 0, 'loads': 0, 'edit_failures': 0}
+
+    async def _ensure_loaded(self, db_manager, recruitment_id: str, state: _RecruitmentState):
+        if time.monotonic() - state.loaded_at < self.resync_interval:
+            return
+
+        async with state.load_lock:
+            if time.monotonic() - state.loaded_at < self.resync_interval:
+                return
+
+            participants = await db_manager.get_recruitment_participants(recruitment_id)
+            state.statuses = {}
+            state.counts = {status: 0 for status in PARTICIPATION_STATUSES}
+            for participant in participants:
+                state.apply(participant['user_id'], participant['status'])
+            state.loaded_at = time.monotonic()
+            self._stats['loads'] += 1
+
+    async def record(self, db_manager, recruitment_id: str, user_id: str, status: str,
+                     interaction: discord.Interaction, view: discord.ui.View, render: RenderFunc):
+        """
+        참가 상태 변경 반영 후 메시지 갱신 예약 (DB 저장이 끝난 뒤 호출)
+
+        Args:
+            interaction: 공지 메시지의 버튼 interaction (가장 최근 것으로 메시지 수정)
+            render: (모집 정보, 상태별 인원) 으로 임베드를 만드는 함수
+        """
+        self._sweep_idle()
+        state = self._states.get(recruitment_id)
+        if state is None:
+            state = self._states[recruitment_id] = _RecruitmentState()
+        state.touched_at = time.monotonic()
+
+        await self._ensure_loaded(db_manager, recruitment_id, state)
+        state.apply(user_id, status)
+        self._stats['updates'] += 1
+
+        state.interaction = interaction
+        state.view = view
+        state.render = render
+        state.dirty = True
+
+        if state.task is None:
+            state.task = asyncio.create_task(self._flush_loop(db_manager, recruitment_id, state))
+
+    def invalidate(self, recruitment_id: str):
+        """참가자 목록을 버튼 외 경로로 바꾼 경우 다음 클릭 때 다시 조회"""
+        state = self._states.get(recruitment_id)
+        if state is not None:
+            state.loaded_at = 0.0
+
+    def discard(self, recruitment_id: str):
+        """마감/취소된 모집의 집계와 예약된 갱신 제거"""
+        state = self._states.pop(recruitment_id, None)
+        if state is not None and state.task is not None:
+            state.task.cancel()
+
+    def _sweep_idle(self):
+        """idle_ttl 동안 클릭이 없던 모집 정리 (idle_ttl 당 최대 1회 검사)"""
+        now = time.monotonic()
+        if now - self._last_sweep < self.idle_ttl:
+            return
+        self._last_sweep = now
+
+        expired = [
+            recruitment_id for recruitment_id, state in self._states.items()
+            if state.task is None and now - state.touched_at >= self.idle_ttl
+        ]
+        for recruitment_id in expired:
+            del self._states[recruitment_id]
+
+    async def _flush_loop(self, db_manager, recruitment_id: str, state: _RecruitmentState):
+        try:
+            while state.dirty:
+                wait = state.last_edit + self.min_interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                state.dirty = False
+                recruitment = await db_manager.get_recruitment_by_id(recruitment_id)
+                if not recruitment or recruitment['status'] != 'active':
+                    # 마감/취소 처리된 공지는 스케줄러가 수정하므로 덮어쓰지 않음
+                    if self._states.get(recruitment_id) is state:
+                        del self._states[recruitment_id]
+                    return
+
+                embed = state.render(recruitment, dict(state.counts))
+                try:
+                    await state.interaction.edit_original_response(embed=embed, view=state.view)
+                    self._stats['edits'] += 1
+                except discord.HTTPException as e:
+                    self._stats['edit_failures'] += 1
+                    logger.warning(f"⚠️ 모집 메시지 업데이트 실패 ({recruitment_id}): {e}")
+                state.last_edit = time.monotonic()
+        except Exception as e:
+            logger.error(f"❌ 모집 메시지 갱신 오류 ({recruitment_id}): {e}")
+        finally:
+            state.task = None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'tracked': len(self._states),
+            'updates': self._stats['updates'],
+            'edits': self._stats['edits'],
+            'coalesced': self._stats['updates'] - self._stats['edits'] - self._stats['edit_failures'],
+            'loads': self._stats['loads'],
+            'edit_failures': self._stats['edit_failures'],
+        }
+
+
+recruitment_refresher = RecruitmentMessageRefresher()
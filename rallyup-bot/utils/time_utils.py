@@ -39,6 +39,20 @@ class TimeUtils:
             dt = UTC.localize(dt)
         return dt
     
+    @staticmethod
+    def to_timestamp(value, naive_utc=False):
+        """DB 에 저장된 시각(datetime, ISO 문자열, epoch 초)을 epoch 초로 변환
+
+        시간대 정보가 없는 값은 서버 로컬 시간으로 본다 (naive_utc=True 면 UTC)
+        """
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if value.tzinfo is None and naive_utc:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
     @staticmethod
     def get_discord_timestamp(dt):
         """Discord timestamp 형식으로 변환"""
@@ -0,0 +1,293 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _InflightSynth:
+    """진행 중인 합성 1건과 그 결과를 기다리는 호출자 수"""
+
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class TTSAudioCache:
+    """합성된 TTS 음성 캐시 (Opus 인코딩 결과를 내용 주소로 저장)
+
+    - 키: (텍스트, 목소리, 속도, 피치, 볼륨) 의 SHA-256
+    - 값: 재생 가능한 Ogg Opus 바이트 (재생할 때 ffmpeg 없이 패킷만 꺼내 보냄)
+    - 디스크 총 용량(max_bytes) 기준 LRU 제거
+    - 작은 클립은 메모리 hot tier 에도 보관해 디스크를 읽지 않고 바로 재생
+    - 같은 키를 동시에 요청하면 합성은 한 번만 수행 (기다리는 호출자가 모두 취소되면 합성도 취소)
+    - 봇 재시작 시 디스크의 기존 파일을 수정 시각 순으로 다시 인덱싱 (다른 형식의 예전 파일은 정리)
+    - 파일 읽기/쓰기/삭제는 스레드에서 실행하고 이벤트 루프에서는 메모리 인덱스만 확인
+    """
+
+    SUFFIX = '.opus'
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 200 * 1024 * 1024,
+        memory_bytes: int = 16 * 1024 * 1024,
+        memory_item_bytes: int = 256 * 1024
+    ):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        self.memory_item_bytes = memory_item_bytes
+
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_total = 0
+
+        self._inflight: Dict[str, _InflightSynth] = {}
+
+        self._stats = {
+            'hits': 0,
+            'memory_hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'synth_failures': 0,
+            'synth_cancelled': 0,
+            'evictions': 0,
+            'synth_seconds': 0.0,
+        }
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(text: str, voice: str, rate: str, pitch: str, volume: str) -> str:
+        """합성 파라미터로 캐시 키 생성"""
+        raw = '\0'.join((text, voice, rate, pitch, volume))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + self.SUFFIX)
+
+    def _load_index(self):
+        """디스크에 남아 있는 캐시 파일 인덱싱 (오래된 순)"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if not name.endswith(self.SUFFIX):
+                    # 저장 도중 종료되어 남은 임시 파일 / 예전 형식 파일 정리
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, name[:-len(self.SUFFIX)], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+        for path in self._evict():
+            self._remove_file(path)
+        if self._index:
+            logger.info(f"💾 TTS 캐시 로드: {len(self._index)}개, {self._total_bytes / 1024 / 1024:.1f}MB")
+
+    def _remember_in_memory(self, key: str, data: bytes):
+        if self.memory_bytes <= 0 or len(data) > self.memory_item_bytes:
+            return
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+
+        self._memory[key] = data
+        self._memory_total += len(data)
+        while self._memory_total > self.memory_bytes and self._memory:
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_total -= len(dropped)
+
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        with open(path, 'rb') as f:
+            data = f.read()
+        os.utime(path)
+        return data
+
+    @staticmethod
+    def _write_file(path: str, data: bytes) -> bool:
+        """임시 파일에 쓴 뒤 교체 (원자적 저장)"""
+        tmp_path = f"{path}.{os.getpid()}.{time.time_ns()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            logger.warning(f"⚠️ TTS 캐시 저장 실패: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @classmethod
+    def _remove_files(cls, paths: List[str]):
+        for path in paths:
+            cls._remove_file(path)
+
+    async def _lookup(self, key: str) -> Optional[bytes]:
+        """캐시 적중 시 음성 데이터 반환 (메모리 우선, 없으면 디스크에서 읽음)"""
+        if key not in self._index:
+            return None
+
+        data = self._memory.get(key)
+        if data is not None:
+            self._index.move_to_end(key)
+            self._memory.move_to_end(key)
+            self._stats['memory_hits'] += 1
+            return data
+
+        try:
+            data = await asyncio.to_thread(self._read_file, self.path_for(key))
+        except OSError:
+            # 외부에서 지워졌거나 읽는 사이 제거된 파일 - 인덱스에서 제거
+            size = self._index.pop(key, None)
+            if size is not None:
+                self._total_bytes -= size
+            return None
+
+        if key in self._index:
+            self._index.move_to_end(key)
+            self._remember_in_memory(key, data)
+        return data
+
+    def _evict(self) -> List[str]:
+        """총 용량이 max_bytes 이하가 될 때까지 오래된 항목부터 인덱스에서 제거 (지울 파일 경로 반환)"""
+        removed = []
+        while self._total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self._stats['evictions'] += 1
+
+            dropped = self._memory.pop(key, None)
+            if dropped is not None:
+                self._memory_total -= len(dropped)
+            removed.append(self.path_for(key))
+        return removed
+
+    async def _store(self, key: str, data: bytes):
+        """합성 결과를 디스크에 원자적으로 저장 (실패해도 이번 재생에는 지장 없음)"""
+        if not await asyncio.to_thread(self._write_file, self.path_for(key), data):
+            return
+
+        if key in self._index:
+            self._total_bytes -= self._index[key]
+        self._index[key] = len(data)
+        self._total_bytes += len(data)
+
+        self._remember_in_memory(key, data)
+        removed = self._evict()
+        if removed:
+            await asyncio.to_thread(self._remove_files, removed)
+
+    async def _synthesize(self, key: str, synthesize: Callable[[], Awaitable[Optional[bytes]]]) -> Optional[bytes]:
+        started = time.perf_counter()
+        try:
+            data = await synthesize()
+        except Exception:
+            self._stats['synth_failures'] += 1
+            raise
+        finally:
+            self._stats['synth_seconds'] += time.perf_counter() - started
+
+        if not data:
+            self._stats['synth_failures'] += 1
+            return None
+
+        await self._store(key, data)
+        return data
+
+    async def get_or_create(self, key: str, synthesize: Callable[[], Awaitable[Optional[bytes]]]) -> Optional[bytes]:
+        """
+        캐시된 음성 데이터 반환 (없으면 합성 후 저장)
+
+        Args:
+            key: make_key() 로 만든 캐시 키
+            synthesize: Ogg Opus 바이트를 만들어 반환하는 코루틴 함수 (실패 시 None)
+
+        Returns:
+            Ogg Opus 바이트 또는 None
+        """
+        data = await self._lookup(key)
+        if data is not None:
+            self._stats['hits'] += 1
+            return data
+
+        self._stats['misses'] += 1
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats['coalesced'] += 1
+        else:
+            inflight = _InflightSynth(asyncio.ensure_future(self._synthesize(key, synthesize)))
+            self._inflight[key] = inflight
+            inflight.task.add_done_callback(lambda _t, k=key, entry=inflight: self._forget(k, entry))
+
+        # 한 호출자가 취소돼도 다른 호출자는 결과를 받도록 shield 로 기다리고,
+        # 마지막 호출자가 취소되면 (예: /퇴장) 다운로드/인코딩도 멈춘다
+        inflight.waiters += 1
+        try:
+            return await asyncio.shield(inflight.task)
+        except asyncio.CancelledError:
+            if inflight.waiters == 1 and not inflight.task.done():
+                inflight.task.cancel()
+                self._stats['synth_cancelled'] += 1
+            raise
+        finally:
+            inflight.waiters -= 1
+
+    def _forget(self, key: str, entry: _InflightSynth):
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+    def get_stats(self) -> Dict:
+        """적중률/용량 통계"""
+        lookups = self._stats['hits'] + self._stats['misses']
+        synthesized = (self._stats['misses'] - self._stats['coalesced']
+                       - self._stats['synth_failures'] - self._stats['synth_cancelled'])
+        return {
+            'entries': len(self._index),
+            'total_bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+            'memory_entries': len(self._memory),
+            'memory_bytes': self._memory_total,
+            'hits': self._stats['hits'],
+            'memory_hits': self._stats['memory_hits'],
+            'misses': self._stats['misses'],
+            'coalesced': self._stats['coalesced'],
+            'synth_failures': self._stats['synth_failures'],
+            'synth_cancelled': self._stats['synth_cancelled'],
+            'evictions': self._stats['evictions'],
+            # 동시 요청 병합도 합성을 건너뛴 것이므로 적중으로 계산
+            'hit_rate': round((self._stats['hits'] + self._stats['coalesced']) / lookups, 4) if lookups else 0.0,
+            'avg_synth_ms': round(self._stats['synth_seconds'] / synthesized * 1000, 1) if synthesized > 0 else 0.0,
+        }
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+# guild_id -> 로그를 보낼 쓰레드 (없으면 None)
+ThreadResolver = Callable[[str], Awaitable[Optional[discord.Thread]]]
+# (guild_id, 실제로 전송된 로그 수)
+FlushCallback = Callable[[str, int], Awaitable[None]]
+
+
+class _GuildBuffer:
+    """서버 1곳의 대기 중인 로그"""
+
+    def __init__(self):
+        self.entries: List[str] = []
+        self.chars = 0
+        self.full = asyncio.Event()
+        self.lock = asyncio.Lock()
+        self.task: Optional[asyncio.Task] = None
+
+
+class TTSLogSink:
+    """TTS 로그 묶음 전송기
+
+    - 재생 태스크는 add() 로 로그 한 줄을 버퍼에 넣기만 하고 바로 다음 클립으로 넘어간다
+    - 서버별로 모인 로그는 flush_interval 이 지나거나 메시지 한도(2000자)만큼 차면
+      한도 안에서 최대한 합친 메시지로 쓰레드에 전송한다
+    - 전송이 끝나면 on_flushed 로 묶음당 한 번만 카운트를 올린다
+    - 쓰레드가 응답하지 않아도 버퍼는 max_pending 개를 넘지 않는다 (오래된 로그부터 버림)
+    """
+
+    def __init__(self, resolve_thread: ThreadResolver, on_flushed: Optional[FlushCallback] = None,
+                 flush_interval: float = 3.0, max_chars: int = DISCORD_MESSAGE_LIMIT,
+                 max_pending: int = 500):
+        self.resolve_thread = resolve_thread
+        self.on_flushed = on_flushed
+        self.flush_interval = flush_interval
+        self.max_chars = max_chars
+        self.max_pending = max_pending
+
+        self._buffers: Dict[str, _GuildBuffer] = {}
+        self._closed = False
+        self._stats = {'entries': 0, 'messages': 0, 'flushes': 0, 'dropped': 0, 'send_failures': 0}
+
+    def add(self, guild_id: str, entry: str):
+        """로그 한 건을 버퍼에 추가 (대기 없음)"""
+        if len(entry) > self.max_chars:
+            entry = entry[:self.max_chars - 1] + '…'
+
+        buffer = self._buffers.get(guild_id)
+        if buffer is None:
+            buffer = self._buffers[guild_id] = _GuildBuffer()
+
+        buffer.entries.append(entry)
+        buffer.chars += len(entry) + 1
+        self._stats['entries'] += 1
+
+        if len(buffer.entries) > self.max_pending:
+            dropped = buffer.entries.pop(0)
+            buffer.chars -= len(dropped) + 1
+            self._stats['dropped'] += 1
+
+        if buffer.chars >= self.max_chars:
+            buffer.full.set()
+
+        if self._closed:
+            return
+        if buffer.task is None or buffer.task.done():
+            buffer.task = asyncio.create_task(self._run(guild_id, buffer))
+
+    async def flush(self, guild_id: str):
+        """대기 중인 로그를 지금 전송 (세션 구분선처럼 순서가 중요한 메시지 전에 호출)"""
+        buffer = self._buffers.get(guild_id)
+        if buffer is not None:
+            await self._flush(guild_id, buffer)
+
+    async def close(self):
+        """타이머를 멈추고 남은 로그를 모두 전송"""
+        self._closed = True
+        tasks = [buffer.task for buffer in self._buffers.values() if buffer.task and not buffer.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for guild_id, buffer in list(self._buffers.items()):
+            await self._flush(guild_id, buffer)
+
+    async def _run(self, guild_id: str, buffer: _GuildBuffer):
+        """서버별 전송 태스크: 크기/시간 조건이 되면 전송, 더 쌓인 게 없으면 종료"""
+        while buffer.entries:
+            if buffer.chars < self.max_chars:
+                try:
+                    await asyncio.wait_for(buffer.full.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self._flush(guild_id, buffer)
+
+    def _pack(self, entries: List[str]) -> List[Tuple[str, int]]:
+        """로그들을 메시지 한도 안에서 순서대로 합치기 -> [(메시지, 포함된 로그 수)]"""
+        messages = []
+        current = ''
+        count = 0
+        for entry in entries:
+            if current and len(current) + 1 + len(entry) > self.max_chars:
+                messages.append((current, count))
+                current, count = entry, 1
+            else:
+                current = f"{current}\n{entry}" if current else entry
+                count += 1
+        if current:
+            messages.append((current, count))
+        return messages
+
+    async def _flush(self, guild_id: str, buffer: _GuildBuffer):
+        async with buffer.lock:
+            if not buffer.entries:
+                return
+            entries = buffer.entries
+            buffer.entries = []
+            buffer.chars = 0
+            buffer.full.clear()
+
+            try:
+                thread = await self.resolve_thread(guild_id)
+            except Exception as e:
+                logger.error(f"⚠️ TTS 로그 쓰레드 조회 실패: {e}")
+                thread = None
+
+            if thread is None:
+                self._stats['dropped'] += len(entries)
+                return
+
+            sent = 0
+            for message, count in self._pack(entries):
+                try:
+                    await thread.send(message)
+                    sent += count
+                    self._stats['messages'] += 1
+                except discord.Forbidden:
+                    self._stats['send_failures'] += 1
+                    logger.error(f"⚠️ 쓰레드 쓰기 권한 없음: {guild_id}")
+                    break
+                except discord.HTTPException as e:
+                    self._stats['send_failures'] += 1
+                    logger.error(f"⚠️ 쓰레드 메시지 전송 실패: {e}")
+
+            self._stats['flushes'] += 1
+            self._stats['dropped'] += len(entries) - sent
+
+            if self.on_flushed and sent:
+                try:
+                    await self.on_flushed(guild_id, sent)
+                except Exception as e:
+                    logger.error(f"⚠️ TTS 로그 카운트 갱신 실패: {e}")
+
+    def get_stats(self) -> Dict:
+        return {
+            **self._stats,
+            'pending': sum(len(buffer.entries) for buffer in self._buffers.values()),
+        }
@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+# 짧은 시간 안에 켰다 껐다 할 수 있는 상태 (음소거, 화면 공유)
+TOGGLE_KINDS = ('mute', 'screen_share')
+
+
+@dataclass
+class _VoiceEvent:
+    kind: str  # join / leave / move / mute / screen_share
+    member: discord.Member
+    before_channel: Optional[discord.abc.Connectable] = None
+    after_channel: Optional[discord.abc.Connectable] = None
+    was: bool = False
+    now: bool = False
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _PendingToggle:
+    member: discord.Member
+    initial: bool
+    latest: bool
+    handle: asyncio.TimerHandle
+
+
+class _GuildQueue:
+    """서버 1곳의 순서 보장 이벤트 큐 (워커는 비어 있으면 종료, 다음 이벤트 때 다시 시작)"""
+
+    def __init__(self):
+        self.events: Deque[_VoiceEvent] = deque()
+        self.task: Optional[asyncio.Task] = None
+        self.warned = False
+
+
+class VoiceEventDispatcher:
+    """음성 상태 이벤트 처리기
+
+    - 게이트웨이 이벤트 핸들러는 submit() 으로 큐에 넣기만 하고 바로 반환 (DB 작업을 기다리지 않음)
+    - 서버별 큐 하나를 워커 하나가 도착 순서대로 처리하므로 같은 유저의 입장/퇴장이 뒤섞이지 않고,
+      서로 다른 서버의 이벤트는 동시에 처리된다
+    - 음소거/화면 공유 전환은 toggle_window 동안 모았다가 최종 상태만 반영 (켰다 끄면 아무 것도 하지 않음)
+      같은 유저의 입장/퇴장/이동이 들어오면 모아둔 전환을 먼저 큐에 넣어 순서를 지킨다
+    - 큐 길이/대기 시간/처리 시간 통계를 get_stats() 로 제공
+    """
+
+    def __init__(self, tracker, toggle_window: float = 3.0, warn_depth: int = 50):
+        self.tracker = tracker
+        self.toggle_window = toggle_window
+        self.warn_depth = warn_depth
+
+        self._queues: Dict[str, _GuildQueue] = {}
+        self._toggles: Dict[Tuple[str, str, str], _PendingToggle] = {}
+        self._closed = False
+
+        self._stats = {
+            'submitted': 0,
+            'processed': 0,
+            'failed': 0,
+            'coalesced': 0,
+            'toggles_cancelled': 0,
+            'max_depth': 0,
+            'wait_seconds': 0.0,
+            'max_wait': 0.0,
+            'handle_seconds': 0.0,
+            'max_handle': 0.0,
+        }
+
+    def submit(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        """음성 상태 변경 1건 등록 (대기 없음)"""
+        if self._closed or member.bot:
+            return
+
+        if before.channel is None and after.channel is not None:
+            self._submit_presence(_VoiceEvent('join', member, after_channel=after.channel))
+        elif before.channel is not None and after.channel is None:
+            self._submit_presence(_VoiceEvent('leave', member, before_channel=before.channel))
+        elif before.channel != after.channel:
+            self._submit_presence(_VoiceEvent(
+                'move', member, before_channel=before.channel, after_channel=after.channel
+            ))
+        elif before.self_mute != after.self_mute:
+            self._defer_toggle('mute', member, before.self_mute, after.self_mute)
+        elif before.self_stream != after.self_stream:
+            self._defer_toggle('screen_share', member, before.self_stream, after.self_stream)
+
+    def _submit_presence(self, event: _VoiceEvent):
+        # 이 유저의 모아둔 전환부터 반영해야 퇴장 뒤에 음소거가 처리되는 일이 없다
+        guild_id, user_id = str(event.member.guild.id), str(event.member.id)
+        for kind in TOGGLE_KINDS:
+            self._release_toggle((guild_id, user_id, kind))
+        self._enqueue(guild_id, event)
+
+    def _defer_toggle(self, kind: str, member: discord.Member, was: bool, now: bool):
+        key = (str(member.guild.id), str(member.id), kind)
+        pending = self._toggles.get(key)
+        if pending is not None:
+            pending.member = member
+            pending.latest = now
+            self._stats['coalesced'] += 1
+            return
+
+        handle = asyncio.get_running_loop().call_later(self.toggle_window, self._release_toggle, key)
+        self._toggles[key] = _PendingToggle(member, was, now, handle)
+
+    def _release_toggle(self, key: Tuple[str, str, str]):
+        pending = self._toggles.pop(key, None)
+        if pending is None:
+            return
+        pending.handle.cancel()
+
+        if pending.initial == pending.latest:
+            # 창 안에서 원래 상태로 돌아옴
+            self._stats['toggles_cancelled'] += 1
+            return
+
+        guild_id, _, kind = key
+        self._enqueue(guild_id, _VoiceEvent(kind, pending.member, was=pending.initial, now=pending.latest))
+
+    def _enqueue(self, guild_id: str, event: _VoiceEvent):
+        queue = self._queues.get(guild_id)
+        if queue is None:
+            queue = self._queues[guild_id] = _GuildQueue()
+
+        queue.events.append(event)
+        self._stats['submitted'] += 1
+
+        depth = len(queue.events)
+        self._stats['max_depth'] = max(self._stats['max_depth'], depth)
+        if depth >= self.warn_depth and not queue.warned:
+            queue.warned = True
+            logger.warning(f"⚠️ 음성 이벤트 큐 적체: {guild_id} ({depth}건)")
+
+        if queue.task is None or queue.task.done():
+            queue.task = asyncio.create_task(self._run(guild_id, queue))
+
+    async def _run(self, guild_id: str, queue: _GuildQueue):
+        while queue.events:
+            event = queue.events.popleft()
+            if not queue.events:
+                queue.warned = False
+
+            started = time.perf_counter()
+            wait = started - event.enqueued_at
+            self._stats['wait_seconds'] += wait
+            self._stats['max_wait'] = max(self._stats['max_wait'], wait)
+
+            try:
+                await self._handle(event)
+                self._stats['processed'] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats['failed'] += 1
+                logger.error(f"❌ 음성 이벤트 처리 실패 ({event.kind}: {event.member.id}): {e}", exc_info=True)
+
+            elapsed = time.perf_counter() - started
+            self._stats['handle_seconds'] += elapsed
+            self._stats['max_handle'] = max(self._stats['max_handle'], elapsed)
+
+    async def _handle(self, event: _VoiceEvent):
+        tracker = self.tracker
+        if event.kind == 'join':
+            await tracker.handle_voice_join(event.member, event.after_channel)
+        elif event.kind == 'leave':
+            await tracker.handle_voice_leave(event.member, event.before_channel)
+        elif event.kind == 'move':
+            await tracker.handle_voice_move(event.member, event.before_channel, event.after_channel)
+        elif event.kind == 'mute':
+            await tracker.handle_mute_change(event.member, event.was, event.now)
+        elif event.kind == 'screen_share':
+            await tracker.handle_screen_share_change(event.member, event.was, event.now)
+
+    async def stop(self, timeout: float = 5.0):
+        """새 이벤트를 받지 않고, 모아둔 전환까지 큐에 넣은 뒤 timeout 동안 처리하고 종료"""
+        self._closed = True
+        for key in list(self._toggles):
+            self._release_toggle(key)
+
+        tasks = [queue.task for queue in self._queues.values() if queue.task and not queue.task.done()]
+        if not tasks:
+            return
+
+        _, still_running = await asyncio.wait(tasks, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            await asyncio.gather(*still_running, return_exceptions=True)
+            logger.warning(f"⚠️ 음성 이벤트 {sum(len(q.events) for q in self._queues.values())}건 미처리 종료")
+
+    def get_stats(self) -> Dict:
+        processed = self._stats['processed'] + self._stats['failed']
+        depths = {guild_id: len(queue.events) for guild_id, queue in self._queues.items() if queue.events}
+        return {
+            'submitted': self._stats['submitted'],
+            'processed': self._stats['processed'],
+            'failed': self._stats['failed'],
+            'coalesced': self._stats['coalesced'],
+            'toggles_cancelled': self._stats['toggles_cancelled'],
+            'pending_toggles': len(self._toggles),
+            'depth': depths,
+            'max_depth': self._stats['max_depth'],
+            'avg_wait_ms': round(self._stats['wait_seconds'] / processed * 1000, 1) if processed else 0.0,
+            'max_wait_ms': round(self._stats['max_wait'] * 1000, 1),
+            'avg_handle_ms': round(self._stats['handle_seconds'] / processed * 1000, 1) if processed else 0.0,
+            'max_handle_ms': round(self._stats['max_handle'] * 1000, 1),
+        }
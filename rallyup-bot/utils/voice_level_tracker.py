@@ -2,10 +2,11 @@ import discord
 from discord.ext import tasks
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import asyncio
 from utils.voice_exp_calculator import VoiceExpCalculator
 from utils.voice_notification_manager import VoiceNotificationManager
+from utils.voice_presence import VoicePresenceGraph, VoiceSessionState
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +19,120 @@ class VoiceLevelTracker:
     - 플레이 시간과 EXP는 세션 종료 시 단 한 번만 지급
     - 백그라운드 태스크는 관계 시간만 업데이트
     - 음소거 전환 시 부분 정산 제거
+
+    접속 현황(채널별 유저, 세션 상태, 파트너)은 VoicePresenceGraph 가 메모리에 들고 있고,
+    입장/퇴장/음소거/1분 주기 처리는 DB 를 조회하지 않는다.
+    변경 사항은 쓰기 큐로 비동기 저장하며 재시작 시 DB 의 활성 세션으로 모델을 복구한다.
     """
     
     def __init__(self, bot):
         self.bot = bot
         self.db = bot.db_manager
         self.exp_calculator = VoiceExpCalculator(self.db)
-        self.active_sessions: Dict[Tuple[str, str], str] = {}
+        self.presence = VoicePresenceGraph()
         self.notification_manager = VoiceNotificationManager(bot, self.db)
+
+        # user_levels 행이 있는 것으로 확인된 (guild_id, user_id) - 입장마다 조회하지 않도록
+        self._known_user_levels: Set[Tuple[str, str]] = set()
+        self._pending_writes: Set[asyncio.Task] = set()
+        self._presence_ready = asyncio.Event()
+        self._presence_task = asyncio.create_task(self._load_presence())
+
         self.relationship_update_task.start()
         logger.info("✅ VoiceLevelTracker initialized (fixed version)")
+
+    async def _load_presence(self):
+        """봇 준비 후 DB 의 활성 세션 중 지금도 음성 채널에 있는 유저만 메모리 모델로 복구"""
+        try:
+            await self.bot.wait_until_ready()
+            restored = await self._adopt_active_sessions()
+            logger.info(f"🗺️ 음성 접속 현황 복구: {restored}개 세션")
+        except Exception as e:
+            logger.error(f"Error loading voice presence: {e}", exc_info=True)
+        finally:
+            self._presence_ready.set()
+
+    async def _adopt_active_sessions(self, guild: Optional[discord.Guild] = None) -> int:
+        rows = await self.db.get_active_voice_sessions(str(guild.id) if guild else None)
+        restored = 0
+
+        for row in rows:
+            target_guild = guild or self.bot.get_guild(int(row['guild_id']))
+            member = target_guild.get_member(int(row['user_id'])) if target_guild else None
+            if not member or not member.voice or not member.voice.channel:
+                continue
+
+            # 이미 입장 이벤트로 새 세션이 생긴 유저는 그대로 둔다
+            if guild is None and self.presence.get(row['guild_id'], row['user_id']):
+                continue
+
+            self.presence.adopt(VoiceSessionState(
+                session_uuid=row['session_uuid'],
+                guild_id=row['guild_id'],
+                user_id=row['user_id'],
+                channel_id=str(member.voice.channel.id),
+                join_time=datetime.fromisoformat(row['join_time']),
+                updated_at=datetime.fromisoformat(row['updated_at']),
+                is_muted=row['is_muted'],
+                is_screen_sharing=row['is_screen_sharing'],
+                muted_seconds=row['muted_seconds'],
+                screen_share_seconds=row['screen_share_seconds'],
+                is_solo=row['is_solo'],
+                partners=set(row['partners'])
+            ))
+            self._known_user_levels.add((row['guild_id'], row['user_id']))
+            restored += 1
+
+        return restored
+
+    async def reload_presence(self, guild: discord.Guild) -> int:
+        """관리자가 DB 세션을 직접 고친 뒤 해당 서버의 메모리 모델을 DB 기준으로 다시 구성"""
+        await self.flush_writes()
+        self.presence.clear_guild(str(guild.id))
+        return await self._adopt_active_sessions(guild)
+
+    def _persist(self, coro):
+        """DB 기록을 기다리지 않고 쓰기 큐에 넘김 (생성 순서대로 큐에 들어감)"""
+        task = asyncio.create_task(coro)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._on_persisted)
+
+    def _on_persisted(self, task: asyncio.Task):
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error persisting voice session: {task.exception()}")
+
+    async def flush_writes(self):
+        """예약된 세션 기록이 모두 끝날 때까지 대기"""
+        if self._pending_writes:
+            await asyncio.gather(*list(self._pending_writes), return_exceptions=True)
+
+    async def _ensure_user_level(self, guild_id: str, user_id: str, member_name: str):
+        key = (guild_id, user_id)
+        if key in self._known_user_levels:
+            return
+        
+        user_level = await self.db.get_user_level(guild_id, user_id)
+        if not user_level:
+            await self.db.create_user_level(guild_id, user_id)
+            logger.info(f"✅ Created user_level for {member_name}")
+        self._known_user_levels.add(key)
+
+    def _end_session(self, state: VoiceSessionState) -> Tuple[int, int, int]:
+        """메모리에서 세션 정산 후 종료 기록 예약"""
+        now = datetime.utcnow()
+        total_duration, active_duration, screen_share_duration = state.finish(now)
+        self._persist(self.db.save_voice_session_end(
+            state.session_uuid, now.isoformat(), total_duration,
+            int(state.muted_seconds), screen_share_duration
+        ))
+        return total_duration, active_duration, screen_share_duration
+
+    def _save_session_state(self, state: VoiceSessionState):
+        self._persist(self.db.save_voice_session_state(
+            state.session_uuid, state.is_muted, state.is_screen_sharing,
+            state.muted_seconds, state.screen_share_seconds, state.updated_at.isoformat()
+        ))
     
     async def handle_voice_join(self, member: discord.Member, channel: discord.VoiceChannel):
         """음성 채널 입장 처리"""
@@ -35,6 +140,8 @@ class VoiceLevelTracker:
             if member.bot:
                 return
             
+            await self._presence_ready.wait()
+            
             guild_id = str(member.guild.id)
             user_id = str(member.id)
             channel_id = str(channel.id)
@@ -43,35 +150,32 @@ class VoiceLevelTracker:
             if not settings['enabled']:
                 return
             
-            user_level = await self.db.get_user_level(guild_id, user_id)
-            if not user_level:
-                await self.db.create_user_level(guild_id, user_id)
-                logger.info(f"✅ Created user_level for {member.display_name}")
+            await self._ensure_user_level(guild_id, user_id, member.display_name)
+            
+            # 퇴장 이벤트를 놓쳐 남아 있던 세션은 보상 없이 닫는다
+            stale = self.presence.close(guild_id, user_id)
+            if stale:
+                self._end_session(stale)
             
             is_muted = member.voice.self_mute if member.voice else False
             is_screen_sharing = member.voice.self_stream if member.voice else False
 
-            session_uuid = await self.db.create_voice_session(
-                guild_id, user_id, channel_id, is_muted, is_screen_sharing 
+            state, partner_states = self.presence.open(
+                guild_id, user_id, channel_id, is_muted, is_screen_sharing, datetime.utcnow()
             )
             
-            self.active_sessions[(guild_id, user_id)] = session_uuid
-
-            users_in_channel = await self.db.get_users_in_channel(guild_id, channel_id)
-            partner_ids = [u['user_id'] for u in users_in_channel if u['user_id'] != user_id]
-
-            if partner_ids:
-                # 내 세션에 파트너들 추가
-                await self.db.add_session_partners(session_uuid, partner_ids)
-                
-                # 기존 세션들에도 나를 파트너로 추가
-                for partner_id in partner_ids:
-                    partner_session = await self.db.get_active_session(guild_id, partner_id)
-                    if partner_session:
-                        await self.db.add_session_partner(
-                            partner_session['session_uuid'], 
-                            user_id
-                        )
+            # 내 세션에 파트너들, 기존 세션들에 나를 추가 (한 번의 일괄 기록)
+            partner_rows = [(state.session_uuid, partner.user_id) for partner in partner_states]
+            partner_rows += [(partner.session_uuid, user_id) for partner in partner_states]
+            
+            async def persist():
+                await self.db.save_voice_session_start(
+                    state.session_uuid, guild_id, user_id, channel_id,
+                    state.join_time.isoformat(), is_muted, is_screen_sharing
+                )
+                await self.db.add_session_partner_rows(partner_rows)
+            
+            self._persist(persist())
 
             status = []
             if is_muted:
@@ -100,6 +204,8 @@ class VoiceLevelTracker:
             if member.bot:
                 return
             
+            await self._presence_ready.wait()
+            
             guild_id = str(member.guild.id)
             user_id = str(member.id)
             
@@ -107,19 +213,13 @@ class VoiceLevelTracker:
             if not settings['enabled'] or not settings.get('screen_share_bonus_enabled', True):
                 return
             
-            session_key = (guild_id, user_id)
-            session_uuid = self.active_sessions.get(session_key)
-            
-            if not session_uuid:
-                session_data = await self.db.get_active_session(guild_id, user_id)
-                if session_data:
-                    session_uuid = session_data['session_uuid']
-            
-            if not session_uuid:
+            state = self.presence.get(guild_id, user_id)
+            if not state:
                 return
             
             # ✅ 화면 공유 상태 업데이트 (음소거와 동일한 패턴)
-            await self.db.update_session_screen_share_status(session_uuid, is_screen_sharing)
+            state.set_screen_sharing(is_screen_sharing, datetime.utcnow())
+            self._save_session_state(state)
             
             status_text = "화면 공유 시작" if is_screen_sharing else "화면 공유 종료"
             logger.info(f"🖥️ {member.display_name} {status_text}")
@@ -137,6 +237,8 @@ class VoiceLevelTracker:
             if member.bot:
                 return
             
+            await self._presence_ready.wait()
+            
             guild_id = str(member.guild.id)
             user_id = str(member.id)
             
@@ -144,25 +246,14 @@ class VoiceLevelTracker:
             if not settings['enabled']:
                 return
             
-            session_key = (guild_id, user_id)
-            session_uuid = self.active_sessions.get(session_key)
-            
-            if not session_uuid:
-                session_data = await self.db.get_active_session(guild_id, user_id)
-                if session_data:
-                    session_uuid = session_data['session_uuid']
-            
-            if not session_uuid:
+            state = self.presence.close(guild_id, user_id)
+            if not state:
                 return
 
-            partner_ids = await self.db.get_session_partners(session_uuid)
+            partner_ids = list(state.partners)
             
             # 세션 종료 및 시간 계산
-            total_duration, active_duration, screen_share_duration = \
-                await self.db.end_voice_session_with_screen_share(session_uuid)
-            
-            # 메모리 캐시에서 제거
-            self.active_sessions.pop(session_key, None)
+            total_duration, active_duration, screen_share_duration = self._end_session(state)
             
             # EXP + 플레이 시간 + 화면 공유 시간 지급
             await self._award_exp_for_session(
@@ -193,12 +284,14 @@ class VoiceLevelTracker:
         음소거 상태 변경 처리
         
         ✅ 수정: 부분 시간 정산 제거! 음소거 상태만 기록합니다.
-        실제 시간 계산은 세션 종료 시 end_voice_session_with_mute에서 일괄 처리됩니다.
+        실제 시간 계산은 세션 종료 시 일괄 처리됩니다.
         """
         try:
             if member.bot:
                 return
             
+            await self._presence_ready.wait()
+            
             guild_id = str(member.guild.id)
             user_id = str(member.id)
             
@@ -206,19 +299,13 @@ class VoiceLevelTracker:
             if not settings['enabled'] or not settings['check_mute_status']:
                 return
             
-            session_key = (guild_id, user_id)
-            session_uuid = self.active_sessions.get(session_key)
-            
-            if not session_uuid:
-                session_data = await self.db.get_active_session(guild_id, user_id)
-                if session_data:
-                    session_uuid = session_data['session_uuid']
-            
-            if not session_uuid:
+            state = self.presence.get(guild_id, user_id)
+            if not state:
                 return
             
             # ✅ 음소거 상태만 업데이트 (시간 계산은 나중에!)
-            await self.db.update_session_mute_status_with_time(session_uuid, is_muted)
+            state.set_muted(is_muted, datetime.utcnow())
+            self._save_session_state(state)
             
             status_text = "음소거" if is_muted else "음소거 해제"
             logger.info(f"🔇 {member.display_name} {status_text}")
@@ -233,23 +320,17 @@ class VoiceLevelTracker:
         ✅ 수정: 관계 시간만 업데이트! EXP/플레이 시간은 _award_exp_for_session에서 처리
         """
         try:
-            users_in_channel = await self.db.get_users_in_channel(guild_id, channel_id)
-            partners = [u for u in users_in_channel if u['user_id'] != user_id]
+            partners = [
+                partner_id for partner_id in self.presence.channel_members(guild_id, channel_id)
+                if partner_id != user_id
+            ]
             
             if not partners:
                 logger.debug(f"No partners found for user {user_id} in channel {channel_id}")
                 return
             
-            guild = self.bot.get_guild(int(guild_id))
-            if not guild:
-                return
-            
-            total_users = len(partners) + 1
-            
             # ✅ 관계 시간만 업데이트
-            for partner in partners:
-                partner_id = partner['user_id']
-                
+            for partner_id in partners:
                 await self.db.update_relationship_time(
                     guild_id, user_id, partner_id, duration
                 )
@@ -273,67 +354,44 @@ class VoiceLevelTracker:
             if random.randint(1, 60) == 1:
                 self.notification_manager.cleanup_old_notifications()
 
-            if not self.active_sessions:
+            if not self.presence:
                 return
             
-            guilds_to_check: Set[str] = set()
-            for (guild_id, _) in self.active_sessions.keys():
-                guilds_to_check.add(guild_id)
-            
-            for guild_id in guilds_to_check:
+            for guild_id in self.presence.guild_ids():
                 settings = await self.db.get_voice_level_settings(guild_id)
                 if not settings['enabled']:
                     continue
                 
-                guild = self.bot.get_guild(int(guild_id))
-                if not guild:
-                    continue
-                
-                channels_users: Dict[str, List[str]] = {}
-                solo_users: List[str] = []
+                # 길드 단위 쓰기를 모아서 한 번에 대기 (쓰기 큐가 단일 트랜잭션으로 병합)
+                writes = []
                 
-                for voice_channel in guild.voice_channels:
-                    channel_id = str(voice_channel.id)
-                    users_in_channel = []
+                for channel_id, members in self.presence.guild_channels(guild_id):
+                    states = [self.presence.get(guild_id, user_id) for user_id in members]
+                    states = [state for state in states if state is not None]
+                    if settings['check_mute_status']:
+                        states = [state for state in states if not state.is_muted]
                     
-                    for member in voice_channel.members:
-                        if member.bot:
-                            continue
-                        
-                        user_id = str(member.id)
-                        session_key = (guild_id, user_id)
-                        
-                        if session_key in self.active_sessions:
-                            if settings['check_mute_status'] and member.voice and member.voice.self_mute:
-                                continue
-                            
-                            users_in_channel.append(user_id)
+                    # 혼자/함께 상태가 바뀐 세션만 기록
+                    is_solo = len(states) == 1
+                    for state in states:
+                        if state.is_solo != is_solo:
+                            state.is_solo = is_solo
+                            if is_solo:
+                                writes.append(self.db.mark_session_as_solo(state.session_uuid))
+                                logger.debug(f"👤 User {state.user_id} is solo in voice channel")
+                            else:
+                                writes.append(self.db.mark_session_as_active_with_partners(state.session_uuid))
                     
-                    if len(users_in_channel) == 1:
-                        solo_users.append(users_in_channel[0])
-                    elif len(users_in_channel) >= 2:
-                        channels_users[channel_id] = users_in_channel
-                
-                # 혼자 있는 유저 표시
-                for user_id in solo_users:
-                    session_key = (guild_id, user_id)
-                    session_uuid = self.active_sessions.get(session_key)
-                    if session_uuid:
-                        await self.db.mark_session_as_solo(session_uuid)
-                        logger.debug(f"👤 User {user_id} is solo in voice channel")
+                    if len(states) >= 2:
+                        # ✅ 관계 시간만 업데이트 (EXP/플레이 시간은 절대 추가 안 함!)
+                        writes.append(self._update_channel_relationships_batch(
+                            guild_id, [state.user_id for state in states], 60
+                        ))
+                        
+                        logger.debug(f"✅ Updated relationships for {len(states)} users in channel {channel_id}")
                 
-                # ✅ 관계 시간만 배치 업데이트
-                for channel_id, users in channels_users.items():
-                    for user_id in users:
-                        session_key = (guild_id, user_id)
-                        session_uuid = self.active_sessions.get(session_key)
-                        if session_uuid:
-                            await self.db.mark_session_as_active_with_partners(session_uuid)
-                    
-                    # ✅ 관계 시간만 업데이트 (EXP/플레이 시간은 절대 추가 안 함!)
-                    await self._update_channel_relationships_batch(guild_id, users, 60)
-                    
-                    logger.debug(f"✅ Updated relationships for {len(users)} users in channel {channel_id}")
+                if writes:
+                    await asyncio.gather(*writes)
         
         except Exception as e:
             logger.error(f"Error in relationship_update_task: {e}", exc_info=True)
@@ -511,68 +569,36 @@ class VoiceLevelTracker:
         """추적 시스템 중지"""
         if self.relationship_update_task.is_running():
             self.relationship_update_task.cancel()
+        if not self._presence_task.done():
+            self._presence_task.cancel()
         logger.info("VoiceLevelTracker stopped")
 
     async def restore_voice_sessions(self):
         """
         봇 재시작 시 활성 음성 세션 복구
-        현재 음성 채널에 있는 유저들의 세션 자동 생성
+        현재 음성 채널에 있지만 세션이 없는 유저들의 세션 자동 생성
         """
         try:
+            await self._presence_ready.wait()
             restored_count = 0
             
             for guild in self.bot.guilds:
-                settings = await self.db.get_voice_level_settings(str(guild.id))
+                guild_id = str(guild.id)
+                settings = await self.db.get_voice_level_settings(guild_id)
                 if not settings['enabled']:
                     continue
                 
                 for voice_channel in guild.voice_channels:
-                    # 채널에 있는 모든 멤버 ID 수집 (봇 제외)
-                    members_in_channel = [m for m in voice_channel.members if not m.bot]
-                    
-                    for member in members_in_channel:
-                        guild_id = str(guild.id)
-                        user_id = str(member.id)
-                        
-                        # 기존 세션 확인
-                        existing_session = await self.db.get_active_session(guild_id, user_id)
-                        if existing_session:
+                    for member in voice_channel.members:
+                        if member.bot or self.presence.get(guild_id, str(member.id)):
                             continue
                         
-                        # 유저 레벨 확인/생성
-                        user_level = await self.db.get_user_level(guild_id, user_id)
-                        if not user_level:
-                            await self.db.create_user_level(guild_id, user_id)
-                        
-                        is_muted = member.voice.self_mute if member.voice else False
-                        is_screen_sharing = member.voice.self_stream if member.voice else False
-                        
-                        # 세션 생성
-                        session_uuid = await self.db.create_voice_session(
-                            guild_id, user_id, str(voice_channel.id), 
-                            is_muted, is_screen_sharing
-                        )
-                        
-                        self.active_sessions[(guild_id, user_id)] = session_uuid
+                        # 채널에 이미 있는 멤버들과 서로 파트너로 등록됨
+                        await self.handle_voice_join(member, voice_channel)
                         restored_count += 1
-                    
-                    # 같은 채널 멤버들을 서로 파트너로 등록
-                    for i, member in enumerate(members_in_channel):
-                        user_id = str(member.id)
-                        session_uuid = self.active_sessions.get((str(guild.id), user_id))
-                        
-                        if session_uuid:
-                            # 자신을 제외한 다른 멤버들
-                            partner_ids = [
-                                str(other.id) for other in members_in_channel 
-                                if other.id != member.id
-                            ]
-                            
-                            if partner_ids:
-                                await self.db.add_session_partners(session_uuid, partner_ids)
             
             if restored_count > 0:
                 logger.info(f"🎤 Restored {restored_count} voice sessions")
         
         except Exception as e:
-            logger.error(f"Error restoring voice sessions: {e}", exc_info=True)
\ No newline at end of file
+            logger.error(f"Error restoring voice sessions: {e}", exc_info=True)
@@ -0,0 +1,144 @@
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+@dataclass
+class VoiceSessionState:
+    """음성 세션 1개의 메모리 상태 (voice_sessions 행과 같은 계산 규칙)"""
+    session_uuid: str
+    guild_id: str
+    user_id: str
+    channel_id: str
+    join_time: datetime
+    updated_at: datetime
+    is_muted: bool = False
+    is_screen_sharing: bool = False
+    muted_seconds: float = 0.0
+    screen_share_seconds: float = 0.0
+    is_solo: bool = False  # 마지막으로 DB 에 기록한 값
+    partners: Set[str] = field(default_factory=set)
+
+    def _advance(self, now: datetime):
+        """마지막 갱신 이후 구간을 음소거/화면 공유 누적 시간에 반영"""
+        elapsed = max(0.0, (now - self.updated_at).total_seconds())
+        if self.is_muted:
+            self.muted_seconds += elapsed
+        if self.is_screen_sharing:
+            self.screen_share_seconds += elapsed
+        self.updated_at = now
+
+    def set_muted(self, is_muted: bool, now: datetime):
+        self._advance(now)
+        self.is_muted = is_muted
+
+    def set_screen_sharing(self, is_screen_sharing: bool, now: datetime):
+        self._advance(now)
+        self.is_screen_sharing = is_screen_sharing
+
+    def finish(self, now: datetime) -> Tuple[int, int, int]:
+        """
+        세션 정산
+
+        Returns:
+            (total_duration, active_duration, screen_share_duration): 전체, 활성(음소거 제외), 화면공유 시간 (초)
+        """
+        self._advance(now)
+        total_duration = int((now - self.join_time).total_seconds())
+        active_duration = max(0, int(total_duration - self.muted_seconds))
+        return total_duration, active_duration, int(self.screen_share_seconds)
+
+
+class VoicePresenceGraph:
+    """음성 채널 접속 현황 메모리 모델
+
+    - (서버, 유저) -> 활성 세션, (서버, 채널) -> 접속 유저, 세션별 함께한 파트너 집합
+    - 입장/퇴장/음소거/1분 주기 처리가 DB 를 조회하지 않고 이 모델만 읽는다
+    - DB(voice_sessions/session_partners)는 재시작 복구용 기록이며 변경은 호출자가 비동기로 저장
+    """
+
+    def __init__(self):
+        self.sessions: Dict[Tuple[str, str], VoiceSessionState] = {}
+        self.channels: Dict[Tuple[str, str], Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def get(self, guild_id: str, user_id: str) -> Optional[VoiceSessionState]:
+        return self.sessions.get((guild_id, user_id))
+
+    def channel_members(self, guild_id: str, channel_id: str) -> Set[str]:
+        return self.channels.get((guild_id, channel_id), set())
+
+    def guild_ids(self) -> Set[str]:
+        return {guild_id for guild_id, _ in self.sessions}
+
+    def guild_channels(self, guild_id: str) -> Iterator[Tuple[str, Set[str]]]:
+        """서버의 (채널 ID, 접속 유저) 목록"""
+        for (channel_guild_id, channel_id), members in list(self.channels.items()):
+            if channel_guild_id == guild_id:
+                yield channel_id, members
+
+    def open(
+        self,
+        guild_id: str,
+        user_id: str,
+        channel_id: str,
+        is_muted: bool,
+        is_screen_sharing: bool,
+        now: datetime
+    ) -> Tuple[VoiceSessionState, List[VoiceSessionState]]:
+        """
+        새 세션 시작 및 채널에 이미 있던 유저들과 서로 파트너로 연결
+
+        Returns:
+            (새 세션, 파트너가 된 기존 세션 목록)
+        """
+        members = self.channels.setdefault((guild_id, channel_id), set())
+        partner_states = [
+            state for state in (self.sessions.get((guild_id, member_id)) for member_id in members)
+            if state is not None
+        ]
+
+        state = VoiceSessionState(
+            session_uuid=str(uuid.uuid4()),
+            guild_id=guild_id,
+            user_id=user_id,
+            channel_id=channel_id,
+            join_time=now,
+            updated_at=now,
+            is_muted=is_muted,
+            is_screen_sharing=is_screen_sharing,
+            partners={partner.user_id for partner in partner_states}
+        )
+        for partner in partner_states:
+            partner.partners.add(user_id)
+
+        self.sessions[(guild_id, user_id)] = state
+        members.add(user_id)
+        return state, partner_states
+
+    def adopt(self, state: VoiceSessionState):
+        """DB 에서 복구한 세션 등록 (같은 유저의 기존 세션은 대체)"""
+        self.close(state.guild_id, state.user_id)
+        self.sessions[(state.guild_id, state.user_id)] = state
+        self.channels.setdefault((state.guild_id, state.channel_id), set()).add(state.user_id)
+
+    def close(self, guild_id: str, user_id: str) -> Optional[VoiceSessionState]:
+        """세션을 모델에서 제거해 반환 (정산은 호출자가 finish() 로)"""
+        state = self.sessions.pop((guild_id, user_id), None)
+        if state is None:
+            return None
+
+        channel_key = (guild_id, state.channel_id)
+        members = self.channels.get(channel_key)
+        if members is not None:
+            members.discard(user_id)
+            if not members:
+                del self.channels[channel_key]
+        return state
+
+    def clear_guild(self, guild_id: str):
+        for _, user_id in [key for key in self.sessions if key[0] == guild_id]:
+            self.close(guild_id, user_id)